@@ -11,103 +11,175 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cusignal.acoustics.cepstrum import rceps, cceps, cceps_unwrap
-from cusignal.filtering.resample import (
-    decimate,
-    resample,
-    resample_poly,
-    upfirdn,
-)
-from cusignal.filtering.filtering import (
-    wiener,
-    lfiltic,
-    sosfilt,
-    hilbert,
-    hilbert2,
-    detrend,
-    freq_shift,
-)
-from cusignal.convolution.correlate import correlate, correlate2d
-from cusignal.convolution.convolve import (
-    fftconvolve,
-    choose_conv_method,
-    convolve,
-    convolve2d,
-)
-from cusignal.filter_design.fir_filter_design import (
-    kaiser_beta,
-    kaiser_atten,
-    firwin,
-    cmplx_sort,
-)
-from cusignal.windows.windows import (
-    general_cosine,
-    boxcar,
-    triang,
-    parzen,
-    bohman,
-    blackman,
-    nuttall,
-    blackmanharris,
-    flattop,
-    bartlett,
-    hann,
-    tukey,
-    barthann,
-    general_hamming,
-    hamming,
-    kaiser,
-    gaussian,
-    general_gaussian,
-    chebwin,
-    cosine,
-    exponential,
-    get_window,
-)
-from cusignal.spectral_analysis.spectral import (
-    lombscargle,
-    periodogram,
-    welch,
-    csd,
-    spectrogram,
-    stft,
-    vectorstrength,
-    coherence,
-)
-from cusignal.bsplines.bsplines import (
-    gauss_spline,
-    cubic,
-    quadratic,
-    cspline1d,
-)
-from cusignal.waveforms.waveforms import (
-    square,
-    gausspulse,
-    chirp,
-    unit_impulse,
-)
-from cusignal.wavelets.wavelets import qmf, morlet, ricker, cwt
-from cusignal.peak_finding.peak_finding import (
-    argrelmin,
-    argrelmax,
-    argrelextrema,
-)
-from cusignal.utils.arraytools import (
-    get_shared_array,
-    get_shared_mem,
-    get_pinned_array,
-    get_pinned_mem,
-)
-from cusignal.utils.compile_kernels import precompile_kernels
-from cusignal.io.reader import (
-    read_bin,
-    unpack_bin,
-    read_sigmf,
-)
-from cusignal.io.writer import (
-    write_bin,
-    pack_bin,
-    write_sigmf,
+from cusignal._lazy import attach
+
+# Public functions are imported on first access (PEP 562), so that
+# `import cusignal` stays cheap for jobs only using a few of them.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    [
+        "acoustics",
+        "bsplines",
+        "convolution",
+        "filter_design",
+        "filtering",
+        "io",
+        "peak_finding",
+        "spectral_analysis",
+        "utils",
+        "waveforms",
+        "wavelets",
+        "windows",
+    ],
+    {
+        "acoustics.cepstrum": [
+            "rceps",
+            "cceps",
+            "cceps_unwrap",
+        ],
+        "filtering.resample": [
+            "decimate",
+            "resample",
+            "resample_poly",
+            "upfirdn",
+            "StreamingUpFIRDn",
+            "StreamingResamplePoly",
+            "ResamplePlan",
+            "ResampleStage",
+            "cic_decimate",
+            "cic_interpolate",
+            "StreamingCICDecimator",
+            "StreamingCICInterpolator",
+            "resample_filter_cache_info",
+            "clear_resample_filter_cache",
+        ],
+        "filtering.channelize": [
+            "channelize",
+            "synthesize_channels",
+            "ddc",
+        ],
+        "filtering.filtering": [
+            "wiener",
+            "lfiltic",
+            "lfilter",
+            "sosfilt",
+            "sosfilt_zi",
+            "sosfiltfilt",
+            "SosFilter",
+            "hilbert",
+            "hilbert2",
+            "detrend",
+            "freq_shift",
+        ],
+        "convolution.correlate": [
+            "correlate",
+            "correlate2d",
+        ],
+        "convolution.convolve": [
+            "fftconvolve",
+            "choose_conv_method",
+            "convolve",
+            "convolve2d",
+        ],
+        "filter_design.fir_filter_design": [
+            "kaiser_beta",
+            "kaiser_atten",
+            "firwin",
+            "cic_compensator",
+            "cmplx_sort",
+        ],
+        "windows.windows": [
+            "general_cosine",
+            "boxcar",
+            "triang",
+            "parzen",
+            "bohman",
+            "blackman",
+            "nuttall",
+            "blackmanharris",
+            "flattop",
+            "bartlett",
+            "hann",
+            "tukey",
+            "barthann",
+            "general_hamming",
+            "hamming",
+            "kaiser",
+            "gaussian",
+            "general_gaussian",
+            "chebwin",
+            "cosine",
+            "exponential",
+            "get_window",
+        ],
+        "spectral_analysis.spectral": [
+            "lombscargle",
+            "periodogram",
+            "welch",
+            "csd",
+            "spectrogram",
+            "stft",
+            "vectorstrength",
+            "coherence",
+            "SpectralPlan",
+        ],
+        "bsplines.bsplines": [
+            "gauss_spline",
+            "cubic",
+            "quadratic",
+            "cspline1d",
+        ],
+        "waveforms.waveforms": [
+            "square",
+            "gausspulse",
+            "chirp",
+            "unit_impulse",
+        ],
+        "wavelets.wavelets": [
+            "qmf",
+            "morlet",
+            "ricker",
+            "cwt",
+        ],
+        "peak_finding.peak_finding": [
+            "argrelmin",
+            "argrelmax",
+            "argrelextrema",
+        ],
+        "utils.arraytools": [
+            "get_shared_array",
+            "get_shared_mem",
+            "get_pinned_array",
+            "get_pinned_mem",
+        ],
+        "utils.backend": [
+            "get_array_module",
+            "get_backend",
+            "set_backend",
+        ],
+        "utils.compile_kernels": [
+            "precompile_kernels",
+        ],
+        "utils.kernel_cache": [
+            "kernel_cache_info",
+        ],
+        "utils.autotune": [
+            "set_autotune",
+        ],
+        "utils.memory": [
+            "workspace",
+        ],
+        "io.reader": [
+            "read_bin",
+            "unpack_bin",
+            "read_sigmf",
+        ],
+        "io.writer": [
+            "write_bin",
+            "pack_bin",
+            "write_sigmf",
+        ],
+    },
 )
 
 # Versioneer
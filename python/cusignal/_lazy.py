@@ -0,0 +1,62 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import sys
+
+
+def attach(package, submodules, submodule_attrs):
+    """
+    Lazily expose submodules and their public names on a package (PEP 562).
+
+    Parameters
+    ----------
+    package : str
+        Name of the package, i.e. ``__name__`` of its ``__init__``.
+    submodules : list of str
+        Submodules, relative to `package`, exposed as attributes.
+    submodule_attrs : dict
+        Map of submodule, relative to `package`, to the names it exports.
+
+    Returns
+    -------
+    __getattr__, __dir__, __all__
+        To be assigned at module level in the package ``__init__``.
+    """
+    attr_to_module = {
+        attr: mod for mod, attrs in submodule_attrs.items() for attr in attrs
+    }
+    names = sorted(set(submodules) | set(attr_to_module))
+
+    def __getattr__(name):
+        if name in attr_to_module:
+            module = importlib.import_module(
+                "{}.{}".format(package, attr_to_module[name])
+            )
+            attr = getattr(module, name)
+        elif name in submodules:
+            attr = importlib.import_module("{}.{}".format(package, name))
+        else:
+            raise AttributeError(
+                "module '{}' has no attribute '{}'".format(package, name)
+            )
+
+        # Cache, so that __getattr__ is only called once per name
+        setattr(sys.modules[package], name, attr)
+
+        return attr
+
+    def __dir__():
+        return sorted(set(names) | set(vars(sys.modules[package])))
+
+    return __getattr__, __dir__, list(names)
@@ -0,0 +1,63 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code):
+    # Each round needs a fresh interpreter, as imports are cached
+    subprocess.check_call([sys.executable, "-c", code])
+
+
+class BenchImport:
+    @pytest.mark.benchmark(group="Import")
+    class BenchImportCusignal:
+        def bench_import_python(self, benchmark):
+            # Interpreter startup and CuPy, for reference
+            benchmark.pedantic(_run, args=("import cupy",), rounds=10)
+
+        def bench_import_lazy(self, benchmark):
+            benchmark.pedantic(
+                _run,
+                args=(
+                    "import cusignal, sys\n"
+                    "assert 'numba' not in sys.modules\n"
+                    "assert 'cusignal.windows.windows' not in sys.modules",
+                ),
+                rounds=10,
+            )
+
+        def bench_import_read_sigmf(self, benchmark):
+            benchmark.pedantic(
+                _run,
+                args=(
+                    "from cusignal import read_sigmf\n"
+                    "import sys\n"
+                    "assert 'numba' not in sys.modules",
+                ),
+                rounds=10,
+            )
+
+        def bench_import_all(self, benchmark):
+            benchmark.pedantic(
+                _run,
+                args=(
+                    "import cusignal\n"
+                    "for name in cusignal.__all__:\n"
+                    "    getattr(cusignal, name)",
+                ),
+                rounds=10,
+            )
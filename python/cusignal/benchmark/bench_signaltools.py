@@ -184,6 +184,257 @@ class BenchSignaltools:
             key = self.cpu_version(cpu_sig, up, down, axis)
             assert array_equal(cp.asnumpy(output), key)
 
+    @pytest.mark.benchmark(group="UpFirDnNd")
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("up", [2, 3])
+    @pytest.mark.parametrize("down", [1, 9])
+    @pytest.mark.parametrize("axis", [-1, 0, 1])
+    class BenchUpFirDnNd:
+        np.random.seed(1234)
+
+        def cpu_version(self, cpu_sig, up, down, axis):
+            return signal.upfirdn([1, 1, 1], cpu_sig, up, down, axis)
+
+        def bench_upfirdn_nd_cpu(self, benchmark, num_samps, up, down, axis):
+            cpu_sig = np.random.rand(16, 8, num_samps)
+            benchmark(
+                self.cpu_version, cpu_sig, up, down, axis,
+            )
+
+        def bench_upfirdn_nd_gpu(self, benchmark, num_samps, up, down, axis):
+            cpu_sig = np.random.rand(16, 8, num_samps)
+            gpu_sig = cp.asarray(cpu_sig)
+            output = benchmark(
+                cusignal.upfirdn, [1, 1, 1], gpu_sig, up, down, axis,
+            )
+
+            key = self.cpu_version(cpu_sig, up, down, axis)
+            assert array_equal(cp.asnumpy(output), key)
+
+    @pytest.mark.benchmark(group="StreamingResamplePoly")
+    @pytest.mark.parametrize("num_samps", [2 ** 16])
+    @pytest.mark.parametrize("num_signals", [1, 16])
+    @pytest.mark.parametrize("up", [2, 3, 7])
+    @pytest.mark.parametrize("down", [1, 2, 9])
+    class BenchStreamingResamplePoly:
+        np.random.seed(1234)
+
+        def cpu_version(self, cpu_sig, up, down):
+            return signal.resample_poly(cpu_sig, up, down, axis=-1)
+
+        def bench_streaming_resample_poly_cpu(
+            self, benchmark, num_samps, num_signals, up, down
+        ):
+            cpu_sig = np.random.rand(num_signals, num_samps)
+            benchmark(self.cpu_version, cpu_sig, up, down)
+
+        def bench_streaming_resample_poly_gpu(
+            self, benchmark, num_samps, num_signals, up, down
+        ):
+            cpu_sig = np.random.rand(num_signals, num_samps)
+            gpu_sig = cp.asarray(cpu_sig)
+
+            rs = cusignal.StreamingResamplePoly(
+                up, down, n_channels=num_signals
+            )
+
+            def process():
+                rs.reset()
+                return rs.process(gpu_sig)
+
+            output = benchmark(process)
+
+            # The first chunk of a stream lacks the last outputs
+            key = self.cpu_version(cpu_sig, up, down)
+            assert array_equal(cp.asnumpy(output), key[:, : output.shape[1]])
+
+    @pytest.mark.benchmark(group="ResampleMultistage")
+    @pytest.mark.parametrize("num_samps", [2 ** 20])
+    @pytest.mark.parametrize("q", [64, 256])
+    @pytest.mark.parametrize("method", ["single", "multistage"])
+    class BenchResampleMultistage:
+        np.random.seed(1234)
+
+        def cpu_version(self, cpu_sig, q):
+            return signal.resample_poly(cpu_sig, 1, q)
+
+        def bench_resample_multistage_cpu(
+            self, benchmark, num_samps, q, method
+        ):
+            cpu_sig = np.random.rand(num_samps)
+            benchmark(self.cpu_version, cpu_sig, q)
+
+        def bench_resample_multistage_gpu(
+            self, benchmark, num_samps, q, method
+        ):
+            cpu_sig = np.random.rand(num_samps)
+            gpu_sig = cp.asarray(cpu_sig)
+
+            output = benchmark(
+                cusignal.resample_poly, gpu_sig, 1, q, method=method
+            )
+
+            # Differs from a single stage by the passband ripple
+            key = self.cpu_version(cpu_sig, q)
+            assert output.shape == key.shape
+            if method == "single":
+                assert array_equal(cp.asnumpy(output), key)
+
+    @pytest.mark.benchmark(group="CICDecimate")
+    @pytest.mark.parametrize("num_samps", [2 ** 22])
+    @pytest.mark.parametrize("num_signals", [1, 16])
+    @pytest.mark.parametrize("down", [64, 1024])
+    class BenchCICDecimate:
+        np.random.seed(1234)
+
+        def cpu_version(self, cpu_sig, down):
+            # Polyphase decimation, which a CIC filter replaces
+            return signal.resample_poly(cpu_sig, 1, down, axis=-1)
+
+        def bench_cic_decimate_cpu(
+            self, benchmark, num_samps, num_signals, down
+        ):
+            cpu_sig = np.random.randint(
+                -128, 128, (num_signals, num_samps)
+            ).astype(np.int8)
+            benchmark(self.cpu_version, cpu_sig, down)
+
+        def bench_cic_decimate_gpu(
+            self, benchmark, num_samps, num_signals, down
+        ):
+            cpu_sig = np.random.randint(
+                -128, 128, (num_signals, num_samps)
+            ).astype(np.int8)
+            gpu_sig = cp.asarray(cpu_sig)
+
+            output = benchmark(cusignal.cic_decimate, gpu_sig, down, 5)
+
+            with cusignal.set_backend("numpy"):
+                key = cusignal.cic_decimate(cpu_sig[:, : 64 * down], down, 5)
+            assert array_equal(cp.asnumpy(output[:, :64]), key)
+
+    @pytest.mark.benchmark(group="DecimateIIR")
+    @pytest.mark.parametrize("num_samps", [2 ** 20])
+    @pytest.mark.parametrize("num_signals", [1, 64])
+    @pytest.mark.parametrize("q", [4, 16])
+    @pytest.mark.parametrize("zero_phase", [True, False])
+    class BenchDecimateIIR:
+        np.random.seed(1234)
+
+        def cpu_version(self, cpu_sig, q, zero_phase):
+            return signal.decimate(
+                cpu_sig, q, ftype="iir", zero_phase=zero_phase
+            )
+
+        def bench_decimate_iir_cpu(
+            self, benchmark, num_samps, num_signals, q, zero_phase
+        ):
+            cpu_sig = np.random.rand(num_signals, num_samps)
+            benchmark(self.cpu_version, cpu_sig, q, zero_phase)
+
+        def bench_decimate_iir_gpu(
+            self, benchmark, num_samps, num_signals, q, zero_phase
+        ):
+            cpu_sig = np.random.rand(num_signals, num_samps)
+            gpu_sig = cp.asarray(cpu_sig)
+
+            output = benchmark(
+                cusignal.decimate,
+                gpu_sig,
+                q,
+                ftype="iir",
+                zero_phase=zero_phase,
+            )
+
+            key = self.cpu_version(cpu_sig, q, zero_phase)
+            assert array_equal(cp.asnumpy(output), key)
+
+    @pytest.mark.benchmark(group="Channelize")
+    @pytest.mark.parametrize("num_samps", [2 ** 20])
+    @pytest.mark.parametrize("n_channels", [64, 256])
+    @pytest.mark.parametrize("oversample", [1, 2])
+    class BenchChannelize:
+        np.random.seed(1234)
+
+        def cpu_version(self, cpu_sig, h, n_channels, oversample):
+            # One frequency shift and filter per channel
+            t = np.arange(cpu_sig.shape[-1])
+            return np.stack(
+                [
+                    signal.upfirdn(
+                        h,
+                        cpu_sig * np.exp(-2j * np.pi * k * t / n_channels),
+                        1,
+                        n_channels // oversample,
+                    )
+                    for k in range(n_channels)
+                ]
+            )
+
+        def bench_channelize_cpu(
+            self, benchmark, num_samps, n_channels, oversample
+        ):
+            cpu_sig = np.random.rand(num_samps) * (1 + 1j)
+            h = signal.firwin(n_channels * 16, 1 / n_channels)
+            benchmark(self.cpu_version, cpu_sig, h, n_channels, oversample)
+
+        def bench_channelize_gpu(
+            self, benchmark, num_samps, n_channels, oversample
+        ):
+            cpu_sig = np.random.rand(num_samps) * (1 + 1j)
+            h = signal.firwin(n_channels * 16, 1 / n_channels)
+            gpu_sig = cp.asarray(cpu_sig)
+
+            output = benchmark(
+                cusignal.channelize,
+                gpu_sig,
+                cp.asarray(h),
+                n_channels,
+                oversample,
+            )
+
+            key = self.cpu_version(cpu_sig[:4096], h, n_channels, oversample)
+            n_key = 4096 // (n_channels // oversample)
+            assert array_equal(cp.asnumpy(output[:, :n_key]), key[:, :n_key])
+
+    @pytest.mark.benchmark(group="DDC")
+    @pytest.mark.parametrize("num_samps", [2 ** 22])
+    @pytest.mark.parametrize("num_channels", [1, 16])
+    @pytest.mark.parametrize("down", [8, 64])
+    class BenchDDC:
+        np.random.seed(1234)
+
+        def cpu_version(self, cpu_sig, f_offset, fs, h, down):
+            # Mix, filter, and decimate in separate passes
+            t = np.arange(cpu_sig.shape[-1])
+            mixed = cpu_sig * np.exp(-2j * np.pi * f_offset[:, None] / fs * t)
+            return signal.upfirdn(h, mixed, 1, down)
+
+        def bench_ddc_cpu(self, benchmark, num_samps, num_channels, down):
+            cpu_sig = np.random.rand(num_samps)
+            f_offset = np.linspace(-2e5, 2e5, num_channels)
+            h = signal.firwin(8 * down, 1 / down)
+            benchmark(self.cpu_version, cpu_sig, f_offset, 1e6, h, down)
+
+        def bench_ddc_gpu(self, benchmark, num_samps, num_channels, down):
+            cpu_sig = np.random.rand(num_samps)
+            f_offset = np.linspace(-2e5, 2e5, num_channels)
+            h = signal.firwin(8 * down, 1 / down)
+            gpu_sig = cp.asarray(cpu_sig)
+
+            output = benchmark(
+                cusignal.ddc,
+                gpu_sig,
+                cp.asarray(f_offset),
+                1e6,
+                cp.asarray(h),
+                down,
+            )
+
+            key = self.cpu_version(cpu_sig[:8192], f_offset, 1e6, h, down)
+            n_key = 8192 // down
+            assert array_equal(cp.asnumpy(output[:, :n_key]), key[:, :n_key])
+
     @pytest.mark.benchmark(group="FirWin")
     @pytest.mark.parametrize("num_samps", [2 ** 15])
     @pytest.mark.parametrize("f1", [0.1, 0.15])
@@ -272,6 +523,62 @@ class BenchSignaltools:
             key = self.cpu_version(cpu_sig, cpu_win, mode, method)
             assert array_equal(cp.asnumpy(output), key)
 
+    @pytest.mark.benchmark(group="SymmetricFIR")
+    @pytest.mark.parametrize("num_samps", [2 ** 20])
+    @pytest.mark.parametrize("num_taps", [63, 255])
+    @pytest.mark.parametrize("down", [1, 4])
+    @pytest.mark.parametrize("taps", ["symmetric", "generic"])
+    class BenchSymmetricFIR:
+        np.random.seed(1234)
+
+        def design(self, num_taps, taps):
+            h = signal.firwin(num_taps, 0.2)
+            if taps == "generic":
+                # Break the symmetry, to time the generic kernels on the
+                # same filter up to rounding
+                h[0] *= 1 + 1e-9
+            return h
+
+        def cpu_version(self, cpu_sig, h, down):
+            return signal.upfirdn(h, cpu_sig, 1, down)
+
+        def bench_symmetric_fir_cpu(
+            self, benchmark, num_samps, num_taps, down, taps
+        ):
+            cpu_sig = np.random.rand(num_samps)
+            h = self.design(num_taps, taps)
+            benchmark(self.cpu_version, cpu_sig, h, down)
+
+        def bench_symmetric_fir_gpu(
+            self, benchmark, num_samps, num_taps, down, taps
+        ):
+            cpu_sig = np.random.rand(num_samps)
+            gpu_sig = cp.asarray(cpu_sig)
+            h = self.design(num_taps, taps)
+            gpu_h = cp.asarray(h)
+
+            if down == 1:
+                output = benchmark(
+                    cusignal.convolve,
+                    gpu_sig,
+                    gpu_h,
+                    method="direct",
+                    detect_symmetry=True,
+                )
+            else:
+                output = benchmark(
+                    cusignal.upfirdn,
+                    gpu_h,
+                    gpu_sig,
+                    1,
+                    down,
+                    detect_symmetry=True,
+                )
+
+            # Accuracy against the exactly symmetric double precision filter
+            key = self.cpu_version(cpu_sig, signal.firwin(num_taps, 0.2), down)
+            assert array_equal(cp.asnumpy(output), key)
+
     @pytest.mark.benchmark(group="FFTConvolve")
     @pytest.mark.parametrize("num_samps", [2 ** 15])
     @pytest.mark.parametrize("mode", ["full", "valid", "same"])
@@ -471,6 +778,7 @@ class BenchSignaltools:
             cpu_sig = np.array(cpu_sig, dtype=dtype)
             benchmark(self.cpu_version, cpu_sos, cpu_sig)
 
+        @pytest.mark.parametrize("method", ["serial", "parallel"])
         def bench_sosfilt_gpu(
             self,
             rand_2d_data_gen,
@@ -479,6 +787,7 @@ class BenchSignaltools:
             num_samps,
             order,
             dtype,
+            method,
         ):
 
             cpu_sos = signal.ellip(order, 0.009, 80, 0.05, output='sos')
@@ -492,7 +801,168 @@ class BenchSignaltools:
                 cusignal.sosfilt,
                 gpu_sos,
                 gpu_sig,
+                method=method,
             )
 
             key = self.cpu_version(cpu_sos, cpu_sig)
             assert array_equal(cp.asnumpy(output), key)
+
+    @pytest.mark.benchmark(group="SosFilter")
+    @pytest.mark.parametrize("order", [32, 64])
+    @pytest.mark.parametrize("num_samps", [2 ** 15])
+    @pytest.mark.parametrize("num_signals", [1, 10])
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    class BenchSosFilter:
+        np.random.seed(1234)
+
+        def cpu_version(self, sos, cpu_sig, zi):
+            return signal.sosfilt(sos, cpu_sig, zi=zi)
+
+        def bench_sos_filter_cpu(
+            self, benchmark, num_signals, num_samps, order, dtype,
+        ):
+            cpu_sos = signal.ellip(order, 0.009, 80, 0.05, output="sos")
+            cpu_sos = np.array(cpu_sos, dtype=dtype)
+            cpu_sig = np.random.rand(num_signals, num_samps)
+            cpu_sig = np.array(cpu_sig, dtype=dtype)
+            zi = np.zeros((cpu_sos.shape[0], num_signals, 2), dtype)
+            benchmark(self.cpu_version, cpu_sos, cpu_sig, zi)
+
+        def bench_sos_filter_gpu(
+            self, benchmark, num_signals, num_samps, order, dtype,
+        ):
+            cpu_sos = signal.ellip(order, 0.009, 80, 0.05, output="sos")
+            cpu_sos = np.array(cpu_sos, dtype=dtype)
+            cpu_sig = np.random.rand(num_signals, num_samps)
+            cpu_sig = np.array(cpu_sig, dtype=dtype)
+            gpu_sig = cp.asarray(cpu_sig)
+
+            filt = cusignal.SosFilter(cp.asarray(cpu_sos), num_signals, dtype)
+            out = cp.empty_like(gpu_sig)
+
+            def process():
+                filt.reset()
+                return filt.process(gpu_sig, out)
+
+            output = benchmark(process)
+
+            zi = np.zeros((cpu_sos.shape[0], num_signals, 2), dtype)
+            key, _ = self.cpu_version(cpu_sos, cpu_sig, zi)
+            assert array_equal(cp.asnumpy(output), key)
+
+    @pytest.mark.benchmark(group="SOSFiltBank")
+    @pytest.mark.parametrize("order", [8, 32])
+    @pytest.mark.parametrize("num_samps", [2 ** 15])
+    @pytest.mark.parametrize("num_signals", [16, 128])
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    class BenchSOSFiltBank:
+        np.random.seed(1234)
+
+        def cpu_version(self, sos, cpu_sig):
+            return np.stack(
+                [signal.sosfilt(s, x) for s, x in zip(sos, cpu_sig)]
+            )
+
+        def _bank(self, order, num_signals, dtype):
+            return np.stack(
+                [
+                    signal.butter(order, f, output="sos")
+                    for f in np.linspace(0.1, 0.8, num_signals)
+                ]
+            ).astype(dtype)
+
+        def bench_sosfilt_bank_loop_gpu(
+            self, benchmark, num_signals, num_samps, order, dtype,
+        ):
+            cpu_sos = self._bank(order, num_signals, dtype)
+            gpu_sos = cp.asarray(cpu_sos)
+            cpu_sig = np.random.rand(num_signals, num_samps).astype(dtype)
+            gpu_sig = cp.asarray(cpu_sig)
+
+            def loop():
+                return cp.stack(
+                    [cusignal.sosfilt(s, x) for s, x in zip(gpu_sos, gpu_sig)]
+                )
+
+            output = benchmark(loop)
+
+            key = self.cpu_version(cpu_sos, cpu_sig)
+            assert array_equal(cp.asnumpy(output), key)
+
+        def bench_sosfilt_bank_gpu(
+            self, benchmark, num_signals, num_samps, order, dtype,
+        ):
+            cpu_sos = self._bank(order, num_signals, dtype)
+            cpu_sig = np.random.rand(num_signals, num_samps).astype(dtype)
+
+            output = benchmark(
+                cusignal.sosfilt, cp.asarray(cpu_sos), cp.asarray(cpu_sig),
+            )
+
+            key = self.cpu_version(cpu_sos, cpu_sig)
+            assert array_equal(cp.asnumpy(output), key)
+
+    @pytest.mark.benchmark(group="SOSFiltFilt")
+    @pytest.mark.parametrize("order", [8, 32])
+    @pytest.mark.parametrize("num_samps", [2 ** 15, 2 ** 20])
+    @pytest.mark.parametrize("num_signals", [1, 10])
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    class BenchSOSFiltFilt:
+        np.random.seed(1234)
+
+        def cpu_version(self, sos, cpu_sig):
+            return signal.sosfiltfilt(sos, cpu_sig)
+
+        def bench_sosfiltfilt_cpu(
+            self, benchmark, num_signals, num_samps, order, dtype,
+        ):
+            cpu_sos = signal.butter(order, 0.2, output="sos").astype(dtype)
+            cpu_sig = np.random.rand(num_signals, num_samps).astype(dtype)
+            benchmark(self.cpu_version, cpu_sos, cpu_sig)
+
+        def bench_sosfiltfilt_gpu(
+            self, benchmark, num_signals, num_samps, order, dtype,
+        ):
+            cpu_sos = signal.butter(order, 0.2, output="sos").astype(dtype)
+            cpu_sig = np.random.rand(num_signals, num_samps).astype(dtype)
+
+            output = benchmark(
+                cusignal.sosfiltfilt, cp.asarray(cpu_sos), cp.asarray(cpu_sig),
+            )
+
+            key = self.cpu_version(cpu_sos, cpu_sig)
+            assert array_equal(cp.asnumpy(output), key)
+
+    @pytest.mark.benchmark(group="LFilter")
+    @pytest.mark.parametrize("order", [2, 8])
+    @pytest.mark.parametrize("num_samps", [2 ** 15, 2 ** 20])
+    @pytest.mark.parametrize("num_signals", [1, 10])
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    class BenchLFilter:
+        np.random.seed(1234)
+
+        def cpu_version(self, b, a, cpu_sig):
+            return signal.lfilter(b, a, cpu_sig)
+
+        def bench_lfilter_cpu(
+            self, benchmark, num_signals, num_samps, order, dtype,
+        ):
+            b, a = signal.butter(order, 0.2)
+            cpu_sig = np.random.rand(num_signals, num_samps).astype(dtype)
+            benchmark(self.cpu_version, b, a, cpu_sig)
+
+        def bench_lfilter_gpu(
+            self, benchmark, num_signals, num_samps, order, dtype,
+        ):
+            b, a = signal.butter(order, 0.2)
+            cpu_sig = np.random.rand(num_signals, num_samps).astype(dtype)
+
+            output = benchmark(
+                cusignal.lfilter,
+                cp.asarray(b),
+                cp.asarray(a),
+                cp.asarray(cpu_sig),
+            )
+
+            key = self.cpu_version(b, a, cpu_sig)
+            assert array_equal(cp.asnumpy(output), key)
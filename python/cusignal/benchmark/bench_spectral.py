@@ -365,6 +365,32 @@ class BenchSpectral:
             _, _, key = self.cpu_version(cpu_sig, fs, nperseg)
             assert array_equal(cp.asnumpy(output), key)
 
+    @pytest.mark.benchmark(group="SpectralPlan")
+    @pytest.mark.parametrize("num_samps", [2 ** 14])
+    @pytest.mark.parametrize("fs", [1.0, 1e6])
+    @pytest.mark.parametrize("nperseg", [1024, 2048])
+    class BenchSpectralPlan:
+        def cpu_version(self, cpu_sig, fs, nperseg):
+            return signal.welch(cpu_sig, fs, nperseg=nperseg)
+
+        def bench_spectral_plan_cpu(
+            self, rand_data_gen, benchmark, num_samps, fs, nperseg
+        ):
+            cpu_sig, _ = rand_data_gen(num_samps)
+            benchmark(self.cpu_version, cpu_sig, fs, nperseg)
+
+        def bench_spectral_plan_gpu(
+            self, rand_data_gen, benchmark, num_samps, fs, nperseg
+        ):
+
+            cpu_sig, gpu_sig = rand_data_gen(num_samps)
+            plan = cusignal.SpectralPlan(nperseg=nperseg, fs=fs)
+            out = cp.empty(nperseg // 2 + 1)
+            _, output = benchmark(plan.psd, gpu_sig, out=out)
+
+            _, key = self.cpu_version(cpu_sig, fs, nperseg)
+            assert array_equal(cp.asnumpy(output), key)
+
     @pytest.mark.benchmark(group="LombScargle")
     @pytest.mark.parametrize("num_in_samps", [2 ** 10])
     @pytest.mark.parametrize("num_out_samps", [2 ** 16, 2 ** 18])
@@ -16,7 +16,15 @@ import numpy as np
 
 from string import Template
 
-from ..utils._caches import _cupy_kernel_cache
+from ..filter_design.filter_design_utils import _fir_symmetry
+from ..utils._registry import GPUKernel, _register_kernel
+from ..utils.autotune import (
+    _get_launch_config,
+    _grid_2d_configs,
+    _grid_stride_configs,
+)
+from ..utils.backend import get_array_module
+from ..utils.memory import _empty, _output, _unaliased
 from .convolution_utils import (
     FULL,
     SAME,
@@ -24,7 +32,6 @@ from .convolution_utils import (
     CIRCULAR,
     REFLECT,
     PAD,
-    _iDivUp,
     _valfrommode,
     _bvalfromboundary,
 )
@@ -44,6 +51,7 @@ extern "C" {
             const int kerW,
             const int mode,
             const bool swapped_inputs,
+            const int symmetry,
             ${datatype} * __restrict__ out,
             const int outW) {
 
@@ -55,7 +63,40 @@ extern "C" {
 
             ${datatype} temp {};
 
-            if ( mode == 0 ) {  // Valid
+            if ( symmetry != 0 ) {
+                // Linear-phase kernel: add mirrored samples, then
+                // multiply once per pair of taps
+                int start {};
+                if ( mode == 0 ) {  // Valid
+                    start = tid;
+                } else if ( mode == 1 ) {   // Same
+                    if ( !swapped_inputs ) {
+                        start = 0 - ( kerW / 2 ) + tid;
+                    } else {
+                        start = ( ( inpW - 1 ) / 2 ) - ( kerW - 1 ) + tid;
+                    }
+                } else {    // Full
+                    start = 0 - ( kerW - 1 ) + tid;
+                }
+                for ( int j = 0; j < kerW / 2; j++ ) {
+                    const int a { start + j };
+                    const int b { start + kerW - 1 - j };
+                    ${datatype} x_a {};
+                    ${datatype} x_b {};
+                    if ( a >= 0 && a < inpW ) {
+                        x_a = inp[a];
+                    }
+                    if ( b >= 0 && b < inpW ) {
+                        x_b = inp[b];
+                    }
+                    temp += ( symmetry > 0 ? x_a + x_b : x_b - x_a )
+                        * kernel[j];
+                }
+                const int m { start + kerW / 2 };
+                if ( symmetry > 0 && ( kerW & 1 ) && m >= 0 && m < inpW ) {
+                    temp += inp[m] * kernel[kerW / 2];
+                }
+            } else if ( mode == 0 ) {  // Valid
                 if ( tid >= 0 && tid < inpW ) {
                     for ( int j = 0; j < kerW; j++ ) {
                         temp += inp[tid + j] * kernel[( kerW - 1 ) - j];
@@ -178,6 +219,7 @@ extern "C" {
             const int kerW,
             const int mode,
             const bool swapped_inputs,
+            const int symmetry,
             ${datatype} * __restrict__ out,
             const int outW) {
 
@@ -188,7 +230,40 @@ extern "C" {
         for ( int tid = tx; tid < outW; tid += stride ) {
             ${datatype} temp {};
 
-            if ( mode == 0 ) {  // Valid
+            if ( symmetry != 0 ) {
+                // Linear-phase kernel: add mirrored samples, then
+                // multiply once per pair of taps
+                int start {};
+                if ( mode == 0 ) {  // Valid
+                    start = tid;
+                } else if ( mode == 1 ) {   // Same
+                    if ( !swapped_inputs ) {
+                        start = 0 - ( kerW / 2 ) + tid;
+                    } else {
+                        start = ( ( inpW - 1 ) / 2 ) - ( kerW - 1 ) + tid;
+                    }
+                } else {    // Full
+                    start = 0 - ( kerW - 1 ) + tid;
+                }
+                for ( int j = 0; j < kerW / 2; j++ ) {
+                    const int a { start + j };
+                    const int b { start + kerW - 1 - j };
+                    ${datatype} x_a {};
+                    ${datatype} x_b {};
+                    if ( a >= 0 && a < inpW ) {
+                        x_a = inp[a];
+                    }
+                    if ( b >= 0 && b < inpW ) {
+                        x_b = inp[b];
+                    }
+                    temp += ( symmetry > 0 ? x_a + x_b : x_a - x_b )
+                        * kernel[j];
+                }
+                const int m { start + kerW / 2 };
+                if ( symmetry > 0 && ( kerW & 1 ) && m >= 0 && m < inpW ) {
+                    temp += inp[m] * kernel[kerW / 2];
+                }
+            } else if ( mode == 0 ) {  // Valid
                 if ( tid >= 0 && tid < inpW ) {
                     for ( int j = 0; j < kerW; j++ ) {
                         temp += inp[tid + j] * kernel[j];
@@ -305,6 +380,38 @@ extern "C" {
 )
 
 
+_CONVOLVE_TYPES = [
+    "int32",
+    "int64",
+    "float32",
+    "float64",
+    "complex64",
+    "complex128",
+]
+
+_register_kernel(
+    GPUKernel.CONVOLVE, _cupy_convolve_src, "_cupy_convolve", _CONVOLVE_TYPES,
+)
+_register_kernel(
+    GPUKernel.CORRELATE,
+    _cupy_correlate_src,
+    "_cupy_correlate",
+    _CONVOLVE_TYPES,
+)
+_register_kernel(
+    GPUKernel.CONVOLVE2D,
+    _cupy_convolve_2d_src,
+    "_cupy_convolve_2d",
+    _CONVOLVE_TYPES,
+)
+_register_kernel(
+    GPUKernel.CORRELATE2D,
+    _cupy_correlate_2d_src,
+    "_cupy_correlate_2d",
+    _CONVOLVE_TYPES,
+)
+
+
 class _cupy_convolve_wrapper(object):
     def __init__(self, grid, block, kernel):
         if isinstance(grid, int):
@@ -317,7 +424,7 @@ class _cupy_convolve_wrapper(object):
         self.kernel = kernel
 
     def __call__(
-        self, d_inp, d_kernel, mode, swapped_inputs, out,
+        self, d_inp, d_kernel, mode, swapped_inputs, symmetry, out,
     ):
 
         kernel_args = (
@@ -327,6 +434,7 @@ class _cupy_convolve_wrapper(object):
             d_kernel.shape[0],
             mode,
             swapped_inputs,
+            symmetry,
             out,
             out.shape[0],
         )
@@ -370,9 +478,9 @@ class _cupy_convolve_2d_wrapper(object):
 def _get_backend_kernel(
     dtype, grid, block, k_type,
 ):
-    from ..utils.compile_kernels import GPUKernel
+    from ..utils.compile_kernels import _populate_kernel_cache
 
-    kernel = _cupy_kernel_cache[(str(dtype), k_type.value)]
+    kernel = _populate_kernel_cache(dtype, k_type)
     if kernel:
         if k_type == GPUKernel.CONVOLVE or k_type == GPUKernel.CORRELATE:
             return _cupy_convolve_wrapper(grid, block, kernel)
@@ -390,32 +498,66 @@ def _get_backend_kernel(
         )
 
 
-def _convolve_gpu(
+def _convolve_cpu(
     inp, out, ker, mode, use_convolve, swapped_inputs,
 ):
-    from ..utils.compile_kernels import _populate_kernel_cache, GPUKernel
+    """Host implementation of `_cupy_convolve`/`_cupy_correlate`"""
+    if not use_convolve:
+        ker = ker[::-1]
+
+    full = np.convolve(inp, ker, "full")
+
+    if mode == VALID:
+        start = ker.shape[0] - 1
+    elif mode == SAME:
+        if not swapped_inputs:
+            start = (ker.shape[0] - 1) // 2
+        else:
+            start = (inp.shape[0] - 1) // 2
+    else:
+        start = 0
 
-    d_inp = cp.array(inp)
-    d_kernel = cp.array(ker)
+    out[...] = full[start : start + out.shape[0]]
+    if swapped_inputs and not use_convolve:
+        out[...] = out[::-1].copy()
 
-    device_id = cp.cuda.Device()
-    numSM = device_id.attributes["MultiProcessorCount"]
+    return out
 
-    threadsperblock = 256
-    blockspergrid = numSM * 20
+
+def _convolve_gpu(
+    inp, out, ker, mode, use_convolve, swapped_inputs, detect_symmetry,
+):
+    d_inp = cp.ascontiguousarray(inp)
+    d_kernel = cp.ascontiguousarray(ker)
 
     if use_convolve:
-        _populate_kernel_cache(out.dtype, GPUKernel.CONVOLVE)
-        kernel = _get_backend_kernel(
-            out.dtype, blockspergrid, threadsperblock, GPUKernel.CONVOLVE,
-        )
+        k_type = GPUKernel.CONVOLVE
     else:
-        _populate_kernel_cache(out.dtype, GPUKernel.CORRELATE)
+        k_type = GPUKernel.CORRELATE
+
+    # Linear-phase kernels take half the multiplies. Detecting them waits
+    # for the device, so it is left to callers reusing the same taps.
+    symmetry = 0
+    if detect_symmetry and d_kernel.size <= d_inp.size:
+        symmetry, start, stop = _fir_symmetry(d_kernel)
+        if start != 0 or stop != d_kernel.size:
+            symmetry = 0
+
+    def launch(blockspergrid, threadsperblock):
         kernel = _get_backend_kernel(
-            out.dtype, blockspergrid, threadsperblock, GPUKernel.CORRELATE,
+            out.dtype, blockspergrid, threadsperblock, k_type,
         )
-
-    kernel(d_inp, d_kernel, mode, swapped_inputs, out)
+        kernel(d_inp, d_kernel, mode, swapped_inputs, symmetry, out)
+
+    launch(
+        *_get_launch_config(
+            k_type,
+            out.dtype,
+            out.size * d_kernel.size,
+            _grid_stride_configs(256),
+            launch,
+        )
+    )
 
     return out
 
@@ -423,8 +565,6 @@ def _convolve_gpu(
 def _convolve2d_gpu(
     inp, out, ker, mode, boundary, use_convolve, fillvalue,
 ):
-    from ..utils.compile_kernels import _populate_kernel_cache, GPUKernel
-
     if (boundary != PAD) and (boundary != REFLECT) and (boundary != CIRCULAR):
         raise Exception("Invalid boundary flag")
 
@@ -495,46 +635,52 @@ def _convolve2d_gpu(
     outW = out.shape[1]
     outH = out.shape[0]
 
-    d_inp = cp.array(inp)
-    d_kernel = cp.array(ker)
-
-    threadsperblock = (16, 16)
-    blockspergrid = (
-        _iDivUp(out.shape[1], threadsperblock[0]),
-        _iDivUp(out.shape[0], threadsperblock[1]),
-    )
+    d_inp = cp.ascontiguousarray(inp)
+    d_kernel = cp.ascontiguousarray(ker)
 
     if use_convolve:
-        _populate_kernel_cache(out.dtype, GPUKernel.CONVOLVE2D)
-        kernel = _get_backend_kernel(
-            out.dtype, blockspergrid, threadsperblock, GPUKernel.CONVOLVE2D,
-        )
+        k_type = GPUKernel.CONVOLVE2D
     else:
-        _populate_kernel_cache(out.dtype, GPUKernel.CORRELATE2D)
+        k_type = GPUKernel.CORRELATE2D
+
+    def launch(blockspergrid, threadsperblock):
         kernel = _get_backend_kernel(
-            out.dtype, blockspergrid, threadsperblock, GPUKernel.CORRELATE2D,
+            out.dtype, blockspergrid, threadsperblock, k_type,
+        )
+        kernel(
+            d_inp, paddedW, paddedH, d_kernel, S[0], S[1], out, outW, outH,
+            pick,
         )
 
-    kernel(
-        d_inp, paddedW, paddedH, d_kernel, S[0], S[1], out, outW, outH, pick
+    launch(
+        *_get_launch_config(
+            k_type,
+            out.dtype,
+            out.size * d_kernel.size,
+            _grid_2d_configs((outW, outH)),
+            launch,
+        )
     )
 
     return out
 
 
 def _convolve(
-    in1, in2, use_convolve, swapped_inputs, mode,
+    in1, in2, use_convolve, swapped_inputs, mode, out=None,
+    detect_symmetry=False,
 ):
 
     val = _valfrommode(mode)
 
+    xp = get_array_module(in1, in2)
+
     # Promote inputs
-    promType = cp.promote_types(in1.dtype, in2.dtype)
-    in1 = in1.astype(promType)
-    in2 = in2.astype(promType)
+    promType = xp.promote_types(in1.dtype, in2.dtype)
+    in1 = in1.astype(promType, copy=False)
+    in2 = in2.astype(promType, copy=False)
 
-    # Create empty array to hold number of aout dimensions
-    out_dimens = np.empty(in1.ndim, np.int)
+    # Create list to hold number of out dimensions
+    out_dimens = [0] * in1.ndim
     if val == VALID:
         for i in range(in1.ndim):
             out_dimens[i] = (
@@ -559,10 +705,17 @@ def _convolve(
     else:
         raise Exception("mode must be 0 (valid), 1 (same), or 2 (full)")
 
-    # Create empty array out on GPU
-    out = cp.empty(out_dimens.tolist(), in1.dtype)
+    # Create empty output array on the active backend
+    out = _output(out, out_dimens, in1.dtype, xp, "convolve.out")
+    in1 = _unaliased(in1, out, xp)
+    in2 = _unaliased(in2, out, xp)
+
+    if xp is np:
+        return _convolve_cpu(in1, out, in2, val, use_convolve, swapped_inputs)
 
-    out = _convolve_gpu(in1, out, in2, val, use_convolve, swapped_inputs,)
+    out = _convolve_gpu(
+        in1, out, in2, val, use_convolve, swapped_inputs, detect_symmetry,
+    )
 
     return out
 
@@ -574,8 +727,8 @@ def _convolve2d(in1, in2, use_convolve, mode, boundary, fillvalue):
 
     # Promote inputs
     promType = cp.promote_types(in1.dtype, in2.dtype)
-    in1 = in1.astype(promType)
-    in2 = in2.astype(promType)
+    in1 = in1.astype(promType, copy=False)
+    in2 = in2.astype(promType, copy=False)
 
     if (bval != PAD) and (bval != REFLECT) and (bval != CIRCULAR):
         raise Exception("Incorrect boundary value.")
@@ -595,8 +748,8 @@ def _convolve2d(in1, in2, use_convolve, mode, boundary, fillvalue):
         if fill is None:
             raise Exception("Unable to create fill array")
 
-    # Create empty array to hold number of aout dimensions
-    out_dimens = np.empty(in1.ndim, np.int)
+    # Create list to hold number of out dimensions
+    out_dimens = [0] * in1.ndim
     if val == VALID:
         for i in range(in1.ndim):
             out_dimens[i] = in1.shape[i] - in2.shape[i] + 1
@@ -615,7 +768,9 @@ def _convolve2d(in1, in2, use_convolve, mode, boundary, fillvalue):
         raise Exception("mode must be 0 (valid), 1 (same), or 2 (full)")
 
     # Create empty array out on GPU
-    out = cp.empty(out_dimens.tolist(), in1.dtype)
+    out = _empty(out_dimens, in1.dtype, cp, "convolve2d.out")
+    in1 = _unaliased(in1, out, cp)
+    in2 = _unaliased(in2, out, cp)
 
     out = _convolve2d_gpu(in1, out, in2, val, bval, use_convolve, fill,)
 
@@ -11,9 +11,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cupy import ndarray, array, asarray
-import cupy as cp
+from cupy import array, asarray
 
+import math
 import timeit
 
 FULL = 2
@@ -83,7 +83,7 @@ def _numeric_arrays(arrays, kinds="buifc"):
         the ndarrays are not in this string the function returns False and
         otherwise returns True.
     """
-    if type(arrays) == ndarray:
+    if hasattr(arrays, "dtype"):
         return arrays.dtype.kind in kinds
     for array_ in arrays:
         if array_.dtype.kind not in kinds:
@@ -148,7 +148,7 @@ def _fftconv_faster(x, h, mode):
     # convolution method is faster (discussed in scikit-image PR #1792)
     direct_time = x.size * h.size * _prod(out_shape)
     fft_time = sum(
-        n * cp.log(n) for n in (x.shape + h.shape + tuple(out_shape))
+        n * math.log(n) for n in (x.shape + h.shape + tuple(out_shape))
     )
 
     return big_O_constant * fft_time < direct_time
@@ -12,10 +12,13 @@
 # limitations under the License.
 
 import cupy as cp
+import numpy as np
 import sys
 
 from cupyx.scipy import fftpack
 
+from ..utils.backend import get_array_module, _asarray
+from ..utils.memory import _copy_to
 from ..utils.fftpack_helper import (
     _init_nd_shape_and_axes_sorted,
     next_fast_len,
@@ -33,7 +36,7 @@ _modedict = {"valid": 0, "same": 1, "full": 2}
 
 
 def convolve(
-    in1, in2, mode="full", method="auto",
+    in1, in2, mode="full", method="auto", out=None, detect_symmetry=False,
 ):
     """
     Convolve two N-dimensional arrays.
@@ -72,6 +75,14 @@ def convolve(
         ``auto``
            Automatically chooses direct or Fourier method based on an estimate
            of which is faster (default).
+    out : ndarray, optional
+        Array the output is written to. It must have the shape and data
+        type of the output, and be C-contiguous with the 'direct' method.
+    detect_symmetry : bool, optional
+        If True, check whether the shorter input is symmetric or
+        antisymmetric, and if so compute the 'direct' convolution with half
+        the multiplies. The check waits for the device, so it only pays
+        off for long inputs. Default is False.
 
     Returns
     -------
@@ -119,11 +130,12 @@ def convolve(
 
     """
 
-    volume = cp.asarray(in1)
-    kernel = cp.asarray(in2)
+    xp = get_array_module(in1, in2)
+    volume = _asarray(in1, xp)
+    kernel = _asarray(in2, xp)
 
     if volume.ndim == kernel.ndim == 0:
-        return volume * kernel
+        return _copy_to(out, volume * kernel, xp)
     elif volume.ndim != kernel.ndim:
         raise ValueError("in1 and in2 should have the same dimensionality")
 
@@ -136,11 +148,11 @@ def convolve(
         method = choose_conv_method(volume, kernel, mode=mode)
 
     if method == "fft":
-        out = fftconvolve(volume, kernel, mode=mode)
-        result_type = cp.result_type(volume, kernel)
+        result = fftconvolve(volume, kernel, mode=mode)
+        result_type = xp.result_type(volume, kernel)
         if result_type.kind in {"u", "i"}:
-            out = cp.around(out)
-        return out.astype(result_type)
+            result = xp.around(result)
+        return _copy_to(out, result.astype(result_type, copy=False), xp)
     elif method == "direct":
 
         if volume.ndim > 1:
@@ -152,7 +164,7 @@ def convolve(
             volume, kernel = kernel, volume
 
         return _convolution_cuda._convolve(
-            volume, kernel, True, swapped_inputs, mode
+            volume, kernel, True, swapped_inputs, mode, out, detect_symmetry
         )
 
     else:
@@ -245,6 +257,13 @@ def fftconvolve(in1, in2, mode="full", axes=None):
     >>> fig.show()
 
     """
+    if get_array_module(in1, in2) is np:
+        from scipy import signal
+
+        return signal.fftconvolve(
+            _asarray(in1, np), _asarray(in2, np), mode=mode, axes=axes
+        )
+
     in1 = cp.asarray(in1)
     in2 = cp.asarray(in2)
     noaxes = axes is None
@@ -484,8 +503,9 @@ def choose_conv_method(in1, in2, mode="full", measure=False):
     >>> conv2 = cusignal.convolve(c, d, mode='same', method=method)
 
     """
-    volume = cp.asarray(in1)
-    kernel = cp.asarray(in2)
+    xp = get_array_module(in1, in2)
+    volume = _asarray(in1, xp)
+    kernel = _asarray(in2, xp)
 
     if measure:
         times = {}
@@ -499,7 +519,7 @@ def choose_conv_method(in1, in2, mode="full", measure=False):
 
     # fftconvolve doesn't support complex256
     fftconv_unsup = "complex256" if sys.maxsize > 2 ** 32 else "complex192"
-    if hasattr(cp, fftconv_unsup):
+    if hasattr(np, fftconv_unsup):
         if volume.dtype == fftconv_unsup or kernel.dtype == fftconv_unsup:
             return "direct"
 
@@ -507,9 +527,9 @@ def choose_conv_method(in1, in2, mode="full", measure=False):
     # catch when more precision required than float provides (representing an
     # integer as float can lose precision in fftconvolve if larger than 2**52)
     if any([_numeric_arrays([x], kinds="ui") for x in [volume, kernel]]):
-        max_value = int(cp.abs(volume).max()) * int(cp.abs(kernel).max())
+        max_value = int(xp.abs(volume).max()) * int(xp.abs(kernel).max())
         max_value *= int(min(volume.size, kernel.size))
-        if max_value > 2 ** cp.finfo("float").nmant - 1:
+        if max_value > 2 ** np.finfo("float").nmant - 1:
             return "direct"
 
     if _numeric_arrays([volume, kernel], kinds="b"):
@@ -13,6 +13,8 @@
 
 import cupy as cp
 
+from ..utils.backend import get_array_module, _asarray
+from ..utils.memory import _copy_to
 from . import _convolution_cuda
 
 from .convolve import convolve
@@ -22,7 +24,7 @@ _modedict = {"valid": 0, "same": 1, "full": 2}
 
 
 def correlate(
-    in1, in2, mode="full", method="auto",
+    in1, in2, mode="full", method="auto", out=None, detect_symmetry=False,
 ):
     r"""
     Cross-correlate two N-dimensional arrays.
@@ -61,6 +63,14 @@ def correlate(
         ``auto``
            Automatically chooses direct or Fourier method based on an estimate
            of which is faster (default).  See `convolve` Notes for more detail.
+    out : ndarray, optional
+        Array the output is written to. It must have the shape and data
+        type of the output, and be C-contiguous with the 'direct' method.
+    detect_symmetry : bool, optional
+        If True, check whether the shorter input is symmetric or
+        antisymmetric, and if so compute the 'direct' correlation with half
+        the multiplies. The check waits for the device, so it only pays
+        off for long inputs. Default is False.
 
     Returns
     -------
@@ -126,17 +136,20 @@ def correlate(
 
     """
 
-    in1 = cp.asarray(in1)
-    in2 = cp.asarray(in2)
+    xp = get_array_module(in1, in2)
+    in1 = _asarray(in1, xp)
+    in2 = _asarray(in2, xp)
 
     if in1.ndim == in2.ndim == 0:
-        return in1 * in2.conj()
+        return _copy_to(out, in1 * in2.conj(), xp)
     elif in1.ndim != in2.ndim:
         raise ValueError("in1 and in2 should have the same dimensionality")
 
     # this either calls fftconvolve or this function with method=='direct'
     if method in ("fft", "auto"):
-        return convolve(in1, _reverse_and_conj(in2), mode, method)
+        return convolve(
+            in1, _reverse_and_conj(in2), mode, method, out, detect_symmetry
+        )
 
     elif method == "direct":
 
@@ -149,7 +162,7 @@ def correlate(
             in1, in2 = in2, in1
 
         return _convolution_cuda._convolve(
-            in1, in2, False, swapped_inputs, mode
+            in1, in2, False, swapped_inputs, mode, out, detect_symmetry
         )
 
     else:
@@ -15,5 +15,6 @@ from cusignal.filter_design.fir_filter_design import (
     kaiser_beta,
     kaiser_atten,
     firwin,
+    cic_compensator,
     cmplx_sort
 ) 
\ No newline at end of file
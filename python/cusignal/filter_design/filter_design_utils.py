@@ -11,12 +11,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import cupy as cp
+import numpy as np
+
+from ..utils.backend import get_array_module
 
 
 def _validate_sos(sos):
     """Helper to validate a SOS input"""
-    sos = cp.atleast_2d(sos)
+    xp = get_array_module(sos)
+    sos = xp.atleast_2d(sos)
     if sos.ndim != 2:
         raise ValueError('sos array must be 2D')
     n_sections, m = sos.shape
@@ -25,3 +28,45 @@ def _validate_sos(sos):
     if not (sos[:, 3] == 1).all():
         raise ValueError('sos[:, 3] should be all ones')
     return sos, n_sections
+
+
+def _fir_symmetry(h):
+    """
+    Helper to detect linear-phase FIR taps. Return ``(symmetry, start,
+    stop)``, where ``h[start:stop]`` is symmetric if `symmetry` is 1, or
+    antisymmetric if it is -1, and the taps outside are zero. `symmetry`
+    is 0 if `h` has neither structure.
+
+    Designed filters are only symmetric up to rounding, so mirrored
+    floating-point taps may differ by a few ulps of the largest tap.
+    """
+    # Reduced where `h` lives, so that only the result leaves the device
+    xp = get_array_module(h)
+    n = h.size
+    nonzero = h != 0
+    start = xp.argmax(nonzero)
+    stop = n - xp.argmax(nonzero[::-1])
+    i = xp.arange(n)
+    outside = (i < start) | (i >= stop)
+    mirrored = h[xp.clip(start + stop - 1 - i, 0, n - 1)]
+    tol = 0
+    if h.dtype.kind in "fc":
+        tol = 8 * np.finfo(h.dtype).eps * xp.abs(h).max()
+    flags = xp.stack(
+        [
+            nonzero.sum(),
+            start,
+            stop,
+            xp.all(outside | (xp.abs(h - mirrored) <= tol)),
+            xp.all(outside | (xp.abs(h + mirrored) <= tol)),
+        ]
+    ).astype(np.int64)
+    count, start, stop, symmetric, antisymmetric = flags.tolist()
+    if count < 2:
+        return 0, 0, n
+
+    if symmetric:
+        return 1, start, stop
+    if antisymmetric:
+        return -1, start, stop
+    return 0, 0, n
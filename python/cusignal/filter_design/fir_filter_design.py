@@ -12,6 +12,9 @@
 # limitations under the License.
 
 import cupy as cp
+import numpy as np
+
+from ..utils.backend import get_array_module
 from ..windows.windows import get_window
 
 
@@ -275,6 +278,82 @@ def firwin(numtaps, cutoff, width=None, window='hamming', pass_zero=True,
     return h
 
 
+def cic_compensator(numtaps, rate, order=4, delay=1, cutoff=0.5,
+                    window='hamming'):
+    """
+    Design an FIR filter compensating the passband droop of a CIC filter.
+
+    The filter runs at the low rate of a cascaded integrator-comb filter,
+    i.e. after `cic_decimate` or before `cic_interpolate`. Its gain is
+    the inverse of the CIC magnitude response up to `cutoff`, and zero
+    above it.
+
+    Parameters
+    ----------
+    numtaps : int
+        Length of the filter. It must be odd if the gain at the Nyquist
+        frequency is not zero.
+    rate : int
+        Rate change of the CIC filter.
+    order : int, optional
+        Order of the CIC filter. Default is 4.
+    delay : int, optional
+        Differential delay of the CIC filter. Default is 1.
+    cutoff : float, optional
+        Edge of the passband, relative to the Nyquist frequency at the
+        low rate. Must be between 0 and 1. Default is 0.5.
+    window : string or tuple of string and parameter values, optional
+        Window used in the frequency sampling design. Default is
+        'hamming'.
+
+    Returns
+    -------
+    h : (numtaps,) ndarray
+        Coefficients of the compensation filter.
+
+    See Also
+    --------
+    cic_decimate
+    cic_interpolate
+
+    Notes
+    -----
+    The filter is designed on the host with `scipy.signal.firwin2`, from
+    the CIC response
+
+    .. math:: |H(f)| = \\left|\\frac{\\sin(\\pi f M)}
+              {R M \\sin(\\pi f / R)}\\right|^N
+
+    where ``f`` is in cycles per low-rate sample, ``R`` is `rate`, ``N``
+    is `order` and ``M`` is `delay`.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> h = cusignal.cic_compensator(31, 64, order=5)
+    >>> x = cp.random.randn(2 ** 20)
+    >>> y = cusignal.cic_decimate(x, 64, order=5, compensate=h)
+    """
+    from scipy import signal
+
+    if not 0 < cutoff < 1:
+        raise ValueError("cutoff must be between 0 and 1")
+
+    # Frequencies in cycles per low-rate sample
+    f = np.linspace(0, cutoff, 256) / 2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cic = np.sin(np.pi * f * delay) / (
+            rate * delay * np.sin(np.pi * f / rate))
+    cic[0] = 1.0
+    gain = np.abs(cic) ** -float(order)
+
+    h = signal.firwin2(numtaps, np.r_[2 * f, cutoff, 1.0],
+                       np.r_[gain, 0.0, 0.0], window=window)
+
+    return get_array_module().asarray(h)
+
+
 def cmplx_sort(p):
     """Sort roots based on magnitude.
 
@@ -16,13 +16,32 @@ from cusignal.filtering.resample import (
     resample,
     resample_poly,
     upfirdn,
+    StreamingUpFIRDn,
+    StreamingResamplePoly,
+    ResamplePlan,
+    ResampleStage,
+    cic_decimate,
+    cic_interpolate,
+    StreamingCICDecimator,
+    StreamingCICInterpolator,
+    resample_filter_cache_info,
+    clear_resample_filter_cache,
 )
 from cusignal.filtering.filtering import (
     wiener,
     lfiltic,
+    lfilter,
     sosfilt,
+    sosfilt_zi,
+    sosfiltfilt,
+    SosFilter,
     hilbert,
     hilbert2,
     detrend,
     freq_shift,
 )
+from cusignal.filtering.channelize import (
+    channelize,
+    synthesize_channels,
+    ddc,
+)
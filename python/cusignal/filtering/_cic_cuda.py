@@ -0,0 +1,474 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cupy as cp
+import numpy as np
+
+from string import Template
+
+from ..utils._registry import _C_TYPES, GPUKernel, _register_kernel
+from ..utils.autotune import _get_launch_config, _grid_stride_configs
+from ..utils.memory import _empty
+from ._upfirdn_cuda import _batch_strides, _pad_h, _upfirdn_cpu
+
+# Size of the comb delay lines held by each thread
+_CIC_MAX_ORDER = 10
+_CIC_MAX_DELAY = 2
+
+# Each thread computes a run of outputs, after restarting the
+# integrators from zero state a filter length before the first one.
+# The recursion is exact for any such restart, since a CIC filter is an
+# FIR filter. Integers wrap around in unsigned accumulators.
+_cupy_cic_decimate_src = Template(
+    """
+$header
+
+extern "C" {
+    __global__ void _cupy_cic_decimate(
+            const ${datatype} * __restrict__ inp,
+            const long long s_pre,
+            const long long s_axis,
+            const long long s_post,
+            const int x_shape_a,
+            const int rate,
+            const int order,
+            const int delay,
+            const long long phase,
+            const int chunk,
+            const double scale,
+            ${out_type} * __restrict__ out,
+            const int n_out,
+            const int n_post,
+            const int n_blocks,
+            const long long n_tasks) {
+
+        const long long tx {
+            static_cast<long long>(blockIdx.x * blockDim.x + threadIdx.x) };
+        const long long stride {
+            static_cast<long long>(blockDim.x * gridDim.x) };
+
+        for ( long long tid = tx; tid < n_tasks; tid += stride ) {
+            const int q { static_cast<int>(tid % n_post) };
+            const long long r { tid / n_post };
+            const int b { static_cast<int>(r % n_blocks) };
+            const int p { static_cast<int>(r / n_blocks) };
+            const ${datatype} * __restrict__ row {
+                inp + p * s_pre + q * s_post };
+            ${out_type} * __restrict__ out_row {
+                out + static_cast<long long>(p) * n_out * n_post + q };
+
+            // Output m is the integrator output at input m * rate + phase
+            const int m0 { b * chunk };
+            const int m1 { min(m0 + chunk, n_out) };
+            const int n_comb { order * delay };
+            const long long n_first {
+                static_cast<long long>(m0 - n_comb) * rate + phase + 1 };
+            const long long n_last {
+                static_cast<long long>(m1 - 1) * rate + phase };
+
+            ${acc_type} integ[${max_order}] {};
+            ${acc_type} lines[${max_order} * ${max_delay}] {};
+            int m { m0 - n_comb + 1 };
+            int count { rate == 1 ? 0 : 1 };
+            int slot { 0 };
+
+            for ( long long n = n_first; n <= n_last; n++ ) {
+                ${acc_type} v {};
+                if ( n >= 0 && n < x_shape_a ) {
+                    v = static_cast<${acc_type}>(
+                        static_cast<${wide_type}>(row[n * s_axis]) );
+                }
+                for ( int k = 0; k < order; k++ ) {
+                    integ[k] += v;
+                    v = integ[k];
+                }
+                if ( count == 0 ) {
+                    for ( int k = 0; k < order; k++ ) {
+                        const ${acc_type} old { lines[k * delay + slot] };
+                        lines[k * delay + slot] = v;
+                        v -= old;
+                    }
+                    slot = ( slot + 1 == delay ) ? 0 : slot + 1;
+                    if ( m >= m0 ) {
+                        out_row[static_cast<long long>(m) * n_post] =
+                            ${store};
+                    }
+                    m++;
+                }
+                count = ( count + 1 == rate ) ? 0 : count + 1;
+            }
+        }
+    }
+}
+"""
+)
+
+_cupy_cic_interpolate_src = Template(
+    """
+$header
+
+extern "C" {
+    __global__ void _cupy_cic_interpolate(
+            const ${datatype} * __restrict__ inp,
+            const long long s_pre,
+            const long long s_axis,
+            const long long s_post,
+            const int x_shape_a,
+            const int rate,
+            const int order,
+            const int delay,
+            const long long phase,
+            const int chunk,
+            const double scale,
+            ${out_type} * __restrict__ out,
+            const int n_out,
+            const int n_post,
+            const int n_blocks,
+            const long long n_tasks) {
+
+        const long long tx {
+            static_cast<long long>(blockIdx.x * blockDim.x + threadIdx.x) };
+        const long long stride {
+            static_cast<long long>(blockDim.x * gridDim.x) };
+
+        for ( long long tid = tx; tid < n_tasks; tid += stride ) {
+            const int q { static_cast<int>(tid % n_post) };
+            const long long r { tid / n_post };
+            const int b { static_cast<int>(r % n_blocks) };
+            const int p { static_cast<int>(r / n_blocks) };
+            const ${datatype} * __restrict__ row {
+                inp + p * s_pre + q * s_post };
+            ${out_type} * __restrict__ out_row {
+                out + static_cast<long long>(p) * n_out * n_post + q };
+
+            // Output t is the integrator output at t + phase, where input
+            // i is upsampled to i * rate
+            const long long k0 {
+                static_cast<long long>(b) * chunk * rate + phase };
+            const long long k1 { min(
+                k0 + static_cast<long long>(chunk) * rate,
+                static_cast<long long>(n_out) + phase ) };
+            const long long numtaps {
+                static_cast<long long>(order) * (rate * delay - 1) + 1 };
+            long long i_first { k0 - numtaps + 1 };
+            i_first = ( i_first >= 0 ) ? i_first / rate
+                : -( ( rate - 1 - i_first ) / rate );
+
+            ${acc_type} integ[${max_order}] {};
+            ${acc_type} lines[${max_order} * ${max_delay}] {};
+            int slot { 0 };
+
+            for ( long long i = i_first; i * rate < k1; i++ ) {
+                ${acc_type} v {};
+                if ( i >= 0 && i < x_shape_a ) {
+                    v = static_cast<${acc_type}>(
+                        static_cast<${wide_type}>(row[i * s_axis]) );
+                }
+                for ( int k = 0; k < order; k++ ) {
+                    const ${acc_type} old { lines[k * delay + slot] };
+                    lines[k * delay + slot] = v;
+                    v -= old;
+                }
+                slot = ( slot + 1 == delay ) ? 0 : slot + 1;
+
+                // Zeros between the upsampled inputs
+                for ( long long k = i * rate; k < ( i + 1 ) * rate; k++ ) {
+                    for ( int j = 0; j < order; j++ ) {
+                        integ[j] += v;
+                        v = integ[j];
+                    }
+                    v = 0;
+                    if ( k >= k0 && k < k1 ) {
+                        out_row[( k - phase ) * n_post] = ${store_last};
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+)
+
+
+_CIC_TYPES = [
+    "int8",
+    "uint8",
+    "int16",
+    "uint16",
+    "int32",
+    "uint32",
+    "float32",
+    "float64",
+    "complex64",
+    "complex128",
+]
+
+
+def _cic_substitutions(np_type):
+    """Accumulator and output types of the CIC kernels for `np_type`"""
+    max_sizes = {"max_order": _CIC_MAX_ORDER, "max_delay": _CIC_MAX_DELAY}
+    kind = np.dtype(np_type).kind
+    if kind in "iu":
+        # Exact in two's complement, wrapping around without overflow
+        return dict(
+            max_sizes,
+            acc_type="unsigned long long",
+            wide_type="long long",
+            out_type="long long",
+            store="static_cast<long long>(v)",
+            store_last="static_cast<long long>(integ[order - 1])",
+        )
+
+    acc_type = "complex<double>" if kind == "c" else "double"
+    return dict(
+        max_sizes,
+        acc_type=acc_type,
+        wide_type=acc_type,
+        out_type=_C_TYPES[np_type],
+        store="static_cast<%s>(v * scale)" % _C_TYPES[np_type],
+        store_last="static_cast<%s>(integ[order - 1] * scale)"
+        % _C_TYPES[np_type],
+    )
+
+
+_register_kernel(
+    GPUKernel.CIC_DECIMATE,
+    _cupy_cic_decimate_src,
+    "_cupy_cic_decimate",
+    _CIC_TYPES,
+    substitutions=_cic_substitutions,
+)
+_register_kernel(
+    GPUKernel.CIC_INTERPOLATE,
+    _cupy_cic_interpolate_src,
+    "_cupy_cic_interpolate",
+    _CIC_TYPES,
+    substitutions=_cic_substitutions,
+)
+
+
+class _cupy_cic_wrapper(object):
+    def __init__(self, grid, block, kernel):
+        if isinstance(grid, int):
+            grid = (grid,)
+        if isinstance(block, int):
+            block = (block,)
+
+        self.grid = grid
+        self.block = block
+        self.kernel = kernel
+
+    def __call__(
+        self,
+        x,
+        x_strides,
+        x_shape_a,
+        rate,
+        order,
+        delay,
+        phase,
+        chunk,
+        scale,
+        out,
+        out_shape,
+        n_blocks,
+    ):
+
+        kernel_args = (
+            x,
+            *x_strides,
+            x_shape_a,
+            rate,
+            order,
+            delay,
+            np.int64(phase),
+            chunk,
+            np.float64(scale),
+            out,
+            out_shape[1],
+            out_shape[2],
+            n_blocks,
+            np.int64(out_shape[0] * n_blocks * out_shape[2]),
+        )
+
+        self.kernel(self.grid, self.block, kernel_args)
+
+
+def _get_backend_kernel(dtype, grid, block, k_type):
+    from ..utils.compile_kernels import _populate_kernel_cache
+
+    kernel = _populate_kernel_cache(dtype, k_type)
+    if kernel:
+        return _cupy_cic_wrapper(grid, block, kernel)
+    else:
+        raise ValueError(
+            "Kernel {} not found in _cupy_kernel_cache".format(k_type)
+        )
+
+
+def _cic_taps(rate, order, delay):
+    """Integer taps of the FIR filter equivalent to a CIC filter"""
+    h = np.ones(1, np.int64)
+    for _ in range(order):
+        h = np.convolve(h, np.ones(rate * delay, np.int64))
+    return h
+
+
+class _CIC(object):
+    def __init__(self, rate, order, delay, interpolate, x_dtype, xp):
+        """Helper for CIC decimation and interpolation"""
+        self._rate = int(rate)
+        self._order = int(order)
+        self._delay = int(delay)
+        if self._rate < 1:
+            raise ValueError("The rate change must be >= 1")
+        if not 1 <= self._order <= _CIC_MAX_ORDER:
+            raise ValueError(
+                "order must be between 1 and %d" % _CIC_MAX_ORDER
+            )
+        if not 1 <= self._delay <= _CIC_MAX_DELAY:
+            raise ValueError(
+                "delay must be between 1 and %d" % _CIC_MAX_DELAY
+            )
+        self._interpolate = bool(interpolate)
+        self._xp = xp
+
+        # DC gain, exact for integers
+        gain = (self._rate * self._delay) ** self._order
+        if self._interpolate:
+            gain //= self._rate
+        self.gain = gain
+        self.numtaps = self._order * (self._rate * self._delay - 1) + 1
+
+        x_dtype = np.dtype(x_dtype)
+        if x_dtype.kind in "iu":
+            info = np.iinfo(x_dtype)
+            peak = max(-int(info.min), int(info.max))
+            if peak * (self._rate * self._delay) ** self._order >= 2 ** 63:
+                raise ValueError(
+                    "The output of a CIC filter of order %d and rate %d "
+                    "overflows 64-bit integers for %s input"
+                    % (self._order, self._rate, x_dtype.name)
+                )
+            self._output_type = np.dtype(np.int64)
+        elif x_dtype.kind in "fc":
+            self._output_type = np.result_type(x_dtype, np.float32)
+        else:
+            raise ValueError("Unsupported data type %s" % x_dtype.name)
+
+    def output_len(self, n):
+        """Number of outputs for `n` input samples"""
+        if self._interpolate:
+            return n * self._rate
+        return -(-n // self._rate)
+
+    def _filter(self, x, axis, out, phase=0, scale=1.0):
+        """Compute the CIC filter outputs ``0, ..., out.shape[axis] - 1``,
+        where decimation output ``m`` is the full-rate output at input
+        ``m * rate + phase``, and interpolation output ``t`` is the
+        full-rate output ``t + phase``. Samples outside of `x` are zeros.
+        Floating point outputs are multiplied by `scale`.
+        """
+        xp = self._xp
+        axis = axis % x.ndim
+        n_out = out.shape[axis]
+        up, down = (self._rate, 1) if self._interpolate else (1, self._rate)
+
+        if xp is np:
+            h_trans_flip = _pad_h(
+                _cic_taps(self._rate, self._order, self._delay), up
+            )
+            h_per_phase = len(h_trans_flip) // up
+            # Exact in int64 for integers, in double precision otherwise
+            if self._output_type.kind == "i":
+                acc_type = self._output_type
+            else:
+                acc_type = np.result_type(self._output_type, np.float64)
+            acc = np.zeros(out.shape, acc_type)
+            if self._interpolate:
+                t_offset, x_offset = phase, 0
+            else:
+                t_offset, x_offset = 0, -phase
+            last_idx = (n_out - 1 + t_offset) * down // up - x_offset
+            _upfirdn_cpu(
+                x,
+                h_trans_flip,
+                up,
+                down,
+                axis,
+                x.shape[axis],
+                h_per_phase,
+                max(last_idx + 1, 1),
+                t_offset,
+                x_offset,
+                acc,
+            )
+            if self._output_type.kind != "i":
+                acc *= scale
+            out[...] = acc
+            return out
+
+        x_strides = _batch_strides(x, axis)
+        if x_strides is None:
+            x_copy = _empty(x.shape, x.dtype, cp, "cic.x")
+            x_copy[...] = x
+            x = x_copy
+            x_strides = _batch_strides(x, axis)
+
+        out_shape = (
+            int(np.prod(out.shape[:axis])),
+            n_out,
+            int(np.prod(out.shape[axis + 1 :])),
+        )
+
+        # Runs of `chunk` low-rate samples, long enough to amortize the
+        # restarts, in enough threads to fill the device
+        n_low = -(-n_out // up)
+        chunk = (n_low * out_shape[0] * out_shape[2]) >> 15
+        chunk = max(1, min(8 * self._order * self._delay, chunk))
+        n_blocks = -(-n_low // chunk)
+
+        k_type = GPUKernel.CIC_DECIMATE
+        if self._interpolate:
+            k_type = GPUKernel.CIC_INTERPOLATE
+
+        def launch(blockspergrid, threadsperblock):
+            kernel = _get_backend_kernel(
+                x.dtype, blockspergrid, threadsperblock, k_type,
+            )
+            kernel(
+                x,
+                x_strides,
+                x.shape[axis],
+                self._rate,
+                self._order,
+                self._delay,
+                phase,
+                chunk,
+                scale,
+                out,
+                out_shape,
+                n_blocks,
+            )
+
+        launch(
+            *_get_launch_config(
+                k_type,
+                x.dtype,
+                out_shape[0] * n_blocks * out_shape[2],
+                _grid_stride_configs(256),
+                launch,
+            )
+        )
+
+        return out
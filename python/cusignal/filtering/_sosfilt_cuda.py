@@ -11,9 +11,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import cupy as cp
+import numpy as np
+
 from string import Template
 
-from ..utils._caches import _cupy_kernel_cache
+from ..utils._registry import _C_TYPES, GPUKernel, _register_kernel
+from ..utils.backend import get_array_module
 
 
 # Custom Cupy raw kernel implementing lombscargle operation
@@ -29,26 +33,35 @@ extern "C" {
         const int n_sections,
         const int zi_width,
         const int sos_width,
-        const ${datatype} * __restrict__ sos,
-        const ${datatype} * __restrict__ zi,
-        ${datatype} * __restrict__ x_in
+        const int sos_stride,
+        const int reverse,
+        const ${coeftype} * __restrict__ sos,
+        ${datatype} * __restrict__ zi,
+        ${datatype} * __restrict__ x_in,
+        const int down,
+        const int phase,
+        const int n_out,
+        ${datatype} * y_out
      ) {
 
-        extern __shared__ ${datatype} s_buffer[];
+        // Raw bytes, as complex types cannot be extern __shared__ arrays
+        extern __shared__ __align__( 16 ) unsigned char s_buffer[];
 
-        ${datatype} *s_out { s_buffer };
+        // Outputs of each section, double buffered by step parity
+        ${datatype} *s_out { reinterpret_cast<${datatype}*>( s_buffer ) };
         ${datatype} *s_zi {
-            reinterpret_cast<${datatype}*>(&s_out[n_sections]) };
-        ${datatype} *s_sos {
-            reinterpret_cast<${datatype}*>(
+            reinterpret_cast<${datatype}*>(&s_out[2 * n_sections]) };
+        ${coeftype} *s_sos {
+            reinterpret_cast<${coeftype}*>(
                 &s_zi[n_sections * zi_width]) };
 
         const int tx { static_cast<int>( threadIdx.x ) };
         const int ty {
             static_cast<int>( blockIdx.y * blockDim.y + threadIdx.y ) };
 
-        // Reset shared memory
-        s_out[tx] = 0;
+        if ( ty >= n_signals ) {
+            return;
+        }
 
         // Load zi
         for ( int i = 0; i < zi_width; i++ ) {
@@ -56,54 +69,32 @@ extern "C" {
                 zi[ty * n_sections * zi_width + tx * zi_width + i ];
         }
 
-        // Load SOS
+        // Load SOS, of this signal if sos_stride is not 0
         // b is in s_sos[tx * sos_width + [0-2]]
         // a is in s_sos[tx * sos_width + [3-6]]
         for ( int i = 0; i < sos_width; i++ ) {
-            s_sos[tx * sos_width + i] = sos[tx * sos_width + i];
+            s_sos[tx * sos_width + i] =
+                sos[ty * sos_stride + tx * sos_width + i];
         }
 
         __syncthreads();
 
-        const int load_size { n_sections - 1 };
-        const int unload_size { n_samples - load_size };
-
         ${datatype} temp {};
         ${datatype} x_n {};
 
-        if ( ty < n_signals ) {
-            // Loading phase
-            for ( int n = 0; n < load_size; n++ ) {
-                if ( tx == 0 ) {
-                    x_n = x_in[ty * n_samples + n];
-                } else {
-                    x_n = s_out[tx - 1];
-                }
-
-                // Use direct II transposed structure
-                temp = s_sos[tx * sos_width + 0]
-                    * x_n + s_zi[tx * zi_width + 0];
+        // Pipeline over sections: at step n, section tx filters sample
+        // n - tx, taking the output of section tx - 1 from step n - 1
+        for ( int n = 0; n < n_samples + n_sections - 1; n++ ) {
+            const int i { n - tx };
 
-                s_zi[tx * zi_width + 0] =
-                    s_sos[tx * sos_width + 1] * x_n
-                    - s_sos[tx * sos_width + 4] * temp
-                    + s_zi[tx * zi_width + 1];
-
-                s_zi[tx * zi_width + 1] =
-                    s_sos[tx * sos_width + 2] * x_n
-                    - s_sos[tx * sos_width + 5] * temp;
-
-                s_out[tx] = temp;
-
-                __syncthreads();
-            }
+            // Index of sample i, filtering from the end if reverse is set
+            const int j { reverse ? n_samples - 1 - i : i };
 
-            // Processing phase
-            for ( int n = load_size; n < n_samples; n++ ) {
+            if ( i >= 0 && i < n_samples ) {
                 if ( tx == 0 ) {
-                    x_n = x_in[ty * n_samples + n];
+                    x_n = x_in[ty * n_samples + j];
                 } else {
-                    x_n = s_out[tx - 1];
+                    x_n = s_out[( ( n - 1 ) & 1 ) * n_sections + tx - 1];
                 }
 
                 // Use direct II transposed structure
@@ -119,42 +110,26 @@ extern "C" {
                     s_sos[tx * sos_width + 2] * x_n
                     - s_sos[tx * sos_width + 5] * temp;
 
-                if ( tx < load_size ) {
-                    s_out[tx] = temp;
+                if ( tx == n_sections - 1 ) {
+                    if ( down == 0 ) {
+                        x_in[ty * n_samples + j] = temp;
+                    } else if ( j >= phase && ( j - phase ) % down == 0
+                            && ( j - phase ) / down < n_out ) {
+                        // Only the kept samples of a decimated output
+                        y_out[ty * n_out + ( j - phase ) / down] = temp;
+                    }
                 } else {
-                    x_in[ty * n_samples + ( n - load_size )] = temp;
+                    s_out[( n & 1 ) * n_sections + tx] = temp;
                 }
-
-                __syncthreads();
             }
 
-            // Unloading phase
-            for ( int n = 0; n < n_sections; n++ ) {
-                // retire threads that are less than n
-                if ( tx > n ) {
-                    x_n = s_out[tx - 1];
-
-                    // Use direct II transposed structure
-                    temp = s_sos[tx * sos_width + 0] *
-                        x_n + s_zi[tx * zi_width + 0];
-
-                    s_zi[tx * zi_width + 0] =
-                        s_sos[tx * sos_width + 1] * x_n
-                        - s_sos[tx * sos_width + 4] * temp
-                        + s_zi[tx * zi_width + 1];
-
-                    s_zi[tx * zi_width + 1] =
-                        s_sos[tx * sos_width + 2] * x_n
-                        - s_sos[tx * sos_width + 5] * temp;
-
-                    if ( tx < load_size ) {
-                        s_out[tx] = temp;
-                    } else {
-                        x_in[ty * n_samples + ( n + unload_size )] = temp;
-                    }
-                    __syncthreads();
-                }
-            }
+            __syncthreads();
+        }
+
+        // Store final filter delay values
+        for ( int i = 0; i < zi_width; i++ ) {
+            zi[ty * n_sections * zi_width + tx * zi_width + i ] =
+                s_zi[tx * zi_width + i];
         }
     }
 }
@@ -162,6 +137,31 @@ extern "C" {
 )
 
 
+def _real_type(np_type):
+    """Real counterpart of a NumPy data type, e.g. float32 for complex64"""
+    return np.dtype(np_type).type(0).real.dtype
+
+
+# Coefficients of the data type
+_register_kernel(
+    GPUKernel.SOSFILT,
+    _cupy_sosfilt_src,
+    "_cupy_sosfilt",
+    ["float32", "float64", "complex64", "complex128"],
+    substitutions=lambda np_type: {"coeftype": _C_TYPES[np_type]},
+)
+# Real coefficients on complex data, avoiding complex multiplies
+_register_kernel(
+    GPUKernel.SOSFILT_REAL,
+    _cupy_sosfilt_src,
+    "_cupy_sosfilt",
+    ["complex64", "complex128"],
+    substitutions=lambda np_type: {
+        "coeftype": _C_TYPES[_real_type(np_type).name]
+    },
+)
+
+
 class _cupy_sosfilt_wrapper(object):
     def __init__(self, grid, block, smem, kernel):
         if isinstance(grid, int):
@@ -174,24 +174,37 @@ class _cupy_sosfilt_wrapper(object):
         self.smem = smem
         self.kernel = kernel
 
-    def __call__(self, sos, x, zi):
+    def __call__(self, sos, x, zi, reverse=False, out=None, down=1, phase=0):
+
+        # Coefficients per signal, or shared by all signals
+        sos_stride = 0
+        if sos.ndim == 3:
+            sos_stride = sos.shape[1] * sos.shape[2]
 
         kernel_args = (
             x.shape[0],
             x.shape[1],
-            sos.shape[0],
+            sos.shape[-2],
             zi.shape[2],
-            sos.shape[1],
+            sos.shape[-1],
+            sos_stride,
+            int(reverse),
             sos,
             zi,
             x,
+            0 if out is None else down,
+            phase,
+            0 if out is None else out.shape[1],
+            x if out is None else out,
         )
 
         self.kernel(self.grid, self.block, kernel_args, shared_mem=self.smem)
 
 
 def _get_backend_kernel(dtype, grid, block, smem, k_type):
-    kernel = _cupy_kernel_cache[(dtype.name, k_type.value)]
+    from ..utils.compile_kernels import _populate_kernel_cache
+
+    kernel = _populate_kernel_cache(dtype, k_type)
     if kernel:
         return _cupy_sosfilt_wrapper(grid, block, smem, kernel)
     else:
@@ -204,22 +217,232 @@ def _get_backend_kernel(dtype, grid, block, smem, k_type):
     )
 
 
-def _sosfilt(sos, x, zi):
-    from ..utils.compile_kernels import _populate_kernel_cache, GPUKernel
+def _sos_type(sos, dtype):
+    """
+    Data type to store `sos` in to filter data of type `dtype`. Real
+    coefficients are kept real on complex data, for the faster kernel.
+    """
+    if dtype.kind == "c" and sos.dtype.kind != "c":
+        return _real_type(dtype)
+    return dtype
 
-    threadsperblock = (sos.shape[0], 1)  # Up-to (1024, 1) = 1024 max per block
-    blockspergrid = (1, x.shape[0])
 
-    _populate_kernel_cache(x.dtype, GPUKernel.SOSFILT)
+def _sosfilt_cpu(sos, x, zi, reverse=False, out=None, down=1, phase=0):
+    """Host implementation of `_cupy_sosfilt`, filtering `x` in place"""
+    from scipy import signal
 
-    out_size = threadsperblock[0]
-    z_size = zi.shape[1] * zi.shape[2]
-    sos_size = sos.shape[0] * sos.shape[1]
+    y = x
+    if out is not None:
+        y = x.copy()
+    if reverse:
+        y = y[:, ::-1]
+
+    if sos.ndim == 3:
+        # One filter per signal
+        for i in range(y.shape[0]):
+            y[i], zi[i] = signal.sosfilt(sos[i], y[i], zi=zi[i])
+    else:
+        y[...], zf = signal.sosfilt(
+            sos, y, axis=-1, zi=np.swapaxes(zi, 0, 1)
+        )
+        zi[...] = np.swapaxes(zf, 0, 1)
+
+    if out is not None:
+        if reverse:
+            y = y[:, ::-1]
+        out[...] = y[:, phase::down][:, : out.shape[1]]
+
+
+def _sosfilt_shared_mem(n_sections, zi_width, sos_width, dtype, sos_dtype):
+    """Shared memory used by `_cupy_sosfilt` for `n_sections` sections"""
+    # Section outputs (double buffered) and delays, then coefficients
+    return n_sections * (
+        (2 + zi_width) * dtype.itemsize + sos_width * sos_dtype.itemsize
+    )
 
-    shared_mem = (out_size + z_size + sos_size) * x.dtype.itemsize
+
+def _sosfilt_max_sections(dtype, sos_dtype, zi_width, sos_width):
+    """
+    Number of sections `_cupy_sosfilt` can filter in one block on the
+    current device, with one thread and its shared memory per section.
+    """
+    d = cp.cuda.Device()
+    max_smem = d.attributes["MaxSharedMemoryPerBlock"]
+    max_tpb = d.attributes["MaxThreadsPerBlock"]
+    section_mem = _sosfilt_shared_mem(
+        1, zi_width, sos_width, dtype, sos_dtype
+    )
+
+    return min(max_tpb, max_smem // section_mem)
+
+
+def _sosfilt(
+    sos, x, zi, max_sections=None, reverse=False, out=None, down=1, phase=0
+):
+    """
+    Filter the rows of `x` in place, updating the filter delays `zi` of
+    shape ``(x.shape[0], n_sections, 2)`` to their final values. `sos` is
+    either of the data type of `x`, or real when `x` is complex, and of
+    shape ``(n_sections, 6)``, or ``(x.shape[0], n_sections, 6)`` for one
+    filter per row.
+    `max_sections` may be given to skip the device queries of
+    `_sosfilt_max_sections`. If `reverse` is True, the rows are filtered
+    from their last sample to their first, without reversing them in
+    memory.
+
+    If `out` is given, only the outputs ``phase + k * down`` of each row
+    are computed, into ``out[:, k]``, and the output is not written to
+    `x`, which is left unspecified.
+
+    Cascades with more sections than fit in a block are split into groups
+    of consecutive sections, each filtering the whole of `x` in place
+    before the next one runs.
+    """
+    if get_array_module(x) is np:
+        _sosfilt_cpu(sos, x, zi, reverse, out, down, phase)
+        return
+
+    n_sections = sos.shape[-2]
+    if max_sections is None:
+        max_sections = _sosfilt_max_sections(
+            x.dtype, sos.dtype, zi.shape[2], sos.shape[-1]
+        )
+
+    if n_sections <= max_sections:
+        _sosfilt_group(sos, x, zi, reverse, out, down, phase)
+        return
+
+    # Evenly sized groups, so that every launch keeps as many threads busy
+    n_groups = -(-n_sections // max_sections)
+    group_size = -(-n_sections // n_groups)
+    for start in range(0, n_sections, group_size):
+        group = slice(start, start + group_size)
+        zi_group = cp.ascontiguousarray(zi[:, group])
+        sos_group = cp.ascontiguousarray(sos[..., group, :])
+        if start + group_size < n_sections:
+            _sosfilt_group(sos_group, x, zi_group, reverse)
+        else:
+            _sosfilt_group(
+                sos_group, x, zi_group, reverse, out, down, phase
+            )
+        zi[:, group] = zi_group
+
+
+def _sosfilt_group(sos, x, zi, reverse=False, out=None, down=1, phase=0):
+    """Filter the rows of `x` with one block per row. See `_sosfilt`"""
+    shared_mem = _sosfilt_shared_mem(
+        sos.shape[-2], zi.shape[2], sos.shape[-1], x.dtype, sos.dtype
+    )
+    if sos.dtype == x.dtype:
+        k_type = GPUKernel.SOSFILT
+    else:
+        k_type = GPUKernel.SOSFILT_REAL
+
+    threadsperblock = (sos.shape[-2], 1)
+    blockspergrid = (1, x.shape[0])
 
     kernel = _get_backend_kernel(
-        x.dtype, blockspergrid, threadsperblock, shared_mem, GPUKernel.SOSFILT,
+        x.dtype, blockspergrid, threadsperblock, shared_mem, k_type,
+    )
+
+    kernel(sos, x, zi, reverse, out, down, phase)
+
+
+def _parallel_segment_len(n_samples, n_rows, n_sections):
+    """
+    Segment length for `_sosfilt_parallel`: enough segments to occupy the
+    device, each long enough to amortize its boundary fix-up.
+    """
+    n_segments = max(1, 2048 // n_rows)
+    return max(64, n_sections, -(-n_samples // n_segments))
+
+
+def _sosfilt_basis(sos, segment_len, dtype, xp):
+    """
+    Response of the cascade to each unit initial delay, over a zero input
+    of `segment_len` samples.
+
+    Returns the matrix `P`, advancing flattened delays (as row vectors)
+    by `segment_len` samples, and the zero-input responses `H`, of shape
+    ``(2 * n_sections, segment_len)``. Both have a leading dimension of
+    one per filter when `sos` is 3D.
+    """
+    n_sections = sos.shape[-2]
+    n_states = 2 * n_sections
+    lead = sos.shape[:-2]
+    n_filters = int(np.prod(lead, dtype=np.int64))
+
+    H = xp.zeros((n_filters * n_states, segment_len), dtype)
+    P = xp.tile(
+        xp.eye(n_states, dtype=dtype).reshape(1, n_states, n_sections, 2),
+        (n_filters, 1, 1, 1),
+    ).reshape(n_filters * n_states, n_sections, 2)
+    if sos.ndim == 3:
+        sos = xp.repeat(sos, n_states, axis=0)
+    _sosfilt(sos, H, P)
+
+    return (
+        P.reshape(lead + (n_states, n_states)),
+        H.reshape(lead + (n_states, segment_len)),
     )
 
-    kernel(sos, x, zi)
+
+def _sosfilt_parallel(sos, x, zi, segment_len=None):
+    """
+    Time-parallel version of `_sosfilt`, for few long signals.
+
+    Each signal is split into segments, which are filtered independently
+    from zero initial delays. The filter is linear, so the true delays at
+    each segment boundary follow from the final delays of the segments by
+    a prefix scan, ``s[k] = s[k - 1] @ P + w[k]``, solved in
+    ``log2(n_segments)`` steps. The responses to those delays are then
+    added to every segment at once. Any remaining samples are filtered
+    serially from the last boundary.
+    """
+    xp = get_array_module(x)
+    n_rows, n_samples = x.shape
+    n_sections = sos.shape[-2]
+    n_states = 2 * n_sections
+
+    if segment_len is None:
+        segment_len = _parallel_segment_len(n_samples, n_rows, n_sections)
+    n_segments = n_samples // segment_len
+    if n_segments < 2:
+        _sosfilt(sos, x, zi)
+        return
+
+    # Zero-state responses and final delays of every segment
+    n_body = n_segments * segment_len
+    body = x[:, :n_body]
+    if n_body != n_samples:
+        body = xp.ascontiguousarray(body)
+    body = body.reshape(n_rows * n_segments, segment_len)
+    w = xp.zeros((n_rows * n_segments, n_sections, 2), x.dtype)
+    if sos.ndim == 3:
+        _sosfilt(xp.repeat(sos, n_segments, axis=0), body, w)
+    else:
+        _sosfilt(sos, body, w)
+
+    P, H = _sosfilt_basis(sos, segment_len, x.dtype, xp)
+
+    # Inclusive prefix scan of the delays at the end of each segment
+    w = w.reshape(n_rows, n_segments, n_states)
+    z0 = zi.reshape(n_rows, 1, n_states).copy()
+    w[:, :1] += z0 @ P
+    step = 1
+    while step < n_segments:
+        w[:, step:] += w[:, :-step] @ P
+        P = P @ P
+        step *= 2
+
+    # Add the response to the initial delays of each segment
+    init = xp.concatenate((z0, w[:, :-1]), axis=1)
+    body = body.reshape(n_rows, n_segments, segment_len)
+    body += init @ H
+    zi[...] = w[:, -1].reshape(zi.shape)
+
+    if n_body != n_samples:
+        x[:, :n_body] = body.reshape(n_rows, n_body)
+        tail = xp.ascontiguousarray(x[:, n_body:])
+        _sosfilt(sos, tail, zi)
+        x[:, n_body:] = tail
@@ -12,11 +12,15 @@
 # limitations under the License.
 
 import cupy as cp
+import numpy as np
 
-from math import ceil
 from string import Template
 
-from ..utils._caches import _cupy_kernel_cache
+from ..filter_design.filter_design_utils import _fir_symmetry
+from ..utils._registry import GPUKernel, _register_kernel
+from ..utils.autotune import _get_launch_config, _grid_stride_configs
+from ..utils.backend import get_array_module, _asarray
+from ..utils.memory import _empty, _output
 
 
 def _pad_h(h, up):
@@ -28,8 +32,9 @@ def _pad_h(h, up):
        0,    h[7], h[4], h[1],   // flipped phase 1 coefs (zero-padded)
        0,    h[8], h[5], h[2],   // flipped phase 2 coefs (zero-padded)
     """
+    xp = get_array_module(h)
     h_padlen = len(h) + (-len(h) % up)
-    h_full = cp.zeros(h_padlen, h.dtype)
+    h_full = xp.zeros(h_padlen, h.dtype)
     h_full[: len(h)] = h
     h_full = h_full.reshape(-1, up).T[:, ::-1].ravel()
     return h_full
@@ -60,6 +65,11 @@ extern "C" {
             const int x_shape_a,
             const int h_per_phase,
             const int padded_len,
+            const int t_offset,
+            const int x_offset,
+            const int symmetry,
+            const int sym_start,
+            const int sym_len,
             ${datatype} * __restrict__ out,
             const int outW) {
 
@@ -68,17 +78,47 @@ extern "C" {
         const int stride { static_cast<int>(blockDim.x * gridDim.x) };
 
         for ( size_t tid = t; tid < outW; tid += stride ) {
-            int x_idx { static_cast<int>((tid * down) / up) % padded_len };
-            int h_idx { (tid * down) % up * h_per_phase };
+            // Output tid + t_offset, of an input starting at x_offset
+            int x_idx { ( static_cast<int>(((tid + t_offset) * down) / up)
+                - x_offset ) % padded_len };
+            int h_idx { static_cast<int>((tid + t_offset) * down) % up
+                * h_per_phase };
             int x_conv_idx { x_idx - h_per_phase + 1 };
 
+            ${datatype} temp {};
+
+            if ( symmetry != 0 ) {
+                // Single phase with linear-phase taps in
+                // h_trans_flip[sym_start:sym_start + sym_len]:
+                // add mirrored samples, then multiply once per pair
+                const int x_first { x_conv_idx + sym_start };
+                const int x_last { x_first + sym_len - 1 };
+                for ( int k = 0; k < sym_len / 2; k++ ) {
+                    ${datatype} x_a {};
+                    ${datatype} x_b {};
+                    if ( x_first + k >= 0 && x_first + k < x_shape_a ) {
+                        x_a = inp[x_first + k];
+                    }
+                    if ( x_last - k >= 0 && x_last - k < x_shape_a ) {
+                        x_b = inp[x_last - k];
+                    }
+                    temp += ( symmetry > 0 ? x_a + x_b : x_a - x_b )
+                        * h_trans_flip[sym_start + k];
+                }
+                const int x_mid { x_first + sym_len / 2 };
+                if ( symmetry > 0 && ( sym_len & 1 ) &&
+                        x_mid >= 0 && x_mid < x_shape_a ) {
+                    temp += inp[x_mid] * h_trans_flip[sym_start + sym_len / 2];
+                }
+                out[tid] = temp;
+                continue;
+            }
+
             if ( x_conv_idx < 0 ) {
                 h_idx -= x_conv_idx;
                 x_conv_idx = 0;
             }
 
-            ${datatype} temp {};
-
             for ( int x_c = x_conv_idx; x_c < (x_idx + 1); x_c++ ) {
                 if ( x_c < x_shape_a && x_c >= 0 ) {
                     temp += inp[x_c] * h_trans_flip[h_idx];
@@ -92,68 +132,300 @@ extern "C" {
 """
 )
 
-_cupy_upfirdn_2d_src = Template(
+# Batched over all axes but the filtered one. `x` is indexed as
+# (pre, axis, post) with element strides, and `out` is C-contiguous
+_cupy_upfirdn_nd_src = Template(
     """
 $header
 
 extern "C" {
-    __global__ void _cupy_upfirdn_2d(
+    __global__ void _cupy_upfirdn_nd(
             const ${datatype} * __restrict__ inp,
-            const int inpH,
+            const long long s_pre,
+            const long long s_axis,
+            const long long s_post,
             const ${datatype} * __restrict__ h_trans_flip,
             const int up,
             const int down,
-            const int axis,
             const int x_shape_a,
             const int h_per_phase,
             const int padded_len,
+            const int t_offset,
+            const int x_offset,
+            const int symmetry,
+            const int sym_start,
+            const int sym_len,
             ${datatype} * __restrict__ out,
-            const int outW,
-            const int outH) {
+            const int n_out,
+            const int n_post,
+            const long long out_size) {
+
+        const long long tx {
+            static_cast<long long>(blockIdx.x * blockDim.x + threadIdx.x) };
+        const long long stride {
+            static_cast<long long>(blockDim.x * gridDim.x) };
+
+        for ( long long tid = tx; tid < out_size; tid += stride ) {
+            // Consecutive threads write consecutive outputs
+            const int q { static_cast<int>(tid % n_post) };
+            const long long r { tid / n_post };
+            const int p { static_cast<int>(r / n_out) };
+            const ${datatype} * __restrict__ row {
+                inp + p * s_pre + q * s_post };
+
+            // Output t + t_offset, of an input starting at x_offset
+            const int t { static_cast<int>(r % n_out) + t_offset };
+            int x_idx { ( static_cast<int>(t * down) / up - x_offset )
+                % padded_len };
+            int h_idx { (t * down) % up * h_per_phase };
+
+            int x_conv_idx { x_idx - h_per_phase + 1 };
 
+            ${datatype} temp {};
 
-        const int ty {
-            static_cast<int>(blockIdx.x * blockDim.x + threadIdx.x) };
-        const int tx {
-            static_cast<int>(blockIdx.y * blockDim.y + threadIdx.y) };
-
-        if ( (tx < outH) && (ty < outW) ) {
-            int x_idx {};
-            int h_idx {};
-
-            if ( axis == 1 ) {
-                x_idx = ( static_cast<int>(tx * down) / up ) % padded_len;
-                h_idx = (tx * down) % up * h_per_phase;
-            } else {
-                x_idx = ( static_cast<int>(ty * down) / up ) % padded_len;
-                h_idx = (ty * down) % up * h_per_phase;
+            if ( symmetry != 0 ) {
+                // See _cupy_upfirdn_1d
+                const int x_first { x_conv_idx + sym_start };
+                const int x_last { x_first + sym_len - 1 };
+                for ( int k = 0; k < sym_len / 2; k++ ) {
+                    ${datatype} x_a {};
+                    ${datatype} x_b {};
+                    if ( x_first + k >= 0 && x_first + k < x_shape_a ) {
+                        x_a = row[(x_first + k) * s_axis];
+                    }
+                    if ( x_last - k >= 0 && x_last - k < x_shape_a ) {
+                        x_b = row[(x_last - k) * s_axis];
+                    }
+                    temp += ( symmetry > 0 ? x_a + x_b : x_a - x_b )
+                        * h_trans_flip[sym_start + k];
+                }
+                const int x_mid { x_first + sym_len / 2 };
+                if ( symmetry > 0 && ( sym_len & 1 ) &&
+                        x_mid >= 0 && x_mid < x_shape_a ) {
+                    temp += row[x_mid * s_axis]
+                        * h_trans_flip[sym_start + sym_len / 2];
+                }
+                out[tid] = temp;
+                continue;
             }
 
-            int x_conv_idx { x_idx - h_per_phase + 1 };
             if ( x_conv_idx < 0 ) {
                 h_idx -= x_conv_idx;
                 x_conv_idx = 0;
             }
 
-            ${datatype} temp {};
-
             for ( int x_c = x_conv_idx; x_c < (x_idx + 1); x_c++ ) {
                 if ( x_c < x_shape_a && x_c >= 0 ) {
-                    if (axis == 1) {
-                        temp += inp[ty * inpH + x_c] * h_trans_flip[h_idx];
-                    } else {
-                        temp += inp[x_c * inpH + tx] * h_trans_flip[h_idx];
-                    }
+                    temp += row[x_c * s_axis] * h_trans_flip[h_idx];
                 }
                 h_idx += 1;
             }
-            out[ty * outH + tx] = temp;
+            out[tid] = temp;
+        }
+    }
+}
+"""
+)
+
+
+_UPFIRDN_TYPES = ["float32", "float64", "complex64", "complex128"]
+
+_register_kernel(
+    GPUKernel.UPFIRDN,
+    _cupy_upfirdn_1d_src,
+    "_cupy_upfirdn_1d",
+    _UPFIRDN_TYPES,
+)
+_register_kernel(
+    GPUKernel.UPFIRDN2D,
+    _cupy_upfirdn_nd_src,
+    "_cupy_upfirdn_nd",
+    _UPFIRDN_TYPES,
+)
+
+# Polyphase sums of a filter-bank analysis, out[row, n, r] summing the
+# products h[m] * x[row, n * down - m] over the taps m with
+# n * down - m = r (mod n_chans). An FFT over r gives the channels.
+_cupy_channelize_src = Template(
+    """
+$header
+
+extern "C" {
+    __global__ void _cupy_channelize(
+            const ${datatype} * __restrict__ inp,
+            const int x_shape_a,
+            const ${datatype} * __restrict__ h,
+            const int h_len,
+            const int n_chans,
+            const int down,
+            ${datatype} * __restrict__ out,
+            const int n_out,
+            const long long out_size) {
+
+        const long long tx {
+            static_cast<long long>(blockIdx.x * blockDim.x + threadIdx.x) };
+        const long long stride {
+            static_cast<long long>(blockDim.x * gridDim.x) };
+
+        for ( long long tid = tx; tid < out_size; tid += stride ) {
+            const int r { static_cast<int>(tid % n_chans) };
+            const long long q { tid / n_chans };
+            const long long row { q / n_out };
+            const long long t0 {
+                static_cast<long long>(q % n_out) * down };
+            const ${datatype} * __restrict__ x { inp + row * x_shape_a };
+
+            // First tap of the phase feeding sample r
+            int m { static_cast<int>(( ( t0 - r ) % n_chans + n_chans )
+                % n_chans) };
+
+            ${datatype} temp {};
+            for ( ; m < h_len && t0 - m >= 0; m += n_chans ) {
+                if ( t0 - m < x_shape_a ) {
+                    temp += h[m] * x[t0 - m];
+                }
+            }
+            out[tid] = temp;
+        }
+    }
+}
+"""
+)
+
+# Filter-bank synthesis, out[row, t] summing h[t - n * up] *
+# w[row, t % n_chans, n] over the inputs n, where w is the inverse FFT of
+# the channels
+_cupy_channelize_synthesis_src = Template(
+    """
+$header
+
+extern "C" {
+    __global__ void _cupy_channelize_synthesis(
+            const ${datatype} * __restrict__ inp,
+            const int n_in,
+            const ${datatype} * __restrict__ h,
+            const int h_len,
+            const int n_chans,
+            const int up,
+            ${datatype} * __restrict__ out,
+            const int n_out,
+            const long long out_size) {
+
+        const long long tx {
+            static_cast<long long>(blockIdx.x * blockDim.x + threadIdx.x) };
+        const long long stride {
+            static_cast<long long>(blockDim.x * gridDim.x) };
+
+        for ( long long tid = tx; tid < out_size; tid += stride ) {
+            const int t { static_cast<int>(tid % n_out) };
+            const long long row { tid / n_out };
+            const ${datatype} * __restrict__ w {
+                inp + ( row * n_chans + t % n_chans ) * n_in };
+
+            int n { min(t / up, n_in - 1) };
+            ${datatype} temp {};
+            for ( ; n >= 0 && t - n * up < h_len; n-- ) {
+                temp += h[t - n * up] * w[n];
+            }
+            out[tid] = temp;
         }
     }
 }
 """
 )
 
+_register_kernel(
+    GPUKernel.CHANNELIZE,
+    _cupy_channelize_src,
+    "_cupy_channelize",
+    _UPFIRDN_TYPES,
+)
+_register_kernel(
+    GPUKernel.CHANNELIZE_SYNTHESIS,
+    _cupy_channelize_synthesis_src,
+    "_cupy_channelize_synthesis",
+    _UPFIRDN_TYPES[2:],
+)
+
+# Digital down-conversion, out[row, n] = nco * sum_m g[row, m] *
+# x[x_rows[row], n * down - m], with the taps g = h * exp(2j pi f m)
+# modulated by the frequency f of the row. The mix of each input sample
+# with exp(-2j pi (f t + phase)) is then a single rotation per output,
+# with the NCO phase in cycles reduced in double precision. The output
+# is complex also for real inputs.
+_cupy_ddc_src = Template(
+    """
+$header
+#include <cupy/complex.cuh>
+
+extern "C" {
+    __global__ void _cupy_ddc(
+            const ${datatype} * __restrict__ inp,
+            const long long * __restrict__ x_rows,
+            const int x_shape_a,
+            const ${out_type} * __restrict__ g,
+            const int h_len,
+            const double * __restrict__ freq,
+            const double * __restrict__ phase,
+            const int down,
+            const int t_offset,
+            ${out_type} * __restrict__ out,
+            const int n_out,
+            const long long out_size) {
+
+        const long long tx {
+            static_cast<long long>(blockIdx.x * blockDim.x + threadIdx.x) };
+        const long long stride {
+            static_cast<long long>(blockDim.x * gridDim.x) };
+
+        for ( long long tid = tx; tid < out_size; tid += stride ) {
+            const long long row { tid / n_out };
+            const long long t0 {
+                static_cast<long long>(tid % n_out) * down + t_offset };
+            const ${datatype} * __restrict__ x {
+                inp + x_rows[row] * x_shape_a };
+            const ${out_type} * __restrict__ taps { g + row * h_len };
+
+            ${out_type} temp {};
+            const int m_start { static_cast<int>(
+                t0 >= x_shape_a ? t0 - x_shape_a + 1 : 0) };
+            for ( int m = m_start; m < h_len && t0 - m >= 0; m++ ) {
+                temp += taps[m] * x[t0 - m];
+            }
+
+            double cycles { fma(freq[row], static_cast<double>(t0),
+                phase[row]) };
+            cycles -= rint(cycles);
+            ${real_type} s;
+            ${real_type} c;
+            ${sincospi}(static_cast<${real_type}>(-2.0 * cycles), &s, &c);
+            out[tid] = temp * ${out_type}(c, s);
+        }
+    }
+}
+"""
+)
+
+
+def _ddc_substitutions(np_type):
+    """Output and NCO types of the DDC kernel for input type `np_type`"""
+    if np_type in ("float32", "complex64"):
+        return dict(
+            out_type="complex<float>", real_type="float", sincospi="sincospif"
+        )
+    return dict(
+        out_type="complex<double>", real_type="double", sincospi="sincospi"
+    )
+
+
+_register_kernel(
+    GPUKernel.DDC,
+    _cupy_ddc_src,
+    "_cupy_ddc",
+    _UPFIRDN_TYPES,
+    substitutions=_ddc_substitutions,
+)
+
 
 class _cupy_upfirdn_wrapper(object):
     def __init__(self, grid, block, kernel):
@@ -176,6 +448,9 @@ class _cupy_upfirdn_wrapper(object):
         x_shape_a,
         h_per_phase,
         padded_len,
+        t_offset,
+        x_offset,
+        symmetry,
         out,
     ):
 
@@ -188,6 +463,9 @@ class _cupy_upfirdn_wrapper(object):
             x_shape_a,
             h_per_phase,
             padded_len,
+            t_offset,
+            x_offset,
+            *symmetry,
             out,
             out.shape[0],
         )
@@ -195,7 +473,7 @@ class _cupy_upfirdn_wrapper(object):
         self.kernel(self.grid, self.block, kernel_args)
 
 
-class _cupy_upfirdn2d_wrapper(object):
+class _cupy_upfirdn_nd_wrapper(object):
     def __init__(self, grid, block, kernel):
         if isinstance(grid, int):
             grid = (grid,)
@@ -209,29 +487,95 @@ class _cupy_upfirdn2d_wrapper(object):
     def __call__(
         self,
         x,
+        x_strides,
         h_trans_flip,
         up,
         down,
-        axis,
         x_shape_a,
         h_per_phase,
         padded_len,
+        t_offset,
+        x_offset,
+        symmetry,
         out,
+        out_shape,
     ):
 
         kernel_args = (
             x,
-            x.shape[1],
+            *x_strides,
             h_trans_flip,
             up,
             down,
-            axis,
             x_shape_a,
             h_per_phase,
             padded_len,
+            t_offset,
+            x_offset,
+            *symmetry,
             out,
-            out.shape[0],
-            out.shape[1],
+            out_shape[1],
+            out_shape[2],
+            out.size,
+        )
+
+        self.kernel(self.grid, self.block, kernel_args)
+
+
+class _cupy_channelize_wrapper(object):
+    def __init__(self, grid, block, kernel):
+        if isinstance(grid, int):
+            grid = (grid,)
+        if isinstance(block, int):
+            block = (block,)
+
+        self.grid = grid
+        self.block = block
+        self.kernel = kernel
+
+    def __call__(self, x, h, n_chans, rate, out, n_out):
+
+        kernel_args = (
+            x,
+            x.shape[-1],
+            h,
+            h.shape[0],
+            n_chans,
+            rate,
+            out,
+            n_out,
+            np.int64(out.size),
+        )
+
+        self.kernel(self.grid, self.block, kernel_args)
+
+
+class _cupy_ddc_wrapper(object):
+    def __init__(self, grid, block, kernel):
+        if isinstance(grid, int):
+            grid = (grid,)
+        if isinstance(block, int):
+            block = (block,)
+
+        self.grid = grid
+        self.block = block
+        self.kernel = kernel
+
+    def __call__(self, x, x_rows, g, freq, phase, down, t_offset, out):
+
+        kernel_args = (
+            x,
+            x_rows,
+            x.shape[-1],
+            g,
+            g.shape[-1],
+            freq,
+            phase,
+            down,
+            t_offset,
+            out,
+            out.shape[-1],
+            np.int64(out.size),
         )
 
         self.kernel(self.grid, self.block, kernel_args)
@@ -240,93 +584,337 @@ class _cupy_upfirdn2d_wrapper(object):
 def _get_backend_kernel(
     dtype, grid, block, k_type,
 ):
-    from ..utils.compile_kernels import GPUKernel
+    from ..utils.compile_kernels import _populate_kernel_cache
 
-    kernel = _cupy_kernel_cache[(str(dtype), k_type.value)]
+    kernel = _populate_kernel_cache(dtype, k_type)
     if kernel:
         if k_type == GPUKernel.UPFIRDN:
             return _cupy_upfirdn_wrapper(grid, block, kernel)
         elif k_type == GPUKernel.UPFIRDN2D:
-            return _cupy_upfirdn2d_wrapper(grid, block, kernel)
+            return _cupy_upfirdn_nd_wrapper(grid, block, kernel)
+        elif k_type in (
+            GPUKernel.CHANNELIZE,
+            GPUKernel.CHANNELIZE_SYNTHESIS,
+        ):
+            return _cupy_channelize_wrapper(grid, block, kernel)
+        elif k_type == GPUKernel.DDC:
+            return _cupy_ddc_wrapper(grid, block, kernel)
     else:
         raise ValueError(
             "Kernel {} not found in _cupy_kernel_cache".format(k_type)
         )
 
 
+def _upfirdn_cpu(
+    x,
+    h_trans_flip,
+    up,
+    down,
+    axis,
+    x_shape_a,
+    h_per_phase,
+    padded_len,
+    t_offset,
+    x_offset,
+    out,
+):
+    """Host implementation of `_cupy_upfirdn_1d`/`_cupy_upfirdn_2d`"""
+    x = np.moveaxis(x, axis, -1)
+    out = np.moveaxis(out, axis, -1)
+
+    # Same index arithmetic as the kernels, vectorized over all outputs
+    tid = np.arange(out.shape[-1]) + t_offset
+    x_idx = ((tid * down) // up - x_offset) % padded_len
+    h_idx = (tid * down) % up * h_per_phase
+    x_conv_idx = x_idx - h_per_phase + 1
+
+    for j in range(h_per_phase):
+        x_c = x_conv_idx + j
+        valid = (x_c >= 0) & (x_c < x_shape_a)
+        taps = h_trans_flip[h_idx + j] * valid
+        out += x[..., np.clip(x_c, 0, x_shape_a - 1)] * taps
+
+
+def _batch_strides(x, axis):
+    """
+    Element strides of `x` viewed as a ``(pre, x.shape[axis], post)``
+    array, where ``pre`` and ``post`` collapse the axes before and after
+    `axis`. Return None if these axes cannot be collapsed without a copy.
+    """
+    strides = [st // x.itemsize for st in x.strides]
+
+    def collapse(dims):
+        # Size 1 axes can have any stride
+        dims = [(n, st) for n, st in dims if n != 1]
+        for (_, st0), (n1, st1) in zip(dims, dims[1:]):
+            if st0 != n1 * st1:
+                return None
+        return dims[-1][1] if dims else 0
+
+    s_pre = collapse(zip(x.shape[:axis], strides[:axis]))
+    s_post = collapse(zip(x.shape[axis + 1 :], strides[axis + 1 :]))
+    if s_pre is None or s_post is None:
+        return None
+
+    return s_pre, strides[axis], s_post
+
+
 class _UpFIRDn(object):
-    def __init__(self, h, x_dtype, up, down):
-        """Helper for resampling"""
-        h = cp.asarray(h)
+    def __init__(self, h, x_dtype, up, down, detect_symmetry=False):
+        """
+        Helper for resampling. With `detect_symmetry`, linear-phase taps
+        are detected once, at the cost of a device synchronization, for
+        filters applied many times.
+        """
+        xp = get_array_module(h)
+        h = _asarray(h, xp)
         if h.ndim != 1 or h.size == 0:
             raise ValueError("h must be 1D with non-zero length")
 
-        self._output_type = cp.result_type(h.dtype, x_dtype, cp.float32)
-        h = cp.asarray(h, self._output_type)
+        self._output_type = xp.result_type(h.dtype, x_dtype, xp.float32)
+        h = xp.asarray(h, self._output_type)
         self._up = int(up)
         self._down = int(down)
         if self._up < 1 or self._down < 1:
             raise ValueError("Both up and down must be >= 1")
         # This both transposes, and "flips" each phase for filtering
         self._h_trans_flip = _pad_h(h, self._up)
-        self._h_trans_flip = cp.ascontiguousarray(self._h_trans_flip)
+        self._h_trans_flip = xp.ascontiguousarray(self._h_trans_flip)
+
+        # With a single phase, linear-phase taps take half the multiplies
+        self._symmetry = (0, 0, 0)
+        if detect_symmetry and self._up == 1 and xp is cp:
+            symmetry, start, stop = _fir_symmetry(self._h_trans_flip)
+            if symmetry != 0:
+                self._symmetry = (symmetry, start, stop - start)
 
     def apply_filter(
-        self, x, axis,
+        self, x, axis, out=None,
     ):
         """Apply the prepared filter to the specified axis of a nD signal x"""
-        from ..utils.compile_kernels import _populate_kernel_cache, GPUKernel
+        xp = get_array_module(self._h_trans_flip)
 
         output_len = _output_len(
             len(self._h_trans_flip), x.shape[axis], self._up, self._down
         )
-        output_shape = cp.asarray(x.shape)
+        output_shape = list(x.shape)
         output_shape[axis] = output_len
-        out = cp.zeros(
-            cp.asnumpy(output_shape), dtype=self._output_type, order="C"
-        )
+        out = _output(out, output_shape, self._output_type, xp, "upfirdn.out")
+
+        return self._filter(x, axis, out)
+
+    def _filter(self, x, axis, out, t_offset=0, x_offset=0):
+        """Compute outputs ``t_offset, ..., t_offset + out.shape[axis] - 1``
+        of the upfirdn of a signal whose first sample is ``x[0]`` at input
+        index ``x_offset``. Both offsets default to the one-shot operation.
+        Outputs past the end of the one-shot operation are those of the
+        signal extended with zeros.
+        """
+        xp = get_array_module(self._h_trans_flip)
         axis = axis % x.ndim
 
         # Precompute variables on CPU
         x_shape_a = x.shape[axis]
         h_per_phase = len(self._h_trans_flip) // self._up
         padded_len = x.shape[axis] + (len(self._h_trans_flip) // self._up) - 1
+        last_idx = (t_offset + out.shape[axis] - 1) * self._down // self._up
+        padded_len = max(padded_len, last_idx - x_offset + 1)
+
+        if xp is np:
+            out.fill(0)
+            _upfirdn_cpu(
+                np.asarray(x, self._output_type),
+                self._h_trans_flip,
+                self._up,
+                self._down,
+                axis,
+                x_shape_a,
+                h_per_phase,
+                padded_len,
+                t_offset,
+                x_offset,
+                out,
+            )
+            return out
+
+        x_strides = None
+        if x.dtype == self._output_type:
+            x_strides = _batch_strides(x, axis)
+        if x_strides is None:
+            x_cast = _empty(x.shape, self._output_type, cp, "upfirdn.x")
+            x_cast[...] = x
+            x = x_cast
+            x_strides = _batch_strides(x, axis)
+
+        k_type = GPUKernel.UPFIRDN2D
+        if x.ndim == 1 and x_strides[1] == 1:
+            k_type = GPUKernel.UPFIRDN
+        out_shape = (
+            int(np.prod(out.shape[:axis])),
+            out.shape[axis],
+            int(np.prod(out.shape[axis + 1 :])),
+        )
 
-        if out.ndim > 1:
-            threadsperblock = (16, 16)
-            blockspergrid_x = ceil(out.shape[0] / threadsperblock[0])
-            blockspergrid_y = ceil(out.shape[1] / threadsperblock[1])
-            blockspergrid = (blockspergrid_x, blockspergrid_y)
-
-        else:
-            device_id = cp.cuda.Device()
-            numSM = device_id.attributes["MultiProcessorCount"]
-            blockspergrid = numSM * 20
-            threadsperblock = 512
-
-        if out.ndim == 1:
-            _populate_kernel_cache(out.dtype, GPUKernel.UPFIRDN)
+        def launch(blockspergrid, threadsperblock):
             kernel = _get_backend_kernel(
-                out.dtype, blockspergrid, threadsperblock, GPUKernel.UPFIRDN,
+                out.dtype, blockspergrid, threadsperblock, k_type,
             )
-        elif out.ndim == 2:
-            _populate_kernel_cache(out.dtype, GPUKernel.UPFIRDN2D)
-            kernel = _get_backend_kernel(
-                out.dtype, blockspergrid, threadsperblock, GPUKernel.UPFIRDN2D,
+            if k_type == GPUKernel.UPFIRDN:
+                kernel(
+                    x,
+                    self._h_trans_flip,
+                    self._up,
+                    self._down,
+                    axis,
+                    x_shape_a,
+                    h_per_phase,
+                    padded_len,
+                    t_offset,
+                    x_offset,
+                    self._symmetry,
+                    out,
+                )
+            else:
+                kernel(
+                    x,
+                    x_strides,
+                    self._h_trans_flip,
+                    self._up,
+                    self._down,
+                    x_shape_a,
+                    h_per_phase,
+                    padded_len,
+                    t_offset,
+                    x_offset,
+                    self._symmetry,
+                    out,
+                    out_shape,
+                )
+
+        launch(
+            *_get_launch_config(
+                k_type,
+                out.dtype,
+                out.size,
+                _grid_stride_configs(512),
+                launch,
             )
+        )
+
+        return out
+
+
+def _channelize_cpu(x, h, n_chans, down, out):
+    """Host implementation of `_cupy_channelize`"""
+    t0 = np.arange(out.shape[1])[:, None] * down
+    m = (t0 - np.arange(n_chans)) % n_chans
+
+    out.fill(0)
+    for _ in range(-(-len(h) // n_chans)):
+        t = t0 - m
+        valid = (m < len(h)) & (t >= 0) & (t < x.shape[-1])
+        taps = h[np.minimum(m, len(h) - 1)] * valid
+        out += x[:, np.clip(t, 0, x.shape[-1] - 1)] * taps
+        m = m + n_chans
+
+
+def _channelize_synthesis_cpu(w, h, n_chans, up, out):
+    """Host implementation of `_cupy_channelize_synthesis`"""
+    t = np.arange(out.shape[-1])
+    r = t % n_chans
+
+    out.fill(0)
+    for j in range(-(-len(h) // up)):
+        n = t // up - j
+        m = t - n * up
+        valid = (n >= 0) & (n < w.shape[-1]) & (m < len(h))
+        taps = h[np.minimum(m, len(h) - 1)] * valid
+        out += w[:, r, np.clip(n, 0, w.shape[-1] - 1)] * taps
+
+
+def _channelize_phases(x, h, n_chans, rate, out, synthesis=False):
+    """
+    Polyphase part of a filter-bank channelizer, on C-contiguous arrays
+    of the data type of `out`, with one signal per row of `x`.
+
+    The analysis computes the ``(n_rows, n_out, n_chans)`` sums of
+    `_cupy_channelize`, for a decimation by `rate`. The synthesis
+    computes the ``(n_rows, n_out)`` outputs of
+    `_cupy_channelize_synthesis`, from the inverse FFTs `x` of shape
+    ``(n_rows, n_chans, n_in)``, for an interpolation by `rate`.
+    """
+    xp = get_array_module(out)
+    if xp is np:
+        if synthesis:
+            _channelize_synthesis_cpu(x, h, n_chans, rate, out)
         else:
-            raise NotImplementedError("upfirdn() requires ndim <= 2")
+            _channelize_cpu(x, h, n_chans, rate, out)
+        return out
 
-        kernel(
-            cp.asarray(x, self._output_type),
-            self._h_trans_flip,
-            self._up,
-            self._down,
-            axis,
-            x_shape_a,
-            h_per_phase,
-            padded_len,
-            out,
+    k_type = GPUKernel.CHANNELIZE
+    n_out = out.shape[1]
+    if synthesis:
+        k_type = GPUKernel.CHANNELIZE_SYNTHESIS
+        n_out = out.shape[-1]
+
+    def launch(blockspergrid, threadsperblock):
+        kernel = _get_backend_kernel(
+            out.dtype, blockspergrid, threadsperblock, k_type,
         )
+        kernel(x, h, n_chans, rate, out, n_out)
+
+    launch(
+        *_get_launch_config(
+            k_type, out.dtype, out.size, _grid_stride_configs(512), launch,
+        )
+    )
+
+    return out
 
+
+def _ddc_cpu(x, x_rows, g, freq, phase, down, t_offset, out):
+    """Host implementation of `_cupy_ddc`"""
+    t0 = np.arange(out.shape[-1]) * down + t_offset
+    x = x[x_rows]
+
+    out.fill(0)
+    for m in range(g.shape[-1]):
+        t = t0 - m
+        valid = (t >= 0) & (t < x.shape[-1])
+        out += g[:, m : m + 1] * x[:, np.clip(t, 0, x.shape[-1] - 1)] * valid
+
+    cycles = freq[:, None] * t0 + phase[:, None]
+    cycles -= np.rint(cycles)
+    out *= np.exp(-2j * np.pi * cycles)
+
+
+def _ddc(x, x_rows, g, freq, phase, down, out, t_offset=0):
+    """
+    Mix, filter, and decimate the rows `x_rows` of the C-contiguous 2-D
+    `x` into the rows of `out`, with the modulated taps `g` of shape
+    ``(n_rows, len(h))`` and the frequencies `freq` and initial phases
+    `phase` of each row in cycles. Output ``n`` is the full-rate output at
+    input ``n * down + t_offset``. See `_cupy_ddc`.
+    """
+    xp = get_array_module(out)
+    if xp is np:
+        _ddc_cpu(x, x_rows, g, freq, phase, down, t_offset, out)
         return out
+
+    def launch(blockspergrid, threadsperblock):
+        kernel = _get_backend_kernel(
+            x.dtype, blockspergrid, threadsperblock, GPUKernel.DDC,
+        )
+        kernel(x, x_rows, g, freq, phase, down, t_offset, out)
+
+    launch(
+        *_get_launch_config(
+            GPUKernel.DDC,
+            x.dtype,
+            out.size,
+            _grid_stride_configs(512),
+            launch,
+        )
+    )
+
+    return out
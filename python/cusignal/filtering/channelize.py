@@ -0,0 +1,389 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cupy as cp
+import numpy as np
+
+from collections import namedtuple
+
+from ..utils.backend import get_array_module, _asarray
+from ..utils.memory import _empty, _output
+from ._upfirdn_cuda import _channelize_phases, _ddc, _output_len
+
+
+def _bank_params(h, n_channels, oversample):
+    """Validate the prototype filter and return the channel rate change"""
+    if h.ndim != 1 or h.size == 0:
+        raise ValueError("h must be 1D with non-zero length")
+    n_channels = int(n_channels)
+    oversample = int(oversample)
+    if n_channels < 1:
+        raise ValueError("n_channels must be >= 1")
+    if oversample < 1 or n_channels % oversample != 0:
+        raise ValueError(
+            "oversample must be a positive divisor of n_channels, got %r"
+            % (oversample,)
+        )
+
+    return n_channels, n_channels // oversample
+
+
+def channelize(x, h, n_channels, oversample=1):
+    r"""
+    Split signals into `n_channels` evenly spaced frequency channels with a
+    polyphase filter bank (PFB).
+
+    Channel ``k`` is centered on the normalized frequency
+    ``k / n_channels``, filtered with the prototype low-pass filter `h`,
+    and decimated by ``n_channels // oversample``. It is computed with
+    one polyphase filtering pass and a batched FFT, instead of a
+    frequency shift and a filter per channel.
+
+    Parameters
+    ----------
+    x : array_like
+        Signals to channelize, along their last axis. All other axes are
+        batched over.
+    h : array_like
+        1-D prototype low-pass FIR filter, typically with a cutoff of
+        ``1 / n_channels`` times the Nyquist frequency and a multiple of
+        `n_channels` taps.
+    n_channels : int
+        Number of channels.
+    oversample : int, optional
+        Ratio of the output rate of each channel to the channel spacing,
+        which must divide `n_channels`. Default is 1, a critically
+        sampled filter bank.
+
+    Returns
+    -------
+    y : ndarray
+        Complex channels, of shape
+        ``x.shape[:-1] + (n_channels, n_out)``, with
+        ``n_out = ceil((x.shape[-1] + len(h) - 1) / (n_channels //
+        oversample))`` samples per channel.
+
+    See Also
+    --------
+    synthesize_channels : Combine channels with a synthesis filter bank.
+    upfirdn : Upsample, FIR filter, and downsample.
+    freq_shift : Frequency shift a signal.
+
+    Notes
+    -----
+    With ``D = n_channels // oversample`` and ``M = n_channels``, channel
+    ``k`` is
+
+    .. math:: y_k[n] = \sum_m h[m] x[nD - m] e^{-2 \pi j k (nD - m) / M}
+
+    the same as ``upfirdn(h, freq_shift(x, k / M, 1), 1, D)``. Summing
+    the products of each polyphase branch of `h` separately, the
+    channels are the FFT of these ``M`` sums, for ``len(h)`` multiplies
+    per output sample of all channels.
+
+    Examples
+    --------
+    Split a signal into 16 channels, oversampled by 2:
+
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> x = cp.random.randn(2 ** 16) + 1j * cp.random.randn(2 ** 16)
+    >>> h = cusignal.firwin(16 * 16, 1 / 16)
+    >>> y = cusignal.channelize(x, h, 16, oversample=2)
+    >>> y.shape
+    (16, 8224)
+    """
+    xp = get_array_module(x, h)
+    x = _asarray(x, xp)
+    h = _asarray(h, xp)
+    if x.ndim == 0:
+        raise ValueError("x must be at least 1D")
+    n_channels, down = _bank_params(h, n_channels, oversample)
+    dtype = xp.result_type(x.dtype, h.dtype, xp.float32)
+    if dtype.char not in "fdFD":
+        raise NotImplementedError("input type '%s' not supported" % dtype)
+
+    # One C-contiguous row per signal
+    x_shape = x.shape
+    n_rows = int(np.prod(x_shape[:-1], dtype=np.int64))
+    x = x.reshape(n_rows, x_shape[-1])
+    if x.dtype != dtype or not x.flags.c_contiguous:
+        x_cast = _empty(x.shape, dtype, xp, "channelize.x")
+        x_cast[...] = x
+        x = x_cast
+    h = xp.ascontiguousarray(h, dtype)
+
+    n_out = _output_len(len(h), x_shape[-1], 1, down)
+    phases = _empty((n_rows, n_out, n_channels), dtype, xp, "channelize.v")
+    _channelize_phases(x, h, n_channels, down, phases)
+
+    y = xp.fft.fft(phases, axis=-1)
+    y = y.astype(xp.result_type(dtype, xp.complex64), copy=False)
+
+    return xp.swapaxes(y.reshape(x_shape[:-1] + (n_out, n_channels)), -1, -2)
+
+
+def synthesize_channels(y, h, oversample=1):
+    r"""
+    Combine frequency channels into signals with a polyphase synthesis
+    filter bank, the inverse of `channelize`.
+
+    Channel ``k`` is interpolated by ``n_channels // oversample`` with
+    the prototype low-pass filter `h`, and shifted to the normalized
+    frequency ``k / n_channels``, where ``n_channels = y.shape[-2]``.
+    The shifted channels are summed.
+
+    Parameters
+    ----------
+    y : array_like
+        Channels, of shape ``(..., n_channels, n_in)``. All leading axes
+        are batched over, one output signal each.
+    h : array_like
+        1-D prototype low-pass FIR filter.
+    oversample : int, optional
+        Ratio of the rate of each channel to the channel spacing, which
+        must divide ``n_channels``. Default is 1, a critically sampled
+        filter bank.
+
+    Returns
+    -------
+    x : ndarray
+        Complex signals, of shape ``y.shape[:-2] + (n_out,)``, with
+        ``n_out = (n_in - 1) * (n_channels // oversample) + len(h)``.
+
+    See Also
+    --------
+    channelize : Split signals into channels with an analysis filter bank.
+
+    Notes
+    -----
+    With ``D = n_channels // oversample`` and ``M = n_channels``, the
+    output is
+
+    .. math:: x[t] = \sum_k e^{2 \pi j k t / M} \sum_n h[t - nD] y_k[n]
+
+    the sum over ``k`` of ``freq_shift(upfirdn(h, y[k], D, 1), -k / M,
+    1)``. As the complex exponential only depends on ``t % M``, the
+    channels are combined with one inverse FFT per input sample before a
+    single polyphase interpolation.
+
+    With a gain of ``D`` applied to `h`, the input of `channelize` is
+    reconstructed, delayed by the group delays of both filters, when the
+    squared magnitude responses of the prototype filter shifted by the
+    channel spacing sum to a constant, and do not overlap once shifted by
+    ``1 / D``.
+    """
+    xp = get_array_module(y, h)
+    y = _asarray(y, xp)
+    h = _asarray(h, xp)
+    if y.ndim < 2:
+        raise ValueError("y must be at least 2D")
+    n_channels, up = _bank_params(h, y.shape[-2], oversample)
+    dtype = xp.result_type(y.dtype, h.dtype, xp.complex64)
+    if dtype.char not in "FD":
+        raise NotImplementedError("input type '%s' not supported" % dtype)
+
+    # Sums over the channels for each output phase, one block per signal
+    y_shape = y.shape
+    n_rows = int(np.prod(y_shape[:-2], dtype=np.int64))
+    w = xp.fft.ifft(y.reshape(n_rows, n_channels, y_shape[-1]), axis=1)
+    w = xp.ascontiguousarray(w, dtype)
+    # Undoes the 1 / n_channels scaling of the inverse FFT
+    h = xp.asarray(h * n_channels, dtype)
+
+    n_out = (y_shape[-1] - 1) * up + len(h)
+    out = _output(None, (n_rows, n_out), dtype, xp, "synthesize.out")
+    _channelize_phases(w, h, n_channels, up, out, synthesis=True)
+
+    return out.reshape(y_shape[:-2] + (n_out,))
+
+
+# State of a stream down-converted in chunks by `ddc`: the NCO `phase` in
+# radians for the next sample, the last ``len(h) - 1`` input samples of
+# each signal, and the number of samples to the next decimated output
+_DDCState = namedtuple("_DDCState", ["phase", "tail", "offset"])
+
+
+def ddc(x, f_offset, fs, h, down=1, phase=None):
+    r"""
+    Digital down-converter: shift signals down in frequency, low-pass
+    filter, and decimate them in a single pass.
+
+    The numerically controlled oscillator (NCO) mixing the signals is
+    generated on the fly, and only the retained output samples are
+    computed, without full-rate temporaries.
+
+    Parameters
+    ----------
+    x : array_like
+        Signals to down-convert, along their last axis.
+    f_offset : float or array_like
+        Frequency shifted to 0 Hz, in the units of `fs`. An array
+        down-converts several channels at once, broadcast with the
+        leading axes of `x`, so that a 1-D `x` and ``n`` frequencies give
+        ``n`` channels.
+    fs : float
+        Sampling frequency of `x`.
+    h : array_like
+        1-D low-pass FIR filter coefficients.
+    down : int, optional
+        Downsampling factor. Default is 1.
+    phase : float or array_like or state, optional
+        Initial phase of the NCO in radians, broadcast like `f_offset`.
+        If given, `x` is the first chunk of a stream, and the state of the
+        stream is also returned. Passing that state instead continues the
+        stream with the next chunk.
+
+    Returns
+    -------
+    y : ndarray
+        Complex down-converted signals, of shape
+        ``broadcast(x.shape[:-1], f_offset, phase) + (n_out,)``. Without
+        `phase`, ``n_out = ceil((x.shape[-1] + len(h) - 1) / down)``.
+        Otherwise, `y` holds the outputs of the stream at the samples of
+        `x`.
+    state : object
+        State of the stream after `x`: the NCO phase, filter history and
+        decimation offset. Only returned if `phase` is given.
+
+    See Also
+    --------
+    freq_shift : Frequency shift a signal.
+    upfirdn : Upsample, FIR filter, and downsample.
+    channelize : Split signals into evenly spaced channels.
+    StreamingUpFIRDn : Resample a stream of chunks.
+
+    Notes
+    -----
+    The output is ``upfirdn(h, freq_shift(x, f_offset, fs) * exp(-1j *
+    phase), 1, down)``. Writing the NCO at sample ``n * down - m`` as its
+    value at ``n * down`` times ``exp(2j * pi * f_offset / fs * m)``, the
+    taps of `h` are modulated once per channel, and each output sample is
+    rotated once.
+
+    The outputs of the chunks of a stream concatenate to the output of
+    the whole signal, but for the filter tail past its end, which is
+    returned by passing ``len(h) - 1`` zeros as a final chunk. The state
+    carries the filter history and the position on the decimation grid
+    across chunks of any length. `f_offset`, `fs`, `h` and `down` must
+    not change during a stream.
+
+    Examples
+    --------
+    Down-convert two channels of a capture, in chunks:
+
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> fs = 1e6
+    >>> h = cusignal.firwin(128, 0.05)
+    >>> f_offset = cp.array([-100e3, 250e3])
+    >>> state = 0.0
+    >>> for chunk in cp.split(cp.random.randn(2 ** 20), 16):
+    ...     y, state = cusignal.ddc(chunk, f_offset, fs, h, 16, state)
+    """
+    xp = get_array_module(x, h)
+    x = _asarray(x, xp)
+    h = _asarray(h, xp)
+    if x.ndim == 0:
+        raise ValueError("x must be at least 1D")
+    if h.ndim != 1 or h.size == 0:
+        raise ValueError("h must be 1D with non-zero length")
+    down = int(down)
+    if down < 1:
+        raise ValueError("down must be >= 1")
+    x_type = xp.result_type(x.dtype, h.dtype, xp.float32)
+    if x_type.char not in "fdFD":
+        raise NotImplementedError("input type '%s' not supported" % x_type)
+    dtype = xp.result_type(x_type, xp.complex64)
+
+    # Frequencies and phases in cycles, and input row, of each output row
+    streaming = phase is not None
+    state = phase if isinstance(phase, _DDCState) else None
+    if state is not None:
+        phase = state.phase
+    freq = np.asarray(cp.asnumpy(f_offset), np.float64) / fs
+    cycles = np.asarray(
+        cp.asnumpy(0.0 if phase is None else phase), np.float64
+    ) / (2 * np.pi)
+    x_shape = x.shape
+    batch_shape = np.broadcast(
+        np.empty(x_shape[:-1], np.bool_), freq, cycles
+    ).shape
+    n_x_rows = int(np.prod(x_shape[:-1], dtype=np.int64))
+    x_rows = np.arange(n_x_rows, dtype=np.int64).reshape(x_shape[:-1])
+    x_rows = np.broadcast_to(x_rows, batch_shape).ravel()
+    freq = np.broadcast_to(freq, batch_shape).ravel()
+    cycles = np.broadcast_to(cycles, batch_shape).ravel()
+
+    n = x_shape[-1]
+    x = x.reshape(n_x_rows, n)
+    m = np.arange(len(h))
+    g = xp.asarray(np.exp(2j * np.pi * freq[:, None] * m)) * h
+    g = xp.ascontiguousarray(g, dtype)
+
+    if not streaming:
+        if x.dtype != x_type or not x.flags.c_contiguous:
+            x_cast = _empty(x.shape, x_type, xp, "ddc.x")
+            x_cast[...] = x
+            x = x_cast
+        n_out = _output_len(len(h), n, 1, down)
+        out = _output(None, batch_shape + (n_out,), dtype, xp, "ddc.out")
+        _ddc(
+            x,
+            xp.asarray(x_rows),
+            g,
+            xp.asarray(freq),
+            xp.asarray(cycles),
+            down,
+            out.reshape(len(freq), n_out),
+        )
+        return out
+
+    # The chunk follows the last inputs of the stream, zeros at its start
+    n_tail = len(h) - 1
+    offset = 0
+    if state is not None:
+        if state.tail.shape != (n_x_rows, n_tail):
+            raise ValueError(
+                "Invalid chunk shape. The stream has %d signals filtered "
+                "with %d taps, got a chunk of shape %r."
+                % (state.tail.shape[0], state.tail.shape[1] + 1, x_shape)
+            )
+        offset = state.offset
+    buf = _empty((n_x_rows, n_tail + n), x_type, xp, "ddc.x")
+    if state is not None:
+        buf[:, :n_tail] = state.tail
+    else:
+        buf[:, :n_tail] = 0
+    buf[:, n_tail:] = x
+
+    # Outputs on the decimation grid of the stream, at the samples of x
+    n_out = max(-(-(n - offset) // down), 0)
+    out = _output(None, batch_shape + (n_out,), dtype, xp, "ddc.out")
+    if n_out:
+        _ddc(
+            buf,
+            xp.asarray(x_rows),
+            g,
+            xp.asarray(freq),
+            xp.asarray(cycles - freq * n_tail),
+            down,
+            out.reshape(len(freq), n_out),
+            n_tail + offset,
+        )
+
+    cycles = cycles + freq * n
+    phase_out = 2 * np.pi * (cycles - np.floor(cycles)).reshape(batch_shape)
+    state = _DDCState(phase_out, buf[:, n:].copy(), (offset - n) % down)
+
+    return out, state
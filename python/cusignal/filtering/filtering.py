@@ -42,7 +42,16 @@ import numpy as np
 
 from ..convolution.correlate import correlate
 from ..filter_design.filter_design_utils import _validate_sos
-from ._sosfilt_cuda import _sosfilt
+from ..utils.arraytools import _axis_slice, _const_ext, _even_ext, _odd_ext
+from ..utils.backend import get_array_module, _asarray
+from ..utils.memory import _empty, _output
+from ._sosfilt_cuda import (
+    _sos_type,
+    _sosfilt,
+    _sosfilt_max_sections,
+    _sosfilt_parallel,
+)
+from ._upfirdn_cuda import _UpFIRDn
 
 
 def wiener(im, mysize=None, noise=None):
@@ -139,36 +148,306 @@ def lfiltic(b, a, y, x=None):
     lfilter, lfilter_zi
 
     """
-    N = cp.size(a) - 1
-    M = cp.size(b) - 1
-    K = cp.max(M, N)
-    y = asarray(y)
-    if y.dtype.kind in "bui":
+    xp = get_array_module(b, a, y, x)
+    a = xp.atleast_1d(_asarray(a, xp))
+    b = xp.atleast_1d(_asarray(b, xp))
+    if a.ndim > 1:
+        raise ValueError("Filter coefficients `a` must be 1-D.")
+    if b.ndim > 1:
+        raise ValueError("Filter coefficients `b` must be 1-D.")
+    N = a.size - 1
+    M = b.size - 1
+    K = max(M, N)
+    y = xp.atleast_1d(_asarray(y, xp))
+
+    if N < 0:
+        raise ValueError("There must be at least one `a` coefficient.")
+
+    inputs = [b, a, y]
+    if x is not None:
+        x = xp.atleast_1d(_asarray(x, xp))
+        inputs.append(x)
+    dtype = xp.result_type(*inputs)
+    if dtype.kind in "bui":
         # ensure calculations are floating point
-        y = y.astype(cp.float64)
-    zi = zeros(K, y.dtype)
-    if x is None:
-        x = zeros(M, y.dtype)
-    else:
-        x = asarray(x)
-        L = cp.size(x)
-        if L < M:
-            x = r_[x, zeros(M - L)]
-    L = cp.size(y)
-    if L < N:
-        y = r_[y, zeros(N - L)]
+        dtype = xp.float64
 
-    for m in range(M):
-        zi[m] = cp.sum(b[m + 1 :] * x[: M - m], axis=0)
+    zi = xp.zeros(K, dtype)
+    if x is not None:
+        zi[:M] = _lfiltic_sum(b, x.astype(dtype, copy=False), M, xp)
+    zi[:N] -= _lfiltic_sum(a, y.astype(dtype, copy=False), N, xp)
 
-    for m in range(N):
-        zi[m] -= cp.sum(a[m + 1 :] * y[: N - m], axis=0)
+    a0 = a[0].item()
+    if a0 != 1:
+        if a0 == 0:
+            raise ValueError("First `a` filter coefficient must be non-zero.")
+        zi /= a0
 
     return zi
 
 
+def _lfiltic_sum(c, v, n, xp):
+    """
+    ``sum(c[m + 1:] * v[:n - m])`` for every ``m < n``, with `v` padded
+    with zeros to `n` values.
+    """
+    # lag[m, k] = k - m pairs c[k + 1] with v[k - m]
+    k = xp.arange(n)
+    lag = k[None, :] - k[:, None]
+    valid = (lag >= 0) & (lag < v.size)
+    terms = v[xp.clip(lag, 0, max(v.size - 1, 0))] * valid
+
+    return (c[1 : n + 1] * terms).sum(axis=1)
+
+
+def _lfilter_fir(b, x, zi):
+    """
+    Filter the rows of `x` with the FIR filter `b`, from delays `zi` of
+    shape ``(x.shape[0], b.size - 1)``. Returns the output and the final
+    delays.
+    """
+    n_samples = x.shape[1]
+    n_delays = b.size - 1
+
+    # Full convolution of each row, with the direct upfirdn kernel. Its
+    # tail holds the contribution of the signal to the final delays.
+    full = _UpFIRDn(b, x.dtype, 1, 1).apply_filter(x, -1)
+    y = full[:, :n_samples]
+    zf = full[:, n_samples:]
+
+    # The initial delays are added to the first outputs, and to the final
+    # delays when the signal is shorter than them
+    n = min(n_delays, n_samples)
+    y[:, :n] += zi[:, :n]
+    zf[:, : n_delays - n] += zi[:, n:]
+
+    return y, zf
+
+
+def _roots(a, n_iter=4):
+    """
+    Roots of the polynomial `a`, refined by Newton iterations in extended
+    precision. The eigenvalues of the companion matrix alone are not
+    accurate enough for the clustered poles of narrow-band filters.
+    """
+    # Trailing zeros are roots at the origin, kept out of the iterations
+    n_zeros = a.size - np.trim_zeros(a, "b").size
+    a = a[: a.size - n_zeros]
+    roots = np.roots(a).astype(np.clongdouble)
+    a = a.astype(np.clongdouble)
+    da = a[:-1] * np.arange(a.size - 1, 0, -1)
+    for _ in range(n_iter):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = np.polyval(a, roots) / np.polyval(da, roots)
+        roots -= np.where(np.isfinite(step), step, 0)
+
+    return np.concatenate((roots, np.zeros(n_zeros))).astype(np.complex128)
+
+
+# Below this many signals, the all-pole part of `lfilter` is also split in
+# time, as one thread block per signal does not occupy the device
+_LFILTER_PARALLEL_ROWS = 256
+
+
+def _lfilter_iir(b, a, x, zi):
+    """
+    Filter the rows of `x` with the IIR filter (`b`, `a`), normalized so
+    that ``a[0] == 1`` and of equal lengths, from delays `zi` of shape
+    ``(x.shape[0], a.size - 1)``. Returns the output and the final delays.
+
+    The output is ``w / A(z)``, where ``w`` is the FIR filtered signal
+    ``b * x`` with the initial delays added to its first samples. The
+    all-pole part is filtered with `sosfilt`, in sections of one or two
+    poles, which is stable for any stable filter. Few rows do not occupy
+    the device, so they are also split in time with the parallel scan of
+    `sosfilt`. The final delays of the direct form II transposed structure
+    are the tail of ``w`` minus that of ``(a - 1) * y``.
+    """
+    xp = get_array_module(x)
+    w, zf = _lfilter_fir(b, x, zi)
+
+    # Conjugate poles are paired for real coefficients
+    poles = _roots(cp.asnumpy(a))
+    if a.dtype.kind == "c":
+        sos = np.zeros((poles.size, 6), poles.dtype)
+        sos[:, 0] = 1
+        sos[:, 3] = 1
+        sos[:, 4] = -poles
+    else:
+        from scipy import signal
+
+        sos = signal.zpk2sos([], poles, 1)
+    sos = xp.asarray(sos).astype(_sos_type(sos, w.dtype), copy=False)
+
+    y = xp.ascontiguousarray(w)
+    z_sos = xp.zeros((y.shape[0], sos.shape[0], 2), y.dtype)
+    if y.shape[0] < _LFILTER_PARALLEL_ROWS:
+        _sosfilt_parallel(sos, y, z_sos)
+    else:
+        _sosfilt(sos, y, z_sos)
+
+    a_tail = a.copy()
+    a_tail[0] = 0
+    _, y_tail = _lfilter_fir(a_tail, y, xp.zeros_like(zi))
+    zf -= y_tail
+
+    return y, zf
+
+
+def lfilter(b, a, x, axis=-1, zi=None):
+    """
+    Filter data along one-dimension with an IIR or FIR filter.
+
+    Filter a data sequence, `x`, using a digital filter. On the GPU, the
+    data types supported are single and double precision, real or
+    complex. The filter is a direct form II transposed implementation of
+    the standard difference equation (see Notes).
+
+    Parameters
+    ----------
+    b : array_like
+        The numerator coefficient vector in a 1-D sequence.
+    a : array_like
+        The denominator coefficient vector in a 1-D sequence.  If ``a[0]``
+        is not 1, then both `a` and `b` are normalized by ``a[0]``.
+    x : array_like
+        An N-dimensional input array.
+    axis : int, optional
+        The axis of the input data array along which to apply the
+        linear filter. The filter is applied to each subarray along
+        this axis.  Default is -1.
+    zi : array_like, optional
+        Initial conditions for the filter delays.  It is a vector
+        (or array of vectors for an N-dimensional input) of length
+        ``max(len(a), len(b)) - 1``.  If `zi` is None or is not given then
+        initial rest is assumed.  See `lfiltic` for more information.
+
+    Returns
+    -------
+    y : array
+        The output of the digital filter.
+    zf : array, optional
+        If `zi` is None, this is not returned, otherwise, `zf` holds the
+        final filter delay values.
+
+    See Also
+    --------
+    lfiltic : Construct initial conditions for `lfilter`.
+    sosfilt : Filter data using cascaded second-order sections.
+
+    Notes
+    -----
+    The filter function is implemented as a direct II transposed
+    structure. This means that the filter implements::
+
+       a[0]*y[n] = b[0]*x[n] + b[1]*x[n-1] + ... + b[M]*x[n-M]
+                             - a[1]*y[n-1] - ... - a[N]*y[n-N]
+
+    On the GPU, filters with a single `a` coefficient are computed as a
+    direct convolution of every signal at once. Other filters are computed
+    as the convolution with `b`, followed by the poles of `a` in
+    second-order sections with `sosfilt`, the poles being found on the
+    host. Filters designed as second-order sections are better filtered
+    with `sosfilt` directly.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> from scipy import signal
+    >>> b, a = signal.butter(3, 0.05)
+    >>> x = cp.random.randn(4, 2 ** 16)
+    >>> zi = cp.asarray(signal.lfilter_zi(b, a))[None, :] * x[:, :1]
+    >>> y, zf = cusignal.lfilter(b, a, x, zi=zi)
+    """
+    xp = get_array_module(b, a, x, zi)
+    b = xp.atleast_1d(_asarray(b, xp))
+    a = xp.atleast_1d(_asarray(a, xp))
+    x = _asarray(x, xp)
+    if a.ndim > 1 or b.ndim > 1:
+        raise ValueError("Filter coefficients `b` and `a` must be 1-D.")
+    if a.size == 0:
+        raise ValueError("There must be at least one `a` coefficient.")
+    if x.ndim == 0:
+        raise ValueError("x must be at least 1D")
+    n_delays = max(a.size, b.size) - 1
+    axis = axis % x.ndim  # make positive
+    x_zi_shape = list(x.shape)
+    x_zi_shape[axis] = n_delays
+    x_zi_shape = tuple(x_zi_shape)
+    inputs = [b, a, x]
+    if zi is not None:
+        zi = _asarray(zi, xp)
+        if zi.shape != x_zi_shape:
+            raise ValueError(
+                "Invalid zi shape. With axis=%r, an input with shape %r, "
+                "and filters of lengths %d and %d, zi must have shape %r, "
+                "got %r."
+                % (axis, x.shape, b.size, a.size, x_zi_shape, zi.shape)
+            )
+        inputs.append(zi)
+    dtype = xp.result_type(*inputs)
+    if dtype.char not in "fdgFDGO":
+        raise NotImplementedError("input type '%s' not supported" % dtype)
+
+    if xp is np:
+        from scipy import signal
+
+        return signal.lfilter(b, a, x, axis=axis, zi=zi)
+
+    # The kernels have no long double or object variants
+    if dtype.char not in "fdFD":
+        raise NotImplementedError("input type '%s' not supported" % dtype)
+
+    a0 = a[0].item()
+    if a0 == 0:
+        raise ValueError("First `a` filter coefficient must be non-zero.")
+    coeffs = xp.zeros((2, n_delays + 1), dtype)
+    coeffs[0, : b.size] = b
+    coeffs[1, : a.size] = a
+    coeffs /= a0
+    b, a = coeffs
+
+    # Filtered as C order arrays with one row per signal
+    x = xp.moveaxis(x, axis, -1)
+    x_shape = x.shape
+    n_rows = int(np.prod(x_shape[:-1], dtype=np.int64))
+    x = xp.ascontiguousarray(x, dtype).reshape(n_rows, x_shape[-1])
+    if zi is not None:
+        zf = xp.moveaxis(zi, axis, -1).astype(dtype)
+        zf = zf.reshape(n_rows, n_delays)
+    else:
+        zf = xp.zeros((n_rows, n_delays), dtype)
+
+    if x.shape[1] == 0:
+        y = x
+    elif a.size == 1 or not a[1:].any():
+        y, zf = _lfilter_fir(b, x, zf)
+    else:
+        y, zf = _lfilter_iir(b, a, x, zf)
+
+    y = xp.moveaxis(y.reshape(x_shape), -1, axis)
+    if zi is not None:
+        zf = xp.moveaxis(zf.reshape(x_shape[:-1] + (n_delays,)), -1, axis)
+        return y, zf
+
+    return y
+
+
+def _validate_sos_bank(sos):
+    """
+    Like `_validate_sos`, also accepting one filter per signal, of shape
+    ``(n_signals, n_sections, 6)``.
+    """
+    if sos.ndim != 3:
+        return _validate_sos(sos)
+
+    _validate_sos(sos.reshape(-1, sos.shape[-1]))
+    return sos, sos.shape[1]
+
+
 def sosfilt(
-    sos, x, axis=-1, zi=None,
+    sos, x, axis=-1, zi=None, out=None, overwrite_x=False, method="serial",
 ):
     """
     Filter data along one dimension using cascaded second-order sections.
@@ -182,7 +461,10 @@ def sosfilt(
         ``(n_sections, 6)``. Each row corresponds to a second-order
         section, with the first three columns providing the numerator
         coefficients and the last three providing the denominator
-        coefficients.
+        coefficients. A different filter can be applied to each signal
+        with an array of shape ``(n_signals, n_sections, 6)``, where
+        ``n_signals`` is the number of signals in `x`, i.e. the product
+        of its dimensions other than `axis`, in C order.
     x : array_like
         An N-dimensional input array.
     axis : int, optional
@@ -197,6 +479,20 @@ def sosfilt(
         (i.e. all zeros) is assumed.
         Note that these initial conditions are *not* the same as the initial
         conditions given by `lfiltic` or `lfilter_zi`.
+    out : ndarray, optional
+        Array the output is written to. It must have the shape of `x` and
+        the data type of the output, and may be `x` itself.
+    overwrite_x : bool, optional
+        If True, `x` may be filtered in place, when it is an array of the
+        output data type, and returned as the output. Ignored if `out` is
+        given. Default is False.
+    method : {'serial', 'parallel'}, optional
+        ``'serial'`` filters each signal from start to end. ``'parallel'``
+        also splits each signal into segments filtered concurrently, then
+        corrects each segment for the filter state at its start (see
+        Notes). It is faster for a few long signals, which do not
+        otherwise occupy the GPU, and the results match ``'serial'`` up to
+        rounding. Default is ``'serial'``.
 
     Returns
     -------
@@ -218,10 +514,22 @@ def sosfilt(
     with direct-form II transposed structure. It is designed to minimize
     numerical precision errors for high-order filters.
 
-    Limitations
-    -----------
-    1. The number of n_sections must be less than 513.
-    2. The number of samples must be greater than the number of sections
+    With ``method='parallel'``, each signal is split into segments which
+    are filtered from zero initial conditions. As the filter is linear,
+    the final delays of the segments give the true delays at every
+    segment boundary through a prefix scan over the segments, computed
+    with ``log2(n_segments)`` matrix products. The response to these
+    delays, a combination of ``2 * n_sections`` precomputed zero-input
+    responses, is then added to all segments at once.
+
+    Complex data, such as IQ samples, is filtered in a single pass. Real
+    coefficients are then kept real, so that each coefficient multiplies
+    the real and imaginary parts without a full complex product.
+
+    On the GPU, each signal is filtered by one thread block with one
+    thread per section. Cascades with more sections than fit in a block
+    are filtered by groups of sections in turn, each passing its output to
+    the next through global memory.
 
     Examples
     --------
@@ -243,22 +551,27 @@ def sosfilt(
     >>> y = cusignal.sosfilt(sos, x)
     """
 
-    x = asarray(x)
-    sos = asarray(sos)
+    if method not in ("serial", "parallel"):
+        raise ValueError(
+            "method must be 'serial' or 'parallel', got {!r}".format(method)
+        )
+    xp = get_array_module(sos, x, zi)
+    x = _asarray(x, xp)
+    sos = _asarray(sos, xp)
     if x.ndim == 0:
         raise ValueError("x must be at least 1D")
-    sos, n_sections = _validate_sos(sos)
+    sos, n_sections = _validate_sos_bank(sos)
     x_zi_shape = list(x.shape)
     x_zi_shape[axis] = 2
     x_zi_shape = tuple([n_sections] + x_zi_shape)
     inputs = [sos, x]
     if zi is not None:
-        inputs.append(np.asarray(zi))
-    dtype = cp.result_type(*inputs)
+        zi = _asarray(zi, xp)
+        inputs.append(zi)
+    dtype = xp.result_type(*inputs)
     if dtype.char not in "fdgFDGO":
         raise NotImplementedError("input type '%s' not supported" % dtype)
     if zi is not None:
-        zi = cp.array(zi, dtype)  # make a copy so that we can operate in place
         if zi.shape != x_zi_shape:
             raise ValueError(
                 "Invalid zi shape. With axis=%r, an input with "
@@ -268,65 +581,512 @@ def sosfilt(
             )
         return_zi = True
     else:
-        zi = cp.zeros(x_zi_shape, dtype=dtype)
         return_zi = False
     axis = axis % x.ndim  # make positive
-    x = cp.moveaxis(x, axis, -1)
-    zi = cp.moveaxis(zi, [0, axis + 1], [-2, -1])
-    x_shape, zi_shape = x.shape, zi.shape
-    x = cp.reshape(x, (-1, x.shape[-1]))
-    x = cp.array(x, dtype, order="C")  # make a copy, can modify in place
-    zi = cp.ascontiguousarray(cp.reshape(zi, (-1, n_sections, 2)))
-    sos = sos.astype(dtype, copy=False)
-
-    d = cp.cuda.device.Device(0)
-    max_smem = d.attributes["MaxSharedMemoryPerBlock"]
-    max_tpb = d.attributes["MaxThreadsPerBlock"]
-
-    # Determine how much shared memory is needed
-    out_size = sos.shape[0]
-    z_size = zi.shape[1] * zi.shape[2]
-    sos_size = sos.shape[0] * sos.shape[1]
-    shared_mem = (out_size + z_size + sos_size) * x.dtype.itemsize
-
-    if shared_mem > max_smem:
-        max_sections = (
-            max_smem // (1 + zi.shape[2] + sos.shape[1]) // x.dtype.itemsize
+    if out is not None:
+        out = _output(
+            out, x.shape, dtype, xp, "sosfilt.out", contiguous=False
         )
+    elif overwrite_x and x.dtype == dtype:
+        out = x
+    in_place = out is x
+    x = xp.moveaxis(x, axis, -1)
+    x_shape = x.shape
+    zi_shape = x_shape[:-1] + (n_sections, 2)
+    n_rows = int(np.prod(x_shape[:-1], dtype=np.int64))
+    if sos.ndim == 3 and sos.shape[0] != n_rows:
         raise ValueError(
-            "The number of sections ({}), requires too much "
-            "shared memory ({}B) > ({}B). \n"
-            "\n**Max sections possible ({})**".format(
-                sos.shape[0], shared_mem, max_smem, max_sections
+            "sos with one filter per signal must have shape %r, got %r."
+            % ((n_rows, n_sections, 6), sos.shape)
+        )
+
+    # Filtered in place, in C order buffers with one row per signal. The
+    # output is used directly when it has this layout.
+    direct = out is not None and (
+        xp.moveaxis(out, axis, -1).flags.c_contiguous
+    )
+    if direct:
+        y = xp.moveaxis(out, axis, -1).reshape(n_rows, x_shape[-1])
+    else:
+        y = _empty((n_rows, x_shape[-1]), dtype, xp, "sosfilt.y")
+        in_place = False
+    if not in_place:
+        y.reshape(x_shape)[...] = x
+    zf = _empty((n_rows, n_sections, 2), dtype, xp, "sosfilt.zi")
+    if return_zi:
+        zf.reshape(zi_shape)[...] = xp.moveaxis(zi, [0, axis + 1], [-2, -1])
+    else:
+        zf.fill(0)
+    sos = sos.astype(_sos_type(sos, dtype), copy=False)
+
+    if method == "parallel":
+        _sosfilt_parallel(sos, y, zf)
+    else:
+        _sosfilt(sos, y, zf)
+    if direct:
+        y = out
+    else:
+        y = xp.moveaxis(y.reshape(x_shape), -1, axis)
+        if out is not None:
+            out[...] = y
+            y = out
+    if return_zi:
+        zf = xp.moveaxis(zf.reshape(zi_shape), [-2, -1], [0, axis + 1])
+        out = (y, zf)
+    else:
+        out = y
+
+    return out
+
+
+class SosFilter(object):
+    r"""
+    Streaming filter using cascaded second-order sections.
+
+    Filters a stream of chunks with `process`, carrying the filter delays
+    from one chunk to the next. The coefficients are validated, and the
+    delays allocated, once when the filter is created. The delays stay
+    resident in device memory and are updated in place, so chunks are
+    filtered without validation or state copies. The output is identical
+    to that of `sosfilt` applied to the whole stream at once.
+
+    Parameters
+    ----------
+    sos : array_like
+        Array of second-order filter coefficients, must have shape
+        ``(n_sections, 6)``, or ``(n_channels, n_sections, 6)`` for one
+        filter per channel. See `sosfilt`.
+    n_channels : int, optional
+        Number of signals filtered in parallel. Chunks have shape
+        ``(n_channels, n_samples)``, or ``(n_samples,)`` for a single
+        channel. Default is 1.
+    dtype : dtype, optional
+        Data type of the chunks. The filter computes in the data type
+        ``result_type(sos, dtype)``. Default is float64.
+    zi : array_like, optional
+        Initial filter delays, of shape ``(n_sections, n_channels, 2)``,
+        or ``(n_sections, 2)`` for a single channel. Default is zeros.
+
+    See Also
+    --------
+    sosfilt
+
+    Notes
+    -----
+    A filter holds its delays for a single stream, and must not be used
+    by concurrently running threads.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> from scipy import signal
+    >>> sos = signal.butter(8, 0.1, output='sos')
+    >>> filt = cusignal.SosFilter(sos, n_channels=4, dtype=cp.float32)
+    >>> for _ in range(10):
+    ...     chunk = cp.random.randn(4, 2 ** 16, dtype=cp.float32)
+    ...     y = filt.process(chunk)
+    """
+
+    def __init__(self, sos, n_channels=1, dtype=cp.float64, zi=None):
+        xp = get_array_module(sos, zi)
+        sos, n_sections = _validate_sos_bank(_asarray(sos, xp))
+
+        n_channels = int(n_channels)
+        if n_channels < 1:
+            raise ValueError("n_channels must be a positive integer")
+        if sos.ndim == 3 and sos.shape[0] != n_channels:
+            raise ValueError(
+                "sos with one filter per channel must have shape %r, got %r."
+                % ((n_channels, n_sections, 6), sos.shape)
             )
+
+        dtype = xp.result_type(sos, dtype)
+        if dtype.char not in "fdgFDGO":
+            raise NotImplementedError("input type '%s' not supported" % dtype)
+
+        self.n_channels = n_channels
+        self.n_sections = n_sections
+        self.dtype = dtype
+
+        self._xp = xp
+        self._sos = xp.ascontiguousarray(sos, _sos_type(sos, dtype))
+        self._zi = xp.zeros((n_channels, n_sections, 2), dtype)
+        if zi is not None:
+            self.reset(zi)
+
+        self._max_sections = None
+        if xp is cp:
+            self._max_sections = _sosfilt_max_sections(
+                self._zi.dtype, self._sos.dtype, 2, self._sos.shape[-1]
+            )
+
+    @property
+    def zi(self):
+        """
+        Copy of the current filter delays, of shape
+        ``(n_sections, n_channels, 2)``.
+        """
+        return self._xp.moveaxis(self._zi, 0, 1).copy()
+
+    def reset(self, zi=None):
+        """
+        Reset the filter delays to `zi`, or to zeros if `zi` is None.
+        """
+        if zi is None:
+            self._zi.fill(0)
+            return
+
+        zi = _asarray(zi, self._xp)
+        shape = (self.n_sections, self.n_channels, 2)
+        if zi.shape != shape and not (
+            self.n_channels == 1 and zi.shape == (self.n_sections, 2)
+        ):
+            raise ValueError(
+                "Invalid zi shape. With %d channels and an sos array with "
+                "%d sections, zi must have shape %r, got %r."
+                % (self.n_channels, self.n_sections, shape, zi.shape)
+            )
+        self._zi[...] = self._xp.moveaxis(zi.reshape(shape), 0, 1)
+
+    def process(self, x, out=None):
+        """
+        Filter the next chunk of the stream.
+
+        Parameters
+        ----------
+        x : array_like
+            Chunk of shape ``(n_channels, n_samples)``, or
+            ``(n_samples,)`` for a single channel.
+        out : ndarray, optional
+            C-contiguous array the output is written to, with the shape of
+            `x` and the data type of the filter. May be `x` itself.
+
+        Returns
+        -------
+        y : ndarray
+            The filtered chunk.
+        """
+        x = _asarray(x, self._xp)
+        if x.shape[:-1] not in ((), (self.n_channels,)) or (
+            x.ndim == 1 and self.n_channels != 1
+        ):
+            raise ValueError(
+                "Invalid chunk shape. With %d channels, chunks must have "
+                "shape (%d, n_samples), got %r."
+                % (self.n_channels, self.n_channels, x.shape)
+            )
+        out = _output(out, x.shape, self.dtype, self._xp, "SosFilter.out")
+        if out is not x:
+            out[...] = x
+
+        _sosfilt(
+            self._sos,
+            out.reshape(self.n_channels, -1),
+            self._zi,
+            self._max_sections,
         )
 
-    if sos.shape[0] > max_tpb:
+        return out
+
+
+def sosfilt_zi(sos):
+    """
+    Construct initial conditions for sosfilt for step response steady-state.
+
+    Compute an initial state `zi` for the `sosfilt` function that
+    corresponds to the steady state of the step response.
+
+    A typical use of this function is to set the initial state so that the
+    output of the filter starts at the same value as the first element of
+    the signal to be filtered.
+
+    Parameters
+    ----------
+    sos : array_like
+        Array of second-order filter coefficients, must have shape
+        ``(n_sections, 6)``, or ``(n_signals, n_sections, 6)`` for one
+        filter per signal. See `sosfilt` for the SOS filter format
+        specification.
+
+    Returns
+    -------
+    zi : ndarray
+        Initial conditions suitable for use with ``sosfilt``, shape
+        ``(n_sections, 2)``, or ``(n_signals, n_sections, 2)`` for one
+        filter per signal.
+
+    See Also
+    --------
+    sosfilt, sosfiltfilt
+
+    Notes
+    -----
+    The steady state of all sections is computed at once, in closed form,
+    each scaled by the DC gain of the sections before it.
+
+    Examples
+    --------
+    Filter a rectangular pulse that begins at time 0, with and without
+    the use of the `zi` argument of `cusignal.sosfilt`.
+
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> from scipy import signal
+    >>> sos = cp.asarray(signal.butter(9, 0.125, output='sos'))
+    >>> x = cp.zeros(101)
+    >>> x[:25] = 1
+    >>> x0 = cusignal.sosfilt(sos, x)
+    >>> zi = x[:1] * cusignal.sosfilt_zi(sos)
+    >>> x1, zf = cusignal.sosfilt(sos, x, zi=zi)
+    """
+    xp = get_array_module(sos)
+    sos, n_sections = _validate_sos_bank(_asarray(sos, xp))
+    if sos.dtype.kind in "bui":
+        sos = sos.astype(xp.float64)
+
+    b = sos[..., :3]
+    a = sos[..., 3:]
+
+    # Steady state of each section for a unit step, the solution of
+    # (I - A.T) zi = b[1:] - a[1:] * b[0], A being the companion matrix of
+    # a, with a[0] = 1
+    B = b[..., 1:] - a[..., 1:] * b[..., :1]
+    zi = xp.empty(sos.shape[:-1] + (2,), sos.dtype)
+    zi[..., 0] = B.sum(axis=-1) / a.sum(axis=-1)
+    zi[..., 1] = B[..., 1] - a[..., 2] * zi[..., 0]
+
+    # Each section sees the step scaled by the DC gain of the previous ones
+    gain = b.sum(axis=-1) / a.sum(axis=-1)
+    scale = xp.ones_like(gain)
+    scale[..., 1:] = xp.cumprod(gain[..., :-1], axis=-1)
+    zi *= scale[..., None]
+
+    return zi
+
+
+def sosfiltfilt(sos, x, axis=-1, padtype="odd", padlen=None):
+    """
+    A forward-backward digital filter using cascaded second-order sections.
+
+    See `filtfilt` for more complete information about this method.
+
+    Parameters
+    ----------
+    sos : array_like
+        Array of second-order filter coefficients, must have shape
+        ``(n_sections, 6)``, or ``(n_signals, n_sections, 6)`` for one
+        filter per signal. See `sosfilt`.
+    x : array_like
+        The array of data to be filtered.
+    axis : int, optional
+        The axis of `x` to which the filter is applied.
+        Default is -1.
+    padtype : str or None, optional
+        Must be 'odd', 'even', 'constant', or None.  This determines the
+        type of extension to use for the padded signal to which the filter
+        is applied.  If `padtype` is None, no padding is used.  The default
+        is 'odd'.
+    padlen : int or None, optional
+        The number of elements by which to extend `x` at both ends of
+        `axis` before applying the filter.  This value must be less than
+        ``x.shape[axis] - 1``.  ``padlen=0`` implies no padding.
+        The default value is::
+
+            3 * (2 * len(sos) + 1 - min((sos[:, 2] == 0).sum(),
+                                        (sos[:, 5] == 0).sum()))
+
+        The extra subtraction at the end attempts to compensate for poles
+        and zeros at the origin (e.g. for odd-order filters) to yield
+        equivalent estimates of `padlen` to those of `filtfilt` for
+        second-order section filters built with `scipy.signal` functions.
+
+    Returns
+    -------
+    y : ndarray
+        The filtered output with the same shape as `x`.
+
+    See Also
+    --------
+    sosfilt, sosfilt_zi
+
+    Notes
+    -----
+    The padded signal is copied once into a buffer holding one row per
+    signal, which both passes filter in place. The backward pass reads and
+    writes each row from its end, so no reversed copy of the signal is
+    made.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> from scipy import signal
+    >>> sos = cp.asarray(signal.butter(4, 0.125, output='sos'))
+    >>> x = cp.random.randn(4, 2 ** 16)
+    >>> y = cusignal.sosfiltfilt(sos, x)
+    """
+    return _sosfiltfilt(sos, x, axis, padtype, padlen)
+
+
+def _sosfiltfilt(
+    sos, x, axis=-1, padtype="odd", padlen=None, down=1, out=None
+):
+    """
+    Implementation of `sosfiltfilt`, keeping only every `down`-th sample
+    of the output, starting with the first. The backward pass computes
+    the kept samples only, into `out` if given.
+    """
+    xp = get_array_module(sos, x)
+    x = _asarray(x, xp)
+    sos = _asarray(sos, xp)
+    if x.ndim == 0:
+        raise ValueError("x must be at least 1D")
+    sos, n_sections = _validate_sos_bank(sos)
+    dtype = xp.result_type(sos, x)
+    if dtype.char not in "fdgFDGO":
+        raise NotImplementedError("input type '%s' not supported" % dtype)
+    if padtype not in ["even", "odd", "constant", None]:
         raise ValueError(
-            "The number of sections ({}), must be less "
-            "than max threads per block ({})".format(sos.shape[0], max_tpb)
+            (
+                "Unknown value '%s' given to padtype.  padtype "
+                "must be 'even', 'odd', 'constant', or None."
+            )
+            % padtype
         )
+    axis = axis % x.ndim  # make positive
 
-    if sos.shape[0] > x.shape[1]:
+    # Filter order, not counting poles and zeros at the origin
+    ntaps = 2 * n_sections + 1
+    ntaps -= int(
+        xp.minimum(
+            (sos[..., 2] == 0).sum(axis=-1), (sos[..., 5] == 0).sum(axis=-1)
+        ).min()
+    )
+    if padtype is None:
+        padlen = 0
+    edge = 3 * ntaps if padlen is None else padlen
+    if x.shape[axis] <= edge:
         raise ValueError(
-            "The number of samples ({}), must be greater "
-            "than the number of sections ({})".format(x.shape[1], sos.shape[0])
+            "The length of the input vector x must be greater "
+            "than padlen, which is %d." % edge
         )
 
-    _sosfilt(sos, x, zi)
-    x.shape = x_shape
-    x = cp.moveaxis(x, -1, axis)
-    if return_zi:
-        zi.shape = zi_shape
-        zi = cp.moveaxis(zi, [-2, -1], [0, axis + 1])
-        out = (x, zi)
+    padded = padtype is not None and edge > 0
+    if padded:
+        ext = {"even": _even_ext, "odd": _odd_ext, "constant": _const_ext}[
+            padtype
+        ](x, edge, axis=axis)
     else:
-        out = x
+        ext = x
+    ext = xp.moveaxis(ext, axis, -1)
+    ext_shape = ext.shape
+    n_rows = int(np.prod(ext_shape[:-1], dtype=np.int64))
+    if sos.ndim == 3 and sos.shape[0] != n_rows:
+        raise ValueError(
+            "sos with one filter per signal must have shape %r, got %r."
+            % ((n_rows, n_sections, 6), sos.shape)
+        )
+
+    # Filtered in place, in a C order buffer with one row per signal. A
+    # padded signal is a new array, used directly when it has this layout.
+    if padded and ext.dtype == dtype and ext.flags.c_contiguous:
+        y = ext.reshape(n_rows, ext_shape[-1])
+    else:
+        y = _empty((n_rows, ext_shape[-1]), dtype, xp, "sosfiltfilt.y")
+        y.reshape(ext_shape)[...] = ext
+    sos = sos.astype(_sos_type(sos, dtype), copy=False)
+    zi = sosfilt_zi(sos)
+    zf = _empty((n_rows, n_sections, 2), dtype, xp, "sosfiltfilt.zi")
+
+    # Each pass starts from the steady state for its first sample
+    zf[...] = zi * y[:, :1, None]
+    _sosfilt(sos, y, zf)
+    zf[...] = zi * y[:, -1:, None]
+    if down == 1:
+        _sosfilt(sos, y, zf, reverse=True)
+        y = xp.moveaxis(y.reshape(ext_shape), -1, axis)
+        if edge > 0:
+            y = _axis_slice(y, start=edge, stop=-edge, axis=axis)
+        return y
+
+    # Samples edge, edge + down, ... of the padded signal are kept
+    n_out = -(-x.shape[axis] // down)
+    out_shape = ext_shape[:-1] + (n_out,)
+    out = _output(
+        out,
+        x.shape[:axis] + (n_out,) + x.shape[axis + 1 :],
+        dtype,
+        xp,
+        "sosfiltfilt.out",
+        contiguous=False,
+    )
+    direct = xp.moveaxis(out, axis, -1).flags.c_contiguous
+    if direct:
+        y_out = xp.moveaxis(out, axis, -1).reshape(n_rows, n_out)
+    else:
+        y_out = _empty((n_rows, n_out), dtype, xp, "sosfiltfilt.y_out")
+    _sosfilt(sos, y, zf, reverse=True, out=y_out, down=down, phase=edge)
+    if not direct:
+        out[...] = xp.moveaxis(y_out.reshape(out_shape), -1, axis)
+
+    return out
+
+
+def _sosfilt_down(sos, x, down, axis=-1, out=None):
+    """
+    Like `sosfilt` without initial conditions, keeping only every
+    `down`-th sample of the output, starting with the first. Only the
+    kept samples are computed, into `out` if given.
+    """
+    xp = get_array_module(sos, x)
+    x = _asarray(x, xp)
+    sos = _asarray(sos, xp)
+    if x.ndim == 0:
+        raise ValueError("x must be at least 1D")
+    sos, n_sections = _validate_sos_bank(sos)
+    dtype = xp.result_type(sos, x)
+    if dtype.char not in "fdgFDGO":
+        raise NotImplementedError("input type '%s' not supported" % dtype)
+    axis = axis % x.ndim  # make positive
+    n_out = -(-x.shape[axis] // down)
+    out = _output(
+        out,
+        x.shape[:axis] + (n_out,) + x.shape[axis + 1 :],
+        dtype,
+        xp,
+        "sosfilt.out",
+        contiguous=False,
+    )
+    x = xp.moveaxis(x, axis, -1)
+    x_shape = x.shape
+    out_shape = x_shape[:-1] + (n_out,)
+    n_rows = int(np.prod(x_shape[:-1], dtype=np.int64))
+    if sos.ndim == 3 and sos.shape[0] != n_rows:
+        raise ValueError(
+            "sos with one filter per signal must have shape %r, got %r."
+            % ((n_rows, n_sections, 6), sos.shape)
+        )
+
+    y = _empty((n_rows, x_shape[-1]), dtype, xp, "sosfilt.y")
+    y.reshape(x_shape)[...] = x
+    zf = _empty((n_rows, n_sections, 2), dtype, xp, "sosfilt.zi")
+    zf.fill(0)
+    sos = sos.astype(_sos_type(sos, dtype), copy=False)
+
+    direct = xp.moveaxis(out, axis, -1).flags.c_contiguous
+    if direct:
+        y_out = xp.moveaxis(out, axis, -1).reshape(n_rows, n_out)
+    else:
+        y_out = _empty((n_rows, n_out), dtype, xp, "sosfilt.y_out")
+    _sosfilt(sos, y, zf, out=y_out, down=down)
+    if not direct:
+        out[...] = xp.moveaxis(y_out.reshape(out_shape), -1, axis)
 
     return out
 
 
-def hilbert(x, N=None, axis=-1):
+def hilbert(x, N=None, axis=-1, out=None):
     """
     Compute the analytic signal, using the Hilbert transform.
 
@@ -340,11 +1100,16 @@ def hilbert(x, N=None, axis=-1):
         Number of Fourier components.  Default: ``x.shape[axis]``
     axis : int, optional
         Axis along which to do the transformation.  Default: -1.
+    out : ndarray, optional
+        Complex array the analytic signal is written to. It must have the
+        shape of `x`, with ``x.shape[axis]`` replaced by `N`, and the data
+        type ``result_type(x.dtype, complex64)``.
 
     Returns
     -------
     xa : ndarray
-        Analytic signal of `x`, of each 1-D array along `axis`
+        Analytic signal of `x`, of each 1-D array along `axis`. Single
+        precision inputs give a complex64 result.
 
     Notes
     -----
@@ -421,8 +1186,20 @@ def hilbert(x, N=None, axis=-1):
     if N <= 0:
         raise ValueError("N must be positive.")
 
-    Xf = fftpack.fft(x, N, axis=axis)
-    h = zeros(N)
+    # Transform in place in the output, instead of in temporaries
+    out_shape = list(x.shape)
+    out_shape[axis] = N
+    dtype = cp.result_type(x.dtype, cp.complex64)
+    out = _output(out, out_shape, dtype, cp, "hilbert.out", contiguous=False)
+    n = min(N, x.shape[axis])
+    ind = [slice(None)] * x.ndim
+    ind[axis] = slice(0, n)
+    if n < N:
+        out.fill(0)
+    out[tuple(ind)] = x[tuple(ind)]
+
+    Xf = fftpack.fft(out, axis=axis, overwrite_x=True)
+    h = zeros(N, out.real.dtype)
     if N % 2 == 0:
         h[0] = h[N // 2] = 1
         h[1 : N // 2] = 2
@@ -434,8 +1211,12 @@ def hilbert(x, N=None, axis=-1):
         ind = [newaxis] * x.ndim
         ind[axis] = slice(None)
         h = h[tuple(ind)]
-    x = fftpack.ifft(Xf * h, axis=axis)
-    return x
+    Xf *= h
+    x = fftpack.ifft(Xf, axis=axis, overwrite_x=True)
+    if x is not out:
+        out[...] = x
+
+    return out
 
 
 def hilbert2(x, N=None):
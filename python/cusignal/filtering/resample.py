@@ -21,14 +21,22 @@ from cupy import (
 from cupyx.scipy import fftpack
 from cupy.fft import ifftshift
 
-from math import gcd
+import numpy as np
+
+from collections import namedtuple
+from math import ceil, gcd, log10
 
 from ..windows.windows import get_window
-from ._upfirdn_cuda import _UpFIRDn, _output_len
-from ..filter_design.fir_filter_design import firwin
+from ..utils.backend import get_array_module, _asarray
+from ..utils._caches import _resample_filter_cache
+from ..utils.memory import _copy_to, _empty, _output
+from ._cic_cuda import _CIC
+from .filtering import _sosfilt_down, _sosfiltfilt
+from ._upfirdn_cuda import _UpFIRDn
+from ..filter_design.fir_filter_design import firwin, kaiser_beta
 
 
-def _design_resample_poly(up, down, window):
+def _design_resample_poly(up, down, window, xp=cp):
     """
     Design a prototype FIR low-pass filter using the window method
     for use in polyphase rational resampling.
@@ -42,6 +50,8 @@ def _design_resample_poly(up, down, window):
     window : string or tuple
         Desired window to use to design the low-pass filter.
         See below for details.
+    xp : module, optional
+        Array module (`cupy` or `numpy`) the filter is designed with.
 
     Returns
     -------
@@ -79,12 +89,126 @@ def _design_resample_poly(up, down, window):
     # reasonable cutoff for our sinc-like function
     half_len = 10 * max_rate
 
-    h = firwin(2 * half_len + 1, f_c, window=window)
+    if xp is np:
+        from scipy import signal
+
+        h = signal.firwin(2 * half_len + 1, f_c, window=window)
+    else:
+        h = firwin(2 * half_len + 1, f_c, window=window)
     return h
 
 
+def _resample_poly_filter(up, down, window, dtype, xp, reused=False):
+    """
+    Return the prepared polyphase filter `resample_poly` applies to a
+    signal of data type `dtype`, and the number of leading outputs it
+    discards to center the output. `up` and `down` must be coprime.
+
+    Filters designed from a window name or tuple are cached. Those, and
+    filters `reused` by the caller, are checked for linear phase.
+    """
+    custom = isinstance(window, (list, ndarray, np.ndarray))
+
+    def design():
+        if up == down == 1:
+            half_len = 0
+            h = xp.ones(1, dtype)
+        elif custom:
+            w = _asarray(window, xp)
+            if w.ndim > 1:
+                raise ValueError("window must be 1-D")
+            half_len = (w.size - 1) // 2
+            h = up * w
+        else:
+            half_len = 10 * max(up, down)
+            h = up * _design_resample_poly(up, down, window, xp)
+
+        # Zero-pad our filter to put the output samples at the center
+        n_pre_pad = down - half_len % down
+        n_pre_remove = (half_len + n_pre_pad) // down
+        h = xp.concatenate((xp.zeros(n_pre_pad, h.dtype), h))
+
+        ufd = _UpFIRDn(h, dtype, up, down, reused or not custom)
+        return ufd, n_pre_remove
+
+    if custom:
+        return design()
+
+    key = (up, down, window, np.dtype(dtype).str, xp.__name__)
+    if xp is cp:
+        key += (cp.cuda.Device().id,)
+
+    return _resample_filter_cache.get_or_compile(key, design)
+
+
+def resample_filter_cache_info():
+    r"""
+    Report the state of the resampling filter cache.
+
+    `resample_poly` and `StreamingResamplePoly` design a low-pass filter
+    from `window` and arrange it for polyphase filtering on first use of
+    each ``(up, down, window)`` and data type. The prepared filters stay
+    resident on the device, in a least recently used cache holding at most
+    ``CUSIGNAL_RESAMPLE_CACHE_MAXSIZE`` filters (default 64). Filters given
+    as coefficient arrays are not cached.
+
+    Returns
+    -------
+    info : dict
+        ``loaded`` and ``maxsize`` are the current and maximum number of
+        filters, ``hits``, ``misses`` and ``evictions`` count lookups in
+        this process, and ``design_time`` is the total time spent
+        designing filters, in seconds.
+
+    See Also
+    --------
+    clear_resample_filter_cache
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> x = cp.random.randn(2 ** 16)
+    >>> y = cusignal.resample_poly(x, 3, 2)
+    >>> y = cusignal.resample_poly(x, 3, 2)
+    >>> cusignal.resample_filter_cache_info()['hits']
+    1
+    """
+    info = _resample_filter_cache.info()
+    info["design_time"] = info.pop("compile_time")
+
+    return info
+
+
+def clear_resample_filter_cache():
+    """
+    Release the filters held by the resampling filter cache. The lookup
+    statistics of `resample_filter_cache_info` are kept.
+    """
+    _resample_filter_cache.clear()
+
+
+def _decimate_sos(q, n, dtype, xp):
+    """
+    Return the cached Chebyshev type I low-pass of order `n` used by
+    `decimate` with ``ftype='iir'``, as second-order sections.
+    """
+
+    def design():
+        from scipy import signal
+
+        sos = signal.cheby1(n, 0.05, 0.8 / q, output="sos")
+        return xp.asarray(sos, dtype)
+
+    key = ("decimate_iir", q, n, np.dtype(dtype).str, xp.__name__)
+    if xp is cp:
+        key += (cp.cuda.Device().id,)
+
+    return _resample_filter_cache.get_or_compile(key, design)
+
+
 def decimate(
-    x, q, n=None, axis=-1, zero_phase=True,
+    x, q, n=None, axis=-1, zero_phase=True, method="single", ftype="fir",
 ):
     """
     Downsample the signal after applying an anti-aliasing filter.
@@ -97,13 +221,25 @@ def decimate(
     n : int or array_like, optional
         The order of the filter (1 less than the length for FIR) to calculate,
         or the FIR filter coefficients to employ. Defaults to calculating the
-        coefficients for 20 times the downsampling factor.
+        coefficients for 20 times the downsampling factor for FIR, and to 8
+        for IIR.
     axis : int, optional
         The axis along which to decimate.
     zero_phase : bool, optional
         Prevent shifting the outputs back by the filter's
-        group delay when using an FIR filter. The default value of ``True`` is
-        recommended, since a phase shift is generally not desired.
+        group delay when using an FIR filter, or filter forwards and
+        backwards with `sosfiltfilt` when using an IIR filter. The default
+        value of ``True`` is recommended, since a phase shift is generally
+        not desired.
+    method : {'single', 'multistage'}, optional
+        Filter with a single FIR filter of order `n`, or in a cascade of
+        stages planned by `ResamplePlan`, which is much cheaper for large
+        `q`. `n` cannot be given with ``'multistage'``, which requires
+        `zero_phase`. Default is ``'single'``.
+    ftype : {'fir', 'iir'}, optional
+        Filter with an FIR filter, or with a Chebyshev type I filter of
+        order `n` in second-order sections. Default is ``'fir'``, unlike
+        SciPy.
 
     Returns
     -------
@@ -113,11 +249,46 @@ def decimate(
     --------
     resample : Resample up or down using the FFT method.
     resample_poly : Resample using polyphase filtering and an FIR filter.
+    ResamplePlan : Multistage plan for polyphase rational resampling.
     Notes
     -----
-    Only FIR filter types are currently supported in cuSignal.
+    The IIR filter has a passband ripple of 0.05 dB and a cutoff of
+    ``0.8 / q`` times the Nyquist frequency, as in SciPy. Its output is
+    computed at the decimated rate only: with `zero_phase`, the forward
+    pass runs at the full rate, and the backward pass computes the kept
+    samples only.
     """
 
+    if ftype not in ("fir", "iir"):
+        raise ValueError("ftype must be 'fir' or 'iir', got %r" % (ftype,))
+
+    if ftype == "iir":
+        if method != "single":
+            raise ValueError("ftype='iir' requires method='single'")
+        if n is not None and not isinstance(n, (int, np.integer)):
+            raise ValueError("n must be an integer order with ftype='iir'")
+        xp = get_array_module(x)
+        x = _asarray(x, xp)
+        # Real coefficients, also for complex signals
+        dtype = x.dtype.char.lower() if x.dtype.char in "fdFD" else "d"
+        sos = _decimate_sos(q, 8 if n is None else n, dtype, xp)
+        if zero_phase:
+            return _sosfiltfilt(sos, x, axis=axis, down=q)
+        return _sosfilt_down(sos, x, q, axis=axis)
+
+    if method == "multistage":
+        if n is not None:
+            raise ValueError("n cannot be given with method='multistage'")
+        if not zero_phase:
+            raise NotImplementedError(
+                "method='multistage' requires zero_phase=True"
+            )
+        return resample_poly(x, 1, q, axis=axis, method="multistage")
+    elif method != "single":
+        raise ValueError(
+            "method must be 'single' or 'multistage', got %r" % (method,)
+        )
+
     x = asarray(x)
     if isinstance(n, (list, ndarray)):
         b = asarray(n)
@@ -276,7 +447,13 @@ def resample(x, num, t=None, axis=0, window=None, domain="time"):
 
 
 def resample_poly(
-    x, up, down, axis=0, window=("kaiser", 5.0),
+    x,
+    up,
+    down,
+    axis=0,
+    window=("kaiser", 5.0),
+    out=None,
+    method="single",
 ):
     """
     Resample `x` along the given axis using polyphase filtering.
@@ -300,6 +477,15 @@ def resample_poly(
     window : string, tuple, or array_like, optional
         Desired window to use to design the low-pass filter, or the FIR filter
         coefficients to employ. See below for details.
+    out : ndarray, optional
+        Array the output is written to. It must have the shape and data
+        type of the output.
+    method : {'single', 'multistage'}, optional
+        Filter with a single polyphase filter designed from `window`, or in
+        a cascade of stages planned by `ResamplePlan` with its default
+        passband and attenuation, in which case `window` is not used. The
+        multistage plan is much cheaper when ``max(up, down)`` is large.
+        Default is ``'single'``.
 
     Returns
     -------
@@ -310,6 +496,7 @@ def resample_poly(
     --------
     decimate : Downsample the signal after applying an FIR or IIR filter.
     resample : Resample up or down using the FFT method.
+    ResamplePlan : Multistage plan for polyphase rational resampling.
 
     Notes
     -----
@@ -361,11 +548,16 @@ def resample_poly(
     >>> plt.show()
     """
 
-    x = asarray(x)
+    xp = get_array_module(x, window)
+    x = _asarray(x, xp)
     up = int(up)
     down = int(down)
     if up < 1 or down < 1:
         raise ValueError("up and down must be >= 1")
+    if method not in ("single", "multistage"):
+        raise ValueError(
+            "method must be 'single' or 'multistage', got %r" % (method,)
+        )
 
     # Determine our up and down factors
     # Use a rational approimation to save computation time on really long
@@ -374,46 +566,33 @@ def resample_poly(
     up //= g_
     down //= g_
     if up == down == 1:
-        return x.copy()
+        return x.copy() if out is None else _copy_to(out, x, xp)
+    if method == "multistage":
+        return _multistage_plan(up, down)(x, axis, out)
+
     n_out = x.shape[axis] * up
     n_out = n_out // down + bool(n_out % down)
 
-    if isinstance(window, (list, ndarray)):
-        window = asarray(window)
-        if window.ndim > 1:
-            raise ValueError("window must be 1-D")
-        half_len = (window.size - 1) // 2
-        h = up * window
-    else:
-        half_len = 10 * max(up, down)
-        h = up * _design_resample_poly(up, down, window)
-
-    # Zero-pad our filter to put the output samples at the center
-    n_pre_pad = down - half_len % down
-    n_post_pad = 0
-    n_pre_remove = (half_len + n_pre_pad) // down
-    # We should rarely need to do this given our filter lengths...
-    while (
-        _output_len(len(h) + n_pre_pad + n_post_pad, x.shape[axis], up, down)
-        < n_out + n_pre_remove
-    ):
-        n_post_pad += 1
-
-    h = cp.concatenate(
-        (zeros(n_pre_pad, h.dtype), h, zeros(n_post_pad, h.dtype))
+    ufd, n_pre_remove = _resample_poly_filter(up, down, window, x.dtype, xp)
+
+    # Filter, computing only the outputs that are kept
+    output_shape = list(x.shape)
+    output_shape[axis] = n_out
+    direct = isinstance(out, xp.ndarray) and out.flags.c_contiguous
+    y = _output(
+        out if direct else None,
+        output_shape,
+        ufd._output_type,
+        xp,
+        "resample_poly.out",
     )
-    n_pre_remove_end = n_pre_remove + n_out
+    ufd._filter(x, axis, y, n_pre_remove)
 
-    # filter then remove excess
-    y = upfirdn(h, x, up, down, axis)
-    keep = [slice(None)] * x.ndim
-    keep[axis] = slice(n_pre_remove, n_pre_remove_end)
-
-    return y[tuple(keep)]
+    return y if direct else _copy_to(out, y, xp)
 
 
 def upfirdn(
-    h, x, up=1, down=1, axis=-1,
+    h, x, up=1, down=1, axis=-1, out=None, detect_symmetry=False,
 ):
     """
     Upsample, FIR filter, and downsample
@@ -423,7 +602,7 @@ def upfirdn(
     h : array_like
         1-dimensional FIR (finite-impulse response) filter coefficients.
     x : array_like
-        Input signal array.
+        Input signal array, of any number of dimensions.
     up : int, optional
         Upsampling rate. Default is 1.
     down : int, optional
@@ -432,6 +611,14 @@ def upfirdn(
         The axis of the input data array along which to apply the
         linear filter. The filter is applied to each subarray along
         this axis. Default is -1.
+    out : ndarray, optional
+        C-contiguous array the output is written to. It must have the
+        shape and data type of the output.
+    detect_symmetry : bool, optional
+        If True and `up` is 1, check whether `h` is symmetric or
+        antisymmetric, and if so filter with half the multiplies. The
+        check waits for the device, so it only pays off for long signals.
+        Default is False.
 
     Returns
     -------
@@ -451,6 +638,10 @@ def upfirdn(
     O(N*Q) per output sample. The polyphase implementation used here is
     O(N/P).
 
+    All axes of `x` but `axis` are batched over, and `x` is read in place
+    along any `axis`. It is only copied if it has to be cast to the output
+    data type, or if its other axes cannot be flattened without a copy.
+
     Examples
     --------
     Simple operations:
@@ -493,7 +684,1207 @@ def upfirdn(
            [ 6.,  7.]])
     """
 
-    x = cp.asarray(x)
-    ufd = _UpFIRDn(h, x.dtype, up, down)
+    xp = get_array_module(x, h)
+    x = _asarray(x, xp)
+    ufd = _UpFIRDn(_asarray(h, xp), x.dtype, up, down, detect_symmetry)
     # This is equivalent to (but faster than) using cp.apply_along_axis
-    return ufd.apply_filter(x, axis)
+    return ufd.apply_filter(x, axis, out)
+
+
+def _cic_types(cic, normalize, compensate):
+    """
+    Data types of the CIC filter output, before compensation, and of the
+    final output
+    """
+    dtype = cic._output_type
+    if dtype.kind == "i" and normalize:
+        dtype = np.dtype(np.float64)
+    if compensate is None:
+        return dtype, dtype
+    return dtype, np.result_type(dtype, compensate.dtype, np.float32)
+
+
+def _cic_scaled(cic, x, axis, out, phase, scale, tag):
+    """CIC filter `x` into `out`, multiplying the output by `scale`"""
+    if out.dtype == cic._output_type:
+        return cic._filter(x, axis, out, phase, scale)
+
+    # Integer outputs are normalized after the exact filtering
+    xp = get_array_module(out)
+    raw = _empty(out.shape, cic._output_type, xp, tag)
+    cic._filter(x, axis, raw, phase)
+    xp.multiply(raw, scale, out=out)
+
+    return out
+
+
+def cic_decimate(
+    x,
+    down,
+    order=4,
+    delay=1,
+    axis=-1,
+    normalize=True,
+    compensate=None,
+    out=None,
+):
+    r"""
+    Downsample with a cascaded integrator-comb (CIC) filter.
+
+    A CIC decimator of order ``N`` and differential delay ``M`` applies
+    ``N`` integrators at the input rate, keeps every `down`-th sample, and
+    applies ``N`` combs of delay ``M`` at the output rate, with the
+    response
+
+    .. math:: H(z) = \left(\frac{1 - z^{-RM}}{1 - z^{-1}}\right)^N
+
+    where ``R`` is `down`. It needs no multiplications, so it is much
+    cheaper than `decimate` for large rate changes.
+
+    Parameters
+    ----------
+    x : array_like
+        The signal to be downsampled, as an N-dimensional array.
+    down : int
+        The downsampling factor.
+    order : int, optional
+        Number of integrator and comb stages, between 1 and 10. Default
+        is 4.
+    delay : int, optional
+        Differential delay of the combs, 1 or 2. Default is 1.
+    axis : int, optional
+        The axis along which to decimate. Default is -1.
+    normalize : bool, optional
+        Divide the output by the DC gain ``(down * delay) ** order`` of
+        the filter. Default is True.
+    compensate : array_like, optional
+        FIR filter applied at the output rate, typically designed with
+        `cic_compensator` to flatten the passband droop of the CIC filter.
+    out : ndarray, optional
+        C-contiguous array the output is written to. It must have the
+        shape and data type of the output.
+
+    Returns
+    -------
+    y : ndarray
+        The downsampled signal, with ``ceil(n / down)`` samples along
+        `axis`. Its data type is int64 for integer `x` without
+        normalization or compensation, and float64 for other integer
+        `x`. Otherwise, it is the floating point type of `x`, promoted
+        with `compensate`.
+
+    See Also
+    --------
+    cic_interpolate : Upsample with a CIC filter.
+    cic_compensator : Design a CIC droop compensation filter.
+    StreamingCICDecimator : CIC decimation of a stream of chunks.
+    decimate : Downsample the signal after applying an FIR filter.
+
+    Notes
+    -----
+    The filter is causal: output ``m`` is the CIC filter output at input
+    ``m * down``, delayed by ``order * (down * delay - 1) / 2`` input
+    samples with respect to the signal. Values beyond the boundary of the
+    signal are assumed to be zero.
+
+    Integer inputs, e.g. from `unpack_bin`, are filtered exactly, with
+    64-bit accumulators whose wrap-around cancels between the integrators
+    and the combs. A ValueError is raised if the output can overflow 64
+    bits. Floating point inputs are accumulated in double precision.
+
+    Each GPU thread computes a run of consecutive outputs, starting the
+    integrators from zero state one filter length before its first
+    output. All axes of `x` but `axis` are batched over.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> x = cp.random.randint(-128, 128, (4, 2 ** 20)).astype(cp.int8)
+    >>> y = cusignal.cic_decimate(x, 64, order=5)
+    >>> y.shape
+    (4, 16384)
+    """
+    xp = get_array_module(x, compensate)
+    x = _asarray(x, xp)
+    axis = axis % x.ndim
+    if compensate is not None:
+        compensate = _asarray(compensate, xp)
+
+    cic = _CIC(down, order, delay, False, x.dtype, xp)
+    cic_type, out_type = _cic_types(cic, normalize, compensate)
+    scale = 1.0 / cic.gain if normalize else 1.0
+    shape = list(x.shape)
+    shape[axis] = cic.output_len(x.shape[axis])
+
+    if compensate is None:
+        y = _output(out, shape, out_type, xp, "cic_decimate.out")
+        return _cic_scaled(cic, x, axis, y, 0, scale, "cic_decimate.raw")
+
+    y = _empty(shape, cic_type, xp, "cic_decimate.cic")
+    _cic_scaled(cic, x, axis, y, 0, scale, "cic_decimate.raw")
+    ufd = _UpFIRDn(compensate, cic_type, 1, 1)
+    out = _output(out, shape, ufd._output_type, xp, "cic_decimate.out")
+
+    return ufd._filter(y, axis, out)
+
+
+def cic_interpolate(
+    x,
+    up,
+    order=4,
+    delay=1,
+    axis=-1,
+    normalize=True,
+    compensate=None,
+    out=None,
+):
+    r"""
+    Upsample with a cascaded integrator-comb (CIC) filter.
+
+    A CIC interpolator of order ``N`` and differential delay ``M`` applies
+    ``N`` combs of delay ``M`` at the input rate, inserts ``up - 1`` zeros
+    after each sample, and applies ``N`` integrators at the output rate.
+    It needs no multiplications, so it is much cheaper than
+    `resample_poly` for large rate changes.
+
+    Parameters
+    ----------
+    x : array_like
+        The signal to be upsampled, as an N-dimensional array.
+    up : int
+        The upsampling factor.
+    order : int, optional
+        Number of integrator and comb stages, between 1 and 10. Default
+        is 4.
+    delay : int, optional
+        Differential delay of the combs, 1 or 2. Default is 1.
+    axis : int, optional
+        The axis along which to interpolate. Default is -1.
+    normalize : bool, optional
+        Divide the output by the DC gain ``(up * delay) ** order / up``
+        of the filter. Default is True.
+    compensate : array_like, optional
+        FIR filter applied at the input rate, typically designed with
+        `cic_compensator` to flatten the passband droop of the CIC filter.
+    out : ndarray, optional
+        C-contiguous array the output is written to. It must have the
+        shape and data type of the output.
+
+    Returns
+    -------
+    y : ndarray
+        The upsampled signal, with ``n * up`` samples along `axis`. See
+        `cic_decimate` for its data type.
+
+    See Also
+    --------
+    cic_decimate : Downsample with a CIC filter.
+    cic_compensator : Design a CIC droop compensation filter.
+    StreamingCICInterpolator : CIC interpolation of a stream of chunks.
+    resample_poly : Resample using polyphase filtering and an FIR filter.
+
+    Notes
+    -----
+    The filter is causal, and delays the signal by
+    ``order * (up * delay - 1) / 2`` output samples. See `cic_decimate`
+    for the handling of integer inputs.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> x = cp.random.randn(4, 2 ** 12)
+    >>> y = cusignal.cic_interpolate(x, 64, order=5)
+    >>> y.shape
+    (4, 262144)
+    """
+    xp = get_array_module(x, compensate)
+    x = _asarray(x, xp)
+    axis = axis % x.ndim
+    if compensate is not None:
+        compensate = _asarray(compensate, xp)
+        ufd = _UpFIRDn(compensate, x.dtype, 1, 1)
+        x_comp = _empty(x.shape, ufd._output_type, xp, "cic_interpolate.x")
+        x = ufd._filter(x, axis, x_comp)
+
+    cic = _CIC(up, order, delay, True, x.dtype, xp)
+    _, out_type = _cic_types(cic, normalize, None)
+    scale = 1.0 / cic.gain if normalize else 1.0
+    shape = list(x.shape)
+    shape[axis] = cic.output_len(x.shape[axis])
+    y = _output(out, shape, out_type, xp, "cic_interpolate.out")
+
+    return _cic_scaled(cic, x, axis, y, 0, scale, "cic_interpolate.raw")
+
+
+ResampleStage = namedtuple(
+    "ResampleStage", ["kind", "up", "down", "numtaps", "cutoff", "cost"]
+)
+
+
+def _factorizations(n, max_factors):
+    """Ordered factorizations of `n` into at most `max_factors` factors"""
+    plans = [(n,)]
+    if max_factors > 1:
+        for f in range(2, int(n ** 0.5) + 1):
+            if n % f == 0:
+                for g in {f, n // f}:
+                    for rest in _factorizations(n // g, max_factors - 1):
+                        plans.append((g,) + rest)
+    return plans
+
+
+def _design_lowpass(numtaps, cutoff, beta, xp):
+    """Kaiser window low-pass filter, with `cutoff` relative to Nyquist"""
+    if xp is np:
+        from scipy import signal
+
+        return signal.firwin(numtaps, cutoff, window=("kaiser", beta))
+    return firwin(numtaps, cutoff, window=("kaiser", beta))
+
+
+class _PolyphaseStage(object):
+    def __init__(self, stage, beta, dtype, xp):
+        h = _design_lowpass(stage.numtaps, stage.cutoff, beta, xp)
+        self._ufd, self._n_pre_remove = _resample_poly_filter(
+            stage.up, stage.down, h, dtype, xp, reused=True
+        )
+        self._up = stage.up
+        self._down = stage.down
+        self._output_type = self._ufd._output_type
+        self._xp = xp
+
+    def __call__(self, x, axis, tag):
+        n_out = x.shape[axis] * self._up
+        n_out = n_out // self._down + bool(n_out % self._down)
+        shape = list(x.shape)
+        shape[axis] = n_out
+        y = _empty(shape, self._output_type, self._xp, tag)
+
+        return self._ufd._filter(x, axis, y, self._n_pre_remove)
+
+
+class _CICStage(object):
+    def __init__(self, stage, dtype, xp):
+        """
+        Normalized CIC decimation with unit differential delay, centered
+        with respect to its ``order * (down - 1) + 1`` taps.
+        """
+        order = (stage.numtaps - 1) // (stage.down - 1)
+        self._cic = _CIC(stage.down, order, 1, False, dtype, xp)
+        self._output_type, _ = _cic_types(self._cic, True, None)
+        self._phase = (stage.numtaps - 1) // 2
+        self._xp = xp
+
+    def __call__(self, x, axis, tag):
+        shape = list(x.shape)
+        shape[axis] = self._cic.output_len(x.shape[axis])
+        y = _empty(shape, self._output_type, self._xp, tag)
+
+        return _cic_scaled(
+            self._cic,
+            x,
+            axis,
+            y,
+            self._phase,
+            1.0 / self._cic.gain,
+            "ResamplePlan.raw",
+        )
+
+
+class _HalfbandStage(object):
+    def __init__(self, stage, beta, dtype, xp):
+        """
+        Decimation or interpolation by 2 with a halfband filter of
+        ``4 * m + 3`` taps. Every other tap is zero but the center one, so
+        one polyphase branch reduces to a scaled copy of the input, and
+        the other is a symmetric filter of ``2 * m + 2`` taps.
+        """
+        h = _design_lowpass(stage.numtaps, 0.5, beta, xp) * stage.up
+        self._m = (stage.numtaps - 3) // 4
+        self._center = h[2 * self._m + 1].item()
+        self._ufd = _UpFIRDn(
+            xp.ascontiguousarray(h[::2]), dtype, 1, 1, True
+        )
+        self._interpolate = stage.up == 2
+        self._output_type = self._ufd._output_type
+        self._xp = xp
+
+    def __call__(self, x, axis, tag):
+        xp = self._xp
+        dtype = self._output_type
+        n = x.shape[axis]
+        index = [slice(None)] * x.ndim
+
+        if self._interpolate:
+            # Even outputs copy the input, odd ones filter it
+            shape = list(x.shape)
+            shape[axis] = 2 * n
+            y = _empty(shape, dtype, xp, tag)
+            y_pairs = y.reshape(shape[:axis] + [n, 2] + shape[axis + 1 :])
+
+            odd = _empty(x.shape, dtype, xp, "ResamplePlan.odd")
+            self._ufd._filter(x, axis, odd, self._m + 1)
+            y_pairs[tuple(index[: axis + 1] + [1])] = odd
+            y_even = y_pairs[tuple(index[: axis + 1] + [0])]
+            y_even[...] = x
+            y_even *= self._center
+
+            return y
+
+        # Filter the odd inputs, and add the scaled even ones
+        index[axis] = slice(0, None, 2)
+        x_even = x[tuple(index)]
+        index[axis] = slice(1, None, 2)
+        x_odd = x[tuple(index)]
+
+        y = _empty(x_even.shape, dtype, xp, tag)
+        if n > 1:
+            self._ufd._filter(x_odd, axis, y, self._m)
+        else:
+            y.fill(0)
+        y += x_even * self._center
+
+        return y
+
+
+class ResamplePlan(object):
+    r"""
+    Multistage plan for polyphase rational resampling.
+
+    Factors a resampling by ``up / down`` into a cascade of stages,
+    which are cheaper than a single polyphase filter when the rate change
+    is large. The plan with the lowest estimated cost is chosen among
+    all orderings of up to `max_stages` factors of the larger rate.
+    Only the stage operating at the lower output or input rate needs the
+    sharp transition of the overall filter. The other stages only remove
+    the components that would alias, or images that would appear, in the
+    band of interest, so they have far fewer taps.
+
+    Parameters
+    ----------
+    up : int
+        The upsampling factor.
+    down : int
+        The downsampling factor.
+    passband : float, optional
+        Edge of the passband, as a fraction of the lower of the input and
+        output Nyquist frequencies, where the stopband starts. Default is
+        0.8.
+    atten : float, optional
+        Stopband attenuation and passband ripple of the overall filter,
+        in dB. Default is 60.
+    max_stages : int, optional
+        Maximum number of stages. Default is 4.
+    cic : bool, optional
+        Consider CIC stages for decimation. Default is True.
+
+    Attributes
+    ----------
+    stages : tuple of ResampleStage
+        The stages, in the order they are applied. Each one has a `kind`,
+        ``'cic'``, ``'halfband'`` or ``'polyphase'``, its `up` and `down`
+        factors, the `numtaps` and `cutoff` (relative to Nyquist, at the
+        upsampled rate) of its Kaiser window filter, and its estimated
+        `cost`. CIC stages have the `numtaps` of their equivalent FIR
+        filter, ``order * (down - 1) + 1``, and no `cutoff`.
+    cost : float
+        Estimated number of multiply-accumulates per input sample,
+        counting each addition of CIC stages as one.
+
+    See Also
+    --------
+    resample_poly : Resample using polyphase filtering and an FIR filter.
+    decimate : Downsample the signal after applying an anti-aliasing filter.
+
+    Notes
+    -----
+    Each stage is designed with the Kaiser window method, to a stopband
+    attenuation raised by ``20 * log10(n_stages)`` dB so that the ripples
+    of the stages add up to at most `atten`. Decimation and interpolation
+    by 2 outside of the sharp stage use halfband filters, half of whose
+    taps are zero. Linear-phase stages with a single phase pre-add
+    mirrored samples, halving their multiplications.
+
+    Decimation stages before the sharp one may instead use a CIC filter
+    (see `cic_decimate`) of the lowest order whose aliases into the band
+    of interest are attenuated by the stage attenuation. It is only used
+    if its passband droop is within the stage ripple, which requires a
+    large overall decimation, and if its additions are cheaper than the
+    multiply-accumulates of a polyphase stage.
+
+    The output is centered with respect to each filter, like the output
+    of `resample_poly`.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> plan = cusignal.ResamplePlan(1, 256)
+    >>> [(s.kind, s.down) for s in plan.stages]
+    [('polyphase', 32), ('polyphase', 4), ('polyphase', 2)]
+    >>> y = plan(cp.random.randn(2 ** 20))
+    >>> y = cusignal.decimate(cp.random.randn(2 ** 20), 256,
+    ...                       method='multistage')
+    """
+
+    def __init__(
+        self, up, down, passband=0.8, atten=60.0, max_stages=4, cic=True
+    ):
+        up = int(up)
+        down = int(down)
+        if up < 1 or down < 1:
+            raise ValueError("up and down must be >= 1")
+        if not 0 < passband < 1:
+            raise ValueError("passband must be between 0 and 1")
+        if atten <= 7.95:
+            raise ValueError("atten must be larger than 7.95 dB")
+        if int(max_stages) < 1:
+            raise ValueError("max_stages must be a positive integer")
+
+        g_ = gcd(up, down)
+        self.up = up // g_
+        self.down = down // g_
+        self.passband = float(passband)
+        self.atten = float(atten)
+        self._cic = bool(cic)
+
+        best = ()
+        if self.up != self.down:
+            for factors in _factorizations(
+                max(self.up, self.down), int(max_stages)
+            ):
+                stages = self._plan(factors)
+                if stages is None:
+                    continue
+                cost = sum(s.cost for s in stages)
+                if not best or (cost, len(stages)) < (
+                    sum(s.cost for s in best),
+                    len(best),
+                ):
+                    best = stages
+
+        self.stages = best
+        self.cost = sum(s.cost for s in best)
+        self._prepared = {}
+
+    def _plan(self, factors):
+        """Design the stages for an ordering of factors, if it is valid"""
+        if self.down > self.up:
+            # Decimate first, and change the rate by up / down last
+            rates = [(1, d) for d in factors[:-1]]
+            rates.append((self.up, factors[-1]))
+        else:
+            rates = [(factors[0], self.down)]
+            rates += [(u, 1) for u in factors[1:]]
+
+        # Rates relative to the input rate, and the band of interest
+        band = min(1.0, self.up / self.down) / 2
+        f_pass = self.passband * band
+        atten = self.atten + 20 * log10(len(rates))
+
+        stages = []
+        rate = 1.0
+        for up, down in rates:
+            low = rate * min(up, down) / down
+            high = rate * up
+            sharp = low <= 2 * band * (1 + 1e-9)
+
+            order = None
+            if not sharp and up == 1 and down > 2 and self._cic:
+                order = self._cic_order(
+                    down, band / rate, f_pass / rate, atten
+                )
+
+            if order is not None:
+                # Additions at the input rate, with restarts, and the
+                # output rate
+                cost = order * (1.125 + 1.0 / down)
+                stage = ResampleStage(
+                    "cic", 1, down, order * (down - 1) + 1, None, cost * rate
+                )
+            if not sharp and (up, down) in ((1, 2), (2, 1)):
+                # Transition band symmetric around a quarter of `high`
+                width = low - 2 * band
+                numtaps = ceil((atten - 7.95) / (14.36 * width / high)) + 1
+                numtaps = max(4 * ceil((numtaps - 3) / 4) + 3, 3)
+                m = (numtaps - 3) // 4
+                cost = (m + 2) * up / 2
+                stages.append(
+                    ResampleStage(
+                        "halfband", up, down, numtaps, 0.5, cost * rate
+                    )
+                )
+            else:
+                # Pass the band of interest, stop what folds into it
+                f_stop = low - band
+                width = f_stop - f_pass
+                if width <= 0:
+                    # An earlier stage went below the band of interest
+                    return None
+                numtaps = ceil((atten - 7.95) / (14.36 * width / high)) + 1
+                numtaps |= 1
+                cutoff = (f_pass + f_stop) / high
+                if up == 1:
+                    cost = (numtaps // 2 + 1) / down
+                else:
+                    cost = numtaps / down
+                stages.append(
+                    ResampleStage(
+                        "polyphase", up, down, numtaps, cutoff, cost * rate
+                    )
+                )
+            if order is not None and stage.cost < stages[-1].cost:
+                stages[-1] = stage
+            rate = rate * up / down
+
+        return tuple(stages)
+
+    @staticmethod
+    def _cic_order(down, band, f_pass, atten):
+        """
+        Lowest order of a CIC decimator by `down` meeting the stage
+        specifications, with frequencies relative to its input rate, or
+        None. Centering requires an even order for even `down`.
+        """
+
+        def response(f):
+            return abs(np.sin(np.pi * f * down) / (down * np.sin(np.pi * f)))
+
+        ripple = 10 ** (-atten / 20)
+        alias = 20 * log10(response(1.0 / down - band))
+        step = 2 if down % 2 == 0 else 1
+        for order in range(step, 7, step):
+            if alias * order <= -atten:
+                if 1 - response(f_pass) ** order <= ripple:
+                    return order
+                return None
+
+        return None
+
+    def _prepare(self, dtype, xp):
+        """Design the stage filters on first use with each data type"""
+        key = (np.dtype(dtype).str, xp.__name__)
+        if xp is cp:
+            key += (cp.cuda.Device().id,)
+
+        stages = self._prepared.get(key)
+        if stages is None:
+            beta = kaiser_beta(self.atten + 20 * log10(len(self.stages)))
+            stages = []
+            for stage in self.stages:
+                if stage.kind == "cic":
+                    stages.append(_CICStage(stage, dtype, xp))
+                elif stage.kind == "halfband":
+                    stages.append(_HalfbandStage(stage, beta, dtype, xp))
+                else:
+                    stages.append(_PolyphaseStage(stage, beta, dtype, xp))
+                # Later stages see the output data type of this one
+                dtype = stages[-1]._output_type
+            self._prepared[key] = stages
+
+        return stages
+
+    def __repr__(self):
+        return "ResamplePlan(up={}, down={}, stages={}, cost={:.1f})".format(
+            self.up,
+            self.down,
+            [(s.kind, s.up, s.down, s.numtaps) for s in self.stages],
+            self.cost,
+        )
+
+    def __call__(self, x, axis=-1, out=None):
+        """
+        Resample `x` along `axis` according to the plan.
+
+        Parameters
+        ----------
+        x : array_like
+            The data to be resampled.
+        axis : int, optional
+            The axis of `x` that is resampled. Default is -1.
+        out : ndarray, optional
+            Array the output is written to. It must have the shape and
+            data type of the output.
+
+        Returns
+        -------
+        resampled_x : ndarray
+            The resampled array, with ``ceil(n * up / down)`` samples
+            along `axis`.
+        """
+        xp = get_array_module(x)
+        x = _asarray(x, xp)
+        axis = axis % x.ndim
+        if not self.stages:
+            return x.copy() if out is None else _copy_to(out, x, xp)
+
+        n_out = x.shape[axis] * self.up
+        n_out = n_out // self.down + bool(n_out % self.down)
+
+        y = x
+        for i, stage in enumerate(self._prepare(x.dtype, xp)):
+            # Alternate between two buffers in a workspace
+            y = stage(y, axis, "ResamplePlan.stage%d" % (i % 2))
+
+        # Stages round their output lengths up
+        keep = [slice(None)] * x.ndim
+        keep[axis] = slice(0, n_out)
+
+        return _copy_to(out, y[tuple(keep)], xp)
+
+
+def _multistage_plan(up, down):
+    """Return the cached default plan for coprime `up` and `down`"""
+    return _resample_filter_cache.get_or_compile(
+        ("multistage", up, down), lambda: ResamplePlan(up, down)
+    )
+
+
+class StreamingUpFIRDn(object):
+    r"""
+    Streaming upsample, FIR filter, and downsample.
+
+    Applies `upfirdn` to a stream of chunks with `process`, carrying the
+    polyphase history from one chunk to the next. The filter is
+    transformed into its polyphase arrangement once, when the object is
+    created, and stays resident together with the last input samples of
+    the stream. The concatenated outputs of `process` and `flush` are
+    identical to the output of `upfirdn` applied to the whole stream.
+
+    Parameters
+    ----------
+    h : array_like
+        1-dimensional FIR (finite-impulse response) filter coefficients.
+    up : int, optional
+        Upsampling rate. Default is 1.
+    down : int, optional
+        Downsampling rate. Default is 1.
+    dtype : dtype, optional
+        Data type of the chunks. The output has the data type
+        ``result_type(h, dtype, float32)``. Default is float64.
+    n_channels : int, optional
+        Number of signals resampled in parallel. Chunks have shape
+        ``(n_channels, n_samples)``, or ``(n_samples,)`` for a single
+        channel. Default is 1.
+
+    See Also
+    --------
+    upfirdn
+    StreamingResamplePoly
+
+    Notes
+    -----
+    Each call to `process` returns the outputs that depend only on the
+    samples received so far, so chunk sizes may vary freely. `flush` ends
+    the stream, returning the outputs that depend on its last samples.
+
+    An object holds the history of a single stream, and must not be used
+    by concurrently running threads.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> h = cusignal.firwin(63, 0.2)
+    >>> ufd = cusignal.StreamingUpFIRDn(h, 2, 5, dtype=cp.complex64)
+    >>> for _ in range(10):
+    ...     chunk = cp.random.randn(2 ** 16).astype(cp.complex64)
+    ...     y = ufd.process(chunk)
+    >>> y = ufd.flush()
+    """
+
+    def __init__(self, h, up=1, down=1, dtype=cp.float64, n_channels=1):
+        xp = get_array_module(h)
+        ufd = _UpFIRDn(_asarray(h, xp), dtype, up, down, True)
+        self._init(ufd, n_channels, xp)
+
+    def _init(self, ufd, n_channels, xp):
+        self._ufd = ufd
+
+        n_channels = int(n_channels)
+        if n_channels < 1:
+            raise ValueError("n_channels must be a positive integer")
+
+        self.up = self._ufd._up
+        self.down = self._ufd._down
+        self.n_channels = n_channels
+        self.dtype = self._ufd._output_type
+
+        self._xp = xp
+        self._h_per_phase = len(self._ufd._h_trans_flip) // self.up
+        # Output and input indices repeat their phases every `_period`
+        # outputs, which consume `_stride` inputs
+        g_ = gcd(self.up, self.down)
+        self._period = self.up // g_
+        self._stride = self.down // g_
+        # Last inputs of the stream, preceded by zeros at its start
+        self._tail = xp.zeros((n_channels, self._h_per_phase - 1), self.dtype)
+        # Leading outputs that are not returned
+        self._n_skip = 0
+        self.reset()
+
+    def reset(self):
+        """
+        Reset the object to the start of a new stream.
+        """
+        self._tail.fill(0)
+        self._n_in = 0
+        self._n_out = self._n_skip
+        self._n_stop = None
+
+    def output_len(self, n):
+        """
+        Number of outputs `process` returns for a chunk of `n` samples.
+        """
+        n_avail = -(-(self._n_in + int(n)) * self.up // self.down)
+        if self._n_stop is not None:
+            n_avail = min(n_avail, self._n_stop)
+        return max(n_avail - self._n_out, 0)
+
+    def process(self, x, out=None):
+        """
+        Resample the next chunk of the stream.
+
+        Parameters
+        ----------
+        x : array_like
+            Chunk of shape ``(n_channels, n_samples)``, or
+            ``(n_samples,)`` for a single channel.
+        out : ndarray, optional
+            C-contiguous array the output is written to. It must have the
+            shape of the output, with ``output_len(n_samples)`` samples,
+            and the data type of the object.
+
+        Returns
+        -------
+        y : ndarray
+            The outputs that depend only on the samples received so far.
+        """
+        xp = self._xp
+        x = _asarray(x, xp)
+        if x.shape[:-1] not in ((), (self.n_channels,)) or (
+            x.ndim == 1 and self.n_channels != 1
+        ):
+            raise ValueError(
+                "Invalid chunk shape. With %d channels, chunks must have "
+                "shape (%d, n_samples), got %r."
+                % (self.n_channels, self.n_channels, x.shape)
+            )
+
+        n = x.shape[-1]
+        n_tail = self._tail.shape[1]
+        n_new = self.output_len(n)
+        out = _output(
+            out,
+            x.shape[:-1] + (n_new,),
+            self.dtype,
+            xp,
+            "StreamingUpFIRDn.out",
+        )
+
+        buf = _empty(
+            (self.n_channels, n_tail + n),
+            self.dtype,
+            xp,
+            "StreamingUpFIRDn.x",
+        )
+        buf[:, :n_tail] = self._tail
+        buf[:, n_tail:] = x.reshape(self.n_channels, n)
+
+        if n_new:
+            # Shift both indices back by whole periods to keep them small
+            k = self._n_out // self._period
+            self._ufd._filter(
+                buf,
+                1,
+                out.reshape(self.n_channels, n_new),
+                self._n_out - k * self._period,
+                self._n_in - n_tail - k * self._stride,
+            )
+
+        self._tail[...] = buf[:, n:]
+        self._n_in += n
+        self._n_out += n_new
+
+        return out
+
+    def _end(self):
+        """Total number of outputs of the stream received so far"""
+        return -(-(self._n_in + self._h_per_phase - 1) * self.up // self.down)
+
+    def flush(self, out=None):
+        """
+        End the stream, and reset the object for a new one.
+
+        Parameters
+        ----------
+        out : ndarray, optional
+            C-contiguous array the output is written to. See `process`.
+
+        Returns
+        -------
+        y : ndarray
+            The remaining outputs of the stream.
+        """
+        # Pad with the fewest zeros that produce the last output
+        self._n_stop = self._end()
+        n_zeros = 0
+        if self._n_stop > 0:
+            n_zeros = (self._n_stop - 1) * self.down // self.up + 1
+            n_zeros = max(n_zeros - self._n_in, 0)
+
+        shape = (n_zeros,)
+        if self.n_channels != 1:
+            shape = (self.n_channels,) + shape
+        y = self.process(self._xp.zeros(shape, self.dtype), out)
+        self.reset()
+
+        return y
+
+
+class StreamingResamplePoly(StreamingUpFIRDn):
+    r"""
+    Streaming polyphase resampling.
+
+    Applies `resample_poly` to a stream of chunks with `process`,
+    carrying the polyphase history from one chunk to the next. The
+    concatenated outputs of `process` and `flush` are identical to the
+    output of `resample_poly` applied to the whole stream.
+
+    Parameters
+    ----------
+    up : int
+        The upsampling factor.
+    down : int
+        The downsampling factor.
+    window : string, tuple, or array_like, optional
+        Desired window to use to design the low-pass filter, or the FIR
+        filter coefficients to employ. See `resample_poly`.
+    dtype : dtype, optional
+        Data type of the chunks. Default is float64.
+    n_channels : int, optional
+        Number of signals resampled in parallel. Chunks have shape
+        ``(n_channels, n_samples)``, or ``(n_samples,)`` for a single
+        channel. Default is 1.
+
+    See Also
+    --------
+    resample_poly
+    StreamingUpFIRDn
+
+    Notes
+    -----
+    The output of `resample_poly` is centered with respect to the filter,
+    so each chunk's output lags its input by about half the filter
+    length. The last outputs are returned by `flush`, which pads the
+    stream with just enough zeros for ``ceil(n_samples * up / down)``
+    outputs in total.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> rs = cusignal.StreamingResamplePoly(3, 2, n_channels=4)
+    >>> for _ in range(10):
+    ...     chunk = cp.random.randn(4, 2 ** 16)
+    ...     y = rs.process(chunk)
+    >>> y = rs.flush()
+    """
+
+    def __init__(
+        self, up, down, window=("kaiser", 5.0), dtype=cp.float64, n_channels=1
+    ):
+        xp = get_array_module(window)
+        up = int(up)
+        down = int(down)
+        if up < 1 or down < 1:
+            raise ValueError("up and down must be >= 1")
+
+        g_ = gcd(up, down)
+        up //= g_
+        down //= g_
+
+        ufd, n_skip = _resample_poly_filter(
+            up, down, window, dtype, xp, reused=True
+        )
+        self._init(ufd, n_channels, xp)
+        self._n_skip = n_skip
+        self.reset()
+
+    def _end(self):
+        return self._n_skip - (-self._n_in * self.up // self.down)
+
+
+class _StreamingCIC(object):
+    def __init__(
+        self,
+        rate,
+        order,
+        delay,
+        interpolate,
+        dtype,
+        n_channels,
+        normalize,
+        compensate,
+    ):
+        xp = get_array_module(compensate)
+        n_channels = int(n_channels)
+        if n_channels < 1:
+            raise ValueError("n_channels must be a positive integer")
+
+        self.n_channels = n_channels
+        self._interpolate = interpolate
+        self._xp = xp
+
+        # Compensation at the low rate, before interpolation
+        self._comp = None
+        cic_type = np.dtype(dtype)
+        if compensate is not None:
+            compensate = _asarray(compensate, xp)
+            if interpolate:
+                self._comp = StreamingUpFIRDn(
+                    compensate, dtype=dtype, n_channels=n_channels
+                )
+                cic_type = self._comp.dtype
+
+        self._cic = _CIC(rate, order, delay, interpolate, cic_type, xp)
+        self._cic_type, self.dtype = _cic_types(
+            self._cic, normalize, compensate
+        )
+        self._scale = 1.0 / self._cic.gain if normalize else 1.0
+        if compensate is not None and not interpolate:
+            self._comp = StreamingUpFIRDn(
+                compensate, dtype=self._cic_type, n_channels=n_channels
+            )
+            self.dtype = self._comp.dtype
+
+        self.rate = self._cic._rate
+        n_tail = self._cic.numtaps - 1
+        if interpolate:
+            n_tail = -(-n_tail // self.rate)
+        # Last inputs of the stream, preceded by zeros at its start
+        self._tail = xp.zeros((n_channels, n_tail), cic_type)
+        self.reset()
+
+    def reset(self):
+        """
+        Reset the object to the start of a new stream.
+        """
+        self._tail.fill(0)
+        self._n_in = 0
+        self._n_out = 0
+        if self._comp is not None:
+            self._comp.reset()
+
+    def output_len(self, n):
+        """
+        Number of outputs `process` returns for a chunk of `n` samples.
+        """
+        return self._cic.output_len(self._n_in + int(n)) - self._n_out
+
+    def process(self, x, out=None):
+        """
+        Filter the next chunk of the stream.
+
+        Parameters
+        ----------
+        x : array_like
+            Chunk of shape ``(n_channels, n_samples)``, or
+            ``(n_samples,)`` for a single channel.
+        out : ndarray, optional
+            C-contiguous array the output is written to. It must have the
+            shape of the output, with ``output_len(n_samples)`` samples,
+            and the data type of the object.
+
+        Returns
+        -------
+        y : ndarray
+            The outputs up to the last sample received.
+        """
+        xp = self._xp
+        x = _asarray(x, xp)
+        if x.shape[:-1] not in ((), (self.n_channels,)) or (
+            x.ndim == 1 and self.n_channels != 1
+        ):
+            raise ValueError(
+                "Invalid chunk shape. With %d channels, chunks must have "
+                "shape (%d, n_samples), got %r."
+                % (self.n_channels, self.n_channels, x.shape)
+            )
+
+        n = x.shape[-1]
+        n_tail = self._tail.shape[1]
+        n_new = self.output_len(n)
+        if self._interpolate and self._comp is not None:
+            x = self._comp.process(x)
+
+        buf = _empty(
+            (self.n_channels, n_tail + n),
+            self._tail.dtype,
+            xp,
+            "StreamingCIC.x",
+        )
+        buf[:, :n_tail] = self._tail
+        buf[:, n_tail:] = x.reshape(self.n_channels, n)
+
+        # Position of the next output, relative to the start of `buf`
+        if self._interpolate:
+            phase = n_tail * self.rate
+        else:
+            phase = self._n_out * self.rate - (self._n_in - n_tail)
+
+        shape = x.shape[:-1] + (n_new,)
+        if self._interpolate or self._comp is None:
+            y = _output(out, shape, self.dtype, xp, "StreamingCIC.out")
+        else:
+            y = _empty(shape, self._cic_type, xp, "StreamingCIC.cic")
+        _cic_scaled(
+            self._cic,
+            buf,
+            1,
+            y.reshape(self.n_channels, n_new),
+            phase,
+            self._scale,
+            "StreamingCIC.raw",
+        )
+        if not self._interpolate and self._comp is not None:
+            y = self._comp.process(y, out)
+
+        self._tail[...] = buf[:, n:]
+        self._n_in += n
+        self._n_out += n_new
+
+        return y
+
+
+class StreamingCICDecimator(_StreamingCIC):
+    r"""
+    Streaming CIC decimation.
+
+    Applies `cic_decimate` to a stream of chunks with `process`, carrying
+    the filter history from one chunk to the next. The concatenated
+    outputs of `process` are identical to the output of `cic_decimate`
+    applied to the whole stream.
+
+    Parameters
+    ----------
+    down : int
+        The downsampling factor.
+    order : int, optional
+        Number of integrator and comb stages. Default is 4.
+    delay : int, optional
+        Differential delay of the combs. Default is 1.
+    dtype : dtype, optional
+        Data type of the chunks. Default is float64.
+    n_channels : int, optional
+        Number of signals decimated in parallel. Chunks have shape
+        ``(n_channels, n_samples)``, or ``(n_samples,)`` for a single
+        channel. Default is 1.
+    normalize : bool, optional
+        Divide the output by the DC gain of the filter. Default is True.
+    compensate : array_like, optional
+        FIR filter applied at the output rate. See `cic_decimate`.
+
+    See Also
+    --------
+    cic_decimate
+    StreamingCICInterpolator
+
+    Notes
+    -----
+    The filter is causal, so each call to `process` returns all outputs
+    up to the last sample received, and chunk sizes may vary freely.
+
+    An object holds the history of a single stream, and must not be used
+    by concurrently running threads.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> cic = cusignal.StreamingCICDecimator(
+    ...     64, order=5, dtype=cp.int16, n_channels=4)
+    >>> for _ in range(10):
+    ...     chunk = cp.random.randint(-2 ** 15, 2 ** 15, (4, 2 ** 16))
+    ...     y = cic.process(chunk.astype(cp.int16))
+    """
+
+    def __init__(
+        self,
+        down,
+        order=4,
+        delay=1,
+        dtype=cp.float64,
+        n_channels=1,
+        normalize=True,
+        compensate=None,
+    ):
+        super().__init__(
+            down,
+            order,
+            delay,
+            False,
+            dtype,
+            n_channels,
+            normalize,
+            compensate,
+        )
+
+
+class StreamingCICInterpolator(_StreamingCIC):
+    r"""
+    Streaming CIC interpolation.
+
+    Applies `cic_interpolate` to a stream of chunks with `process`,
+    carrying the filter history from one chunk to the next. The
+    concatenated outputs of `process` are identical to the output of
+    `cic_interpolate` applied to the whole stream.
+
+    Parameters
+    ----------
+    up : int
+        The upsampling factor.
+    order : int, optional
+        Number of integrator and comb stages. Default is 4.
+    delay : int, optional
+        Differential delay of the combs. Default is 1.
+    dtype : dtype, optional
+        Data type of the chunks. Default is float64.
+    n_channels : int, optional
+        Number of signals interpolated in parallel. Chunks have shape
+        ``(n_channels, n_samples)``, or ``(n_samples,)`` for a single
+        channel. Default is 1.
+    normalize : bool, optional
+        Divide the output by the DC gain of the filter. Default is True.
+    compensate : array_like, optional
+        FIR filter applied at the input rate. See `cic_interpolate`.
+
+    See Also
+    --------
+    cic_interpolate
+    StreamingCICDecimator
+
+    Notes
+    -----
+    The filter is causal, so each call to `process` returns ``up``
+    outputs for each sample received, and chunk sizes may vary freely.
+
+    An object holds the history of a single stream, and must not be used
+    by concurrently running threads.
+    """
+
+    def __init__(
+        self,
+        up,
+        order=4,
+        delay=1,
+        dtype=cp.float64,
+        n_channels=1,
+        normalize=True,
+        compensate=None,
+    ):
+        super().__init__(
+            up, order, delay, True, dtype, n_channels, normalize, compensate,
+        )
@@ -12,10 +12,16 @@
 # limitations under the License.
 
 import cupy as cp
+import numpy as np
 
 from string import Template
 
-from ..utils._caches import _cupy_kernel_cache
+from ..utils._registry import GPUKernel, _register_kernel
+from ..utils.autotune import (
+    _get_launch_config,
+    _grid_stride_configs,
+)
+from ..utils.backend import get_array_module
 
 
 # Custom Cupy raw kernel implementing binary readers
@@ -166,6 +172,29 @@ extern "C" {
 )
 
 
+# Order must match the FLAG values in `_cupy_unpack_src`
+_UNPACK_TYPES = [
+    "int8",
+    "uint8",
+    "int16",
+    "uint16",
+    "int32",
+    "uint32",
+    "float32",
+    "float64",
+    "complex64",
+    "complex128",
+]
+
+_register_kernel(
+    GPUKernel.UNPACK,
+    _cupy_unpack_src,
+    "_cupy_unpack",
+    _UNPACK_TYPES,
+    substitutions=lambda np_type: {"flag": _UNPACK_TYPES.index(np_type)},
+)
+
+
 class _cupy_unpack_wrapper(object):
     def __init__(self, grid, block, kernel):
         if isinstance(grid, int):
@@ -187,9 +216,9 @@ class _cupy_unpack_wrapper(object):
 def _get_backend_kernel(
     dtype, grid, block, k_type,
 ):
-    from ..utils.compile_kernels import GPUKernel
+    from ..utils.compile_kernels import _populate_kernel_cache
 
-    kernel = _cupy_kernel_cache[(str(dtype), k_type.value)]
+    kernel = _populate_kernel_cache(dtype, k_type)
     if kernel:
         if k_type == GPUKernel.UNPACK:
             return _cupy_unpack_wrapper(grid, block, kernel)
@@ -199,14 +228,25 @@ def _get_backend_kernel(
         )
 
 
-def _unpack(binary, dtype, endianness):
+def _unpack_cpu(binary, dtype, endianness, out_size):
+    """Host implementation of `_cupy_unpack`"""
+    data_size = np.dtype(dtype).itemsize // binary.dtype.itemsize
+
+    out = binary[: out_size * data_size].view(dtype)
+    if endianness == "B":
+        return out.byteswap()
+    return out.copy()
 
-    from ..utils.compile_kernels import _populate_kernel_cache, GPUKernel
+
+def _unpack(binary, dtype, endianness):
 
     data_size = cp.dtype(dtype).itemsize // binary.dtype.itemsize
 
     out_size = binary.shape[0] // data_size
 
+    if get_array_module(binary) is np:
+        return _unpack_cpu(binary, dtype, endianness, out_size)
+
     out = cp.empty_like(binary, dtype=dtype, shape=out_size)
 
     if endianness == "B":
@@ -214,19 +254,20 @@ def _unpack(binary, dtype, endianness):
     else:
         little = True
 
-    device_id = cp.cuda.Device()
-    numSM = device_id.attributes["MultiProcessorCount"]
-    blockspergrid = numSM * 20
-    threadsperblock = 512
-
-    _populate_kernel_cache(out.dtype, GPUKernel.UNPACK)
-    kernel = _get_backend_kernel(
-        out.dtype, blockspergrid, threadsperblock, GPUKernel.UNPACK,
+    def launch(blockspergrid, threadsperblock):
+        kernel = _get_backend_kernel(
+            out.dtype, blockspergrid, threadsperblock, GPUKernel.UNPACK,
+        )
+        kernel(out_size, little, binary, out)
+
+    launch(
+        *_get_launch_config(
+            GPUKernel.UNPACK,
+            out.dtype,
+            out_size,
+            _grid_stride_configs(512),
+            launch,
+        )
     )
 
-    kernel(out_size, little, binary, out)
-
-    # Remove binary data
-    del binary
-
     return out
@@ -12,10 +12,16 @@
 # limitations under the License.
 
 import cupy as cp
+import numpy as np
 
 from string import Template
 
-from ..utils._caches import _cupy_kernel_cache
+from ..utils._registry import GPUKernel, _register_kernel
+from ..utils.autotune import (
+    _get_launch_config,
+    _grid_stride_configs,
+)
+from ..utils.backend import get_array_module
 
 
 # Custom Cupy raw kernel implementing binary writers
@@ -44,6 +50,25 @@ extern "C" {
 )
 
 
+_register_kernel(
+    GPUKernel.PACK,
+    _cupy_pack_src,
+    "_cupy_pack",
+    [
+        "int8",
+        "uint8",
+        "int16",
+        "uint16",
+        "int32",
+        "uint32",
+        "float32",
+        "float64",
+        "complex64",
+        "complex128",
+    ],
+)
+
+
 class _cupy_pack_wrapper(object):
     def __init__(self, grid, block, kernel):
         if isinstance(grid, int):
@@ -65,9 +90,9 @@ class _cupy_pack_wrapper(object):
 def _get_backend_kernel(
     dtype, grid, block, k_type,
 ):
-    from ..utils.compile_kernels import GPUKernel
+    from ..utils.compile_kernels import _populate_kernel_cache
 
-    kernel = _cupy_kernel_cache[(str(dtype), k_type.value)]
+    kernel = _populate_kernel_cache(dtype, k_type)
     if kernel:
         if k_type == GPUKernel.PACK:
             return _cupy_pack_wrapper(grid, block, kernel)
@@ -79,26 +104,29 @@ def _get_backend_kernel(
 
 def _pack(binary):
 
-    from ..utils.compile_kernels import _populate_kernel_cache, GPUKernel
-
     data_size = binary.dtype.itemsize * binary.shape[0]
     out_size = data_size
 
-    out = cp.empty_like(binary, dtype=cp.ubyte, shape=out_size)
+    if get_array_module(binary) is np:
+        # Host implementation of `_cupy_pack`
+        return np.ascontiguousarray(binary).view(np.ubyte).copy()
 
-    device_id = cp.cuda.Device()
-    numSM = device_id.attributes["MultiProcessorCount"]
-    blockspergrid = numSM * 20
-    threadsperblock = 512
+    out = cp.empty_like(binary, dtype=cp.ubyte, shape=out_size)
 
-    _populate_kernel_cache(out.dtype, GPUKernel.PACK)
-    kernel = _get_backend_kernel(
-        out.dtype, blockspergrid, threadsperblock, GPUKernel.PACK,
+    def launch(blockspergrid, threadsperblock):
+        kernel = _get_backend_kernel(
+            out.dtype, blockspergrid, threadsperblock, GPUKernel.PACK,
+        )
+        kernel(out_size, binary, out)
+
+    launch(
+        *_get_launch_config(
+            GPUKernel.PACK,
+            out.dtype,
+            out_size,
+            _grid_stride_configs(512),
+            launch,
+        )
     )
 
-    kernel(out_size, binary, out)
-
-    # Remove binary data
-    del binary
-
     return out
@@ -16,6 +16,7 @@ import numpy as np
 
 import json
 
+from ..utils.backend import get_array_module, _asarray
 from ._reader_cuda import _unpack
 
 
@@ -45,7 +46,8 @@ def read_bin(file, buffer=None, dtype=cp.uint8, num_samples=None, offset=0):
     """
     Reads binary file into GPU memory.
     Can be used as a building blocks for custom unpack/pack
-    data readers/writers.
+    data readers/writers. With the NumPy backend, the data is
+    read into host memory instead.
 
     Parameters
     ----------
@@ -53,6 +55,7 @@ def read_bin(file, buffer=None, dtype=cp.uint8, num_samples=None, offset=0):
         A string of filename to be read to GPU.
     buffer : ndarray, optional
         Pinned memory buffer to use when copying data from GPU.
+        Ignored with the NumPy backend.
     dtype : data-type, optional
         Any object that can be interpreted as a numpy data type.
     num_samples : int, optional
@@ -69,14 +72,19 @@ def read_bin(file, buffer=None, dtype=cp.uint8, num_samples=None, offset=0):
 
     """
 
-    # Get current stream, default or not.
-    stream = cp.cuda.get_current_stream()
-
     # offset is measured in bytes
     offset *= cp.dtype(dtype).itemsize
 
     fp = np.memmap(file, mode="r", offset=offset, shape=num_samples)
 
+    if get_array_module() is np:
+        out = np.array(fp)
+        del fp
+        return out
+
+    # Get current stream, default or not.
+    stream = cp.cuda.get_current_stream()
+
     if buffer is not None:
         out = cp.empty(buffer.shape, buffer.dtype)
 
@@ -118,6 +126,7 @@ def unpack_bin(binary, dtype, endianness="L"):
     if endianness != "L" and endianness != "B" and endianness != "N":
         raise ValueError("'endianness' should be 'L' or 'B'")
 
+    binary = _asarray(binary, get_array_module(binary))
     out = _unpack(binary, dtype, endianness)
 
     return out
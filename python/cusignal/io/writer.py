@@ -12,7 +12,9 @@
 # limitations under the License.
 
 import cupy as cp
+import numpy as np
 
+from ..utils.backend import get_array_module, _asarray
 from ._writer_cuda import _pack
 
 
@@ -38,6 +40,17 @@ def write_bin(file, binary, buffer=None, append=True):
 
     """
 
+    if append is True:
+        mode = "ab"
+    else:
+        mode = "wb"
+
+    if get_array_module(binary) is np:
+        binary = _asarray(binary, np)
+        with open(file, mode) as f:
+            binary.tofile(f)
+        return
+
     # Get current stream, default or not.
     stream = cp.cuda.get_current_stream()
 
@@ -46,11 +59,6 @@ def write_bin(file, binary, buffer=None, append=True):
     else:
         binary.get(out=buffer)
 
-    if append is True:
-        mode = "ab"
-    else:
-        mode = "wb"
-
     with open(file, mode) as f:
         stream.synchronize()
         buffer.tofile(f)
@@ -11,11 +11,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import cupy as cp
+import numpy as np
 
 from string import Template
 
-from ..utils._caches import _cupy_kernel_cache
+from ..utils._registry import GPUKernel, _register_kernel
+from ..utils.autotune import (
+    _get_launch_config,
+    _grid_stride_configs,
+)
+from ..utils.backend import get_array_module
 
 
 # Custom Cupy raw kernel implementing lombscargle operation
@@ -97,6 +102,14 @@ extern "C" {
 )
 
 
+_register_kernel(
+    GPUKernel.LOMBSCARGLE,
+    _cupy_lombscargle_src,
+    "_cupy_lombscargle",
+    ["float32", "float64"],
+)
+
+
 class _cupy_lombscargle_wrapper(object):
     def __init__(self, grid, block, kernel):
         if isinstance(grid, int):
@@ -127,7 +140,9 @@ class _cupy_lombscargle_wrapper(object):
 
 def _get_backend_kernel(dtype, grid, block, k_type):
 
-    kernel = _cupy_kernel_cache[(str(dtype), k_type.value)]
+    from ..utils.compile_kernels import _populate_kernel_cache
+
+    kernel = _populate_kernel_cache(dtype, k_type)
     if kernel:
         return _cupy_lombscargle_wrapper(grid, block, kernel)
     else:
@@ -136,18 +151,62 @@ def _get_backend_kernel(dtype, grid, block, k_type):
         )
 
 
-def _lombscargle(x, y, freqs, pgram, y_dot):
-    from ..utils.compile_kernels import _populate_kernel_cache, GPUKernel
+def _lombscargle_cpu(x, y, freqs, pgram, y_dot):
+    """Host implementation of `_cupy_lombscargle`"""
+    yD = 1.0 if y_dot[0] == 0 else 2.0 / y_dot[0]
+
+    # Bound the (freqs x samples) temporaries to ~32MB per chunk
+    chunk = max(1, (1 << 22) // max(1, x.shape[0]))
+
+    for start in range(0, freqs.shape[0], chunk):
+        freq = freqs[start : start + chunk, np.newaxis]
+        arg = freq * x
+        c = np.cos(arg)
+        s = np.sin(arg)
+
+        xc = c @ y
+        xs = s @ y
+        cc = (c * c).sum(axis=1)
+        ss = (s * s).sum(axis=1)
+        cs = (c * s).sum(axis=1)
+
+        freq = freq[:, 0]
+        tau = np.arctan2(2.0 * cs, cc - ss) / (2.0 * freq)
+        c_tau = np.cos(freq * tau)
+        s_tau = np.sin(freq * tau)
+        c_tau2 = c_tau * c_tau
+        s_tau2 = s_tau * s_tau
+        cs_tau = 2.0 * c_tau * s_tau
+
+        pgram[start : start + chunk] = (
+            0.5
+            * (
+                (c_tau * xc + s_tau * xs) ** 2
+                / (c_tau2 * cc + cs_tau * cs + s_tau2 * ss)
+                + (c_tau * xs - s_tau * xc) ** 2
+                / (c_tau2 * ss - cs_tau * cs + s_tau2 * cc)
+            )
+            * yD
+        )
 
-    device_id = cp.cuda.Device()
-    numSM = device_id.attributes["MultiProcessorCount"]
-    threadsperblock = 256
-    blockspergrid = numSM * 20
 
-    _populate_kernel_cache(pgram.dtype, GPUKernel.LOMBSCARGLE)
+def _lombscargle(x, y, freqs, pgram, y_dot):
+    if get_array_module(pgram) is np:
+        _lombscargle_cpu(x, y, freqs, pgram, y_dot)
+        return
 
-    kernel = _get_backend_kernel(
-        pgram.dtype, blockspergrid, threadsperblock, GPUKernel.LOMBSCARGLE,
+    def launch(blockspergrid, threadsperblock):
+        kernel = _get_backend_kernel(
+            pgram.dtype, blockspergrid, threadsperblock, GPUKernel.LOMBSCARGLE,
+        )
+        kernel(x, y, freqs, pgram, y_dot)
+
+    launch(
+        *_get_launch_config(
+            GPUKernel.LOMBSCARGLE,
+            pgram.dtype,
+            pgram.size * x.size,
+            _grid_stride_configs(256),
+            launch,
+        )
     )
-
-    kernel(x, y, freqs, pgram, y_dot)
@@ -12,8 +12,8 @@
 # limitations under the License.
 
 import cupy as cp
-from cupy import angle, arange, asarray, reshape, zeros
-from cupyx.scipy import fftpack
+import numpy as np
+from cupy import angle, asarray
 from scipy._lib.six import string_types
 
 from ..windows.windows import get_window
@@ -24,14 +24,22 @@ from ..utils.arraytools import (
     _zero_ext,
     _as_strided,
 )
+from ..utils.backend import (
+    get_array_module,
+    set_backend,
+    _asarray,
+    _get_fftpack,
+)
+from ..utils.memory import _output
 from ..filtering import filtering
 from ._spectral_cuda import _lombscargle
 
+import math
 import warnings
 
 
 def lombscargle(
-    x, y, freqs, precenter=False, normalize=False,
+    x, y, freqs, precenter=False, normalize=False, out=None,
 ):
     """
     lombscargle(x, y, freqs)
@@ -58,6 +66,9 @@ def lombscargle(
         Pre-center amplitudes by subtracting the mean.
     normalize : bool, optional
         Compute normalized periodogram.
+    out : ndarray, optional
+        C-contiguous float64 array, of the shape of `freqs`, the
+        periodogram is written to.
 
     Returns
     -------
@@ -128,22 +139,24 @@ def lombscargle(
     >>> plt.show()
     """
 
-    x = asarray(x, dtype=cp.float64)
-    y = asarray(y, dtype=cp.float64)
-    freqs = asarray(freqs, dtype=cp.float64)
-    pgram = cp.empty(freqs.shape[0], dtype=cp.float64)
+    xp = get_array_module(x, y, freqs)
+    x = _asarray(x, xp, dtype=xp.float64)
+    y = _asarray(y, xp, dtype=xp.float64)
+    freqs = _asarray(freqs, xp, dtype=xp.float64)
 
     assert x.ndim == 1
     assert y.ndim == 1
     assert freqs.ndim == 1
 
+    pgram = _output(out, freqs.shape, xp.float64, xp, "lombscargle.out")
+
     # Check input sizes
     if x.shape[0] != y.shape[0]:
         raise ValueError("Input arrays do not have the same size.")
 
-    y_dot = cp.zeros(1, dtype=cp.float64)
+    y_dot = xp.zeros(1, dtype=xp.float64)
     if normalize:
-        cp.dot(y, y, out=y_dot)
+        y_dot[0] = xp.dot(y, y)
 
     if precenter:
         y_in = y - y.mean()
@@ -268,10 +281,11 @@ def periodogram(
     2.0077340678640727
 
     """
-    x = cp.asarray(x)
+    xp = get_array_module(x)
+    x = _asarray(x, xp)
 
     if x.size == 0:
-        return cp.empty(x.shape), cp.empty(x.shape)
+        return xp.empty(x.shape), xp.empty(x.shape)
 
     if window is None:
         window = "boxcar"
@@ -283,10 +297,9 @@ def periodogram(
     elif nfft > x.shape[axis]:
         nperseg = x.shape[axis]
     elif nfft < x.shape[axis]:
-        # cp.s_ not implemented
-        s = [cp.s_[:]] * len(x.shape)
-        s[axis] = cp.s_[:nfft]
-        x = cp.asarray(x[tuple(s)])
+        s = [slice(None)] * len(x.shape)
+        s[axis] = slice(None, nfft)
+        x = x[tuple(s)]
         nperseg = nfft
         nfft = None
 
@@ -627,8 +640,9 @@ def csd(
     >>> plt.ylabel('CSD [V**2/Hz]')
     >>> plt.show()
     """
-    x = asarray(x)
-    y = asarray(y)
+    xp = get_array_module(x, y)
+    x = _asarray(x, xp)
+    y = x if y is x else _asarray(y, xp)
     freqs, _, Pxy = _spectral_helper(
         x,
         y,
@@ -648,7 +662,7 @@ def csd(
     if len(Pxy.shape) >= 2 and Pxy.size > 0:
         if Pxy.shape[-1] > 1:
             if average == "median":
-                Pxy = cp.median(Pxy, axis=-1) / _median_bias(Pxy.shape[-1])
+                Pxy = xp.median(Pxy, axis=-1) / _median_bias(Pxy.shape[-1])
             elif average == "mean":
                 Pxy = Pxy.mean(axis=-1)
             else:
@@ -656,7 +670,7 @@ def csd(
                     'average must be "median" or "mean", got %s' % (average,)
                 )
         else:
-            Pxy = reshape(Pxy, Pxy.shape[:-1])
+            Pxy = xp.reshape(Pxy, Pxy.shape[:-1])
 
     return freqs, Pxy
 
@@ -810,9 +824,12 @@ def spectrogram(
             )
         )
 
+    xp = get_array_module(x)
+    x = _asarray(x, xp)
+
     # need to set default for nperseg before setting default for noverlap below
     window, nperseg = _triage_segments(
-        window, nperseg, input_length=x.shape[axis]
+        window, nperseg, input_length=x.shape[axis], xp=xp
     )
 
     # Less overlap than welch, so samples are more statisically independent
@@ -852,14 +869,14 @@ def spectrogram(
         )
 
         if mode == "magnitude":
-            Sxx = cp.abs(Sxx)
+            Sxx = xp.abs(Sxx)
         elif mode in ["angle", "phase"]:
-            Sxx = angle(Sxx)
+            Sxx = xp.angle(Sxx)
             if mode == "phase":
                 # Sxx has one additional dimension for time strides
                 if axis < 0:
                     axis -= 1
-                Sxx = cp.unwrap(Sxx, axis=axis)
+                Sxx = xp.unwrap(Sxx, axis=axis)
 
         # mode =='complex' is same as `stft`, doesn't need modification
 
@@ -878,6 +895,7 @@ def stft(
     boundary="zeros",
     padded=True,
     axis=-1,
+    out=None,
 ):
     r"""
     Compute the Short Time Fourier Transform (STFT).
@@ -936,6 +954,11 @@ def stft(
     axis : int, optional
         Axis along which the STFT is computed; the default is over the
         last axis (i.e. ``axis=-1``).
+    out : ndarray, optional
+        Array the STFT is written to, with the shape and complex data type
+        of the output. The transform is then computed with a
+        `SpectralPlan`, writing to `out` without temporary copies of the
+        result.
 
     Returns
     -------
@@ -1018,6 +1041,22 @@ def stft(
     >>> plt.xlabel('Time [sec]')
     >>> plt.show()
     """
+    if out is not None:
+        # Plans use the backend active when they are created
+        with set_backend(get_array_module(x, out).__name__):
+            plan = SpectralPlan(
+                nperseg,
+                noverlap,
+                nfft,
+                window,
+                fs,
+                scaling="spectrum",
+                detrend=detrend,
+                return_onesided=return_onesided,
+                boundary=boundary,
+                padded=padded,
+            )
+            return plan.stft(x, axis=axis, out=out)
 
     freqs, time, Zxx = _spectral_helper(
         x,
@@ -1271,6 +1310,517 @@ def vectorstrength(events, period):
     return strength, phase
 
 
+class SpectralPlan(object):
+    r"""
+    Reusable plan for repeated STFT, Welch and spectrogram computations.
+
+    Validating the parameters, building the window and computing the
+    scaling factors, frequencies and segment times are done once, when the
+    plan is created, instead of on every call. Intermediate buffers are
+    kept between calls with inputs of the same shape and data type, and
+    results can be written to preallocated output arrays. This makes plans
+    well suited to processing a stream of equally sized blocks.
+
+    Parameters
+    ----------
+    nperseg : int, optional
+        Length of each segment. Defaults to None, but if window is str or
+        tuple, is set to 256, and if window is array_like, is set to the
+        length of the window.
+    noverlap : int, optional
+        Number of points to overlap between segments. If `None`,
+        ``noverlap = nperseg // 2``. Defaults to `None`.
+    nfft : int, optional
+        Length of the FFT used, if a zero padded FFT is desired. If
+        `None`, the FFT length is `nperseg`. Defaults to `None`.
+    window : str or tuple or array_like, optional
+        Desired window to use. See `get_window` for a list of windows and
+        required parameters. If `window` is array_like it will be used
+        directly as the window and its length must be nperseg. Defaults
+        to a Hann window.
+    fs : float, optional
+        Sampling frequency of the time series. Defaults to 1.0.
+    scaling : { 'density', 'spectrum' }, optional
+        Selects between computing the power spectral density ('density')
+        where the power has units of V**2/Hz and computing the power
+        spectrum ('spectrum') where it has units of V**2, if the input is
+        measured in V and `fs` is measured in Hz. The STFT is scaled by
+        the square root of the same factor. Defaults to 'density'.
+    mode : str, optional
+        Kind of output returned by `spectrogram`, one of
+        ``['psd', 'complex', 'magnitude', 'angle', 'phase']``. Defaults
+        to 'psd'.
+    detrend : str or function or `False`, optional
+        Specifies how to detrend each segment. If `detrend` is a string,
+        it is passed as the `type` argument to the `detrend` function. If
+        it is a function, it takes a segment and returns a detrended
+        segment. If `detrend` is `False`, no detrending is done. Defaults
+        to 'constant'.
+    return_onesided : bool, optional
+        If `True`, return a one-sided spectrum for real data. If `False`
+        return a two-sided spectrum. For complex data, a two-sided
+        spectrum is always returned.
+    boundary : str or None, optional
+        Specifies whether the input signal is extended at both ends, and
+        how to generate the new values, to center the first windowed
+        segment on the first input point. Valid options are
+        ``['even', 'odd', 'constant', 'zeros', None]``. Defaults to
+        `None`.
+    padded : bool, optional
+        Specifies whether the input signal is zero-padded at the end to
+        make the signal fit exactly into an integer number of window
+        segments. Defaults to `False`.
+
+    See Also
+    --------
+    welch: Power spectral density by Welch's method.
+    stft: Short Time Fourier Transform.
+    spectrogram: Spectrogram by consecutive Fourier transforms.
+
+    Notes
+    -----
+    The defaults match those of `welch`. A plan computes the same results
+    as `stft` when created with ``scaling='spectrum', detrend=False,
+    boundary='zeros', padded=True``. `spectrogram` defaults to a
+    ``('tukey', 0.25)`` window instead of a Hann window, so a plan only
+    matches it when both are given the same window, with
+    ``noverlap=nperseg // 8`` for the plan, e.g.
+    ``SpectralPlan(window=('tukey', 0.25), noverlap=256 // 8)`` for the
+    default `spectrogram`.
+
+    The array backend is selected when the plan is created, and inputs
+    are converted to it. A plan holds buffers that are reused by every
+    call, so a plan must not be shared by concurrently running threads.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> plan = cusignal.SpectralPlan(nperseg=1024, fs=1e4)
+    >>> x = cp.random.randn(16, 2 ** 16)
+    >>> Pxx = cp.empty((16, 513))
+    >>> for _ in range(10):
+    ...     f, _ = plan.psd(x, out=Pxx)
+    """
+
+    _modes = ["psd", "complex", "magnitude", "angle", "phase"]
+
+    _boundary_funcs = {
+        "even": _even_ext,
+        "odd": _odd_ext,
+        "constant": _const_ext,
+        "zeros": _zero_ext,
+        None: None,
+    }
+
+    def __init__(
+        self,
+        nperseg=None,
+        noverlap=None,
+        nfft=None,
+        window="hann",
+        fs=1.0,
+        scaling="density",
+        mode="psd",
+        detrend="constant",
+        return_onesided=True,
+        boundary=None,
+        padded=False,
+    ):
+        if mode not in self._modes:
+            raise ValueError(
+                "unknown value for mode {}, must be one of {}".format(
+                    mode, self._modes
+                )
+            )
+
+        if boundary not in self._boundary_funcs:
+            raise ValueError(
+                "Unknown boundary option '{0}', must be one of: {1}".format(
+                    boundary, list(self._boundary_funcs.keys())
+                )
+            )
+
+        if scaling not in ["density", "spectrum"]:
+            raise ValueError("Unknown scaling: %r" % scaling)
+
+        if nperseg is not None:
+            nperseg = int(nperseg)
+            if nperseg < 1:
+                raise ValueError("nperseg must be a positive integer")
+
+        xp = get_array_module(window)
+
+        # The input length is not known yet, it is checked on every call
+        win, nperseg = _triage_segments(
+            window, nperseg, input_length=float("inf"), xp=xp
+        )
+
+        if nfft is None:
+            nfft = nperseg
+        elif nfft < nperseg:
+            raise ValueError("nfft must be greater than or equal to nperseg.")
+        else:
+            nfft = int(nfft)
+
+        if noverlap is None:
+            noverlap = nperseg // 2
+        else:
+            noverlap = int(noverlap)
+        if noverlap >= nperseg:
+            raise ValueError("noverlap must be less than nperseg.")
+
+        self.nperseg = nperseg
+        self.noverlap = noverlap
+        self.nfft = nfft
+        self.fs = fs
+        self.scaling = scaling
+        self.mode = mode
+        self.detrend = detrend
+        self.return_onesided = return_onesided
+        self.boundary = boundary
+        self.padded = padded
+
+        self._xp = xp
+        self._win = win.real
+        if scaling == "density":
+            self._scale = 1.0 / (fs * float((win * win).sum().real))
+        else:
+            self._scale = 1.0 / float(win.sum().real) ** 2
+
+        # One-sided spectra fold the power of negative frequencies into
+        # the positive ones, except for DC and the unpaired Nyquist point
+        self._onesided_weights = xp.full(nfft // 2 + 1, 2 * self._scale)
+        self._onesided_weights[0] = self._scale
+        if nfft % 2 == 0:
+            self._onesided_weights[-1] = self._scale
+
+        self._freqs = {
+            "onesided": xp.fft.rfftfreq(nfft, 1 / fs),
+            "twosided": xp.fft.fftfreq(nfft, 1 / fs),
+        }
+
+        self._windows = {}
+        self._times = {}
+        self._buffers = {}
+
+    def _buffer(self, name, shape, dtype, zeros=False):
+        """Return a buffer kept between calls, reallocated as needed"""
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            if zeros:
+                buf = self._xp.zeros(shape, dtype)
+            else:
+                buf = self._xp.empty(shape, dtype)
+            self._buffers[name] = buf
+        return buf
+
+    def _window(self, dtype):
+        win = self._windows.get(dtype)
+        if win is None:
+            win = self._win.astype(dtype)
+            self._windows[dtype] = win
+        return win
+
+    def _time(self, n):
+        time = self._times.get(n)
+        if time is None:
+            xp = self._xp
+            time = xp.arange(
+                self.nperseg / 2,
+                n - self.nperseg / 2 + 1,
+                self.nperseg - self.noverlap,
+            ) / float(self.fs)
+            if self.boundary is not None:
+                time -= (self.nperseg / 2) / self.fs
+            self._times[n] = time
+        return time
+
+    def _sides(self, x):
+        if not self.return_onesided:
+            return "twosided"
+        if self._xp.iscomplexobj(x):
+            warnings.warn(
+                "Input data is complex, switching to " "return_onesided=False"
+            )
+            return "twosided"
+        return "onesided"
+
+    def _extend(self, x):
+        """Apply boundary extension and padding to the last axis of x"""
+        xp = self._xp
+        nperseg = self.nperseg
+        nstep = nperseg - self.noverlap
+
+        nb = nperseg // 2 if self.boundary is not None else 0
+        n = x.shape[-1] + 2 * nb
+        nadd = (-(n - nperseg) % nstep) % nperseg if self.padded else 0
+
+        if nb == 0 and nadd == 0:
+            return x
+
+        if self.boundary in ["zeros", None]:
+            # Only the middle of the buffer is written, the rest stays zero
+            ext = self._buffer(
+                "extended", x.shape[:-1] + (n + nadd,), x.dtype, zeros=True
+            )
+            ext[..., nb : nb + x.shape[-1]] = x
+            return ext
+
+        x = self._boundary_funcs[self.boundary](x, nb, axis=-1)
+        if nadd:
+            zeros_shape = x.shape[:-1] + (nadd,)
+            x = xp.concatenate((x, xp.zeros(zeros_shape, x.dtype)), axis=-1)
+        return x
+
+    def _fft(self, x, axis, sides, detrend):
+        """Windowed FFTs of the segments of x, as (..., segment, freq)"""
+        xp = self._xp
+        nperseg = self.nperseg
+        step = nperseg - self.noverlap
+
+        outdtype = xp.result_type(x, xp.complex64)
+        realdtype = np.finfo(outdtype).dtype
+
+        if x.shape[-1] < nperseg:
+            raise ValueError(
+                "nperseg = {0:d} is greater than input length "
+                " = {1:d}".format(nperseg, x.shape[-1])
+            )
+
+        shape = x.shape[:-1] + ((x.shape[-1] - self.noverlap) // step, nperseg)
+        strides = x.strides[:-1] + (step * x.strides[-1], x.strides[-1])
+        segments = _as_strided(x, shape=shape, strides=strides)
+
+        bufdtype = realdtype if sides == "onesided" else outdtype
+        buf = self._buffer("segments", shape, bufdtype)
+        win = self._window(realdtype)
+
+        # Detrend and window each segment, without temporaries for the
+        # default constant detrending
+        if not detrend:
+            xp.multiply(segments, win, out=buf)
+        elif detrend == "constant":
+            xp.subtract(
+                segments, segments.mean(axis=-1, keepdims=True), out=buf
+            )
+            buf *= win
+        else:
+            if hasattr(detrend, "__call__"):
+                if axis != -1:
+                    d = xp.moveaxis(segments, -1, axis)
+                    d = xp.moveaxis(detrend(d), axis, -1)
+                else:
+                    d = detrend(segments)
+            else:
+                if xp is np:
+                    from scipy.signal import detrend as _detrend
+                else:
+                    _detrend = filtering.detrend
+                d = _detrend(segments, type=detrend, axis=-1)
+            xp.multiply(d, win, out=buf)
+
+        if sides == "twosided":
+            result = _get_fftpack(xp).fft(buf, n=self.nfft)
+        else:
+            result = xp.fft.rfft(buf, n=self.nfft)
+
+        return result, outdtype, realdtype
+
+    def _power(self, F, sides, out):
+        """Write the scaled power of the FFTs F into out"""
+        xp = self._xp
+        tmp = self._buffer("power", out.shape, out.dtype)
+        xp.square(F.real, out=out)
+        xp.square(F.imag, out=tmp)
+        out += tmp
+        if sides == "onesided":
+            out *= self._onesided_weights
+        else:
+            out *= self._scale
+        return out
+
+    def _prepare(self, x, axis):
+        """Convert x to the plan's backend, with the data on the last axis"""
+        x = _asarray(x, self._xp)
+        axis = int(axis)
+        if x.ndim > 1 and axis != -1:
+            x = self._xp.moveaxis(x, axis, -1)
+        return x, axis
+
+    def _result(self, out, shape, axis, dtype):
+        """
+        Return an array of `shape` for a result whose last axis is moved
+        to `axis`, as a view of `out` if given.
+        """
+        xp = self._xp
+        if out is None:
+            return xp.empty(shape, dtype)
+
+        expected = list(shape)
+        expected.insert(axis % len(shape), expected.pop())
+        out = _output(out, expected, dtype, xp, None, contiguous=False)
+        return xp.moveaxis(out, axis, -1)
+
+    def _segment_ffts(self, x, axis):
+        """Return f, t, segment FFTs, output dtype, sides and output axis"""
+        x, axis = self._prepare(x, axis)
+        sides = self._sides(x)
+
+        x = self._extend(x)
+        F, outdtype, _ = self._fft(x, axis, sides, self.detrend)
+
+        # Output has a new last axis for the segments, so a negative axis
+        # index shifts down one
+        if axis < 0:
+            axis -= 1
+
+        f = self._freqs[sides]
+        return f, self._time(x.shape[-1]), F, outdtype, sides, axis
+
+    def psd(self, x, axis=-1, average="mean", out=None):
+        """
+        Estimate the power spectral density of `x` with Welch's method.
+
+        Parameters
+        ----------
+        x : array_like
+            Time series of measurement values.
+        axis : int, optional
+            Axis along which the periodogram is computed; the default is
+            over the last axis (i.e. ``axis=-1``).
+        average : { 'mean', 'median' }, optional
+            Method to use when averaging periodograms. Defaults to
+            'mean'.
+        out : ndarray, optional
+            Array the result is written to. It must have the shape of the
+            result.
+
+        Returns
+        -------
+        f : ndarray
+            Array of sample frequencies.
+        Pxx : ndarray
+            Power spectral density or power spectrum of x.
+        """
+        if average not in ["mean", "median"]:
+            raise ValueError(
+                'average must be "median" or "mean", got %s' % (average,)
+            )
+
+        xp = self._xp
+        x, axis = self._prepare(x, axis)
+        sides = self._sides(x)
+
+        F, _, realdtype = self._fft(self._extend(x), axis, sides, self.detrend)
+        P = self._power(F, sides, self._buffer("psd", F.shape, realdtype))
+
+        shape = P.shape[:-2] + P.shape[-1:]
+        result = self._result(out, shape, axis, realdtype)
+        if P.shape[-2] == 1:
+            result[...] = P[..., 0, :]
+        elif average == "median":
+            result[...] = xp.median(P, axis=-2) / _median_bias(P.shape[-2])
+        else:
+            P.mean(axis=-2, out=result)
+
+        if out is None:
+            out = xp.moveaxis(result, -1, axis)
+
+        return self._freqs[sides], out
+
+    def stft(self, x, axis=-1, out=None):
+        """
+        Compute the Short Time Fourier Transform of `x`.
+
+        Parameters
+        ----------
+        x : array_like
+            Time series of measurement values.
+        axis : int, optional
+            Axis along which the STFT is computed; the default is over the
+            last axis (i.e. ``axis=-1``).
+        out : ndarray, optional
+            Complex array the result is written to. It must have the shape
+            of the result.
+
+        Returns
+        -------
+        f : ndarray
+            Array of sample frequencies.
+        t : ndarray
+            Array of segment times.
+        Zxx : ndarray
+            STFT of `x`. By default, the last axis of Zxx corresponds to
+            the segment times.
+        """
+        xp = self._xp
+        f, t, F, outdtype, _, axis = self._segment_ffts(x, axis)
+
+        result = self._result(out, F.shape, axis, outdtype)
+        xp.multiply(F, math.sqrt(self._scale), out=result)
+
+        if out is None:
+            out = xp.moveaxis(result, -1, axis)
+
+        return f, t, out
+
+    def spectrogram(self, x, axis=-1, out=None):
+        """
+        Compute a spectrogram of `x`, of the kind selected by `mode`.
+
+        Parameters
+        ----------
+        x : array_like
+            Time series of measurement values.
+        axis : int, optional
+            Axis along which the spectrogram is computed; the default is
+            over the last axis (i.e. ``axis=-1``).
+        out : ndarray, optional
+            Array the result is written to. It must have the shape of the
+            result.
+
+        Returns
+        -------
+        f : ndarray
+            Array of sample frequencies.
+        t : ndarray
+            Array of segment times.
+        Sxx : ndarray
+            Spectrogram of x. By default, the last axis of Sxx corresponds
+            to the segment times.
+        """
+        xp = self._xp
+        mode = self.mode
+        f, t, F, outdtype, sides, axis = self._segment_ffts(x, axis)
+
+        if mode == "psd":
+            result = self._result(
+                out, F.shape, axis, np.finfo(outdtype).dtype
+            )
+            self._power(F, sides, result)
+        elif mode == "complex":
+            result = self._result(out, F.shape, axis, outdtype)
+            xp.multiply(F, math.sqrt(self._scale), out=result)
+        else:
+            F *= math.sqrt(self._scale)
+            result = self._result(
+                out, F.shape, axis, np.finfo(outdtype).dtype
+            )
+            if mode == "magnitude":
+                xp.abs(F, out=result)
+            else:
+                result[...] = xp.angle(F)
+                if mode == "phase":
+                    # Along the frequency axis, like `spectrogram`
+                    result[...] = xp.unwrap(result, axis=-1)
+
+        if out is None:
+            out = xp.moveaxis(result, -1, axis)
+
+        return f, t, out
+
+
 def _spectral_helper(
     x,
     y,
@@ -1401,13 +1951,14 @@ def _spectral_helper(
 
     axis = int(axis)
 
-    # Ensure we have cp.arrays, get outdtype
-    x = asarray(x)
+    # Ensure we have arrays of the active backend, get outdtype
+    xp = get_array_module(x, y)
+    x = _asarray(x, xp)
     if not same_data:
-        y = asarray(y)
-        outdtype = cp.result_type(x, y, cp.complex64)
+        y = _asarray(y, xp)
+        outdtype = xp.result_type(x, y, xp.complex64)
     else:
-        outdtype = cp.result_type(x, cp.complex64)
+        outdtype = xp.result_type(x, xp.complex64)
 
     if not same_data:
         # Check if we can broadcast the outer axes together
@@ -1416,24 +1967,24 @@ def _spectral_helper(
         xouter.pop(axis)
         youter.pop(axis)
         try:
-            outershape = cp.broadcast(cp.empty(xouter), cp.empty(youter)).shape
+            outershape = xp.broadcast(xp.empty(xouter), xp.empty(youter)).shape
         except ValueError:
             raise ValueError("x and y cannot be broadcast together.")
 
     if same_data:
         if x.size == 0:
-            return cp.empty(x.shape), cp.empty(x.shape), cp.empty(x.shape)
+            return xp.empty(x.shape), xp.empty(x.shape), xp.empty(x.shape)
     else:
         if x.size == 0 or y.size == 0:
-            outshape = outershape + (cp.min([x.shape[axis], y.shape[axis]]),)
-            emptyout = cp.rollaxis(cp.empty(outshape), -1, axis)
+            outshape = outershape + (min([x.shape[axis], y.shape[axis]]),)
+            emptyout = xp.rollaxis(xp.empty(outshape), -1, axis)
             return emptyout, emptyout, emptyout
 
     if x.ndim > 1:
         if axis != -1:
-            x = cp.rollaxis(x, axis, len(x.shape))
+            x = xp.rollaxis(x, axis, len(x.shape))
             if not same_data and y.ndim > 1:
-                y = cp.rollaxis(y, axis, len(y.shape))
+                y = xp.rollaxis(y, axis, len(y.shape))
 
     # Check if x and y are the same length, zero-pad if necessary
     if not same_data:
@@ -1441,11 +1992,11 @@ def _spectral_helper(
             if x.shape[-1] < y.shape[-1]:
                 pad_shape = list(x.shape)
                 pad_shape[-1] = y.shape[-1] - x.shape[-1]
-                x = cp.concatenate((x, zeros(pad_shape)), -1)
+                x = xp.concatenate((x, xp.zeros(pad_shape)), -1)
             else:
                 pad_shape = list(y.shape)
                 pad_shape[-1] = x.shape[-1] - y.shape[-1]
-                y = cp.concatenate((y, zeros(pad_shape)), -1)
+                y = xp.concatenate((y, xp.zeros(pad_shape)), -1)
 
     if nperseg is not None:  # if specified by user
         nperseg = int(nperseg)
@@ -1453,7 +2004,9 @@ def _spectral_helper(
             raise ValueError("nperseg must be a positive integer")
 
     # parse window; if array like, then set nperseg = win.shape
-    win, nperseg = _triage_segments(window, nperseg, input_length=x.shape[-1])
+    win, nperseg = _triage_segments(
+        window, nperseg, input_length=x.shape[-1], xp=xp
+    )
 
     if nfft is None:
         nfft = nperseg
@@ -1487,10 +2040,10 @@ def _spectral_helper(
         # I.e make x.shape[-1] = nperseg + (nseg-1)*nstep, with integer nseg
         nadd = (-(x.shape[-1] - nperseg) % nstep) % nperseg
         zeros_shape = list(x.shape[:-1]) + [nadd]
-        x = cp.concatenate((x, zeros(zeros_shape)), axis=-1)
+        x = xp.concatenate((x, xp.zeros(zeros_shape)), axis=-1)
         if not same_data:
             zeros_shape = list(y.shape[:-1]) + [nadd]
-            y = cp.concatenate((y, zeros(zeros_shape)), axis=-1)
+            y = xp.concatenate((y, xp.zeros(zeros_shape)), axis=-1)
 
     # Handle detrending and window functions
     if not detrend:
@@ -1499,22 +2052,26 @@ def _spectral_helper(
             return d
 
     elif not hasattr(detrend, "__call__"):
+        if xp is np:
+            from scipy.signal import detrend as _detrend
+        else:
+            _detrend = filtering.detrend
 
         def detrend_func(d):
-            return filtering.detrend(d, type=detrend, axis=-1)
+            return _detrend(d, type=detrend, axis=-1)
 
     elif axis != -1:
         # Wrap this function so that it receives a shape that it could
         # reasonably expect to receive.
         def detrend_func(d):
-            d = cp.rollaxis(d, -1, axis)
+            d = xp.rollaxis(d, -1, axis)
             d = detrend(d)
-            return cp.rollaxis(d, axis, len(d.shape))
+            return xp.rollaxis(d, axis, len(d.shape))
 
     else:
         detrend_func = detrend
 
-    if cp.result_type(win, cp.complex64) != outdtype:
+    if xp.result_type(win, xp.complex64) != outdtype:
         win = win.astype(outdtype)
 
     if scaling == "density":
@@ -1525,10 +2082,10 @@ def _spectral_helper(
         raise ValueError("Unknown scaling: %r" % scaling)
 
     if mode == "stft":
-        scale = cp.sqrt(scale)
+        scale = xp.sqrt(scale)
 
     if return_onesided:
-        if cp.iscomplexobj(x):
+        if xp.iscomplexobj(x):
             sides = "twosided"
             warnings.warn(
                 "Input data is complex, switching to " "return_onesided=False"
@@ -1536,7 +2093,7 @@ def _spectral_helper(
         else:
             sides = "onesided"
             if not same_data:
-                if cp.iscomplexobj(y):
+                if xp.iscomplexobj(y):
                     sides = "twosided"
                     warnings.warn(
                         "Input data is complex, switching to "
@@ -1546,9 +2103,9 @@ def _spectral_helper(
         sides = "twosided"
 
     if sides == "twosided":
-        freqs = cp.fft.fftfreq(nfft, 1 / fs)
+        freqs = xp.fft.fftfreq(nfft, 1 / fs)
     elif sides == "onesided":
-        freqs = cp.fft.rfftfreq(nfft, 1 / fs)
+        freqs = xp.fft.rfftfreq(nfft, 1 / fs)
 
     # Perform the windowed FFTs
     result = _fft_helper(x, win, detrend_func, nperseg, noverlap, nfft, sides)
@@ -1558,9 +2115,9 @@ def _spectral_helper(
         result_y = _fft_helper(
             y, win, detrend_func, nperseg, noverlap, nfft, sides
         )
-        result = cp.conj(result) * result_y
+        result = xp.conj(result) * result_y
     elif mode == "psd":
-        result = cp.conj(result) * result
+        result = xp.conj(result) * result
 
     result *= scale
     if sides == "onesided" and mode == "psd":
@@ -1570,7 +2127,7 @@ def _spectral_helper(
             # Last point is unpaired Nyquist freq point, don't double
             result[..., 1:-1] *= 2
 
-    time = arange(
+    time = xp.arange(
         nperseg / 2, x.shape[-1] - nperseg / 2 + 1, nperseg - noverlap
     ) / float(fs)
     if boundary is not None:
@@ -1588,7 +2145,7 @@ def _spectral_helper(
         axis -= 1
 
     # Roll frequency axis back to axis where the data came from
-    result = cp.rollaxis(result, -1, axis)
+    result = xp.rollaxis(result, -1, axis)
 
     return freqs, time, result
 
@@ -1614,9 +2171,11 @@ def _fft_helper(x, win, detrend_func, nperseg, noverlap, nfft, sides):
     Adapted from matplotlib.mlab
 
     """
+    xp = get_array_module(x)
+
     # Created strided array of data segments
     if nperseg == 1 and noverlap == 0:
-        result = x[..., cp.newaxis]
+        result = x[..., None]
     else:
         # https://stackoverflow.com/a/5568169
         step = nperseg - noverlap
@@ -1633,16 +2192,16 @@ def _fft_helper(x, win, detrend_func, nperseg, noverlap, nfft, sides):
 
     # Perform the fft. Acts on last axis by default. Zero-pads automatically
     if sides == "twosided":
-        func = fftpack.fft
+        func = _get_fftpack(xp).fft
     else:
         result = result.real
-        func = cp.fft.rfft
+        func = xp.fft.rfft
     result = func(result, n=nfft)
 
     return result
 
 
-def _triage_segments(window, nperseg, input_length):
+def _triage_segments(window, nperseg, input_length, xp=cp):
     """
     Parses window and nperseg arguments for spectrogram and _spectral_helper.
     This is a helper function, not meant to be called externally.
@@ -1664,6 +2223,9 @@ def _triage_segments(window, nperseg, input_length):
     input_length: int
         Length of input signal, i.e. x.shape[-1]. Used to test for errors.
 
+    xp : module, optional
+        Array module (`cupy` or `numpy`) the window is created with.
+
     Returns
     -------
     win : ndarray
@@ -1688,9 +2250,14 @@ def _triage_segments(window, nperseg, input_length):
                 " = {1:d}, using nperseg = {1:d}".format(nperseg, input_length)
             )
             nperseg = input_length
-        win = get_window(window, nperseg)
+        if xp is np:
+            from scipy.signal import get_window as _get_window
+
+            win = _get_window(window, nperseg)
+        else:
+            win = get_window(window, nperseg)
     else:
-        win = cp.asarray(window)
+        win = _asarray(window, xp)
         if len(win.shape) != 1:
             raise ValueError("window must be 1-D")
         if input_length < win.shape[-1]:
@@ -1723,5 +2290,5 @@ def _median_bias(n):
     bias : float
         Calculated bias.
     """
-    ii_2 = 2 * arange(1.0, (n - 1) // 2 + 1)
-    return 1 + cp.sum(1.0 / (ii_2 + 1) - 1.0 / ii_2)
+    ii_2 = 2 * np.arange(1.0, (n - 1) // 2 + 1)
+    return 1 + np.sum(1.0 / (ii_2 + 1) - 1.0 / ii_2)
@@ -0,0 +1,130 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import pytest
+
+from cusignal.utils.autotune import _Autotuner, _grid_2d_configs
+from cusignal.utils.compile_kernels import GPUKernel
+
+_CONFIGS = [(1600, 512), (400, 128), (800, 256), ((4, 4), (16, 16))]
+
+
+# Stand-in timer, so tuning can be tested without a GPU
+class _FakeTimer(object):
+    def __init__(self, times):
+        self.times = times
+        self.calls = []
+
+    def __call__(self, launch, config):
+        self.calls.append(config)
+        t = self.times[config]
+        if t is None:
+            raise RuntimeError("too many resources requested for launch")
+        return t
+
+
+def _launch(blockspergrid, threadsperblock):
+    raise AssertionError("the fake timer does not launch kernels")
+
+
+class TestAutotune:
+    @pytest.mark.parametrize(
+        "size, bucket", [(0, 1), (1, 1), (2, 2), (3, 4), (1000, 1024)]
+    )
+    def test_bucket(self, size, bucket):
+        assert _Autotuner.bucket(size) == bucket
+
+    def test_key(self):
+        k = GPUKernel.UPFIRDN
+        key = _Autotuner.key("V100", k, "float32", 1000)
+
+        assert key == _Autotuner.key("V100", k, "float32", 600)
+        assert key != _Autotuner.key("V100", k, "float32", 2000)
+        assert key != _Autotuner.key("V100", k, "float64", 1000)
+        assert key != _Autotuner.key("T4", k, "float32", 1000)
+        assert key != _Autotuner.key(
+            "V100", GPUKernel.CONVOLVE, "float32", 1000
+        )
+
+    def test_disabled(self, tmpdir):
+        timer = _FakeTimer({})
+        tuner = _Autotuner(str(tmpdir.join("db.json")), timer)
+
+        config = tuner.get_config(
+            "V100", GPUKernel.UPFIRDN, "float32", 1000, _CONFIGS, _launch
+        )
+        assert config == _CONFIGS[0]
+        assert timer.calls == []
+
+    def test_tune(self, tmpdir):
+        path = str(tmpdir.join("db.json"))
+        timer = _FakeTimer(
+            {_CONFIGS[0]: 3.0, _CONFIGS[1]: None, _CONFIGS[2]: 1.0,
+             _CONFIGS[3]: 2.0}
+        )
+        tuner = _Autotuner(path, timer, enabled=True)
+
+        args = ("V100", GPUKernel.UPFIRDN, "float32", 1000, _CONFIGS, _launch)
+        assert tuner.get_config(*args) == _CONFIGS[2]
+        assert timer.calls == _CONFIGS
+
+        # Tuned once per bucket
+        assert tuner.get_config(*args) == _CONFIGS[2]
+        assert len(timer.calls) == len(_CONFIGS)
+
+        # Persisted, and read by a new process even with tuning disabled
+        with open(path) as f:
+            assert len(json.load(f)["configs"]) == 1
+        tuner = _Autotuner(path, _FakeTimer({}))
+        assert tuner.get_config(*args) == _CONFIGS[2]
+
+        # Tuples survive the JSON round trip
+        timer = _FakeTimer({c: 1.0 / (i + 1) for i, c in enumerate(_CONFIGS)})
+        tuner = _Autotuner(path, timer, enabled=True)
+        args = ("V100", GPUKernel.UPFIRDN2D, "float32", 10, _CONFIGS, _launch)
+        assert tuner.get_config(*args) == _CONFIGS[3]
+        assert _Autotuner(path).get_config(*args) == _CONFIGS[3]
+        assert len(_Autotuner(path).db) == 2
+
+    def test_tune_2d(self, tmpdir):
+        # Same size bucket, different shapes
+        configs = _grid_2d_configs((100, 200))
+        timer = _FakeTimer({c: 1.0 / (i + 1) for i, c in enumerate(configs)})
+        tuner = _Autotuner(str(tmpdir.join("db.json")), timer, enabled=True)
+
+        args = ("V100", GPUKernel.CONVOLVE2D, "float32", 100 * 200)
+        assert tuner.get_config(*args, configs, _launch) == configs[-1]
+
+        # The tuned block, with a grid covering the new shape
+        configs = _grid_2d_configs((200, 100))
+        grid, block = tuner.get_config(*args, configs, _launch)
+        assert (grid, block) == configs[-1]
+        assert grid[0] * block[0] >= 200
+        assert grid[1] * block[1] >= 100
+
+    def test_corrupt_db(self, tmpdir):
+        path = tmpdir.join("db.json")
+        path.write("{not json")
+
+        tuner = _Autotuner(str(path))
+        assert tuner.db == {}
+
+    def test_grid_2d_configs(self):
+        configs = _grid_2d_configs((100, 30))
+
+        assert configs[0] == ((7, 2), (16, 16))
+        for grid, block in configs:
+            assert grid[0] * block[0] >= 100
+            assert grid[1] * block[1] >= 30
+            assert block[0] * block[1] <= 1024
@@ -0,0 +1,30 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cusignal
+import numpy as np
+import pytest
+
+
+class TestBackend:
+    def test_set_backend(self):
+        assert cusignal.get_backend() == "cupy"
+        with cusignal.set_backend("numpy") as xp:
+            assert xp is np
+            assert cusignal.get_backend() == "numpy"
+            assert cusignal.get_array_module([1, 2]) is np
+        assert cusignal.get_backend() == "cupy"
+
+        with pytest.raises(ValueError):
+            with cusignal.set_backend("jax"):
+                pass
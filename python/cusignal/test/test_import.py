@@ -0,0 +1,61 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import subprocess
+import sys
+
+import cusignal
+import pytest
+
+
+def _loaded_modules(code):
+    # Run in a fresh interpreter, since this one already imported cuSignal
+    code += "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    out = subprocess.check_output([sys.executable, "-c", code])
+    return set(json.loads(out.decode().splitlines()[-1]))
+
+
+class TestImport:
+    def test_import_is_lazy(self):
+        modules = _loaded_modules("import cusignal")
+
+        assert "cusignal" in modules
+        assert "numba" not in modules
+        assert not [m for m in modules if m.startswith("cusignal.utils")]
+        assert "cusignal.spectral_analysis.spectral" not in modules
+
+    def test_import_reader(self):
+        modules = _loaded_modules("from cusignal import read_sigmf")
+
+        assert "cusignal.io.reader" in modules
+        assert "numba" not in modules
+        assert "cusignal.windows.windows" not in modules
+
+    @pytest.mark.parametrize(
+        "name", ["welch", "sosfilt", "read_sigmf", "precompile_kernels"]
+    )
+    def test_public_names(self, name):
+        assert name in cusignal.__all__
+        assert name in dir(cusignal)
+        assert callable(getattr(cusignal, name))
+
+    def test_subpackage(self):
+        from cusignal.spectral_analysis import welch
+
+        assert cusignal.spectral_analysis.welch is welch
+        assert cusignal.welch is welch
+
+    def test_missing_name(self):
+        with pytest.raises(AttributeError):
+            cusignal.not_a_function
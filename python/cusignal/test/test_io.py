@@ -0,0 +1,38 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cusignal
+import numpy as np
+import pytest
+
+from cusignal.test.utils import array_equal
+
+
+class TestIO:
+    @pytest.mark.parametrize("dtype", [np.int16, np.float32, np.complex64])
+    @pytest.mark.parametrize("endianness", ["L", "B"])
+    def test_read_bin(self, tmpdir, dtype, endianness):
+        data = (np.random.rand(1024) * 100).astype(dtype)
+        if endianness == "B":
+            data = data.byteswap()
+        fname = str(tmpdir.join("data.bin"))
+        data.tofile(fname)
+
+        with cusignal.set_backend("numpy"):
+            binary = cusignal.read_bin(fname)
+            out = cusignal.unpack_bin(binary, dtype, endianness)
+
+        if endianness == "B":
+            data = data.byteswap()
+        assert isinstance(out, np.ndarray)
+        assert array_equal(data, out)
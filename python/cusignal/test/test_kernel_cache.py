@@ -0,0 +1,285 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cupy as cp
+import cusignal
+import numpy as np
+import os
+import pytest
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from cusignal.utils import compile_kernels
+from cusignal.utils._caches import _LRUKernelCache
+from cusignal.utils.compile_kernels import GPUKernel, _kernel_registry
+from cusignal.utils import kernel_cache
+from cusignal.utils.kernel_cache import _DiskKernelCache
+from scipy import signal
+
+
+# A stand-in compiler, so the cache can be tested without a GPU
+class _FakeCompiler(object):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, src, options, arch):
+        self.calls += 1
+        return src * 100
+
+
+# A stand-in for cp.RawModule
+class _FakeModule(object):
+    def __init__(self, src, options, np_type):
+        self.src = src
+
+    def get_function(self, name):
+        return (name, self.src)
+
+
+# A slow stand-in for cp.RawModule, counting compilations
+class _SlowModule(_FakeModule):
+    lock = threading.Lock()
+    compiled = []
+
+    def __init__(self, src, options, np_type):
+        time.sleep(0.01)
+        with self.lock:
+            self.compiled.append((src, np_type))
+        super().__init__(src, options, np_type)
+
+    def get_function(self, name):
+        # A new object per compilation, to detect duplicates
+        return [name]
+
+
+class TestKernelCache:
+    def test_key(self):
+        args = ("src", ("-std=c++11",), "float32", "70", "11.0")
+        key = _DiskKernelCache.key(*args)
+
+        assert key == _DiskKernelCache.key(*args)
+        for i, other in enumerate(
+            ("src2", ("-O3",), "float64", "80", "11.2")
+        ):
+            changed = list(args)
+            changed[i] = other
+            assert key != _DiskKernelCache.key(*changed)
+
+    def test_fetch(self, tmpdir):
+        compiler = _FakeCompiler()
+        cache = _DiskKernelCache(str(tmpdir), 1 << 20, compiler)
+        args = ("src", ("-std=c++11",), "float32", "70", "11.0")
+
+        f = cache.fetch(*args)
+        assert cache.fetch(*args) == f
+        assert compiler.calls == 1
+        with open(f, "rb") as fp:
+            assert fp.read() == b"src" * 100
+
+        # A new process sees the same cache
+        cache = _DiskKernelCache(str(tmpdir), 1 << 20, compiler)
+        assert cache.fetch(*args) == f
+        assert compiler.calls == 1
+
+        info = cache.info()
+        assert info["entries"] == 1
+        assert info["size"] == 300
+        assert info["hits"] == 1
+        assert info["misses"] == 0
+
+    def test_nvrtc_compile(self, monkeypatch):
+        calls = []
+
+        # CuPy takes the bare arch and returns (binary, name mapping)
+        def compile_using_nvrtc(src, options=(), arch=None):
+            calls.append((src, options, arch))
+            return src.encode("utf-8"), {}
+
+        monkeypatch.setattr(
+            kernel_cache.cp.cuda.compiler,
+            "compile_using_nvrtc",
+            compile_using_nvrtc,
+        )
+        # Include paths added like cp.RawModule does
+        monkeypatch.setattr(
+            kernel_cache.cp._core.core,
+            "assemble_cupy_compiler_options",
+            lambda options: ("-Icupy",) + options,
+        )
+
+        binary = kernel_cache._nvrtc_compile("src", ["-std=c++11"], "70")
+        assert binary == b"src"
+        assert calls == [("src", ("-Icupy", "-std=c++11"), "70")]
+
+    @pytest.mark.parametrize("max_size", [300, 700])
+    def test_evict(self, tmpdir, max_size):
+        compiler = _FakeCompiler()
+        cache = _DiskKernelCache(str(tmpdir), max_size, compiler)
+
+        files = []
+        for i, src in enumerate(("aaa", "bbb", "ccc")):
+            files.append(
+                cache.fetch(src, (), "float32", "70", "11.0")
+            )
+            # Give each entry a distinct access time
+            os.utime(files[-1], (i, i))
+
+        # Least recently used first
+        n_kept = max_size // 300
+        assert [os.path.exists(f) for f in files] == [False] * (
+            3 - n_kept
+        ) + [True] * n_kept
+        assert cache.info()["size"] <= max_size
+        assert cache.info()["evictions"] == 3 - n_kept
+
+        # Entries larger than the cache are kept until the next insertion
+        cache.max_size = 0
+        f = cache.fetch("ddd", (), "float32", "70", "11.0")
+        assert os.path.exists(f)
+        assert cache.info()["entries"] == 1
+
+        cache.clear()
+        assert cache.info()["entries"] == 0
+
+    def test_lru(self):
+        cache = _LRUKernelCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+
+        assert cache.get_or_compile("a", lambda: 0) == 1
+        assert cache.get_or_compile("c", lambda: 3) == 3
+
+        # "b" was the least recently used
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert cache.info() == {
+            "loaded": 2,
+            "maxsize": 2,
+            "hits": 1,
+            "misses": 1,
+            "evictions": 1,
+            "compile_time": cache.compile_time,
+        }
+
+    def test_registry(self):
+        assert set(_kernel_registry) == set(GPUKernel)
+
+        for spec in _kernel_registry.values():
+            for np_type, c_type in spec.types.items():
+                subs = {"datatype": c_type, "header": ""}
+                if spec.substitutions is not None:
+                    subs.update(spec.substitutions(np_type))
+                src = spec.template.substitute(**subs)
+                assert spec.entry in src
+
+    def test_populate(self, monkeypatch):
+        cache = _LRUKernelCache(4)
+        monkeypatch.setattr(compile_kernels, "_cupy_kernel_cache", cache)
+        monkeypatch.setattr(compile_kernels, "_load_module", _FakeModule)
+
+        compile_kernels._populate_kernel_cache(np.float32, GPUKernel.UNPACK)
+        compile_kernels._populate_kernel_cache("float32", GPUKernel.UNPACK)
+        name, src = cache[("float32", "unpack")]
+
+        assert name == "_cupy_unpack"
+        assert "#define FLAG 6" in src
+        assert cache.hits == 1 and cache.misses == 1
+
+        with pytest.raises(KeyError):
+            compile_kernels._populate_kernel_cache("int8", GPUKernel.SOSFILT)
+
+        compile_kernels._validate_input(None, GPUKernel.UPFIRDN)
+        assert len(cache) == 4
+        compile_kernels._validate_input(None, GPUKernel.SOSFILT)
+        assert len(cache) == 4
+        assert cache.evictions == 5
+
+    @pytest.mark.parametrize("n_threads", [16])
+    def test_populate_threads(self, monkeypatch, n_threads):
+        cache = _LRUKernelCache(128)
+        monkeypatch.setattr(compile_kernels, "_cupy_kernel_cache", cache)
+        monkeypatch.setattr(compile_kernels, "_load_module", _SlowModule)
+        _SlowModule.compiled = []
+
+        work = [
+            (np_type, k_type)
+            for k_type in (GPUKernel.UPFIRDN, GPUKernel.CONVOLVE)
+            for np_type in compile_kernels._get_supported_types(k_type)
+        ] * 20
+        np.random.shuffle(work)
+
+        def populate(args):
+            kernel = compile_kernels._populate_kernel_cache(*args)
+            return args, id(kernel)
+
+        with ThreadPoolExecutor(n_threads) as pool:
+            results = list(pool.map(populate, work))
+
+        # Each kernel compiled once, and every caller got that kernel
+        n_kernels = len(set(work))
+        assert len(_SlowModule.compiled) == n_kernels
+        assert len(cache) == n_kernels
+        assert len(set(results)) == n_kernels
+        assert cache.misses == n_kernels
+        assert cache.hits == len(work) - n_kernels
+
+    def test_compile_error(self):
+        cache = _LRUKernelCache(4)
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(1)
+            raise RuntimeError("compilation failed")
+
+        with ThreadPoolExecutor(2) as pool:
+            owner = pool.submit(cache.get_or_compile, "a", failing)
+            started.wait(1)
+            waiter = pool.submit(cache.get_or_compile, "a", lambda: 1)
+            # Wait until the waiter blocks on the in-flight compilation
+            while cache.hits == 0:
+                time.sleep(0.001)
+            release.set()
+
+            for f in (owner, waiter):
+                with pytest.raises(RuntimeError):
+                    f.result()
+
+        # Not cached, the next call compiles again
+        assert cache.get_or_compile("a", lambda: 1) == 1
+
+
+# Compiles real kernels, so requires a GPU
+class TestKernelCacheGPU:
+    def test_compile_complex(self, tmpdir, monkeypatch):
+        disk = _DiskKernelCache(str(tmpdir), 1 << 24)
+        monkeypatch.setattr(kernel_cache, "_disk_cache", disk)
+        monkeypatch.delenv(kernel_cache._ENV_DISABLE, raising=False)
+
+        # Complex kernels include <cupy/complex.cuh>
+        cpu_sig = np.random.rand(1000) + 1j * np.random.rand(1000)
+        h = np.random.rand(31)
+        cpu_out = signal.upfirdn(h, cpu_sig, 3, 2)
+        for _ in range(2):
+            monkeypatch.setattr(
+                compile_kernels, "_cupy_kernel_cache", _LRUKernelCache(128)
+            )
+            out = cusignal.upfirdn(cp.asarray(h), cp.asarray(cpu_sig), 3, 2)
+            assert np.allclose(cpu_out, cp.asnumpy(out))
+
+        # Compiled once, then loaded from disk
+        assert disk.misses > 0
+        assert disk.hits == disk.misses
@@ -0,0 +1,154 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cusignal
+import numpy as np
+import pytest
+
+from cusignal.test.utils import array_equal
+from cusignal.utils.memory import _Workspace, _empty
+from scipy import signal
+
+
+class TestWorkspace:
+    def test_arena(self):
+        ws = _Workspace(1024)
+
+        a = ws.empty((10,), np.float64, np, "a")
+        assert ws.empty((10,), np.float64, np, "a") is a
+        b = ws.empty((10,), np.float32, np, "a")
+        assert not np.shares_memory(a, b)
+        assert (b.ctypes.data - a.ctypes.data) % 256 == 0
+
+        # Does not fit, allocated outside of the arena
+        c = ws.empty((1024,), np.uint8, np, "c")
+        assert ws.empty((1024,), np.uint8, np, "c") is not c
+
+        assert ws.info() == {
+            "nbytes": 1024,
+            "used": 296,
+            "buffers": 2,
+            "hits": 1,
+            "misses": 2,
+            "allocations": 3,
+        }
+
+        with pytest.raises(ValueError):
+            _Workspace(-1)
+
+    def test_scope(self):
+        assert isinstance(_empty((4,), np.float64, np, "a"), np.ndarray)
+        with cusignal.workspace(1024) as outer:
+            with cusignal.workspace(1024) as inner:
+                _empty((4,), np.float64, np, "a")
+            _empty((4,), np.float64, np, "a")
+            _empty((4,), np.float64, np, "a")
+        assert inner.info()["misses"] == 1
+        assert outer.info()["hits"] == 1
+
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("axis", [0, -1])
+    def test_steady_state(self, num_samps, axis):
+        cpu_sig = np.random.rand(2, num_samps)
+        if axis == 0:
+            cpu_sig = cpu_sig.T
+        sos = signal.butter(4, 0.2, output="sos")
+        zi = np.random.rand(sos.shape[0], 2, 2)
+        if axis == 0:
+            zi = zi.swapaxes(1, 2)
+        h = np.random.rand(42)
+        win = np.random.rand(31)
+
+        with cusignal.set_backend("numpy"), cusignal.workspace(2 ** 20) as ws:
+            for i in range(3):
+                out, zf = cusignal.sosfilt(sos, cpu_sig, axis=axis, zi=zi)
+                up = cusignal.upfirdn(h, cpu_sig[0], 3, 2)
+                conv = cusignal.convolve(cpu_sig[0], win, method="direct")
+                if i == 0:
+                    allocations = ws.info()["allocations"]
+
+        # Buffers are reused after the first iteration
+        assert ws.info()["allocations"] == allocations == 1
+
+        cpu_out, cpu_zf = signal.sosfilt(sos, cpu_sig, axis=axis, zi=zi)
+        assert array_equal(cpu_out, out)
+        assert array_equal(cpu_zf, zf)
+        assert array_equal(signal.upfirdn(h, cpu_sig[0], 3, 2), up)
+        assert array_equal(signal.convolve(cpu_sig[0], win), conv)
+
+    def test_unaliased(self):
+        x = np.random.rand(64)
+        win = np.random.rand(9)
+        expected = signal.convolve(
+            signal.convolve(x, win, mode="same"), win, mode="same"
+        )
+
+        # The inner result lives in the buffer the outer call writes
+        with cusignal.set_backend("numpy"), cusignal.workspace(2 ** 20):
+            y = cusignal.convolve(x, win, mode="same", method="direct")
+            y = cusignal.convolve(y, win, mode="same", method="direct")
+        assert array_equal(expected, y)
+
+        out = x.copy()
+        with cusignal.set_backend("numpy"):
+            cusignal.convolve(out, win, mode="same", method="direct", out=out)
+        assert array_equal(signal.convolve(x, win, mode="same"), out)
+
+
+class TestOutput:
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("axis", [0, -1])
+    def test_out(self, num_samps, axis):
+        cpu_sig = np.random.rand(3, num_samps)
+        if axis == 0:
+            cpu_sig = cpu_sig.T.copy()
+        sos = signal.butter(4, 0.2, output="sos")
+        h = np.random.rand(42)
+        win = np.random.rand(31)
+        x = np.linspace(0.01, 10 * np.pi, 256)
+        f = np.linspace(0.01, 10, 128)
+
+        cpu_sosfilt = signal.sosfilt(sos, cpu_sig, axis)
+        cpu_upfirdn = signal.upfirdn(h, cpu_sig, 3, 2, axis)
+        cpu_resample = signal.resample_poly(cpu_sig, 3, 2, axis)
+        cpu_conv = signal.convolve(cpu_sig[:, 0], win)
+        cpu_corr = signal.correlate(cpu_sig[:, 0], win)
+        cpu_lomb = signal.lombscargle(x, np.cos(x), f)
+        _, _, cpu_stft = signal.stft(cpu_sig, nperseg=256, axis=axis)
+
+        with cusignal.set_backend("numpy"):
+            results = [
+                (cpu_sosfilt, cusignal.sosfilt, (sos, cpu_sig, axis)),
+                (cpu_upfirdn, cusignal.upfirdn, (h, cpu_sig, 3, 2, axis)),
+                (cpu_resample, cusignal.resample_poly, (cpu_sig, 3, 2, axis)),
+                (cpu_conv, cusignal.convolve, (cpu_sig[:, 0], win)),
+                (cpu_corr, cusignal.correlate, (cpu_sig[:, 0], win)),
+                (cpu_lomb, cusignal.lombscargle, (x, np.cos(x), f)),
+            ]
+            for key, func, args in results:
+                out = np.empty(key.shape, key.dtype)
+                assert func(*args, out=out) is out
+                assert array_equal(key, out)
+
+                with pytest.raises(ValueError):
+                    func(*args, out=np.empty(key.shape, np.float32))
+
+            out = np.empty(cpu_stft.shape, cpu_stft.dtype)
+            _, _, stft = cusignal.stft(
+                cpu_sig, nperseg=256, axis=axis, out=out
+            )
+            assert stft is out
+            assert array_equal(cpu_stft, out)
+
+            cusignal.sosfilt(sos, cpu_sig, axis, overwrite_x=True)
+            assert array_equal(cpu_sosfilt, cpu_sig)
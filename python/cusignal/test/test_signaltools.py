@@ -16,6 +16,8 @@ import cusignal
 import numpy as np
 import pytest
 
+from cusignal.filter_design.filter_design_utils import _fir_symmetry
+from cusignal.filtering.filtering import _lfilter_fir, _lfilter_iir
 from cusignal.test.utils import array_equal
 from scipy import signal
 
@@ -96,6 +98,216 @@ class TestSignaltools:
 
         assert array_equal(cpu_resample, gpu_resample)
 
+    @pytest.mark.parametrize("num_samps", [2 ** 8])
+    @pytest.mark.parametrize("up", [2, 3, 7])
+    @pytest.mark.parametrize("down", [1, 2, 9])
+    @pytest.mark.parametrize("axis", [0, 1, 2, -1])
+    def test_upfirdn_nd(self, num_samps, up, down, axis):
+        cpu_sig = np.random.rand(3, 4, 5, num_samps)
+        h = np.random.rand(42)
+
+        # Contiguous and strided inputs, with and without a copy
+        for view in (
+            lambda a: a,
+            lambda a: a[:, ::-1, 1:4],
+            lambda a: a.transpose(3, 1, 2, 0),
+        ):
+            cpu_x = view(cpu_sig)
+            gpu_x = view(cp.asarray(cpu_sig))
+
+            cpu_resample = signal.upfirdn(h, cpu_x, up, down, axis)
+            gpu_resample = cusignal.upfirdn(h, gpu_x, up, down, axis)
+
+            assert array_equal(cpu_resample, cp.asnumpy(gpu_resample))
+
+    @pytest.mark.parametrize("num_samps", [2 ** 14])
+    @pytest.mark.parametrize("down", [1, 2, 9])
+    @pytest.mark.parametrize("num_taps", [64, 65])
+    @pytest.mark.parametrize("symmetry", [1, -1])
+    def test_upfirdn_symmetry(self, num_samps, down, num_taps, symmetry):
+        cpu_sig = np.random.rand(2, num_samps)
+        h = np.random.rand(num_taps)
+        h += symmetry * h[::-1]
+
+        for x in (cpu_sig[0], cpu_sig, cpu_sig.T):
+            cpu_resample = signal.upfirdn(h, x, 1, down, axis=0)
+            gpu_resample = cusignal.upfirdn(
+                h, cp.asarray(x), 1, down, axis=0, detect_symmetry=True
+            )
+            assert array_equal(cpu_resample, cp.asnumpy(gpu_resample))
+
+        # Filters with leading zero taps, checked once when prepared
+        cpu_resample = signal.resample_poly(cpu_sig, 1, down, -1, window=h)
+        rs = cusignal.StreamingResamplePoly(1, down, window=h, n_channels=2)
+        gpu_resample = cp.concatenate(
+            [rs.process(cp.asarray(cpu_sig)), rs.flush()], -1
+        )
+        assert array_equal(cpu_resample, cp.asnumpy(gpu_resample))
+
+    @pytest.mark.parametrize("num_samps", [2 ** 14])
+    @pytest.mark.parametrize("n_channels", [1, 4])
+    @pytest.mark.parametrize("up", [2, 3, 7])
+    @pytest.mark.parametrize("down", [1, 2, 9])
+    @pytest.mark.parametrize("chunk", [100, 4096])
+    def test_streaming_resample(self, num_samps, n_channels, up, down, chunk):
+        cpu_sig = np.random.rand(n_channels, num_samps).squeeze()
+        gpu_sig = cp.asarray(cpu_sig)
+        h = np.random.rand(31)
+
+        ufd = cusignal.StreamingUpFIRDn(
+            cp.asarray(h), up, down, n_channels=n_channels
+        )
+        gpu_chunks = [
+            ufd.process(gpu_sig[..., i : i + chunk])
+            for i in range(0, num_samps, chunk)
+        ]
+        gpu_out = cp.concatenate(gpu_chunks + [ufd.flush()], axis=-1)
+
+        # Identical to resampling the whole signal at once
+        assert cp.array_equal(cusignal.upfirdn(h, gpu_sig, up, down), gpu_out)
+
+        rs = cusignal.StreamingResamplePoly(up, down, n_channels=n_channels)
+        gpu_chunks = [
+            rs.process(gpu_sig[..., i : i + chunk])
+            for i in range(0, num_samps, chunk)
+        ]
+        gpu_out = cp.concatenate(gpu_chunks + [rs.flush()], axis=-1)
+
+        cpu_out = signal.resample_poly(cpu_sig, up, down, axis=-1)
+        assert array_equal(cpu_out, cp.asnumpy(gpu_out))
+
+    @pytest.mark.parametrize("n_channels", [1, 4])
+    @pytest.mark.parametrize("up, down", [(1, 256), (3, 256), (64, 1)])
+    def test_resample_multistage(self, n_channels, up, down):
+        band = min(1, up / down) / 2
+        t = np.arange(2 ** 12 * max(1, down // up))
+        cpu_sig = np.cos(2 * np.pi * 0.25 * band * t)
+        cpu_sig = cpu_sig * np.ones((n_channels, 1))
+        gpu_sig = cp.asarray(cpu_sig)
+
+        # Same filtering as the plan on the CPU, and close to a single stage
+        with cusignal.set_backend("numpy"):
+            cpu_out = cusignal.ResamplePlan(up, down)(cpu_sig)
+        gpu_out = cusignal.resample_poly(
+            gpu_sig, up, down, axis=-1, method="multistage"
+        )
+        assert array_equal(cpu_out, cp.asnumpy(gpu_out))
+
+        cpu_out = signal.resample_poly(cpu_sig, up, down, axis=-1)
+        mid = slice(cpu_out.shape[-1] // 8, -cpu_out.shape[-1] // 8)
+        assert np.abs(cp.asnumpy(gpu_out) - cpu_out)[..., mid].max() < 1e-2
+
+    @pytest.mark.parametrize("dtype", [np.int8, np.int16, np.complex64])
+    @pytest.mark.parametrize("n_channels", [1, 4])
+    @pytest.mark.parametrize("rate", [3, 64])
+    @pytest.mark.parametrize("order", [1, 5])
+    def test_cic(self, dtype, n_channels, rate, order):
+        cpu_sig = np.random.randn(n_channels, 2 ** 14) * 50
+        if dtype == np.complex64:
+            cpu_sig = cpu_sig + 1j * np.random.randn(n_channels, 2 ** 14)
+        cpu_sig = cpu_sig.astype(dtype).squeeze()
+        gpu_sig = cp.asarray(cpu_sig)
+
+        # Compared with the FIR form of the filter on the host
+        with cusignal.set_backend("numpy"):
+            cpu_dec = cusignal.cic_decimate(cpu_sig, rate, order)
+            cpu_raw = cusignal.cic_decimate(
+                cpu_sig, rate, order, normalize=False
+            )
+            cpu_int = cusignal.cic_interpolate(cpu_sig, rate, order, delay=2)
+
+        gpu_dec = cusignal.cic_decimate(gpu_sig, rate, order)
+        assert array_equal(cpu_dec, cp.asnumpy(gpu_dec))
+        if dtype != np.complex64:
+            gpu_raw = cusignal.cic_decimate(
+                gpu_sig, rate, order, normalize=False
+            )
+            assert np.array_equal(cpu_raw, cp.asnumpy(gpu_raw))
+
+        gpu_int = cusignal.cic_interpolate(gpu_sig, rate, order, delay=2)
+        assert array_equal(cpu_int, cp.asnumpy(gpu_int))
+
+        # Along the first axis
+        gpu_dec = cusignal.cic_decimate(gpu_sig.T, rate, order, axis=0)
+        assert array_equal(cpu_dec.T, cp.asnumpy(gpu_dec))
+
+        cic = cusignal.StreamingCICDecimator(
+            rate, order, dtype=dtype, n_channels=n_channels
+        )
+        gpu_chunks = [
+            cic.process(gpu_sig[..., i : i + 1000])
+            for i in range(0, 2 ** 14, 1000)
+        ]
+        assert array_equal(
+            cpu_dec, cp.asnumpy(cp.concatenate(gpu_chunks, axis=-1))
+        )
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.complex128])
+    @pytest.mark.parametrize("num_samps", [2 ** 14])
+    @pytest.mark.parametrize("n_channels", [16, 64])
+    @pytest.mark.parametrize("oversample", [1, 2])
+    def test_channelize(self, dtype, num_samps, n_channels, oversample):
+        cpu_sig = np.random.rand(4, num_samps)
+        if dtype == np.complex128:
+            cpu_sig = cpu_sig + 1j * np.random.rand(4, num_samps)
+        cpu_sig = cpu_sig.astype(dtype)
+        h = signal.firwin(n_channels * 8, 1 / n_channels).astype(dtype)
+        gpu_sig = cp.asarray(cpu_sig)
+        gpu_h = cp.asarray(h)
+
+        with cusignal.set_backend("numpy"):
+            cpu_chan = cusignal.channelize(cpu_sig, h, n_channels, oversample)
+            cpu_syn = cusignal.synthesize_channels(cpu_chan, h, oversample)
+
+        gpu_chan = cusignal.channelize(gpu_sig, gpu_h, n_channels, oversample)
+        assert gpu_chan.dtype == cpu_chan.dtype
+        assert array_equal(cpu_chan, cp.asnumpy(gpu_chan))
+
+        gpu_syn = cusignal.synthesize_channels(gpu_chan, gpu_h, oversample)
+        assert array_equal(cpu_syn, cp.asnumpy(gpu_syn))
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.complex128])
+    @pytest.mark.parametrize("num_samps", [2 ** 14])
+    @pytest.mark.parametrize("down", [1, 10])
+    def test_ddc(self, dtype, num_samps, down):
+        fs = 1e6
+        f_offset = np.array([-1e5, 2.5e5])
+        cpu_sig = np.random.rand(2, num_samps)
+        if dtype == np.complex128:
+            cpu_sig = cpu_sig + 1j * np.random.rand(2, num_samps)
+        cpu_sig = cpu_sig.astype(dtype)
+        h = signal.firwin(64, 0.8 / down).astype(np.finfo(dtype).dtype)
+        gpu_sig = cp.asarray(cpu_sig)
+        gpu_h = cp.asarray(h)
+
+        with cusignal.set_backend("numpy"):
+            cpu_ddc = cusignal.ddc(cpu_sig, f_offset, fs, h, down)
+
+        gpu_ddc = cusignal.ddc(gpu_sig, cp.asarray(f_offset), fs, gpu_h, down)
+        assert gpu_ddc.dtype == cpu_ddc.dtype
+        assert array_equal(cpu_ddc, cp.asnumpy(gpu_ddc))
+
+        # In chunks, with the filter tail flushed by zeros
+        state = 0.0
+        chunks = []
+        for x in np.split(gpu_sig, [1, 1000, 1001, 5000], -1) + [
+            cp.zeros((2, len(h) - 1), dtype)
+        ]:
+            y, state = cusignal.ddc(
+                x, cp.asarray(f_offset), fs, gpu_h, down, state
+            )
+            chunks.append(y)
+        assert array_equal(cpu_ddc, cp.asnumpy(cp.concatenate(chunks, -1)))
+
+        # One input for all channels
+        with cusignal.set_backend("numpy"):
+            cpu_ddc = cusignal.ddc(cpu_sig[0], f_offset, fs, h, down)
+
+        gpu_ddc = cusignal.ddc(
+            gpu_sig[0], cp.asarray(f_offset), fs, gpu_h, down
+        )
+        assert array_equal(cpu_ddc, cp.asnumpy(gpu_ddc))
+
     @pytest.mark.parametrize("num_samps", [2 ** 15])
     @pytest.mark.parametrize("f1", [0.1, 0.15])
     @pytest.mark.parametrize("f2", [0.2, 0.4])
@@ -140,6 +352,35 @@ class TestSignaltools:
         )
         assert array_equal(cpu_conv, gpu_conv)
 
+    @pytest.mark.parametrize("num_samps", [2 ** 10, 1025])
+    @pytest.mark.parametrize("num_taps", [32, 33])
+    @pytest.mark.parametrize("mode", ["full", "valid", "same"])
+    @pytest.mark.parametrize("symmetry", [1, -1, 0])
+    def test_convolve_symmetry(self, num_samps, num_taps, mode, symmetry):
+        cpu_sig = np.random.rand(num_samps)
+        cpu_win = np.random.rand(num_taps)
+        if symmetry != 0:
+            cpu_win += symmetry * cpu_win[::-1]
+        gpu_sig = cp.asarray(cpu_sig)
+        gpu_win = cp.asarray(cpu_win)
+
+        for cpu_func, gpu_func in (
+            (signal.convolve, cusignal.convolve),
+            (signal.correlate, cusignal.correlate),
+        ):
+            key = cpu_func(cpu_sig, cpu_win, mode=mode, method="direct")
+            out = gpu_func(
+                gpu_sig, gpu_win, mode, "direct", detect_symmetry=True
+            )
+            assert array_equal(key, cp.asnumpy(out))
+
+            # Kernel longer than the signal
+            key = cpu_func(cpu_win, cpu_sig, mode=mode, method="direct")
+            out = gpu_func(
+                gpu_win, gpu_sig, mode, "direct", detect_symmetry=True
+            )
+            assert array_equal(key, cp.asnumpy(out))
+
     @pytest.mark.parametrize("num_samps", [2 ** 15])
     def test_fftconvolve(self, num_samps, mode="full"):
         cpu_sig = np.random.rand(num_samps)
@@ -161,13 +402,30 @@ class TestSignaltools:
         assert array_equal(cpu_wfilt, gpu_wfilt)
 
     @pytest.mark.parametrize("num_samps", [2 ** 15])
-    def test_hilbert(self, num_samps):
-        cpu_sig = np.random.rand(num_samps)
+    @pytest.mark.parametrize(
+        "dtype, out_type",
+        [(np.float32, np.complex64), (np.float64, np.complex128)],
+    )
+    def test_hilbert(self, num_samps, dtype, out_type):
+        cpu_sig = np.random.rand(num_samps).astype(dtype)
         gpu_sig = cp.asarray(cpu_sig)
 
         cpu_hilbert = signal.hilbert(cpu_sig)
-        gpu_hilbert = cp.asnumpy(cusignal.hilbert(gpu_sig))
-        assert array_equal(cpu_hilbert, gpu_hilbert)
+        gpu_hilbert = cusignal.hilbert(gpu_sig)
+        assert gpu_hilbert.dtype == out_type
+        assert array_equal(cpu_hilbert, cp.asnumpy(gpu_hilbert))
+
+    @pytest.mark.parametrize("num_samps", [2 ** 15])
+    @pytest.mark.parametrize("N", [2 ** 14, 2 ** 15 + 1])
+    def test_hilbert_out(self, num_samps, N):
+        cpu_sig = np.random.rand(2, num_samps)
+        gpu_sig = cp.asarray(cpu_sig)
+        gpu_out = cp.empty((2, N), cp.complex128)
+
+        cpu_hilbert = signal.hilbert(cpu_sig, N)
+        gpu_hilbert = cusignal.hilbert(gpu_sig, N, out=gpu_out)
+        assert gpu_hilbert is gpu_out
+        assert array_equal(cpu_hilbert, cp.asnumpy(gpu_hilbert))
 
     @pytest.mark.parametrize("num_samps", [2 ** 8])
     def test_hilbert2(self, num_samps):
@@ -238,6 +496,33 @@ class TestSignaltools:
 
         assert array_equal(cpu_decimate, gpu_decimate)
 
+    @pytest.mark.parametrize("num_signals", [1, 4])
+    @pytest.mark.parametrize("num_samps", [2 ** 14 + 1])
+    @pytest.mark.parametrize("downsample_factor", [2, 3, 8])
+    @pytest.mark.parametrize("zero_phase", [True, False])
+    def test_decimate_iir(
+        self, num_signals, num_samps, downsample_factor, zero_phase
+    ):
+        cpu_sig = np.random.rand(num_signals, num_samps)
+        gpu_sig = cp.asarray(cpu_sig)
+
+        cpu_decimate = signal.decimate(
+            cpu_sig, downsample_factor, ftype="iir", zero_phase=zero_phase
+        )
+        gpu_decimate = cusignal.decimate(
+            gpu_sig, downsample_factor, ftype="iir", zero_phase=zero_phase
+        )
+        assert array_equal(cpu_decimate, cp.asnumpy(gpu_decimate))
+
+        gpu_decimate = cusignal.decimate(
+            gpu_sig.T,
+            downsample_factor,
+            ftype="iir",
+            axis=0,
+            zero_phase=zero_phase,
+        )
+        assert array_equal(cpu_decimate.T, cp.asnumpy(gpu_decimate))
+
     @pytest.mark.parametrize("num_signals", [1, 2, 10])
     @pytest.mark.parametrize("num_samps", [100])
     def test_sosfilt(self, num_signals, num_samps):
@@ -253,3 +538,777 @@ class TestSignaltools:
         gpu_sosfilt = cp.asnumpy(cusignal.sosfilt(gpu_sos, gpu_sig))
 
         assert array_equal(cpu_sosfilt, gpu_sosfilt)
+
+    @pytest.mark.parametrize("num_signals", [1, 10])
+    @pytest.mark.parametrize("num_samps", [100, 2 ** 12])
+    @pytest.mark.parametrize("axis", [0, -1])
+    @pytest.mark.parametrize(
+        "b, a",
+        [
+            signal.butter(4, 0.1),
+            ([0.5, 0.2], [2.0, -0.9, 0.3, 0.1]),
+            (np.arange(1.0, 32.0), [2.0]),
+        ],
+    )
+    def test_lfilter(self, num_signals, num_samps, axis, b, a):
+        cpu_sig = np.random.rand(num_signals, num_samps)
+        if axis == 0:
+            cpu_sig = cpu_sig.T.copy()
+        zi_shape = list(cpu_sig.shape)
+        zi_shape[axis] = max(len(a), len(b)) - 1
+        cpu_zi = np.random.rand(*zi_shape)
+
+        cpu_lfilter, cpu_zf = signal.lfilter(
+            b, a, cpu_sig, axis=axis, zi=cpu_zi
+        )
+        gpu_lfilter, gpu_zf = cusignal.lfilter(
+            cp.asarray(b),
+            cp.asarray(a),
+            cp.asarray(cpu_sig),
+            axis=axis,
+            zi=cp.asarray(cpu_zi),
+        )
+
+        assert array_equal(cpu_lfilter, cp.asnumpy(gpu_lfilter))
+        assert array_equal(cpu_zf, cp.asnumpy(gpu_zf))
+
+        cpu_zi = signal.lfiltic(b, a, cpu_lfilter[::-1].ravel()[:8])
+        gpu_zi = cusignal.lfiltic(
+            cp.asarray(b), cp.asarray(a), gpu_lfilter[::-1].ravel()[:8]
+        )
+        assert array_equal(cpu_zi, cp.asnumpy(gpu_zi))
+
+    @pytest.mark.parametrize("num_signals", [1, 10])
+    @pytest.mark.parametrize("num_samps", [100, 2 ** 12])
+    @pytest.mark.parametrize("padtype", ["odd", "even", "constant", None])
+    @pytest.mark.parametrize("axis", [0, -1])
+    def test_sosfiltfilt(self, num_signals, num_samps, padtype, axis):
+        cpu_sig = np.random.rand(num_signals, num_samps)
+        if axis == 0:
+            cpu_sig = cpu_sig.T.copy()
+        cpu_sos = signal.butter(8, 0.2, output="sos")
+
+        cpu_zi = signal.sosfilt_zi(cpu_sos)
+        gpu_zi = cusignal.sosfilt_zi(cp.asarray(cpu_sos))
+        assert array_equal(cpu_zi, cp.asnumpy(gpu_zi))
+
+        cpu_sosfiltfilt = signal.sosfiltfilt(
+            cpu_sos, cpu_sig, axis=axis, padtype=padtype, padlen=30
+        )
+        gpu_sosfiltfilt = cusignal.sosfiltfilt(
+            cp.asarray(cpu_sos),
+            cp.asarray(cpu_sig),
+            axis=axis,
+            padtype=padtype,
+            padlen=30,
+        )
+
+        assert array_equal(cpu_sosfiltfilt, cp.asnumpy(gpu_sosfiltfilt))
+
+    @pytest.mark.parametrize("num_signals", [1, 10])
+    @pytest.mark.parametrize("num_samps", [100, 2 ** 12])
+    @pytest.mark.parametrize("n_sections", [16, 1200])
+    def test_sosfilt_bank(self, num_signals, num_samps, n_sections):
+        cpu_sig = np.random.rand(num_signals, num_samps)
+        cpu_sos = np.stack(
+            [
+                np.tile(signal.butter(2, f, output="sos"), (n_sections, 1))
+                for f in np.linspace(0.2, 0.8, num_signals)
+            ]
+        )
+        cpu_zi = np.random.rand(n_sections, num_signals, 2)
+
+        gpu_sosfilt, gpu_zf = cusignal.sosfilt(
+            cp.asarray(cpu_sos), cp.asarray(cpu_sig), zi=cp.asarray(cpu_zi)
+        )
+
+        for i in range(num_signals):
+            cpu_sosfilt, cpu_zf = signal.sosfilt(
+                cpu_sos[i], cpu_sig[i], zi=cpu_zi[:, i]
+            )
+            assert array_equal(cpu_sosfilt, cp.asnumpy(gpu_sosfilt[i]))
+            assert array_equal(cpu_zf, cp.asnumpy(gpu_zf[:, i]))
+
+    @pytest.mark.parametrize("num_signals", [1, 10])
+    @pytest.mark.parametrize("num_samps", [100, 2 ** 12])
+    @pytest.mark.parametrize("dtype", [np.complex64, np.complex128])
+    @pytest.mark.parametrize("complex_sos", [False, True])
+    def test_sosfilt_complex(self, num_signals, num_samps, dtype, complex_sos):
+        cpu_sig = np.random.rand(num_signals, num_samps) + 1j * (
+            np.random.rand(num_signals, num_samps)
+        )
+        cpu_sig = cpu_sig.astype(dtype)
+        cpu_sos = signal.ellip(16, 0.009, 80, 0.05, output="sos")
+        if complex_sos:
+            # Frequency shifted filter, with complex coefficients
+            cpu_sos = cpu_sos.astype(dtype)
+            cpu_sos[:, 1] *= np.exp(0.3j)
+            cpu_sos[:, 4] *= np.exp(0.3j)
+            cpu_sos[:, 2] *= np.exp(0.6j)
+            cpu_sos[:, 5] *= np.exp(0.6j)
+
+        cpu_sosfilt = signal.sosfilt(cpu_sos, cpu_sig)
+
+        gpu_sosfilt = cusignal.sosfilt(
+            cp.asarray(cpu_sos), cp.asarray(cpu_sig)
+        )
+
+        assert gpu_sosfilt.dtype == dtype
+        assert array_equal(cpu_sosfilt, cp.asnumpy(gpu_sosfilt), tol=1e-3)
+
+    @pytest.mark.parametrize("num_signals", [1, 10])
+    @pytest.mark.parametrize("num_samps", [1, 10, 2 ** 12])
+    @pytest.mark.parametrize("n_sections", [16, 1200])
+    def test_sosfilt_sections(self, num_signals, num_samps, n_sections):
+        # Longer cascades than fit in a block, and shorter signals than
+        # the cascade
+        cpu_sos = np.tile(
+            signal.butter(2, 0.4, output="sos"), (n_sections, 1)
+        )
+        cpu_sig = np.random.rand(num_signals, num_samps)
+        cpu_zi = np.random.rand(n_sections, num_signals, 2)
+
+        cpu_sosfilt, cpu_zf = signal.sosfilt(cpu_sos, cpu_sig, zi=cpu_zi)
+
+        gpu_sosfilt, gpu_zf = cusignal.sosfilt(
+            cp.asarray(cpu_sos), cp.asarray(cpu_sig), zi=cp.asarray(cpu_zi)
+        )
+
+        assert array_equal(cpu_sosfilt, cp.asnumpy(gpu_sosfilt))
+        assert array_equal(cpu_zf, cp.asnumpy(gpu_zf))
+
+    @pytest.mark.parametrize("num_signals", [1, 2])
+    @pytest.mark.parametrize("num_samps", [2 ** 16, 2 ** 16 + 123])
+    def test_sosfilt_parallel(self, num_signals, num_samps):
+        cpu_sig = np.random.rand(num_signals, num_samps)
+        cpu_sos = signal.butter(16, 0.2, output="sos")
+        cpu_zi = np.random.rand(cpu_sos.shape[0], num_signals, 2)
+
+        cpu_sosfilt, cpu_zf = signal.sosfilt(cpu_sos, cpu_sig, zi=cpu_zi)
+
+        gpu_sosfilt, gpu_zf = cusignal.sosfilt(
+            cp.asarray(cpu_sos),
+            cp.asarray(cpu_sig),
+            zi=cp.asarray(cpu_zi),
+            method="parallel",
+        )
+
+        assert array_equal(cpu_sosfilt, cp.asnumpy(gpu_sosfilt))
+        assert array_equal(cpu_zf, cp.asnumpy(gpu_zf))
+
+    @pytest.mark.parametrize("num_signals", [1, 10])
+    @pytest.mark.parametrize("num_samps", [100])
+    @pytest.mark.parametrize("axis", [0, -1])
+    def test_sosfilt_out(self, num_signals, num_samps, axis):
+        cpu_sig = np.random.rand(num_signals, num_samps)
+        if axis == 0:
+            cpu_sig = cpu_sig.T.copy()
+
+        cpu_sos = signal.ellip(64, 0.009, 80, 0.05, output="sos")
+        cpu_sosfilt = signal.sosfilt(cpu_sos, cpu_sig, axis=axis)
+
+        gpu_sos = cp.asarray(cpu_sos)
+        gpu_sig = cp.asarray(cpu_sig)
+        gpu_out = cp.empty_like(gpu_sig)
+        gpu_sosfilt = cusignal.sosfilt(gpu_sos, gpu_sig, axis, out=gpu_out)
+        assert gpu_sosfilt is gpu_out
+        assert array_equal(cpu_sosfilt, cp.asnumpy(gpu_sosfilt))
+
+        gpu_sosfilt = cusignal.sosfilt(
+            gpu_sos, gpu_sig, axis, overwrite_x=True
+        )
+        assert gpu_sosfilt is gpu_sig
+        assert array_equal(cpu_sosfilt, cp.asnumpy(gpu_sig))
+
+    @pytest.mark.parametrize("num_signals", [1, 10])
+    @pytest.mark.parametrize("num_samps", [2 ** 14])
+    @pytest.mark.parametrize("chunk", [1000, 2 ** 12])
+    def test_sos_filter(self, num_signals, num_samps, chunk):
+        cpu_sig = np.random.rand(num_signals, num_samps)
+        cpu_sos = signal.ellip(64, 0.009, 80, 0.05, output="sos")
+        cpu_zi = np.random.rand(cpu_sos.shape[0], num_signals, 2)
+
+        cpu_sosfilt, cpu_zf = signal.sosfilt(cpu_sos, cpu_sig, zi=cpu_zi)
+
+        gpu_sig = cp.asarray(cpu_sig)
+        gpu_sosfilt, gpu_zf = cusignal.sosfilt(
+            cp.asarray(cpu_sos), gpu_sig, zi=cp.asarray(cpu_zi)
+        )
+        assert array_equal(cpu_sosfilt, cp.asnumpy(gpu_sosfilt))
+        assert array_equal(cpu_zf, cp.asnumpy(gpu_zf))
+
+        filt = cusignal.SosFilter(cpu_sos, num_signals, zi=cp.asarray(cpu_zi))
+        gpu_chunks = cp.concatenate(
+            [
+                filt.process(gpu_sig[:, i : i + chunk])
+                for i in range(0, num_samps, chunk)
+            ],
+            axis=-1,
+        )
+
+        # Identical to filtering the whole signal at once
+        assert cp.array_equal(gpu_sosfilt, gpu_chunks)
+        assert cp.array_equal(gpu_zf, filt.zi)
+
+
+class TestFilteringHost:
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("order", [4, 8])
+    def test_sosfilt(self, num_samps, order):
+        cpu_sig = np.random.rand(2, num_samps)
+        sos = signal.butter(order, 0.2, output="sos")
+        zi = np.random.rand(sos.shape[0], 2, 2)
+
+        cpu_out, cpu_zf = signal.sosfilt(sos, cpu_sig, zi=zi)
+        with cusignal.set_backend("numpy"):
+            out, zf = cusignal.sosfilt(sos, cpu_sig, zi=zi)
+
+        assert isinstance(out, np.ndarray)
+        assert array_equal(cpu_out, out)
+        assert array_equal(cpu_zf, zf)
+
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("n_channels", [1, 4])
+    @pytest.mark.parametrize("chunk", [100, 1024])
+    def test_sos_filter(self, num_samps, n_channels, chunk):
+        cpu_sig = np.random.rand(n_channels, num_samps).squeeze()
+        sos = signal.butter(8, 0.2, output="sos")
+        zi = np.random.rand(sos.shape[0], n_channels, 2).squeeze()
+
+        cpu_out, cpu_zf = signal.sosfilt(sos, cpu_sig, zi=zi)
+        with cusignal.set_backend("numpy"):
+            filt = cusignal.SosFilter(sos, n_channels, zi=zi)
+            out = np.concatenate(
+                [
+                    filt.process(cpu_sig[..., i : i + chunk])
+                    for i in range(0, num_samps, chunk)
+                ],
+                axis=-1,
+            )
+
+        # Identical to filtering the whole signal at once
+        assert np.array_equal(cpu_out, out)
+        assert np.array_equal(cpu_zf, filt.zi.squeeze())
+
+        filt.reset()
+        assert not filt.zi.any()
+        with pytest.raises(ValueError):
+            filt.reset(np.zeros(3))
+        with pytest.raises(ValueError):
+            filt.process(np.zeros((n_channels + 1, 8)))
+        if n_channels > 1:
+            # Would otherwise be split across the channels
+            with pytest.raises(ValueError):
+                filt.process(np.zeros(8 * n_channels))
+
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("method", ["serial", "parallel"])
+    def test_sosfilt_complex(self, num_samps, method):
+        cpu_sig = np.random.rand(2, num_samps) + 1j * np.random.rand(
+            2, num_samps
+        )
+        sos = signal.butter(8, 0.2, output="sos")
+        zi = np.random.rand(sos.shape[0], 2, 2).astype(np.complex128)
+
+        cpu_out, cpu_zf = signal.sosfilt(sos, cpu_sig, zi=zi)
+        with cusignal.set_backend("numpy"):
+            out, zf = cusignal.sosfilt(sos, cpu_sig, zi=zi, method=method)
+
+        assert out.dtype == np.complex128
+        assert array_equal(cpu_out, out)
+        assert array_equal(cpu_zf, zf)
+
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("method", ["serial", "parallel"])
+    def test_sosfilt_bank(self, num_samps, method):
+        cpu_sig = np.random.rand(3, num_samps)
+        sos = np.stack(
+            [signal.butter(6, f, output="sos") for f in (0.1, 0.2, 0.3)]
+        )
+        zi = np.random.rand(sos.shape[1], 3, 2)
+
+        with cusignal.set_backend("numpy"):
+            out, zf = cusignal.sosfilt(sos, cpu_sig, zi=zi, method=method)
+            with pytest.raises(ValueError):
+                cusignal.sosfilt(sos, cpu_sig[:2])
+
+        for i in range(3):
+            cpu_out, cpu_zf = signal.sosfilt(sos[i], cpu_sig[i], zi=zi[:, i])
+            assert array_equal(cpu_out, out[i])
+            assert array_equal(cpu_zf, zf[:, i])
+
+    @pytest.mark.parametrize("num_samps", [2 ** 10])
+    @pytest.mark.parametrize("axis", [0, -1])
+    @pytest.mark.parametrize(
+        "padtype, padlen", [("odd", None), ("even", 20), (None, None)]
+    )
+    def test_sosfiltfilt(self, num_samps, axis, padtype, padlen):
+        cpu_sig = np.random.rand(3, num_samps)
+        if axis == 0:
+            cpu_sig = cpu_sig.T
+        sos = signal.ellip(7, 0.1, 60, 0.3, output="sos")
+
+        cpu_out = signal.sosfiltfilt(
+            sos, cpu_sig, axis=axis, padtype=padtype, padlen=padlen
+        )
+        with cusignal.set_backend("numpy"):
+            zi = cusignal.sosfilt_zi(sos)
+            assert array_equal(signal.sosfilt_zi(sos), zi)
+            out = cusignal.sosfiltfilt(
+                sos, cpu_sig, axis=axis, padtype=padtype, padlen=padlen
+            )
+            with pytest.raises(ValueError):
+                cusignal.sosfiltfilt(sos, cpu_sig, axis, padtype="mirror")
+
+        assert out.shape == cpu_out.shape
+        assert array_equal(cpu_out, out)
+
+    @pytest.mark.parametrize("num_samps", [2 ** 10])
+    @pytest.mark.parametrize(
+        "b, a",
+        [
+            signal.butter(4, 0.1),
+            signal.cheby1(6, 1, 0.3),
+            ([0.5, 0.2], [2.0, -0.9, 0.3, 0.1]),
+            ([0.2, 0.3, 0.1, 0.4], [2.0, -0.9]),
+            ([0.2, 0.3, 0.1, 0.4], [2.0]),
+        ],
+    )
+    def test_lfilter(self, num_samps, b, a):
+        cpu_sig = np.random.rand(3, num_samps)
+        n_delays = max(len(a), len(b)) - 1
+        zi = np.random.rand(3, n_delays)
+
+        cpu_out, cpu_zf = signal.lfilter(b, a, cpu_sig, zi=zi)
+        with cusignal.set_backend("numpy"):
+            out, zf = cusignal.lfilter(b, a, cpu_sig, zi=zi)
+        assert array_equal(cpu_out, out)
+        assert array_equal(cpu_zf, zf)
+
+        # The GPU engines, on the host
+        coeffs = np.zeros((2, n_delays + 1))
+        coeffs[0, : len(b)] = b
+        coeffs[1, : len(a)] = a
+        coeffs /= coeffs[1, 0]
+        if coeffs[1, 1:].any():
+            out, zf = _lfilter_iir(*coeffs, cpu_sig.copy(), zi)
+        else:
+            out, zf = _lfilter_fir(coeffs[0], cpu_sig.copy(), zi)
+        assert array_equal(cpu_out, out)
+        assert array_equal(cpu_zf, zf)
+
+    # Poles close to the unit circle. SciPy's direct form is itself off by
+    # up to 4e-4 of the output and 6e-3 of the final delays for cheby1.
+    @pytest.mark.parametrize(
+        "b, a, tol",
+        [
+            signal.butter(4, 0.01) + (1e-8,),
+            signal.butter(8, 0.1) + (1e-8,),
+            signal.cheby1(8, 1, 0.02) + (2e-2,),
+        ],
+    )
+    # Few rows are also split in time, many are not
+    @pytest.mark.parametrize("n_rows", [3, 300])
+    def test_lfilter_narrow(self, b, a, tol, n_rows):
+        cpu_sig = np.random.rand(n_rows, 2 ** 12)
+        zi = np.random.rand(n_rows, len(a) - 1)
+
+        cpu_out, cpu_zf = signal.lfilter(b, a, cpu_sig, zi=zi)
+        out, zf = _lfilter_iir(b / a[0], a / a[0], cpu_sig.copy(), zi)
+        assert np.isfinite(out).all()
+        assert np.abs(out - cpu_out).max() < tol * np.abs(cpu_out).max()
+        assert np.abs(zf - cpu_zf).max() < tol * np.abs(cpu_zf).max()
+
+    @pytest.mark.parametrize(
+        "b, a", [signal.butter(4, 0.1), ([0.5, 0.2], [2.0, -0.9, 0.3, 0.1])]
+    )
+    @pytest.mark.parametrize("x", [None, [0.5], np.arange(7.0)])
+    def test_lfiltic(self, b, a, x):
+        y = np.arange(1.0, 4.0)
+
+        with cusignal.set_backend("numpy"):
+            zi = cusignal.lfiltic(b, a, y, x)
+
+        assert array_equal(signal.lfiltic(b, a, y, x), zi)
+
+    @pytest.mark.parametrize("num_samps", [2 ** 14, 2 ** 14 + 123])
+    @pytest.mark.parametrize("n_channels", [1, 4])
+    @pytest.mark.parametrize("axis", [0, -1])
+    def test_sosfilt_parallel(self, num_samps, n_channels, axis):
+        cpu_sig = np.random.rand(n_channels, num_samps)
+        sos = signal.butter(8, 0.2, output="sos")
+        zi = np.random.rand(sos.shape[0], n_channels, 2)
+        if axis == 0:
+            cpu_sig = cpu_sig.T
+            zi = zi.swapaxes(1, 2)
+
+        cpu_out, cpu_zf = signal.sosfilt(sos, cpu_sig, axis=axis, zi=zi)
+        with cusignal.set_backend("numpy"):
+            out, zf = cusignal.sosfilt(
+                sos, cpu_sig, axis=axis, zi=zi, method="parallel"
+            )
+            with pytest.raises(ValueError):
+                cusignal.sosfilt(sos, cpu_sig, method="prefix")
+
+        assert array_equal(cpu_out, out, tol=1e-10)
+        assert array_equal(cpu_zf, zf, tol=1e-10)
+
+
+class TestResampleHost:
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("up", [2, 3, 7])
+    @pytest.mark.parametrize("down", [1, 2, 9])
+    def test_upfirdn(self, num_samps, up, down):
+        cpu_sig = np.random.rand(num_samps)
+        # Filter length is a multiple of every `up`, so the output length
+        # does not depend on the SciPy version
+        h = np.random.rand(42)
+
+        cpu_out = signal.upfirdn(h, cpu_sig, up, down)
+        with cusignal.set_backend("numpy"):
+            out = cusignal.upfirdn(h, cpu_sig, up, down)
+
+        assert array_equal(cpu_out, out)
+
+        cpu_sig = np.random.rand(3, 4, num_samps // 16).transpose(1, 2, 0)
+        for axis in range(cpu_sig.ndim):
+            cpu_out = signal.upfirdn(h, cpu_sig, up, down, axis)
+            with cusignal.set_backend("numpy"):
+                out = cusignal.upfirdn(h, cpu_sig, up, down, axis)
+
+            assert array_equal(cpu_out, out)
+
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("up", [2, 3, 7])
+    @pytest.mark.parametrize("down", [1, 2, 9])
+    def test_resample_poly(self, num_samps, up, down):
+        cpu_sig = np.random.rand(num_samps)
+
+        cpu_out = signal.resample_poly(cpu_sig, up, down)
+        with cusignal.set_backend("numpy"):
+            out = cusignal.resample_poly(cpu_sig, up, down)
+
+        assert array_equal(cpu_out, out)
+
+    def test_fir_symmetry(self):
+        h = signal.firwin(31, 0.2)
+
+        assert _fir_symmetry(h) == (1, 0, 31)
+        assert _fir_symmetry(np.r_[0, 0, h, 0]) == (1, 2, 33)
+        assert _fir_symmetry(signal.firwin(32, 0.2)) == (1, 0, 32)
+        assert _fir_symmetry(np.r_[h, -h]) == (-1, 0, 62)
+        assert _fir_symmetry(np.r_[h, h[::-1], 1]) == (0, 0, 63)
+        assert _fir_symmetry(np.r_[0, 1, 0]) == (0, 0, 3)
+
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    def test_resample_filter_cache(self, num_samps):
+        cpu_sig = np.random.rand(num_samps, 2)
+        cpu_out = signal.resample_poly(cpu_sig, 3, 2, window="hann")
+
+        cusignal.clear_resample_filter_cache()
+        info = cusignal.resample_filter_cache_info()
+        assert info["loaded"] == 0
+
+        with cusignal.set_backend("numpy"):
+            out = cusignal.resample_poly(cpu_sig, 6, 4, window="hann")
+            assert array_equal(cpu_out, out)
+
+            # Reused for the same reduced factors, window and data type
+            out = np.empty((2, cpu_out.shape[0])).T
+            cusignal.resample_poly(cpu_sig, 3, 2, window="hann", out=out)
+            assert array_equal(cpu_out, out)
+            cusignal.StreamingResamplePoly(3, 2, window="hann")
+
+            cusignal.resample_poly(cpu_sig, 3, 2, window=np.ones(3))
+            cusignal.resample_poly(cpu_sig.astype(np.float32), 3, 2, 0, "hann")
+
+        new = cusignal.resample_filter_cache_info()
+        assert new["loaded"] == 2
+        assert new["hits"] - info["hits"] == 2
+        assert new["misses"] - info["misses"] == 2
+
+        cusignal.clear_resample_filter_cache()
+        assert cusignal.resample_filter_cache_info()["loaded"] == 0
+
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("n_channels", [1, 4])
+    @pytest.mark.parametrize("up", [2, 3, 7])
+    @pytest.mark.parametrize("down", [1, 2, 9])
+    def test_streaming_resample(self, num_samps, n_channels, up, down):
+        cpu_sig = np.random.rand(n_channels, num_samps).squeeze()
+        h = np.random.rand(31)
+        cuts = [100, 101, 1000, 2500]
+
+        with cusignal.set_backend("numpy"):
+            cpu_out = cusignal.upfirdn(h, cpu_sig, up, down)
+            ufd = cusignal.StreamingUpFIRDn(h, up, down, n_channels=n_channels)
+            chunks = [ufd.process(c) for c in np.split(cpu_sig, cuts, -1)]
+            out = np.concatenate(chunks + [ufd.flush()], axis=-1)
+
+            # Identical to resampling the whole signal at once
+            assert np.array_equal(cpu_out, out)
+
+            cpu_out = signal.resample_poly(cpu_sig, up, down, axis=-1)
+            rs = cusignal.StreamingResamplePoly(
+                up, down, n_channels=n_channels
+            )
+            chunks = [rs.process(c) for c in np.split(cpu_sig, cuts, -1)]
+            out = np.concatenate(chunks + [rs.flush()], axis=-1)
+
+            assert array_equal(cpu_out, out)
+            assert np.array_equal(
+                cusignal.resample_poly(cpu_sig, up, down, axis=-1), out
+            )
+
+            with pytest.raises(ValueError):
+                rs.process(np.zeros((n_channels + 1, 10)))
+
+    @pytest.mark.parametrize(
+        "up, down", [(1, 64), (1, 256), (3, 256), (64, 1)]
+    )
+    def test_resample_multistage(self, up, down):
+        plan = cusignal.ResamplePlan(up, down)
+        single = cusignal.ResamplePlan(up, down, max_stages=1)
+        assert len(plan.stages) > 1
+        assert np.prod([s.down for s in plan.stages]) == down
+        assert np.prod([s.up for s in plan.stages]) == up
+        assert plan.cost < single.cost / 2
+
+        # In-band tone at a quarter, out-of-band one past the band edge
+        band = min(1, up / down) / 2
+        t = np.arange(2 ** 12 * max(1, down // up))
+        cpu_sig = np.cos(2 * np.pi * 0.25 * band * t)
+        cpu_out = signal.resample_poly(cpu_sig, up, down)
+        mid = slice(len(cpu_out) // 8, -len(cpu_out) // 8)
+
+        with cusignal.set_backend("numpy"):
+            out = cusignal.resample_poly(
+                cpu_sig, up, down, method="multistage"
+            )
+            assert out.shape == cpu_out.shape
+            assert np.abs(out - cpu_out)[mid].max() < 1e-2
+
+            if up == 1:
+                cpu_sig = np.cos(2 * np.pi * 1.5 * band * t)
+                out = cusignal.decimate(cpu_sig, down, method="multistage")
+                assert np.abs(out[mid]).max() < 1e-3
+
+                with pytest.raises(ValueError):
+                    cusignal.decimate(cpu_sig, down, 30, method="multistage")
+
+    @pytest.mark.parametrize("dtype", [np.int8, np.int16, np.float64])
+    @pytest.mark.parametrize("rate", [1, 5, 16])
+    @pytest.mark.parametrize("order", [1, 4])
+    @pytest.mark.parametrize("delay", [1, 2])
+    def test_cic(self, dtype, rate, order, delay):
+        # Integers, so that the recursive reference is exact
+        cpu_sig = np.round(np.random.randn(3, 1000) * 40).astype(dtype)
+        cuts = [1, 17, 500, 501]
+
+        # Integrators at the high rate, combs at the low rate
+        ref = cpu_sig.astype(np.int64 if dtype != np.float64 else dtype)
+        for _ in range(order):
+            ref = np.cumsum(ref, -1)
+        ref = ref[:, ::rate]
+        for _ in range(order):
+            ref = ref - np.pad(ref, ((0, 0), (delay, 0)))[:, :-delay]
+
+        with cusignal.set_backend("numpy"):
+            out = cusignal.cic_decimate(
+                cpu_sig, rate, order, delay, normalize=False
+            )
+            assert out.dtype == ref.dtype
+            assert array_equal(ref, out)
+
+            out = cusignal.cic_decimate(cpu_sig, rate, order, delay)
+            assert array_equal(ref / (rate * delay) ** order, out)
+
+            cic = cusignal.StreamingCICDecimator(
+                rate, order, delay, dtype, n_channels=3
+            )
+            chunks = [cic.process(c) for c in np.split(cpu_sig, cuts, -1)]
+            assert np.array_equal(np.concatenate(chunks, -1), out)
+
+            # Equivalent to upsampling and filtering with the CIC taps
+            h = np.ones(1)
+            for _ in range(order):
+                h = np.convolve(h, np.ones(rate * delay))
+            ref = signal.upfirdn(h, cpu_sig, rate)[:, : 1000 * rate]
+            out = cusignal.cic_interpolate(
+                cpu_sig, rate, order, delay, normalize=False
+            )
+            assert array_equal(ref, out)
+
+            comp = cusignal.cic_compensator(15, rate + 1, order, delay)
+            out = cusignal.cic_interpolate(
+                cpu_sig, rate, order, delay, compensate=comp
+            )
+            cic = cusignal.StreamingCICInterpolator(
+                rate, order, delay, dtype, n_channels=3, compensate=comp
+            )
+            chunks = [cic.process(c) for c in np.split(cpu_sig, cuts, -1)]
+            assert np.array_equal(np.concatenate(chunks, -1), out)
+
+        with pytest.raises(ValueError):
+            cusignal.cic_decimate(cpu_sig.astype(np.int32), 2 ** 16, 2)
+
+    def test_cic_wide(self):
+        # Outputs beyond 2**53, not representable in double precision
+        info = np.iinfo(np.int32)
+        cpu_sig = np.random.randint(info.max - 1000, info.max, (2, 500))
+        cpu_sig = cpu_sig.astype(np.int32)
+
+        ref = cpu_sig.astype(np.int64)
+        for _ in range(5):
+            ref = np.cumsum(ref, -1)
+        ref = ref[:, ::64]
+        for _ in range(5):
+            ref = ref - np.pad(ref, ((0, 0), (1, 0)))[:, :-1]
+
+        with cusignal.set_backend("numpy"):
+            out = cusignal.cic_decimate(cpu_sig, 64, 5, normalize=False)
+        assert np.abs(out).max() > 2 ** 53
+        assert np.array_equal(ref, out)
+
+    def test_cic_compensation(self):
+        with cusignal.set_backend("numpy"):
+            h = cusignal.cic_compensator(31, 64, 5)
+
+            # Flat passband after the CIC droop
+            f = np.linspace(0.01, 0.2, 20)
+            _, resp = signal.freqz(h, worN=2 * np.pi * f)
+            cic = np.sin(np.pi * f) / (64 * np.sin(np.pi * f / 64))
+            assert np.allclose(np.abs(resp) * cic ** 5, 1, atol=0.02)
+
+            # A CIC first stage for a large decimation
+            plan = cusignal.ResamplePlan(1, 10000, atten=40)
+            assert plan.stages[0].kind == "cic"
+            cpu_sig = np.cos(2 * np.pi * 0.25 / 20000 * np.arange(1280000))
+            cpu_out = signal.resample_poly(cpu_sig, 1, 10000)
+            out = plan(cpu_sig)
+            assert np.abs(out - cpu_out)[16:-16].max() < 1e-2
+
+    @pytest.mark.parametrize(
+        "n_channels, oversample", [(8, 1), (8, 2), (16, 4), (5, 1)]
+    )
+    @pytest.mark.parametrize("num_taps", [7, 64])
+    def test_channelize(self, n_channels, oversample, num_taps):
+        down = n_channels // oversample
+        h = signal.firwin(num_taps, 1 / n_channels)
+        cpu_sig = np.random.rand(3, 501) + 1j * np.random.rand(3, 501)
+
+        # One frequency shift and filter per channel
+        t = np.arange(cpu_sig.shape[-1])
+        cpu_out = np.stack(
+            [
+                signal.upfirdn(
+                    h,
+                    cpu_sig * np.exp(-2j * np.pi * k * t / n_channels),
+                    1,
+                    down,
+                )
+                for k in range(n_channels)
+            ],
+            axis=-2,
+        )
+
+        cpu_chan = np.random.rand(3, n_channels, 40)
+        n_out = 39 * down + num_taps
+        t = np.arange(n_out)
+        cpu_syn = sum(
+            signal.upfirdn(h, cpu_chan[:, k], down, 1)[:, :n_out]
+            * np.exp(2j * np.pi * k * t / n_channels)
+            for k in range(n_channels)
+        )
+
+        with cusignal.set_backend("numpy"):
+            out = cusignal.channelize(cpu_sig, h, n_channels, oversample)
+            assert out.shape == cpu_out.shape
+            assert array_equal(cpu_out, out)
+
+            out = cusignal.synthesize_channels(cpu_chan, h, oversample)
+            assert out.shape == cpu_syn.shape
+            assert array_equal(cpu_syn, out)
+
+            with pytest.raises(ValueError):
+                cusignal.channelize(cpu_sig, h, n_channels, 3)
+
+    @pytest.mark.parametrize("down", [1, 4])
+    @pytest.mark.parametrize("num_taps", [1, 33])
+    def test_ddc(self, down, num_taps):
+        fs = 1e3
+        f_offset = np.array([-200.0, 12.5, 330.0])
+        h = signal.firwin(num_taps, 0.2) if num_taps > 1 else np.ones(1)
+        cpu_sig = np.random.rand(1001)
+
+        # Mixed, filtered, and decimated separately
+        t = np.arange(cpu_sig.shape[-1])
+        cpu_mix = cpu_sig * np.exp(-2j * np.pi * f_offset[:, None] / fs * t)
+        cpu_out = signal.upfirdn(h, cpu_mix, 1, down)
+
+        with cusignal.set_backend("numpy"):
+            out = cusignal.ddc(cpu_sig, f_offset, fs, h, down)
+            assert out.shape == cpu_out.shape
+            assert array_equal(cpu_out, out)
+
+            # Chunks of any length reproduce the whole signal, with the
+            # filter tail flushed by zeros
+            state = np.zeros(3)
+            chunks = []
+            for x in np.split(cpu_sig, [0, 1, 2, 100, 101, 600]) + [
+                np.zeros(len(h) - 1)
+            ]:
+                y, state = cusignal.ddc(x, f_offset, fs, h, down, state)
+                chunks.append(y)
+            out = np.concatenate(chunks, -1)
+            assert out.shape == cpu_out.shape
+            assert np.allclose(cpu_out, out, rtol=0, atol=1e-12)
+
+            # Initial phase of the stream
+            y, _ = cusignal.ddc(cpu_sig, f_offset, fs, h, down, 0.5)
+            key = cpu_out * np.exp(-0.5j)
+            assert array_equal(key[:, : y.shape[-1]], y)
+
+            with pytest.raises(ValueError):
+                cusignal.ddc(np.zeros((3, 8)), f_offset, fs, h, down, state)
+
+    @pytest.mark.parametrize("q", [2, 5])
+    @pytest.mark.parametrize("zero_phase", [True, False])
+    @pytest.mark.parametrize("axis", [0, -1])
+    def test_decimate_iir(self, q, zero_phase, axis):
+        cpu_sig = np.random.rand(4, 1001)
+        if axis == 0:
+            cpu_sig = cpu_sig.T
+
+        cpu_out = signal.decimate(
+            cpu_sig, q, ftype="iir", axis=axis, zero_phase=zero_phase
+        )
+        with cusignal.set_backend("numpy"):
+            out = cusignal.decimate(
+                cpu_sig, q, ftype="iir", axis=axis, zero_phase=zero_phase
+            )
+            assert out.shape == cpu_out.shape
+            assert array_equal(cpu_out, out)
+
+            with pytest.raises(ValueError):
+                cusignal.decimate(cpu_sig, q, ftype="butter")
+
+
+class TestConvolutionHost:
+    @pytest.mark.parametrize("num_samps", [2 ** 10, 2 ** 10 + 1])
+    @pytest.mark.parametrize("num_taps", [31, 256])
+    @pytest.mark.parametrize("mode", ["full", "valid", "same"])
+    def test_convolve_correlate(self, num_samps, num_taps, mode):
+        cpu_sig = np.random.rand(num_samps)
+        cpu_win = np.random.rand(num_taps)
+
+        with cusignal.set_backend("numpy"):
+            conv = cusignal.convolve(cpu_sig, cpu_win, mode=mode)
+            corr = cusignal.correlate(cpu_sig, cpu_win, mode=mode)
+            corr_swap = cusignal.correlate(cpu_win, cpu_sig, mode=mode)
+
+        assert array_equal(signal.convolve(cpu_sig, cpu_win, mode), conv)
+        assert array_equal(signal.correlate(cpu_sig, cpu_win, mode), corr)
+        assert array_equal(
+            signal.correlate(cpu_win, cpu_sig, mode), corr_swap
+        )
@@ -13,6 +13,7 @@
 
 import cupy as cp
 import cusignal
+import numpy as np
 import pytest
 
 from cusignal.test.utils import array_equal
@@ -183,6 +184,65 @@ class TestSpectral:
 
         assert array_equal(cpu_stft, gpu_stft)
 
+    @pytest.mark.parametrize("num_samps", [2 ** 14])
+    @pytest.mark.parametrize("fs", [1.0, 1e6])
+    @pytest.mark.parametrize("nperseg", [1024, 2048])
+    @pytest.mark.parametrize("average", ["mean", "median"])
+    def test_plan_psd(self, rand_data_gen, num_samps, fs, nperseg, average):
+        cpu_sig, gpu_sig = rand_data_gen(num_samps)
+
+        _, cpu_welch = signal.welch(
+            cpu_sig, fs, nperseg=nperseg, average=average
+        )
+        plan = cusignal.SpectralPlan(nperseg=nperseg, fs=fs)
+        gpu_out = cp.empty(cpu_welch.shape)
+        for _ in range(2):
+            _, gpu_welch = plan.psd(gpu_sig, average=average, out=gpu_out)
+
+        assert gpu_welch is gpu_out
+        assert array_equal(cpu_welch, cp.asnumpy(gpu_welch))
+
+    @pytest.mark.parametrize("num_samps", [2 ** 14])
+    @pytest.mark.parametrize("fs", [1.0, 1e6])
+    @pytest.mark.parametrize("nperseg", [1024, 2048])
+    def test_plan_stft(self, rand_complex_data_gen, num_samps, fs, nperseg):
+        cpu_sig, gpu_sig = rand_complex_data_gen(num_samps)
+
+        _, _, cpu_stft = signal.stft(cpu_sig, fs, nperseg=nperseg)
+        plan = cusignal.SpectralPlan(
+            nperseg=nperseg,
+            fs=fs,
+            scaling="spectrum",
+            detrend=False,
+            boundary="zeros",
+            padded=True,
+        )
+        for _ in range(2):
+            _, _, gpu_stft = plan.stft(gpu_sig)
+
+        assert array_equal(cpu_stft, cp.asnumpy(gpu_stft))
+
+    @pytest.mark.parametrize("num_samps", [2 ** 14])
+    @pytest.mark.parametrize("nperseg", [1024, 2048])
+    @pytest.mark.parametrize(
+        "mode", ["psd", "complex", "magnitude", "angle", "phase"]
+    )
+    def test_plan_spectrogram(self, rand_data_gen, num_samps, nperseg, mode):
+        cpu_sig, gpu_sig = rand_data_gen(num_samps)
+
+        _, _, cpu_spect = signal.spectrogram(
+            cpu_sig, nperseg=nperseg, mode=mode
+        )
+        plan = cusignal.SpectralPlan(
+            nperseg=nperseg,
+            noverlap=nperseg // 8,
+            window=("tukey", 0.25),
+            mode=mode,
+        )
+        _, _, gpu_spect = plan.spectrogram(gpu_sig)
+
+        assert array_equal(cpu_spect, cp.asnumpy(gpu_spect))
+
     @pytest.mark.parametrize("num_in_samps", [2 ** 10])
     @pytest.mark.parametrize("num_out_samps", [2 ** 16, 2 ** 18])
     @pytest.mark.parametrize("precenter", [True, False])
@@ -211,3 +271,86 @@ class TestSpectral:
         )
 
         assert array_equal(cpu_lombscargle, gpu_lombscargle)
+
+
+class TestSpectralHost:
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("fs", [1.0, 1e6])
+    @pytest.mark.parametrize("nperseg", [256, 1024])
+    def test_welch(self, num_samps, fs, nperseg):
+        cpu_sig = np.random.rand(num_samps)
+
+        _, cpu_welch = signal.welch(cpu_sig, fs, nperseg=nperseg)
+        with cusignal.set_backend("numpy"):
+            _, out = cusignal.welch(cpu_sig, fs, nperseg=nperseg)
+
+        assert array_equal(cpu_welch, out)
+
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("fs", [1.0, 1e6])
+    @pytest.mark.parametrize("nperseg", [256, 1024])
+    def test_stft(self, num_samps, fs, nperseg):
+        cpu_sig = np.random.rand(num_samps)
+
+        _, _, cpu_stft = signal.stft(cpu_sig, fs, nperseg=nperseg)
+        with cusignal.set_backend("numpy"):
+            _, _, out = cusignal.stft(cpu_sig, fs, nperseg=nperseg)
+
+        assert array_equal(cpu_stft, out)
+
+    @pytest.mark.parametrize("num_samps", [2 ** 12])
+    @pytest.mark.parametrize("nperseg", [256, 1024])
+    @pytest.mark.parametrize("axis", [0, -1])
+    def test_spectral_plan(self, num_samps, nperseg, axis):
+        cpu_sig = np.random.rand(3, num_samps)
+        if axis == 0:
+            cpu_sig = cpu_sig.T
+
+        _, cpu_welch = signal.welch(cpu_sig, nperseg=nperseg, axis=axis)
+        _, _, cpu_stft = signal.stft(cpu_sig, nperseg=nperseg, axis=axis)
+        with cusignal.set_backend("numpy"):
+            plan = cusignal.SpectralPlan(nperseg=nperseg)
+            out = np.empty(cpu_welch.shape)
+            _, welch = plan.psd(cpu_sig, axis=axis, out=out)
+
+            plan = cusignal.SpectralPlan(
+                nperseg=nperseg,
+                scaling="spectrum",
+                detrend=False,
+                boundary="zeros",
+                padded=True,
+            )
+            out = np.empty(cpu_stft.shape, np.complex128)
+            _, _, stft = plan.stft(cpu_sig, axis=axis, out=out)
+
+            # With the default window of spectrogram, as documented
+            spec_plan = cusignal.SpectralPlan(
+                nperseg=nperseg,
+                noverlap=nperseg // 8,
+                window=("tukey", 0.25),
+            )
+            _, _, spec = spec_plan.spectrogram(cpu_sig, axis=axis)
+
+        _, _, cpu_spec = signal.spectrogram(
+            cpu_sig, nperseg=nperseg, axis=axis
+        )
+        assert array_equal(cpu_welch, welch)
+        assert array_equal(cpu_stft, stft)
+        assert array_equal(cpu_spec, spec)
+
+        with pytest.raises(ValueError):
+            plan.stft(cpu_sig, axis=axis, out=np.empty(3))
+
+    @pytest.mark.parametrize("num_in_samps", [2 ** 10])
+    @pytest.mark.parametrize("num_out_samps", [2 ** 10])
+    def test_lombscargle(self, num_in_samps, num_out_samps):
+        r = np.random.rand(num_in_samps)
+        x = np.linspace(0.01, 10 * np.pi, num_in_samps)[r >= 0.9]
+        y = 2.0 * np.cos(x + 0.5 * np.pi)
+        f = np.linspace(0.01, 10, num_out_samps)
+
+        cpu_lombscargle = signal.lombscargle(x, y, f)
+        with cusignal.set_backend("numpy"):
+            out = cusignal.lombscargle(x, y, f)
+
+        assert array_equal(cpu_lombscargle, out)
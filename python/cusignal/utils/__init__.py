@@ -11,9 +11,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cusignal.utils.arraytools import (
-    get_shared_array,
-    get_shared_mem,
-    get_pinned_array,
-    get_pinned_mem,
+from cusignal._lazy import attach
+
+# Lazily loaded, since most of cuSignal imports from this package and
+# `arraytools` pulls in Numba
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    [],
+    {
+        "arraytools": [
+            "get_shared_array",
+            "get_shared_mem",
+            "get_pinned_array",
+            "get_pinned_mem",
+        ],
+        "backend": [
+            "get_array_module",
+            "get_backend",
+            "set_backend",
+        ],
+        "kernel_cache": ["kernel_cache_info"],
+        "autotune": ["set_autotune"],
+        "memory": ["workspace"],
+    },
 )
@@ -11,5 +11,128 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import threading
+import time
+
+from collections import OrderedDict
+from concurrent.futures import Future
+
+_DEFAULT_MAXSIZE = 128
+_DEFAULT_RESAMPLE_MAXSIZE = 64
+
+
+class _LRUKernelCache(object):
+    def __init__(self, maxsize):
+        """
+        Compiled kernels, keyed by (dtype, kernel). Holds at most `maxsize`
+        kernels, evicting the least recently used one when full.
+
+        Safe to use from multiple threads. `get_or_compile` compiles each
+        kernel once: concurrent callers wait on the in-flight compilation.
+        """
+        self.maxsize = int(maxsize)
+        self._data = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compile_time = 0.0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __getitem__(self, key):
+        with self._lock:
+            kernel = self._data[key]
+            self._data.move_to_end(key)
+            return kernel
+
+    def __setitem__(self, key, kernel):
+        with self._lock:
+            self._data[key] = kernel
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                return self[key]
+            return default
+
+    def get_or_compile(self, key, compile_fn):
+        """
+        Return the kernel for `key`, calling `compile_fn()` to build it on a
+        miss. Only the first caller compiles; others block until it is done
+        and get the same kernel, or the same exception.
+        """
+        with self._lock:
+            kernel = self.get(key)
+            if kernel is not None:
+                self.hits += 1
+                return kernel
+
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                self.misses += 1
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self.hits += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            start = time.perf_counter()
+            kernel = compile_fn()
+            elapsed = time.perf_counter() - start
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            # Waiters see the error, later calls will try again
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self[key] = kernel
+            self.compile_time += elapsed
+            del self._inflight[key]
+        future.set_result(kernel)
+
+        return kernel
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def info(self):
+        with self._lock:
+            return {
+                "loaded": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "compile_time": self.compile_time,
+            }
+
+
 # Kernel caches
-_cupy_kernel_cache = {}
+_cupy_kernel_cache = _LRUKernelCache(
+    os.environ.get("CUSIGNAL_KERNEL_CACHE_MAXSIZE", _DEFAULT_MAXSIZE)
+)
+
+# Prepared resampling filters, keyed by (up, down, window, dtype, ...)
+_resample_filter_cache = _LRUKernelCache(
+    os.environ.get(
+        "CUSIGNAL_RESAMPLE_CACHE_MAXSIZE", _DEFAULT_RESAMPLE_MAXSIZE
+    )
+)
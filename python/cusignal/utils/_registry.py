@@ -0,0 +1,100 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from collections import OrderedDict, namedtuple
+from enum import Enum
+
+
+class GPUKernel(Enum):
+    CORRELATE = "correlate"
+    CONVOLVE = "convolve"
+    CORRELATE2D = "correlate2d"
+    CONVOLVE2D = "convolve2d"
+    LOMBSCARGLE = "lombscargle"
+    UNPACK = "unpack"
+    PACK = "pack"
+    SOSFILT = "sosfilt"
+    SOSFILT_REAL = "sosfilt_real"
+    UPFIRDN = "upfirdn"
+    UPFIRDN2D = "upfirdn2d"
+    CIC_DECIMATE = "cic_decimate"
+    CIC_INTERPOLATE = "cic_interpolate"
+    CHANNELIZE = "channelize"
+    CHANNELIZE_SYNTHESIS = "channelize_synthesis"
+    DDC = "ddc"
+
+
+# NumPy type and corresponding C type
+_C_TYPES = OrderedDict(
+    (
+        ("int8", "char"),
+        ("uint8", "unsigned char"),
+        ("int16", "short"),
+        ("uint16", "unsigned short"),
+        ("int32", "int"),
+        ("uint32", "unsigned int"),
+        ("int64", "long int"),
+        ("float32", "float"),
+        ("float64", "double"),
+        ("complex64", "complex<float>"),
+        ("complex128", "complex<double>"),
+    )
+)
+
+_DEFAULT_OPTIONS = ("-std=c++11", "-use_fast_math")
+
+_KernelSpec = namedtuple(
+    "_KernelSpec", ["template", "entry", "types", "options", "substitutions"]
+)
+
+# Kernels available for compilation, filled in by the kernel modules
+_kernel_registry = OrderedDict()
+
+
+def _register_kernel(
+    k_type,
+    template,
+    entry,
+    dtypes,
+    options=_DEFAULT_OPTIONS,
+    substitutions=None,
+):
+    """
+    Register a CuPy RawModule kernel.
+
+    Parameters
+    ----------
+    k_type : GPUKernel
+        Kernel identifier.
+    template : string.Template
+        CUDA source, with ``${datatype}`` and ``${header}`` placeholders.
+    entry : str
+        Name of the ``__global__`` function to load from the module.
+    dtypes : list of str
+        NumPy data types the kernel can be compiled for.
+    options : tuple of str, optional
+        NVRTC compile options.
+    substitutions : callable, optional
+        ``substitutions(np_type)`` returns additional template
+        substitutions for data type `np_type`.
+    """
+    types = OrderedDict()
+    for dtype in dtypes:
+        name = np.dtype(dtype).name
+        types[name] = _C_TYPES[name]
+
+    _kernel_registry[k_type] = _KernelSpec(
+        template, entry, types, tuple(options), substitutions
+    )
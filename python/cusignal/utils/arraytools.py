@@ -15,6 +15,8 @@ import cupy as cp
 from numba import cuda
 import numpy as np
 
+from .backend import get_array_module
+
 
 def get_shared_array(data, strides=None, order='C', stream=0, portable=False,
                      wc=True):
@@ -148,7 +150,7 @@ def _axis_slice(a, start=None, stop=None, step=None, axis=-1):
     be 1; the trivial dimension is not removed. (Use numpy.squeeze()
     to remove trivial axes.)
     """
-    a = cp.asarray(a)
+    a = get_array_module(a).asarray(a)
     a_slice = [slice(None)] * a.ndim
     a_slice[axis] = slice(start, stop, step)
     b = a[tuple(a_slice)]
@@ -200,7 +202,8 @@ def _odd_ext(x, n, axis=-1):
     >>> plt.legend(loc='best')
     >>> plt.show()
     """
-    x = cp.asarray(x)
+    xp = get_array_module(x)
+    x = xp.asarray(x)
     if n < 1:
         return x
     if n > x.shape[axis] - 1:
@@ -211,7 +214,7 @@ def _odd_ext(x, n, axis=-1):
     left_ext = _axis_slice(x, start=n, stop=0, step=-1, axis=axis)
     right_end = _axis_slice(x, start=-1, axis=axis)
     right_ext = _axis_slice(x, start=-2, stop=-(n + 2), step=-1, axis=axis)
-    ext = cp.concatenate((2 * left_end - left_ext,
+    ext = xp.concatenate((2 * left_end - left_ext,
                           x,
                           2 * right_end - right_ext),
                          axis=axis)
@@ -254,7 +257,8 @@ def _even_ext(x, n, axis=-1):
     >>> plt.legend(loc='best')
     >>> plt.show()
     """
-    x = cp.asarray(x)
+    xp = get_array_module(x)
+    x = xp.asarray(x)
     if n < 1:
         return x
     if n > x.shape[axis] - 1:
@@ -263,7 +267,7 @@ def _even_ext(x, n, axis=-1):
                          % (n, x.shape[axis] - 1))
     left_ext = _axis_slice(x, start=n, stop=0, step=-1, axis=axis)
     right_ext = _axis_slice(x, start=-2, stop=-(n + 2), step=-1, axis=axis)
-    ext = cp.concatenate((left_ext,
+    ext = xp.concatenate((left_ext,
                           x,
                           right_ext),
                          axis=axis)
@@ -310,17 +314,18 @@ def _const_ext(x, n, axis=-1):
     >>> plt.legend(loc='best')
     >>> plt.show()
     """
-    x = cp.asarray(x)
+    xp = get_array_module(x)
+    x = xp.asarray(x)
     if n < 1:
         return x
     left_end = _axis_slice(x, start=0, stop=1, axis=axis)
     ones_shape = [1] * x.ndim
     ones_shape[axis] = n
-    ones = cp.ones(ones_shape, dtype=x.dtype)
+    ones = xp.ones(ones_shape, dtype=x.dtype)
     left_ext = ones * left_end
     right_end = _axis_slice(x, start=-1, axis=axis)
     right_ext = ones * right_end
-    ext = cp.concatenate((left_ext,
+    ext = xp.concatenate((left_ext,
                           x,
                           right_ext),
                          axis=axis)
@@ -353,13 +358,14 @@ def _zero_ext(x, n, axis=-1):
     array([[ 0,  0,  1,  2,  3,  4,  5,  0,  0],
            [ 0,  0,  0,  1,  4,  9, 16,  0,  0]])
     """
-    x = cp.asarray(x)
+    xp = get_array_module(x)
+    x = xp.asarray(x)
     if n < 1:
         return x
     zeros_shape = list(x.shape)
     zeros_shape[axis] = n
-    zeros = cp.zeros(zeros_shape, dtype=x.dtype)
-    ext = cp.concatenate((zeros, x, zeros), axis=axis)
+    zeros = xp.zeros(zeros_shape, dtype=x.dtype)
+    ext = xp.concatenate((zeros, x, zeros), axis=axis)
     return ext
 
 
@@ -389,5 +395,9 @@ def _as_strided(x, shape=None, strides=None):
     shape = x.shape if shape is None else tuple(shape)
     strides = x.strides if strides is None else tuple(strides)
 
+    if isinstance(x, np.ndarray):
+        return np.lib.stride_tricks.as_strided(x, shape=shape,
+                                               strides=strides)
+
     return cp.ndarray(shape=shape, dtype=x.dtype,
                       memptr=x.data, strides=strides)
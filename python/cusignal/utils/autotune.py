@@ -0,0 +1,305 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cupy as cp
+import json
+import os
+import tempfile
+import threading
+
+from math import ceil
+
+# Environment variables controlling the autotuner
+_ENV_AUTOTUNE = "CUSIGNAL_AUTOTUNE"
+_ENV_DB = "CUSIGNAL_AUTOTUNE_DB"
+
+_DEFAULT_DB = os.path.join("~", ".cusignal", "autotune.json")
+
+_DB_VERSION = 2
+
+# Candidate launch configurations
+_THREADS_1D = (128, 256, 512, 1024)
+_BLOCKS_PER_SM = (4, 8, 16, 20, 32)
+_THREADS_2D = ((16, 16), (32, 8), (8, 32), (32, 16), (16, 32), (64, 4))
+
+
+def _cuda_timer(launch, config, n_repeat=5):
+    """Average time, in ms, of `n_repeat` launches with `config`"""
+    grid, block = config
+
+    # Warm-up
+    launch(grid, block)
+
+    start = cp.cuda.Event()
+    end = cp.cuda.Event()
+
+    start.record()
+    for _ in range(n_repeat):
+        launch(grid, block)
+    end.record()
+    end.synchronize()
+
+    return cp.cuda.get_elapsed_time(start, end) / n_repeat
+
+
+_device_names = {}
+
+
+def _device_name():
+    # Queried once per device, as this runs on every kernel launch
+    device = cp.cuda.runtime.getDevice()
+    name = _device_names.get(device)
+    if name is None:
+        name = cp.cuda.runtime.getDeviceProperties(device)["name"]
+        if isinstance(name, bytes):
+            name = name.decode()
+        _device_names[device] = name
+    return name
+
+
+def _as_config(value):
+    # JSON stores tuples as lists
+    grid, block = value
+    if isinstance(grid, list):
+        grid = tuple(grid)
+    if isinstance(block, list):
+        block = tuple(block)
+    return grid, block
+
+
+class _Autotuner(object):
+    def __init__(self, path, timer=_cuda_timer, enabled=False):
+        """
+        Selects and remembers the fastest launch configuration per
+        (device, kernel, dtype, problem-size bucket).
+
+        Configurations are tuned with `timer(launch, config)` and saved to
+        the JSON file at `path`. If `path` is None, results are only kept
+        in memory.
+        """
+        self.path = path
+        if path is not None:
+            self.path = os.path.abspath(os.path.expanduser(path))
+        self.timer = timer
+        self.enabled = enabled
+        self._db = None
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def bucket(size):
+        """Round `size` up to the next power of two"""
+        return 1 << max(int(size) - 1, 0).bit_length()
+
+    @classmethod
+    def key(cls, device, k_type, dtype, size):
+        return "{}|{}|{}|{}".format(
+            device, k_type.value, str(dtype), cls.bucket(size)
+        )
+
+    @property
+    def db(self):
+        if self._db is None:
+            self._db = self.load()
+        return self._db
+
+    def load(self):
+        if self.path is None:
+            return {}
+
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+        if data.get("version") != _DB_VERSION:
+            return {}
+
+        return {k: _as_config(v) for k, v in data["configs"].items()}
+
+    def save(self):
+        if self.path is None:
+            return
+
+        # Merge with results saved by other processes
+        db = self.load()
+        db.update(self.db)
+        self._db = db
+
+        data = {"version": _DB_VERSION, "configs": db}
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path))
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def lookup(self, key):
+        return self.db.get(key)
+
+    def tune(self, key, configs, launch):
+        """Time all `configs` and store the fastest one"""
+        best, best_time = configs[0], float("inf")
+
+        for config in configs:
+            try:
+                t = self.timer(launch, config)
+            except RuntimeError:
+                # E.g. too many resources requested for launch
+                continue
+            if t < best_time:
+                best, best_time = config, t
+
+        self.db[key] = best
+        self.save()
+
+        return best
+
+    @staticmethod
+    def resolve(config, configs):
+        """
+        The candidate of `configs` matching the stored `config`, either
+        exactly, or by its block only. Problems of the same size bucket can
+        have different shapes, for which the grid of a kernel with one
+        thread per element must be recomputed.
+        """
+        if config in configs:
+            return config
+        for candidate in configs:
+            if candidate[1] == config[1]:
+                return candidate
+        return configs[0]
+
+    def get_config(self, device, k_type, dtype, size, configs, launch):
+        key = self.key(device, k_type, dtype, size)
+
+        # Serialize, so that concurrent callers tune each key only once
+        with self._lock:
+            config = self.lookup(key)
+            if config is not None:
+                return self.resolve(config, configs)
+
+            if self.enabled:
+                return self.tune(key, configs, launch)
+
+        return configs[0]
+
+
+_autotuner = None
+
+
+def _get_autotuner():
+    global _autotuner
+
+    if _autotuner is None:
+        _autotuner = _Autotuner(
+            os.environ.get(_ENV_DB, _DEFAULT_DB),
+            enabled=os.environ.get(_ENV_AUTOTUNE, "0").lower()
+            not in ("", "0", "false"),
+        )
+    return _autotuner
+
+
+def _grid_stride_configs(threadsperblock):
+    """
+    Launch configurations for kernels using a grid-stride loop. The first
+    one is the default used when no tuned configuration exists.
+    """
+    numSM = cp.cuda.Device().attributes["MultiProcessorCount"]
+
+    configs = [(numSM * 20, threadsperblock)]
+    for threads in _THREADS_1D:
+        for blocks in _BLOCKS_PER_SM:
+            if (numSM * blocks, threads) not in configs:
+                configs.append((numSM * blocks, threads))
+
+    return configs
+
+
+def _grid_2d_configs(shape, threadsperblock=(16, 16)):
+    """
+    Launch configurations for 2D kernels with one thread per element of
+    `shape`, i.e. the extents covered by the x and y dimensions of the
+    grid. The first one is the default.
+    """
+    configs = []
+    for block in (threadsperblock,) + _THREADS_2D:
+        grid = (ceil(shape[0] / block[0]), ceil(shape[1] / block[1]))
+        if (grid, block) not in configs:
+            configs.append((grid, block))
+
+    return configs
+
+
+def _get_launch_config(k_type, dtype, size, configs, launch):
+    """
+    Return the (blockspergrid, threadsperblock) to launch kernel `k_type`
+    with, for `size` elements of type `dtype`.
+
+    The tuning database is consulted first. On a miss, all `configs` are
+    timed with `launch(blockspergrid, threadsperblock)` if autotuning is
+    enabled, otherwise ``configs[0]`` is returned. Kernels tuned this way
+    must produce the same output when launched more than once.
+    """
+    return _get_autotuner().get_config(
+        _device_name(), k_type, dtype, size, configs, launch
+    )
+
+
+def set_autotune(enabled=True):
+    r"""
+    Enable or disable autotuning of kernel launch configurations.
+
+    When enabled, the first call to a kernel for a given data type and
+    problem size (rounded up to a power of two) times several block and
+    grid sizes, and uses the fastest from then on. Results are stored in a
+    JSON tuning database and reused by later processes, even when
+    autotuning is disabled. Without a tuned entry, a default launch
+    configuration is used.
+
+    The autotuner is configured with the following environment variables:
+
+    ``CUSIGNAL_AUTOTUNE``
+        Set to 1 to enable autotuning at import. Default is 0.
+    ``CUSIGNAL_AUTOTUNE_DB``
+        Location of the tuning database. Default is
+        ``~/.cusignal/autotune.json``.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether to tune missing launch configurations.
+
+    Returns
+    -------
+    previous : bool
+        Whether autotuning was enabled before the call.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> cusignal.set_autotune(True)
+    False
+    >>> x = cp.random.randn(2 ** 20)
+    >>> y = cusignal.convolve(x, cp.ones(64), method='direct')
+    """
+    autotuner = _get_autotuner()
+    previous = autotuner.enabled
+    autotuner.enabled = bool(enabled)
+
+    return previous
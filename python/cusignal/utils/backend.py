@@ -0,0 +1,149 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cupy as cp
+import numpy as np
+import threading
+
+from contextlib import contextmanager
+
+
+_BACKENDS = ("cupy", "numpy")
+
+# Backend requested through `set_backend`, tracked per thread so that
+# concurrent callers do not see each other's selection.
+_local = threading.local()
+
+
+def _backend_stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _module_from_name(name):
+    return np if name == "numpy" else cp
+
+
+def get_backend():
+    """
+    Return the name of the array backend currently in use.
+
+    Returns
+    -------
+    name : {'cupy', 'numpy'}
+        The backend selected with `set_backend`, or 'cupy' by default.
+    """
+    stack = _backend_stack()
+    if stack:
+        return stack[-1]
+    return "cupy"
+
+
+@contextmanager
+def set_backend(name):
+    """
+    Context manager selecting the array backend used by cuSignal.
+
+    Inside the context, functions supporting multiple backends run on the
+    requested backend regardless of the type of their inputs. Inputs are
+    converted to the requested array type as needed. The selection is local
+    to the calling thread and contexts can be nested.
+
+    Parameters
+    ----------
+    name : {'cupy', 'numpy'}
+        Backend to use. 'cupy' runs on the GPU, 'numpy' runs on the host
+        with NumPy/SciPy and never touches a CUDA device.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import cusignal
+    >>> x = np.random.randn(1000)
+    >>> with cusignal.set_backend('numpy'):
+    ...     f, Pxx = cusignal.welch(x, nperseg=128)
+    >>> type(Pxx)
+    <class 'numpy.ndarray'>
+    """
+    name = str(name).lower()
+    if name not in _BACKENDS:
+        raise ValueError(
+            "Unknown backend '{}', must be one of {}".format(name, _BACKENDS)
+        )
+
+    stack = _backend_stack()
+    stack.append(name)
+    try:
+        yield _module_from_name(name)
+    finally:
+        stack.pop()
+
+
+def get_array_module(*args):
+    """
+    Return the array module (`cupy` or `numpy`) to use for the given inputs.
+
+    The lookup order is:
+
+    1. The backend selected with `set_backend`, if any.
+    2. `cupy` if any argument is a device array (exposes
+       ``__cuda_array_interface__``, e.g. CuPy arrays or Numba mapped
+       arrays).
+    3. `numpy` if any argument is a `numpy.ndarray`.
+    4. The default backend otherwise (e.g. for lists and scalars).
+
+    Parameters
+    ----------
+    args : array_like
+        Values to inspect. `None` entries are ignored.
+
+    Returns
+    -------
+    module : module
+        `cupy` or `numpy`.
+    """
+    stack = _backend_stack()
+    if stack:
+        return _module_from_name(stack[-1])
+
+    for arg in args:
+        if hasattr(arg, "__cuda_array_interface__"):
+            return cp
+
+    for arg in args:
+        if isinstance(arg, np.ndarray):
+            return np
+
+    return _module_from_name(get_backend())
+
+
+def _asarray(a, xp, dtype=None):
+    """
+    Convert `a` to an array of the module `xp`.
+
+    Unlike ``xp.asarray``, this also moves device arrays back to the host
+    when `xp` is `numpy`.
+    """
+    if xp is np and isinstance(a, cp.ndarray):
+        a = cp.asnumpy(a)
+    return xp.asarray(a, dtype=dtype)
+
+
+def _get_fftpack(xp):
+    """Return the `fftpack` module matching the array module `xp`."""
+    if xp is cp:
+        from cupyx.scipy import fftpack
+    else:
+        from scipy import fftpack
+    return fftpack
@@ -11,116 +11,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import cupy as cp
-
-from collections import OrderedDict
-from enum import Enum
+import numpy as np
 
 from ._caches import _cupy_kernel_cache
+from ._registry import GPUKernel, _kernel_registry
+from .kernel_cache import _load_module
 
-from ..convolution._convolution_cuda import (
-    _cupy_convolve_src,
-    _cupy_convolve_2d_src,
-)
-from ..convolution._convolution_cuda import (
-    _cupy_correlate_src,
-    _cupy_correlate_2d_src,
-)
-from ..spectral_analysis._spectral_cuda import _cupy_lombscargle_src
-from ..io._reader_cuda import _cupy_unpack_src
-from ..io._writer_cuda import _cupy_pack_src
-from ..filtering._sosfilt_cuda import _cupy_sosfilt_src
-from ..filtering._upfirdn_cuda import (
-    _cupy_upfirdn_1d_src,
-    _cupy_upfirdn_2d_src,
-)
-
-
-class GPUKernel(Enum):
-    CORRELATE = "correlate"
-    CONVOLVE = "convolve"
-    CORRELATE2D = "correlate2d"
-    CONVOLVE2D = "convolve2d"
-    LOMBSCARGLE = "lombscargle"
-    UNPACK = "unpack"
-    PACK = "pack"
-    SOSFILT = "sosfilt"
-    UPFIRDN = "upfirdn"
-    UPFIRDN2D = "upfirdn2d"
-
-
-# Numba type supported and corresponding C type
-_SUPPORTED_TYPES_CONVOLVE = OrderedDict(
-    (
-        ("int32", "int"),
-        ("int64", "long int"),
-        ("float32", "float"),
-        ("float64", "double"),
-        ("complex64", "complex<float>"),
-        ("complex128", "complex<double>"),
-    )
-)
-
-_SUPPORTED_TYPES_LOMBSCARGLE = OrderedDict(
-    (("float32", "float"), ("float64", "double"),)
-)
-
-_SUPPORTED_TYPES_READER = OrderedDict(
-    (
-        ("int8", "char"),
-        ("uint8", "unsigned char"),
-        ("int16", "short"),
-        ("uint16", "unsigned short"),
-        ("int32", "int"),
-        ("uint32", "unsigned int"),
-        ("float32", "float"),
-        ("float64", "double"),
-        ("complex64", "complex<float>"),
-        ("complex128", "complex<double>"),
-    )
-)
-
-_SUPPORTED_TYPES_SOSFILT = OrderedDict(
-    (("float32", "float"), ("float64", "double"),)
-)
-
-_SUPPORTED_TYPES_UPFIRDN = OrderedDict(
-    (
-        ("float32", "float"),
-        ("float64", "double"),
-        ("complex64", "complex<float>"),
-        ("complex128", "complex<double>"),
-    )
-)
+# Importing the kernel modules registers their kernels
+from ..convolution import _convolution_cuda  # noqa: F401
+from ..spectral_analysis import _spectral_cuda  # noqa: F401
+from ..io import _reader_cuda, _writer_cuda  # noqa: F401
+from ..filtering import _cic_cuda, _sosfilt_cuda, _upfirdn_cuda  # noqa: F401
 
 
 def _get_supported_types(k_type):
 
-    if (
-        k_type == GPUKernel.CORRELATE
-        or k_type == GPUKernel.CONVOLVE
-        or k_type == GPUKernel.CORRELATE2D
-        or k_type == GPUKernel.CONVOLVE2D
-    ):
-        SUPPORTED_TYPES = _SUPPORTED_TYPES_CONVOLVE
-
-    elif k_type == GPUKernel.LOMBSCARGLE:
-        SUPPORTED_TYPES = _SUPPORTED_TYPES_LOMBSCARGLE
-
-    elif k_type == GPUKernel.UNPACK or k_type == GPUKernel.PACK:
-        SUPPORTED_TYPES = _SUPPORTED_TYPES_READER
-
-    elif k_type == GPUKernel.SOSFILT:
-        SUPPORTED_TYPES = _SUPPORTED_TYPES_SOSFILT
-
-    elif k_type == GPUKernel.UPFIRDN or k_type == GPUKernel.UPFIRDN2D:
-        SUPPORTED_TYPES = _SUPPORTED_TYPES_UPFIRDN
-
-    else:
+    try:
+        return _kernel_registry[k_type].types
+    except KeyError:
         raise ValueError("Support not found for '{}'".format(k_type.value))
 
-    return SUPPORTED_TYPES
-
 
 def _validate_input(dtype, k_type):
 
@@ -142,6 +52,12 @@ def _populate_kernel_cache(np_type, k_type):
 
     SUPPORTED_TYPES = _get_supported_types(k_type)
 
+    # Accept type objects, e.g. np.float32, as well as names
+    try:
+        np_type = np.dtype(np_type).name
+    except TypeError:
+        pass
+
     # Check dtypes from user input
     try:
         c_type = SUPPORTED_TYPES[str(np_type)]
@@ -150,116 +66,27 @@ def _populate_kernel_cache(np_type, k_type):
             "Datatype {} not found for '{}'".format(np_type, k_type.value)
         )
 
-    if (str(np_type), k_type.value) in _cupy_kernel_cache:
-        return
-
-    # Instantiate the cupy kernel for this type and compile
-    if c_type.find("complex") != -1:
-        header = "#include <cupy/complex.cuh>"
-    else:
-        header = ""
-
-    if k_type == GPUKernel.CORRELATE:
-        src = _cupy_correlate_src.substitute(datatype=c_type, header=header)
-        module = cp.RawModule(
-            code=src, options=("-std=c++11", "-use_fast_math")
-        )
-        _cupy_kernel_cache[(str(np_type), k_type.value)] = module.get_function(
-            "_cupy_correlate"
-        )
-
-    elif k_type == GPUKernel.CONVOLVE:
-        src = _cupy_convolve_src.substitute(datatype=c_type, header=header)
-        module = cp.RawModule(
-            code=src, options=("-std=c++11", "-use_fast_math")
-        )
-        _cupy_kernel_cache[(str(np_type), k_type.value)] = module.get_function(
-            "_cupy_convolve"
-        )
-
-    elif k_type == GPUKernel.CORRELATE2D:
-        src = _cupy_correlate_2d_src.substitute(datatype=c_type, header=header)
-        module = cp.RawModule(
-            code=src, options=("-std=c++11", "-use_fast_math")
-        )
-        _cupy_kernel_cache[(str(np_type), k_type.value)] = module.get_function(
-            "_cupy_correlate_2d"
-        )
-
-    elif k_type == GPUKernel.CONVOLVE2D:
-        src = _cupy_convolve_2d_src.substitute(datatype=c_type, header=header)
-        module = cp.RawModule(
-            code=src, options=("-std=c++11", "-use_fast_math")
-        )
-        _cupy_kernel_cache[(str(np_type), k_type.value)] = module.get_function(
-            "_cupy_convolve_2d"
-        )
-
-    elif k_type == GPUKernel.LOMBSCARGLE:
-        src = _cupy_lombscargle_src.substitute(datatype=c_type, header=header)
-        module = cp.RawModule(
-            code=src, options=("-std=c++11", "-use_fast_math")
-        )
-        _cupy_kernel_cache[(str(np_type), k_type.value)] = module.get_function(
-            "_cupy_lombscargle"
-        )
-
-    elif k_type == GPUKernel.UNPACK:
-        flag = list(SUPPORTED_TYPES.keys()).index(np_type)
-
-        src = _cupy_unpack_src.substitute(
-            datatype=c_type, header=header, flag=flag
-        )
-        module = cp.RawModule(
-            code=src, options=("-std=c++11", "-use_fast_math")
-        )
-        _cupy_kernel_cache[(str(np_type), k_type.value)] = module.get_function(
-            "_cupy_unpack"
-        )
-
-    elif k_type == GPUKernel.PACK:
+    spec = _kernel_registry[k_type]
 
-        src = _cupy_pack_src.substitute(datatype=c_type, header=header)
-        module = cp.RawModule(
-            code=src, options=("-std=c++11", "-use_fast_math")
-        )
-        _cupy_kernel_cache[(str(np_type), k_type.value)] = module.get_function(
-            "_cupy_pack"
-        )
+    def compile_kernel():
+        # Instantiate the cupy kernel for this type and compile
+        if c_type.find("complex") != -1:
+            header = "#include <cupy/complex.cuh>"
+        else:
+            header = ""
 
-    elif k_type == GPUKernel.SOSFILT:
-        src = _cupy_sosfilt_src.substitute(datatype=c_type, header=header)
-        module = cp.RawModule(
-            code=src, options=("-std=c++11", "-use_fast_math")
-        )
-        _cupy_kernel_cache[(str(np_type), k_type.value)] = module.get_function(
-            "_cupy_sosfilt"
-        )
+        substitutions = {"datatype": c_type, "header": header}
+        if spec.substitutions is not None:
+            substitutions.update(spec.substitutions(str(np_type)))
 
-    elif k_type == GPUKernel.UPFIRDN:
-        src = _cupy_upfirdn_1d_src.substitute(datatype=c_type, header=header)
-        module = cp.RawModule(
-            code=src, options=("-std=c++11", "-use_fast_math")
-        )
-        _cupy_kernel_cache[(str(np_type), k_type.value)] = module.get_function(
-            "_cupy_upfirdn_1d"
-        )
+        src = spec.template.substitute(**substitutions)
 
-    elif k_type == GPUKernel.UPFIRDN2D:
-        src = _cupy_upfirdn_2d_src.substitute(datatype=c_type, header=header)
-        module = cp.RawModule(
-            code=src, options=("-std=c++11", "-use_fast_math")
-        )
-        _cupy_kernel_cache[(str(np_type), k_type.value)] = module.get_function(
-            "_cupy_upfirdn_2d"
-        )
+        module = _load_module(src, spec.options, np_type)
+        return module.get_function(spec.entry)
 
-    else:
-        raise NotImplementedError(
-            "No kernel found for k_type {}, datatype {}".format(
-                k_type, str(np_type)
-            )
-        )
+    return _cupy_kernel_cache.get_or_compile(
+        (str(np_type), k_type.value), compile_kernel
+    )
 
 
 def precompile_kernels(k_type=None, dtype=None):
@@ -270,6 +97,10 @@ def precompile_kernels(k_type=None, dtype=None):
     does not match any precompiled kernels, it will be compile at
     first call (if kernel and data type combination exist)
 
+    Compiled kernels are also stored in an on-disk cache, so later
+    processes load them instead of compiling again. See
+    `kernel_cache_info`.
+
     Parameters
     ----------
     k_type : {str}, optional
@@ -280,6 +111,8 @@ def precompile_kernels(k_type=None, dtype=None):
             'correlate2d'
             'convolve2d'
             'lombscargle'
+            'sosfilt'
+            'sosfilt_real'
             'upfirdn'
             'upfirdn2d'
     dtype : dtype or list of dtype, optional
@@ -302,6 +135,7 @@ def precompile_kernels(k_type=None, dtype=None):
                 float32
                 float64
             }
+            'sosfilt'
             'upfirdn'
             'upfirdn2d'
             {
@@ -310,6 +144,26 @@ def precompile_kernels(k_type=None, dtype=None):
                 complex64
                 complex128
             }
+            'sosfilt_real'
+            {
+                complex64
+                complex128
+            }
+
+    Notes
+    -----
+    Kernels can be compiled and called from multiple threads. Each kernel
+    is compiled once per process: threads needing a kernel that is being
+    compiled wait for that compilation to finish.
+
+    Kernels are launched on the calling thread's current CuPy stream,
+    ``cupy.cuda.get_current_stream()``, which is thread-local. By default
+    this is the legacy default stream, which serializes work from all
+    threads. To overlap work, use a stream per thread
+    (``with cupy.cuda.Stream(non_blocking=True):``) or set
+    ``CUPY_CUDA_PER_THREAD_DEFAULT_STREAM=1`` before importing CuPy.
+    Functions returning host data, such as `read_bin`, only synchronize
+    the calling thread's current stream.
 
     Examples
     ----------
@@ -0,0 +1,275 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cupy as cp
+import hashlib
+import os
+import tempfile
+
+from ._caches import _cupy_kernel_cache
+
+# Environment variables controlling the on-disk kernel cache
+_ENV_DISABLE = "CUSIGNAL_DISABLE_KERNEL_CACHE"
+_ENV_DIR = "CUSIGNAL_KERNEL_CACHE_DIR"
+_ENV_SIZE = "CUSIGNAL_KERNEL_CACHE_SIZE"
+
+_DEFAULT_DIR = os.path.join("~", ".cusignal", "kernel_cache")
+_DEFAULT_SIZE = 64 * 1024 * 1024  # bytes
+
+# NVRTC emits either PTX or a cubin depending on the toolkit; the module
+# loader accepts both, so entries use a neutral suffix.
+_SUFFIX = ".bin"
+
+
+def _cupy_options(options):
+    """
+    Add the include paths `cp.RawModule` passes to NVRTC, so that kernels
+    can include CuPy's headers, such as ``<cupy/complex.cuh>``.
+    """
+    options = tuple(options)
+    assemble = getattr(cp._core.core, "assemble_cupy_compiler_options", None)
+    if assemble is not None:
+        return assemble(options)
+
+    include = os.path.join(os.path.dirname(cp.__file__), "_core", "include")
+    return ("-I" + include,) + options
+
+
+def _nvrtc_compile(src, options, arch):
+    """Compile CUDA source to PTX or a cubin with NVRTC"""
+    # CuPy expects the bare compute capability (e.g. "80") and adds the
+    # -arch flag itself. Since CuPy 9 it returns (binary, name mapping).
+    binary = cp.cuda.compiler.compile_using_nvrtc(
+        src, _cupy_options(options), arch
+    )
+    if isinstance(binary, tuple):
+        binary = binary[0]
+    return binary
+
+
+def _device_arch():
+    return cp.cuda.Device().compute_capability
+
+
+def _toolkit_version():
+    return "cupy-{}-nvrtc-{}.{}".format(
+        cp.__version__, *cp.cuda.nvrtc.getVersion()
+    )
+
+
+class _DiskKernelCache(object):
+    def __init__(self, path, max_size, compile_fn=_nvrtc_compile):
+        """
+        Content-addressed on-disk cache of compiled kernels.
+
+        Entries are keyed by a hash of everything affecting the compiled
+        binary. When the total size of the entries exceeds `max_size`
+        bytes, the least recently used ones are evicted.
+
+        `compile_fn(src, options, arch)` must return the compiled binary as
+        `bytes` or `str`.
+        """
+        self.path = os.path.abspath(os.path.expanduser(path))
+        self.max_size = int(max_size)
+        self.compile_fn = compile_fn
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(src, options, np_type, arch, toolkit):
+        h = hashlib.sha256()
+        for item in (src, " ".join(options), str(np_type), arch, toolkit):
+            h.update(item.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.path, key + _SUFFIX)
+
+    def _entries(self):
+        try:
+            names = os.listdir(self.path)
+        except FileNotFoundError:
+            return []
+
+        entries = []
+        for name in names:
+            if not name.endswith(_SUFFIX):
+                continue
+            f = os.path.join(self.path, name)
+            try:
+                st = os.stat(f)
+            except FileNotFoundError:
+                # Removed by a concurrent process
+                continue
+            entries.append((st.st_mtime, st.st_size, f))
+        return entries
+
+    def get(self, key):
+        """Return the path of a cached entry, or None"""
+        f = self._entry(key)
+        try:
+            # Mark as recently used
+            os.utime(f)
+        except FileNotFoundError:
+            return None
+        return f
+
+    def put(self, key, binary):
+        """Store a compiled binary atomically and return its path"""
+        if isinstance(binary, str):
+            binary = binary.encode("utf-8")
+
+        os.makedirs(self.path, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(binary)
+            os.replace(tmp, self._entry(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+        self.evict(keep=key)
+
+        return self._entry(key)
+
+    def fetch(self, src, options, np_type, arch, toolkit):
+        """Return the path of the compiled binary, compiling on a miss"""
+        key = self.key(src, options, np_type, arch, toolkit)
+
+        f = self.get(key)
+        if f is not None:
+            self.hits += 1
+            return f
+
+        self.misses += 1
+        return self.put(key, self.compile_fn(src, options, arch))
+
+    def evict(self, keep=None):
+        """Remove least recently used entries until under `max_size`"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, f in entries:
+            if total <= self.max_size:
+                break
+            if keep is not None and f == self._entry(keep):
+                continue
+            try:
+                os.unlink(f)
+                self.evictions += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, f in self._entries():
+            try:
+                os.unlink(f)
+            except FileNotFoundError:
+                pass
+
+    def info(self):
+        entries = self._entries()
+        return {
+            "path": self.path,
+            "entries": len(entries),
+            "size": sum(size for _, size, _ in entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+_disk_cache = None
+
+
+def _cache_enabled():
+    return os.environ.get(_ENV_DISABLE, "0").lower() in ("", "0", "false")
+
+
+def _get_disk_cache():
+    global _disk_cache
+
+    if _disk_cache is None:
+        _disk_cache = _DiskKernelCache(
+            os.environ.get(_ENV_DIR, _DEFAULT_DIR),
+            os.environ.get(_ENV_SIZE, _DEFAULT_SIZE),
+        )
+    return _disk_cache
+
+
+def _load_module(src, options, np_type):
+    """
+    Build a `cp.RawModule`, reusing a binary from the disk cache if the
+    same source was already compiled with the same options, data type,
+    architecture and toolkit.
+    """
+    if not _cache_enabled():
+        return cp.RawModule(code=src, options=options)
+
+    f = _get_disk_cache().fetch(
+        src, options, np_type, _device_arch(), _toolkit_version()
+    )
+    return cp.RawModule(path=f)
+
+
+def kernel_cache_info():
+    r"""
+    Report the state of the compiled kernel caches.
+
+    Kernels are compiled the first time they are used, or by
+    `precompile_kernels`. Compiled kernels are stored on disk and reused by
+    later processes, so the compilation cost is only paid once per
+    kernel, data type, GPU architecture and CUDA toolkit.
+
+    The disk cache is configured with the following environment variables:
+
+    ``CUSIGNAL_KERNEL_CACHE_DIR``
+        Cache location. Default is ``~/.cusignal/kernel_cache``.
+    ``CUSIGNAL_KERNEL_CACHE_SIZE``
+        Maximum size of the cache in bytes. Least recently used kernels
+        are evicted when it is exceeded. Default is 64 MiB.
+    ``CUSIGNAL_DISABLE_KERNEL_CACHE``
+        Set to 1 to always compile from source.
+
+    Compiled kernels are also kept in memory, in a least recently used
+    cache holding at most ``CUSIGNAL_KERNEL_CACHE_MAXSIZE`` kernels
+    (default 128).
+
+    Returns
+    -------
+    info : dict
+        In-memory cache statistics: ``loaded`` and ``maxsize`` are the
+        current and maximum number of kernels, ``hits``, ``misses`` and
+        ``evictions`` count lookups in this process, and ``compile_time``
+        is the total time spent compiling or loading kernels, in seconds.
+        ``disk`` holds the disk cache statistics: ``enabled``, ``path``,
+        ``entries``, ``size`` and ``max_size`` in bytes, and the
+        ``hits``, ``misses`` and ``evictions`` counted in this process.
+
+    Examples
+    --------
+    >>> import cusignal
+    >>> cusignal.precompile_kernels('sosfilt')
+    >>> cusignal.kernel_cache_info()['loaded']
+    4
+    """
+    info = _cupy_kernel_cache.info()
+    info["disk"] = _get_disk_cache().info()
+    info["disk"]["enabled"] = _cache_enabled()
+
+    return info
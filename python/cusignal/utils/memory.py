@@ -0,0 +1,238 @@
+# Copyright (c) 2019-2020, NVIDIA CORPORATION.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import threading
+
+from contextlib import contextmanager
+
+# Start of every buffer carved from an arena, in bytes
+_ALIGNMENT = 256
+
+# Workspaces entered with `workspace`, tracked per thread like the backend
+_local = threading.local()
+
+
+def _workspace_stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+class _Workspace(object):
+    def __init__(self, nbytes):
+        """
+        Arena of `nbytes` bytes per array module, handing out buffers
+        keyed by (tag, shape, dtype).
+
+        The first request for a key carves a new buffer from the arena,
+        later requests for the same key return the same buffer. Requests
+        not fitting in the remaining space are allocated normally and not
+        kept.
+        """
+        self.nbytes = int(nbytes)
+        if self.nbytes < 0:
+            raise ValueError("nbytes must be non-negative")
+        self._arenas = {}
+        self._buffers = {}
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.allocations = 0
+
+    def _arena(self, xp):
+        arena = self._arenas.get(xp)
+        if arena is None:
+            arena = [xp.empty(self.nbytes, np.uint8), 0]
+            self._arenas[xp] = arena
+            self.allocations += 1
+        return arena
+
+    def empty(self, shape, dtype, xp, tag):
+        shape = tuple(shape)
+        dtype = np.dtype(dtype)
+        key = (xp.__name__, tag, shape, dtype)
+
+        buf = self._buffers.get(key)
+        if buf is not None:
+            self.hits += 1
+            return buf
+
+        size = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        arena = self._arena(xp)
+        start = -(-arena[1] // _ALIGNMENT) * _ALIGNMENT
+        if start + size > self.nbytes:
+            # Does not fit, allocated for this call only
+            self.allocations += 1
+            return xp.empty(shape, dtype)
+
+        self.misses += 1
+        buf = arena[0][start : start + size].view(dtype).reshape(shape)
+        arena[1] = start + size
+        self.used = sum(a[1] for a in self._arenas.values())
+        self._buffers[key] = buf
+
+        return buf
+
+    def info(self):
+        return {
+            "nbytes": self.nbytes,
+            "used": self.used,
+            "buffers": len(self._buffers),
+            "hits": self.hits,
+            "misses": self.misses,
+            "allocations": self.allocations,
+        }
+
+
+def _empty(shape, dtype, xp, tag):
+    """
+    Return an uninitialized array, from the active workspace if any.
+
+    `tag` names the buffer, so that each call site gets its own buffers.
+    """
+    stack = _workspace_stack()
+    if stack:
+        return stack[-1].empty(shape, dtype, xp, tag)
+    return xp.empty(shape, dtype)
+
+
+def _zeros(shape, dtype, xp, tag):
+    """Like `_empty`, with the array filled with zeros"""
+    stack = _workspace_stack()
+    if stack:
+        out = stack[-1].empty(shape, dtype, xp, tag)
+        out.fill(0)
+        return out
+    return xp.zeros(shape, dtype)
+
+
+def _output(out, shape, dtype, xp, tag, contiguous=True):
+    """
+    Validate a caller-provided output array, or return a new one from
+    `_empty` if `out` is None.
+
+    Kernels index their output directly, so `out` must be C-contiguous
+    unless `contiguous` is False.
+    """
+    if out is None:
+        return _empty(shape, dtype, xp, tag)
+
+    shape = tuple(shape)
+    dtype = np.dtype(dtype)
+    if not isinstance(out, xp.ndarray):
+        raise ValueError(
+            "out must be a {}.ndarray, got {}".format(
+                xp.__name__, type(out).__name__
+            )
+        )
+    if out.shape != shape:
+        raise ValueError(
+            "out has shape {}, expected {}".format(out.shape, shape)
+        )
+    if out.dtype != dtype:
+        raise ValueError(
+            "out has dtype {}, expected {}".format(out.dtype, dtype)
+        )
+    if contiguous and not out.flags.c_contiguous:
+        raise ValueError("out must be C-contiguous")
+
+    return out
+
+
+def _copy_to(out, result, xp):
+    """
+    Write `result` to the caller-provided array `out`, for functions which
+    cannot compute into it directly, and return it. Return `result` if
+    `out` is None.
+    """
+    if out is None:
+        return result
+
+    out = _output(out, result.shape, result.dtype, xp, None, False)
+    out[...] = result
+
+    return out
+
+
+def _unaliased(x, out, xp):
+    """
+    Return `x`, or a copy of it if it may overlap `out`, so that kernels
+    reading `x` while writing `out` never see their own output. This
+    happens when `out` is one of the inputs, or when chained calls in a
+    `workspace` pass the buffer of one call site back to it.
+    """
+    if xp.may_share_memory(x, out):
+        return x.copy()
+    return x
+
+
+@contextmanager
+def workspace(nbytes):
+    r"""
+    Context manager providing a scratch memory arena to cuSignal.
+
+    Inside the context, functions accepting an `out` argument, such as
+    `sosfilt`, `upfirdn`, `resample_poly`, `convolve` and `correlate`,
+    take their temporary arrays, and their output arrays when `out` is
+    not given, from an arena of `nbytes` bytes, allocated on first use,
+    instead of allocating new arrays on every call. Each call site keeps
+    one buffer per shape and data type, so loops calling these functions
+    with the same shapes do not allocate after their first iteration.
+    Requests not fitting in the remaining space of the arena are allocated
+    as usual.
+
+    The selection is local to the calling thread and contexts can be
+    nested, in which case the innermost one is used.
+
+    Parameters
+    ----------
+    nbytes : int
+        Size of the arena in bytes.
+
+    Yields
+    ------
+    ws : object
+        The workspace. ``ws.info()`` returns a dict with the arena size
+        ``nbytes``, the number of bytes ``used``, the number of
+        ``buffers`` carved from it, the number of requests served by an
+        existing buffer (``hits``) or by a new one (``misses``), and the
+        number of ``allocations`` made, including the arena itself.
+
+    Notes
+    -----
+    Results computed inside the context are views into the arena. They
+    are overwritten by the next call from the same call site with the
+    same shapes and data types, so copy results which need to outlive
+    that call.
+
+    Examples
+    --------
+    >>> import cupy as cp
+    >>> import cusignal
+    >>> from scipy import signal
+    >>> sos = cp.asarray(signal.butter(8, 0.1, output='sos'))
+    >>> x = cp.random.randn(16, 2 ** 16)
+    >>> with cusignal.workspace(2 ** 26) as ws:
+    ...     for _ in range(100):
+    ...         y = cusignal.sosfilt(sos, x)
+    >>> ws.info()['allocations']
+    1
+    """
+    ws = _Workspace(nbytes)
+    stack = _workspace_stack()
+    stack.append(ws)
+    try:
+        yield ws
+    finally:
+        stack.pop()